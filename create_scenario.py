@@ -21,6 +21,7 @@ import json
 import sys
 import re
 import wave
+import importlib.util
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
@@ -47,13 +48,14 @@ except ImportError:
         return Path(f"/usr/share/freeswitch/sounds/minibot/{voice}/{audio_type}/{filename}")
     FREESWITCH_SOUNDS_DIR = Path("/usr/share/freeswitch/sounds/minibot")
 
-# Import Vosk pour transcription automatique
+# Vosk pour transcription automatique (import lazy: la bibliothèque native
+# n'est chargée qu'à la première transcription, pas au lancement de l'outil)
 try:
-    from vosk import Model, KaldiRecognizer
     from system.config import VOSK_MODEL_PATH
-    VOSK_AVAILABLE = True
+    VOSK_AVAILABLE = importlib.util.find_spec("vosk") is not None
 except ImportError:
     VOSK_AVAILABLE = False
+if not VOSK_AVAILABLE:
     print_warning = lambda x: print(f"⚠️  {x}")
 
 # Couleurs terminal
@@ -587,6 +589,8 @@ class ScenarioBuilderV3:
             return None
 
         try:
+            from vosk import Model, KaldiRecognizer
+
             # Charger le modèle Vosk une seule fois
             if self.vosk_model is None:
                 print_info(f"  📥 Chargement modèle Vosk...")
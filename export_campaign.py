@@ -2,39 +2,117 @@
 """
 Export Campaign - MiniBotPanel v3
 
-Export résultats campagne en CSV complet.
+Export résultats campagne en CSV complet (ou Parquet / Arrow, pyarrow requis).
 
 Usage:
     python export_campaign.py --campaign-id 42
     python export_campaign.py --campaign-id 42 --output results.csv
+    python export_campaign.py --campaign-id 42 --batch-size 5000
+    python export_campaign.py --campaign-id 42 --format parquet
+    python export_campaign.py --campaign-id 42 --format parquet --compression snappy
+    python export_campaign.py --campaign-id 42 --format arrow --compression lz4
 
 CSV output includes:
     - Contact info (phone, name, company, email)
     - Call results (status, result, duration, started_at, ended_at)
     - Sentiment & transcriptions
     - Audio/transcription file links
+
+Parquet / Arrow output: typed columns (enums dictionary-encoded, native
+timestamps), qualification_data / call_metadata flattened into columns,
+written row group by row group (see system/call_export.py).
 """
 
 import argparse
 import logging
-import csv
 import sys
-import json
-from datetime import datetime
 from pathlib import Path
 
 from system.database import SessionLocal
-from system.models import Campaign, Call, Contact
+from system.models import Campaign, Call, Contact, CallStatus, CallResult
+from system.call_export import COLUMNAR_FORMATS, check_columnar, iter_call_batches, iter_columnar, iter_csv
+from system.call_stats import campaign_call_stats
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def export_campaign_to_csv(campaign_id: int, output_file: str):
+CSV_COLUMNS = [
+    'call_id',
+    'call_uuid',
+    'phone',
+    'first_name',
+    'last_name',
+    'company',
+    'email',
+    'status',
+    'result',
+    'duration_seconds',
+    'started_at',
+    'ended_at',
+    'amd_result',
+    'sentiment',
+    'transcriptions',
+    'intents',
+    'audio_file',
+    'notes',
+    'retry_count'
+]
+
+EXPORT_COLUMNS = [
+    Call.id, Call.uuid, Call.status, Call.result, Call.duration, Call.started_at, Call.ended_at,
+    Call.amd_result, Call.sentiment, Call.call_metadata, Call.recording_path, Call.notes, Call.retry_count,
+    Contact.phone, Contact.first_name, Contact.last_name, Contact.company, Contact.email,
+]
+
+def csv_row(row):
+    """Valeurs CSV d'un appel (ordre de CSV_COLUMNS)"""
+    # Parse metadata for transcriptions and intents
+    metadata = row.call_metadata or {}
+    transcriptions = metadata.get('transcriptions', [])
+    intents = metadata.get('intents', [])
+
+    return [
+        row.id,
+        row.uuid,
+        row.phone or '',
+        row.first_name or '',
+        row.last_name or '',
+        row.company or '',
+        row.email or '',
+        row.status.value if row.status else '',
+        row.result.value if row.result else '',
+        row.duration or 0,
+        row.started_at.isoformat() if row.started_at else '',
+        row.ended_at.isoformat() if row.ended_at else '',
+        row.amd_result or '',
+        row.sentiment.value if row.sentiment else '',
+        ' | '.join(transcriptions) if transcriptions else '',
+        ', '.join(intents) if intents else '',
+        row.recording_path or '',
+        row.notes or '',
+        row.retry_count or 0
+    ]
+
+def summary_path(output_file: str) -> str:
+    """campaign_42_export.csv → campaign_42_export_summary.txt"""
+    return str(Path(output_file).with_suffix('')) + '_summary.txt'
+
+def export_campaign_to_csv(campaign_id: int, output_file: str, batch_size: int = None,
+                           fmt: str = "csv", compression: str = None):
     """
-    Export campaign results to CSV.
+    Export campaign results to CSV (or fmt="parquet" / "arrow").
 
-    Includes all call details, transcriptions, and metadata.
+    Includes all call details, transcriptions, and metadata. Calls are read
+    in batches (server-side cursor) and written batch by batch: memory stays
+    flat whatever the campaign size.
     """
+    if fmt != "csv":
+        try:
+            compression = check_columnar(fmt, compression)
+        except (ValueError, RuntimeError) as e:
+            logger.error(f"❌ {e}")
+            return False
+
     db = SessionLocal()
 
     try:
@@ -46,89 +124,39 @@ def export_campaign_to_csv(campaign_id: int, output_file: str):
 
         logger.info(f"📊 Exporting campaign: {campaign.name}")
 
-        # 2. Récupérer tous les appels avec contacts
-        calls = db.query(Call).join(Contact).filter(
-            Call.campaign_id == campaign_id
-        ).all()
-
-        if not calls:
+        if not db.query(Call.id).filter(Call.campaign_id == campaign_id).first():
             logger.warning("⚠️ No calls found for this campaign")
             return False
 
-        logger.info(f"   Found {len(calls)} calls")
-
-        # 3. Générer CSV
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'call_id',
-                'call_uuid',
-                'phone',
-                'first_name',
-                'last_name',
-                'company',
-                'email',
-                'status',
-                'result',
-                'duration_seconds',
-                'started_at',
-                'ended_at',
-                'amd_result',
-                'sentiment',
-                'transcriptions',
-                'intents',
-                'audio_file',
-                'notes',
-                'retry_count'
-            ]
-
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for call in calls:
-                contact = call.contact
-
-                # Parse metadata for transcriptions and intents
-                metadata = call.metadata or {}
-                transcriptions = metadata.get('transcriptions', [])
-                intents = metadata.get('intents', [])
-
-                # Format transcriptions as single string
-                transcriptions_str = ' | '.join(transcriptions) if transcriptions else ''
-                intents_str = ', '.join(intents) if intents else ''
-
-                # Audio file path (if exists)
-                audio_file = ''
-                if call.recording_path:
-                    audio_file = call.recording_path
-
-                row = {
-                    'call_id': call.id,
-                    'call_uuid': call.uuid,
-                    'phone': contact.phone if contact else '',
-                    'first_name': contact.first_name if contact else '',
-                    'last_name': contact.last_name if contact else '',
-                    'company': contact.company if contact else '',
-                    'email': contact.email if contact else '',
-                    'status': call.status.value if call.status else '',
-                    'result': call.result.value if call.result else '',
-                    'duration_seconds': call.duration or 0,
-                    'started_at': call.started_at.isoformat() if call.started_at else '',
-                    'ended_at': call.ended_at.isoformat() if call.ended_at else '',
-                    'amd_result': call.amd_result or '',
-                    'sentiment': call.sentiment.value if call.sentiment else '',
-                    'transcriptions': transcriptions_str,
-                    'intents': intents_str,
-                    'audio_file': audio_file,
-                    'notes': call.notes or '',
-                    'retry_count': call.retry_count or 0
-                }
-
-                writer.writerow(row)
-
-        logger.info(f"✅ Exported {len(calls)} calls to {output_file}")
-
-        # 4. Generate summary
-        summary_file = output_file.replace('.csv', '_summary.txt')
+        # 2. Appels + contacts lus par lots, 3. Fichier écrit au fur et à mesure
+        if fmt == "csv":
+            exported = 0
+
+            def count_batches(batches):
+                nonlocal exported
+                for batch in batches:
+                    exported += len(batch)
+                    yield batch
+
+            with open(output_file, 'wb') as csvfile:
+                batches = count_batches(iter_call_batches(db, campaign_id, EXPORT_COLUMNS, batch_size))
+                for chunk in iter_csv(CSV_COLUMNS, batches, csv_row):
+                    csvfile.write(chunk)
+
+            logger.info(f"✅ Exported {exported} calls to {output_file}")
+        else:
+            with open(output_file, 'wb') as columnar_file:
+                for chunk in iter_columnar(db, campaign_id, fmt, compression, batch_size):
+                    columnar_file.write(chunk)
+
+            size_mb = Path(output_file).stat().st_size / 1e6
+            logger.info(f"✅ Exported campaign to {output_file} ({fmt}, {compression}, {size_mb:.1f} MB)")
+
+        # 4. Generate summary (compteurs: rollup des stats + appels en cours)
+        stats = campaign_call_stats(db, campaign_id)
+        total = stats["total"]
+        leads = stats["results"][CallResult.LEADS.value]
+        summary_file = summary_path(output_file)
         with open(summary_file, 'w', encoding='utf-8') as f:
             f.write(f"CAMPAIGN EXPORT SUMMARY\n")
             f.write(f"{'='*60}\n\n")
@@ -139,18 +167,17 @@ def export_campaign_to_csv(campaign_id: int, output_file: str):
             f.write(f"Completed: {campaign.completed_at.strftime('%Y-%m-%d %H:%M:%S') if campaign.completed_at else 'N/A'}\n\n")
 
             # Stats
-            stats = campaign.stats or {}
             f.write(f"STATISTICS\n")
             f.write(f"{'-'*60}\n")
-            f.write(f"Total calls: {len(calls)}\n")
-            f.write(f"Leads: {stats.get('leads', 0)}\n")
-            f.write(f"Not interested: {stats.get('not_interested', 0)}\n")
-            f.write(f"Callbacks: {stats.get('callbacks', 0)}\n")
-            f.write(f"No answer: {stats.get('no_answer', 0)}\n")
-            f.write(f"Answering machines: {stats.get('answering_machines', 0)}\n")
-            f.write(f"Failed: {stats.get('failed', 0)}\n\n")
-            f.write(f"Average duration: {stats.get('avg_duration', 0):.1f}s\n")
-            f.write(f"Conversion rate: {stats.get('leads', 0) / len(calls) * 100 if len(calls) > 0 else 0:.1f}%\n")
+            f.write(f"Total calls: {total}\n")
+            f.write(f"Leads: {leads}\n")
+            f.write(f"Not interested: {stats['results'][CallResult.NOT_INTERESTED.value]}\n")
+            f.write(f"Callbacks: {stats['results'][CallResult.NO_ANSWER.value]}\n")
+            f.write(f"No answer: {stats['status'][CallStatus.NO_ANSWER.value]}\n")
+            f.write(f"Answering machines: {stats['amd']['machine']}\n")
+            f.write(f"Failed: {stats['status'][CallStatus.FAILED.value]}\n\n")
+            f.write(f"Average duration: {stats['avg_duration']:.1f}s\n")
+            f.write(f"Conversion rate: {leads / total * 100 if total > 0 else 0:.1f}%\n")
 
         logger.info(f"✅ Summary saved to {summary_file}")
 
@@ -164,24 +191,28 @@ def export_campaign_to_csv(campaign_id: int, output_file: str):
         db.close()
 
 def main():
-    parser = argparse.ArgumentParser(description="Export campagne en CSV")
+    parser = argparse.ArgumentParser(description="Export campagne en CSV / Parquet / Arrow")
     parser.add_argument("--campaign-id", type=int, required=True, help="ID campagne")
-    parser.add_argument("--output", help="Fichier sortie CSV (default: campaign_<id>_export.csv)")
+    parser.add_argument("--output", help="Fichier sortie (default: campaign_<id>_export.<format>)")
+    parser.add_argument("--format", choices=("csv",) + COLUMNAR_FORMATS, default="csv", help="Format (default: csv)")
+    parser.add_argument("--compression", help="Parquet: none/snappy/zstd/gzip/lz4/brotli, Arrow: none/zstd/lz4 "
+                                              "(default: EXPORT_COLUMNAR_COMPRESSION)")
+    parser.add_argument("--batch-size", type=int, help="Appels lus et écrits par lot (default: EXPORT_BATCH_SIZE)")
 
     args = parser.parse_args()
 
     # Default output filename
     if not args.output:
-        args.output = f"campaign_{args.campaign_id}_export.csv"
+        args.output = f"campaign_{args.campaign_id}_export.{args.format}"
 
     logger.info(f"📤 Exporting campaign {args.campaign_id}...")
 
-    success = export_campaign_to_csv(args.campaign_id, args.output)
+    success = export_campaign_to_csv(args.campaign_id, args.output, args.batch_size, args.format, args.compression)
 
     if success:
         logger.info(f"\n✅ Export complete!")
-        logger.info(f"   CSV file: {args.output}")
-        logger.info(f"   Summary: {args.output.replace('.csv', '_summary.txt')}")
+        logger.info(f"   {args.format.upper()} file: {args.output}")
+        logger.info(f"   Summary: {summary_path(args.output)}")
     else:
         logger.error("❌ Export failed")
         sys.exit(1)
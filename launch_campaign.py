@@ -316,7 +316,9 @@ def main():
                 try:
                     from system.objection_matcher import ObjectionMatcher
 
-                    matcher = ObjectionMatcher.load_objections_from_file(theme_file)
+                    matcher = ObjectionMatcher.load_objections_from_file(
+                        theme_file, scenario_data.get("voice", "julie")
+                    )
                     if matcher:
                         logger.info(f"✅ Objections preloaded successfully from '{theme_file}'")
 
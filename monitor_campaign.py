@@ -4,6 +4,10 @@ Monitor Campaign - MiniBotPanel v3
 
 Monitoring temps réel CLI d'une campagne.
 
+Compteurs lus à chaque rafraîchissement par campaign_call_stats() (rollup
+des appels terminés + appels en cours): deux requêtes, quel que soit le
+nombre d'appels de la campagne.
+
 Usage:
     python monitor_campaign.py --campaign-id 42
 """
@@ -16,8 +20,9 @@ import os
 from datetime import datetime
 
 from system.database import SessionLocal
-from system.models import Campaign, Call, CallStatus
-from system.stats_collector import StatsCollector
+from system.models import Campaign, CallStatus, CallResult
+from system.call_stats import campaign_call_stats
+from system.stats_rollup import FINAL_STATUSES
 
 logging.basicConfig(level=logging.WARNING)  # Only warnings/errors
 logger = logging.getLogger(__name__)
@@ -26,6 +31,44 @@ def clear_screen():
     """Clear terminal screen"""
     os.system('cls' if os.name == 'nt' else 'clear')
 
+ACTIVE_STATUSES = (
+    CallStatus.QUEUED, CallStatus.CALLING, CallStatus.RINGING, CallStatus.ANSWERED, CallStatus.IN_PROGRESS
+)
+
+def build_stats(campaign, counts):
+    """Stats affichées par print_stats_table à partir de campaign_call_stats()"""
+    total = counts["total"]
+    completed = sum(counts["status"][status.value] for status in FINAL_STATUSES)
+    leads = counts["results"][CallResult.LEADS.value]
+
+    stats = {
+        "total": total,
+        "completed": completed,
+        "in_progress": sum(counts["status"][status.value] for status in ACTIVE_STATUSES),
+        "leads": leads,
+        "not_interested": counts["results"][CallResult.NOT_INTERESTED.value],
+        "callbacks": counts["results"][CallResult.NO_ANSWER.value],
+        "no_answer": counts["status"][CallStatus.NO_ANSWER.value],
+        "answering_machines": counts["amd"]["machine"],
+        "failed": counts["status"][CallStatus.FAILED.value],
+        "avg_duration": counts["avg_duration"],
+        "completion_rate": round(completed / total * 100, 1) if total else 0.0,
+        "lead_rate": round(leads / completed * 100, 1) if completed else 0.0,
+        "conversion_rate": round(leads / total * 100, 1) if total else 0.0,
+        "calls_per_minute": 0.0,
+        "campaign_duration": "N/A",
+    }
+    for sentiment, count in counts["sentiment"].items():
+        stats[f"sentiment_{sentiment}"] = count
+
+    if campaign.started_at:
+        elapsed = datetime.utcnow() - campaign.started_at
+        stats["campaign_duration"] = str(elapsed).split('.')[0]  # Format HH:MM:SS
+        if elapsed.total_seconds() > 0:
+            stats["calls_per_minute"] = round(completed / (elapsed.total_seconds() / 60), 2)
+
+    return stats
+
 def print_stats_table(campaign, stats):
     """Print formatted stats table"""
     print("\n" + "="*80)
@@ -84,9 +127,6 @@ def main():
 
     args = parser.parse_args()
 
-    # Initialize stats collector
-    collector = StatsCollector()
-
     db = SessionLocal()
 
     # Verify campaign exists
@@ -102,29 +142,13 @@ def main():
 
     try:
         while True:
-            # Récupérer stats from DB
-            calls = db.query(Call).filter(Call.campaign_id == args.campaign_id).all()
-
-            # Manually build stats (since collector may not have been used)
-            for call in calls:
-                # Record in collector if not already
-                if call.status == CallStatus.COMPLETED:
-                    if call.result:
-                        collector.record_call_event(
-                            campaign_id=args.campaign_id,
-                            event_type=call.result.value,
-                            data={
-                                "duration": call.duration,
-                                "sentiment": call.sentiment.value if call.sentiment else None
-                            }
-                        )
-
-            # Get live stats
-            stats = collector.get_live_stats(args.campaign_id)
-
             # Refresh campaign data
             db.refresh(campaign)
 
+            # Compteurs depuis la DB (rollup + appels en cours)
+            stats = build_stats(campaign, campaign_call_stats(db, args.campaign_id))
+            db.commit()  # Fin de transaction: le prochain refresh voit les nouveaux appels
+
             # Clear screen and display
             if not args.no_clear:
                 clear_screen()
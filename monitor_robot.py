@@ -30,7 +30,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from sqlalchemy import desc
 from system.database import SessionLocal
-from system.models import Call, CallStatus, Campaign, CampaignStatus
+from system.models import Call, CallStatus, CallResult, Campaign, CampaignStatus
+from system.call_stats import campaigns_call_stats
+from system.stats_rollup import FINAL_STATUSES
 from system.config import config
 
 # Couleurs
@@ -163,28 +165,30 @@ def get_recent_transcriptions(limit: int = 5) -> List[Dict[str, Any]]:
 
 
 def get_campaigns_summary() -> Dict[str, Any]:
-    """Récupère résumé des campagnes actives"""
+    """Récupère résumé des campagnes actives (compteurs: rollup + appels en cours, 2 requêtes)"""
     db = SessionLocal()
     try:
         running_campaigns = db.query(Campaign).filter(
             Campaign.status == CampaignStatus.RUNNING
         ).all()
+        counts = campaigns_call_stats(db, [campaign.id for campaign in running_campaigns])
 
         total_calls = 0
         total_leads = 0
 
         campaigns_info = []
         for campaign in running_campaigns:
-            stats = campaign.stats or {}
-            total_calls += stats.get("total", 0)
-            total_leads += stats.get("leads", 0)
+            stats = counts[campaign.id]
+            leads = stats["results"][CallResult.LEADS.value]
+            total_calls += stats["total"]
+            total_leads += leads
 
             campaigns_info.append({
                 "id": campaign.id,
                 "name": campaign.name,
-                "total": stats.get("total", 0),
-                "completed": stats.get("completed", 0),
-                "leads": stats.get("leads", 0)
+                "total": stats["total"],
+                "completed": sum(stats["status"][status.value] for status in FINAL_STATUSES),
+                "leads": leads
             })
 
         return {
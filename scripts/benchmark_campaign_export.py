@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Benchmark mémoire des exports de campagne (CSV / JSON / Parquet / Arrow)
+========================================================================
+
+Mesure, pour des campagnes de --sizes appels (100k et 1M par défaut), la
+mémoire maximale (RSS) et la durée de chaque export:
+
+- csv (before): export d'avant (.all() des (Call, Contact), CSV dans un
+  StringIO puis copie dans un BytesIO), limité à --legacy-max-calls
+- csv (stream): endpoint export_campaign_csv, corps consommé morceau par
+  morceau
+- json (stream): endpoint export_campaign_json
+- parquet (stream), arrow (stream): endpoints export_campaign_parquet /
+  export_campaign_arrow (compression EXPORT_COLUMNAR_COMPRESSION, ou
+  --compression); ignorés si pyarrow n'est pas installé
+- cli: export_campaign.py (fichier CSV + résumé)
+
+Taille du fichier produit et durée d'écriture comparées au CSV, plus la
+durée de relecture (Read): csv.reader / json.load / pq.read_table /
+ipc.open_stream, mesurée après le relevé de RSS.
+
+Chaque mesure tourne dans un processus séparé (RSS de départ identique,
+ru_maxrss non pollué par la mesure précédente). Les exports en flux
+doivent garder la même mémoire quelle que soit la taille de la campagne:
+code retour 1 si l'écart de RSS entre la plus petite et la plus grande
+campagne dépasse --max-growth-mb.
+
+Base SQLite temporaire (curseur paresseux: même comportement par lots
+que le curseur serveur PostgreSQL).
+
+Exemples:
+  python scripts/benchmark_campaign_export.py
+  python scripts/benchmark_campaign_export.py --sizes 50000 500000 --legacy-max-calls 50000
+  python scripts/benchmark_campaign_export.py --batch-size 5000
+  python scripts/benchmark_campaign_export.py --sizes 100000 --compression snappy
+"""
+
+import os
+import sys
+import json
+import asyncio
+import time
+import logging
+import argparse
+import resource
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+
+# Ajouter le répertoire parent au path pour imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from system.call_export import ARROW_AVAILABLE
+from system.database import Base
+from system.models import Call, Campaign, Contact, CallStatus, CallResult, Sentiment, CampaignStatus
+
+SEED_CHUNK = 20_000
+CONTACTS = 10_000
+STATUSES = [CallStatus.COMPLETED] * 6 + [CallStatus.NO_ANSWER] * 2 + [CallStatus.FAILED, CallStatus.PENDING]
+RESULTS = [CallResult.LEADS, CallResult.NOT_INTERESTED, CallResult.NO_ANSWER, None]
+METHODS = ["csv (before)", "csv (stream)", "json (stream)", "parquet (stream)", "arrow (stream)", "cli"]
+COLUMNAR_METHODS = {"parquet (stream)": "parquet", "arrow (stream)": "arrow"}
+
+
+def seed(Session, sizes: List[int]) -> Dict[int, int]:
+    """Une campagne par taille. Retourne {taille: campaign_id}."""
+    db = Session()
+    try:
+        contact_ids = db.execute(insert(Contact).returning(Contact.id), [
+            {"phone": f"+3393{i:08d}", "first_name": "Jean", "last_name": f"Dupont {i}", "company": "ACME"}
+            for i in range(CONTACTS)
+        ]).scalars().all()
+        campaigns = {}
+        for size in sizes:
+            campaign = Campaign(name=f"bench_export_{size}", scenario="bench", status=CampaignStatus.COMPLETED)
+            db.add(campaign)
+            db.flush()
+            for offset in range(0, size, SEED_CHUNK):
+                db.execute(insert(Call), [
+                    {
+                        "uuid": f"bench-export-{campaign.id}-{i}",
+                        "contact_id": contact_ids[i % CONTACTS],
+                        "campaign_id": campaign.id,
+                        "status": STATUSES[i % len(STATUSES)],
+                        "result": RESULTS[i % len(RESULTS)],
+                        "sentiment": list(Sentiment)[i % len(Sentiment)],
+                        "duration": i % 300,
+                        "amd_result": "human",
+                        "recording_path": f"recordings/{i}.wav" if i % 2 else None,
+                        "call_metadata": {"transcriptions": ["Bonjour", "Oui"], "intents": ["affirm"]},
+                        "qualification_data": {"budget": i % 5000, "decision_maker": bool(i % 3)} if i % 4 == 0 else None,
+                    }
+                    for i in range(offset, min(offset + SEED_CHUNK, size))
+                ])
+            campaigns[size] = campaign.id
+            db.commit()
+        return campaigns
+    finally:
+        db.close()
+
+
+def legacy_csv(db, campaign_id: int) -> bytes:
+    """Export d'avant: tous les (Call, Contact) en mémoire, StringIO puis BytesIO."""
+    import csv
+    import io
+
+    calls = (
+        db.query(Call, Contact)
+        .join(Contact, Call.contact_id == Contact.id)
+        .filter(Call.campaign_id == campaign_id)
+        .order_by(Call.created_at)
+        .all()
+    )
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=[
+        "phone", "first_name", "last_name", "email", "company", "status", "result", "duration",
+        "sentiment", "confidence", "amd_result", "created_at", "ended_at", "audio_link", "transcript_link"
+    ])
+    writer.writeheader()
+    for call, contact in calls:
+        writer.writerow({
+            "phone": contact.phone,
+            "first_name": contact.first_name or "",
+            "last_name": contact.last_name or "",
+            "email": contact.email or "",
+            "company": contact.company or "",
+            "status": call.status.value if call.status else "",
+            "result": call.result.value if call.result else "",
+            "duration": call.duration or 0,
+            "sentiment": call.sentiment.value if call.sentiment else "",
+            "confidence": call.sentiment_score or 0.0,
+            "amd_result": call.amd_result or "",
+            "created_at": call.created_at.isoformat() if call.created_at else "",
+            "ended_at": call.ended_at.isoformat() if call.ended_at else "",
+            "audio_link": f"http://localhost/api/exports/audio/{call.uuid}" if call.recording_path else "",
+            "transcript_link": "",
+        })
+    output.seek(0)
+    return io.BytesIO(output.read().encode("utf-8")).read()
+
+
+def read_back(method: str, path: str) -> int:
+    """Relit le fichier exporté (comme un analyste). Retourne le nombre de lignes."""
+    if method == "csv (stream)":
+        import csv
+        with open(path, newline="", encoding="utf-8") as f:
+            return sum(1 for _ in csv.reader(f)) - 1
+    if method == "json (stream)":
+        with open(path, encoding="utf-8") as f:
+            return len(json.load(f)["calls"])
+    if method == "parquet (stream)":
+        import pyarrow.parquet as pq
+        return pq.read_table(path).num_rows
+    import pyarrow as pa
+    with pa.OSFile(path, "rb") as f:
+        return pa.ipc.open_stream(f).read_all().num_rows
+
+
+def run_worker(args) -> int:
+    """Processus de mesure: un export, résultat JSON sur stdout."""
+    logging.disable(logging.INFO)
+    engine = create_engine(f"sqlite:///{args.db}")
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    import export_campaign
+    from system.api import exports as exports_api
+    exports_api.SessionLocal = export_campaign.SessionLocal = Session
+    if args.batch_size:
+        exports_api.config.EXPORT_BATCH_SIZE = args.batch_size
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    size = 0
+    output = None
+    start = time.perf_counter()
+    db = Session()
+    try:
+        if args.worker == "csv (before)":
+            size = len(legacy_csv(db, args.campaign_id))
+        elif args.worker == "cli":
+            cli_output = os.path.join(os.path.dirname(args.db), f"export_{args.campaign_id}.csv")
+            if not export_campaign.export_campaign_to_csv(args.campaign_id, cli_output, args.batch_size):
+                return 1
+            size = os.path.getsize(cli_output)
+        else:
+            if args.worker in COLUMNAR_METHODS:
+                fmt = COLUMNAR_METHODS[args.worker]
+                endpoint = exports_api.export_campaign_parquet if fmt == "parquet" else exports_api.export_campaign_arrow
+                response = endpoint(args.campaign_id, compression=args.compression, db=db)
+            else:
+                endpoint = exports_api.export_campaign_csv if args.worker == "csv (stream)" else exports_api.export_campaign_json
+                response = endpoint(args.campaign_id, db=db)
+            output = os.path.join(os.path.dirname(args.db), f"export_{args.campaign_id}_{args.worker.split()[0]}")
+
+            async def consume():
+                # body_iterator: générateur synchrone enveloppé par Starlette (threadpool)
+                written = 0
+                with open(output, "wb") as f:
+                    async for chunk in response.body_iterator:
+                        written += f.write(chunk)
+                return written
+
+            size = asyncio.run(consume())
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    read_seconds = None
+    if output:
+        start = time.perf_counter()
+        read_back(args.worker, output)
+        read_seconds = time.perf_counter() - start
+        os.remove(output)
+
+    print(json.dumps({
+        "seconds": elapsed,
+        "bytes": size,
+        "baseline_mb": baseline,
+        "peak_mb": peak,
+        "read_seconds": read_seconds,
+    }))
+    return 0
+
+
+def measure(db_path: str, method: str, campaign_id: int, batch_size, compression) -> Dict:
+    command = [sys.executable, __file__, "--worker", method, "--db", db_path, "--campaign-id", str(campaign_id)]
+    if batch_size:
+        command += ["--batch-size", str(batch_size)]
+    if compression:
+        command += ["--compression", compression]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{method} failed: {completed.stderr[-2000:]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mémoire des exports de campagne (avant / en flux)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000], help="Appels par campagne")
+    parser.add_argument("--legacy-max-calls", type=int, default=200_000,
+                        help="Taille max pour l'export d'avant (tout en mémoire)")
+    parser.add_argument("--batch-size", type=int, help="Lignes par lot (défaut: EXPORT_BATCH_SIZE)")
+    parser.add_argument("--compression", help="Compression Parquet / Arrow (défaut: EXPORT_COLUMNAR_COMPRESSION)")
+    parser.add_argument("--max-growth-mb", type=float, default=50, help="Écart de RSS toléré entre tailles (flux)")
+    parser.add_argument("--worker", choices=METHODS, help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--campaign-id", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return run_worker(args)
+
+    logging.disable(logging.INFO)
+    sizes = sorted(args.sizes)
+    methods = [method for method in METHODS if ARROW_AVAILABLE or method not in COLUMNAR_METHODS]
+    if not ARROW_AVAILABLE:
+        print("pyarrow not installed: Parquet / Arrow exports skipped")
+
+    with tempfile.TemporaryDirectory(prefix="bench_export_") as tmp:
+        db_path = os.path.join(tmp, "export.db")
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(bind=engine)
+        start = time.perf_counter()
+        campaigns = seed(sessionmaker(bind=engine), sizes)
+        engine.dispose()
+        print(f"Seeded {sum(sizes)} calls ({time.perf_counter() - start:.1f}s)")
+
+        results = {}
+        for size in sizes:
+            for method in methods:
+                if method == "csv (before)" and size > args.legacy_max_calls:
+                    continue
+                results[(method, size)] = measure(db_path, method, campaigns[size], args.batch_size, args.compression)
+
+    print(f"\n{'Method':<17} {'Calls':>10} {'Output':>10} {'vs CSV':>7} {'Time':>9} {'Read':>8} "
+          f"{'Peak RSS':>10} {'Export RSS':>11}")
+    print("-" * 90)
+    for (method, size), r in results.items():
+        ratio = r["bytes"] / results[("csv (stream)", size)]["bytes"]
+        read = f"{r['read_seconds']:>7.1f}s" if r["read_seconds"] is not None else f"{'-':>8}"
+        print(f"{method:<17} {size:>10} {r['bytes'] / 1e6:>8.1f}MB {ratio:>6.2f}x {r['seconds']:>8.1f}s {read} "
+              f"{r['peak_mb']:>8.0f}MB {r['peak_mb'] - r['baseline_mb']:>9.0f}MB")
+
+    growth = {
+        method: results[(method, sizes[-1])]["peak_mb"] - results[(method, sizes[0])]["peak_mb"]
+        for method in methods[1:]
+    }
+    print()
+    for method, delta in growth.items():
+        print(f"{method:<17} RSS {sizes[0]} → {sizes[-1]} calls: {delta:+.0f}MB")
+
+    failures = [method for method, delta in growth.items() if delta > args.max_growth_mb]
+    if failures:
+        print(f"\n❌ Memory grows with campaign size: {', '.join(failures)}")
+        return 1
+    print(f"\n✅ Streaming exports: flat memory ({sizes[0]} → {sizes[-1]} calls, tolerance {args.max_growth_mb:g}MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
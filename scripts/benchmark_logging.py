@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Benchmark du logging par tour d'appel: synchrone vs pipeline asynchrone
+=======================================================================
+
+Simule N appels concurrents (un thread par appel) qui loggent à chaque tour
+ce que loggue le robot pendant l'analyse d'intent:
+
+- legacy: ~35 lignes INFO en f-strings (bannières, tableaux), écrites par
+  le thread d'appel (RotatingFileHandler JSON fait main + console)
+- legacy-async: mêmes lignes, mais derrière le pipeline (QueueHandler +
+  thread écrivain + buffer par appel)
+- async: code actuel: 1 ligne INFO compacte + trace DEBUG en %-args,
+  derrière le pipeline (formatage seulement si l'appel est écrit)
+
+Mesures par tour, dans le thread d'appel: CPU (time.thread_time) et latence
+(p50/p99). Le CPU total du process (thread écrivain compris) est aussi
+affiché: le travail déplacé n'est pas gratuit, seul le travail jeté l'est.
+
+Exemples:
+  python scripts/benchmark_logging.py
+  python scripts/benchmark_logging.py --calls 50 --turns 40 --sample-rate 0.1
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import statistics
+import logging.handlers
+from pathlib import Path
+
+# Ajouter le répertoire parent au path pour imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from system.log_pipeline import LogPipeline, CompactJsonFormatter
+
+LEGACY_JSON_FORMAT = (
+    '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "module": "%(name)s", '
+    '"message": "%(message)s", "function": "%(funcName)s", "line": %(lineno)d}'
+)
+
+ALTERNATIVES = [("pas le temps", 0.82, "objection"), ("pas intéressé", 0.80, "deny"), ("rappeler", 0.74, "time")]
+
+
+def legacy_turn(log: logging.Logger, short_uuid: str, text: str):
+    """Lignes d'un tour avant le pipeline (_analyze_intent + find_best_match en INFO)"""
+    log.info(f"")
+    log.info(f"{'═'*60}")
+    log.info(f"🎯 INTENT ANALYSIS - _analyze_intent()")
+    log.info(f"{'═'*60}")
+    log.info(f"📝 Transcription: '{text}'")
+    log.info(f"📚 Theme: objections_finance")
+    log.info(f"{'─'*60}")
+    log.info(f"✅ ObjectionMatcher chargé: {412} entries, {1830} keywords")
+    log.info(f"🔍 OBJECTION MATCHER - ANALYSE DÉTAILLÉE")
+    log.info(f"📝 Input: '{text}'")
+    log.info(f"⚙️  Config: min_score={0.7}, total_entries={412}")
+    log.info(f"🔎 ÉTAPE 1: Lookup direct (O(1))...")
+    log.info(f"   ❌ Pas de match direct")
+    log.info(f"🔎 ÉTAPE 1b: Lookup phonétique (O(1))...")
+    log.info(f"   ❌ Pas de variante phonétique")
+    log.info(f"{'─'*60}")
+    log.info(f"🔎 ÉTAPE 2: Fuzzy matching (word boundary + RapidFuzz)...")
+    log.info(f"   📊 TOP {3} après tri:")
+    for i, (kw, score, entry_type) in enumerate(ALTERNATIVES, 1):
+        log.info(f"   {'→' if i == 1 else ' '} {i}. [{entry_type}] '{kw}' (len={len(kw)}) = {score:.2f} ✓")
+    log.info(f"   💡 Raison: score supérieur ({0.82:.2f} > {0.80:.2f})")
+    log.info(f"{'─'*60}")
+    log.info(f"🏆 RÉSULTAT FINAL: [objection] 'pas le temps'")
+    log.info(f"   Score: {0.82:.2f} | Méthode: fuzzy | Len: {12}")
+    log.info(f"{'═'*60}")
+    log.info(f"🔄 MAPPING entry_type → intent:")
+    log.info(f"   entry_type='objection' → intent='objection' (réponse audio)")
+    log.info(f"   📋 Alternatives: {', '.join([f'{kw}({t}):{s:.2f}' for kw, s, t in ALTERNATIVES])}")
+    log.info(f"{'─'*60}")
+    log.info(f"🏆 RÉSULTAT _analyze_intent:")
+    log.info(f"   Intent: OBJECTION")
+    log.info(f"   Confidence: {0.82:.2f}")
+    log.info(f"   Keyword: 'pas le temps' (len={12})")
+    log.info(f"   Entry type: objection")
+    log.info(f"   Latency: {3.2:.1f}ms")
+    log.info(f"{'═'*60}")
+    log.info(f"[{short_uuid}] Navigation: offre -> objection_temps (intent: objection)")
+
+
+def current_turn(log: logging.Logger, short_uuid: str, text: str):
+    """Lignes d'un tour avec le code actuel (INFO compact + trace DEBUG lazy)"""
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🎯 INTENT ANALYSIS - _analyze_intent()")
+        log.debug("📝 Transcription: '%s'", text)
+        log.debug("📚 Theme: %s", "objections_finance")
+        log.debug("✅ ObjectionMatcher chargé: %d entries, %d keywords", 412, 1830)
+        log.debug("🔄 MAPPING entry_type='%s' → intent='%s'", "objection", "objection")
+        log.debug("   📋 Alternatives: %s", ', '.join(f'{kw}({t}):{s:.2f}' for kw, s, t in ALTERNATIVES))
+    log.info(
+        "🎯 Intent: %s (conf=%.2f, keyword='%s', entry_type=%s, theme=%s, %.1fms)",
+        "OBJECTION", 0.82, "pas le temps", "objection", "objections_finance", 3.2
+    )
+    log.info("[%s] Navigation: %s -> %s (intent: %s)", short_uuid, "offre", "objection_temps", "objection")
+
+
+def build_logger(mode: str, log_dir: Path, console, pipeline):
+    """Logger isolé (pas de propagation) avec fichier + console, branché ou non sur le pipeline"""
+    log = logging.getLogger(f"bench.{mode}")
+    log.handlers.clear()
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / f"{mode}.log", maxBytes=50 * 1024 * 1024, backupCount=1, encoding="utf-8"
+    )
+    console_handler = logging.StreamHandler(console)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s'))
+
+    if mode == "legacy":
+        file_handler.setFormatter(logging.Formatter(LEGACY_JSON_FORMAT))
+    else:
+        file_handler.setFormatter(CompactJsonFormatter())
+
+    log.addHandler(file_handler)
+    log.addHandler(console_handler)
+    if pipeline:
+        pipeline.attach(log)
+    return log
+
+
+def run_mode(mode: str, calls: int, turns: int, sample_rate: float, log_dir: Path, console):
+    pipeline = LogPipeline(queue_size=200000, sample_rate=sample_rate) if mode != "legacy" else None
+    log = build_logger(mode, log_dir, console, pipeline)
+    emit_turn = current_turn if mode == "async" else legacy_turn
+
+    cpu_us, wall_us = [], []
+    lock = threading.Lock()
+    barrier = threading.Barrier(calls)
+
+    def call_thread(index: int):
+        call_uuid = f"{index:08d}-bench"
+        local_cpu, local_wall = [], []
+        barrier.wait()
+        if pipeline:
+            pipeline.begin_call(call_uuid)
+        for turn in range(turns):
+            cpu_start, wall_start = time.thread_time(), time.perf_counter()
+            emit_turn(log, call_uuid[:8], f"non j'ai pas le temps là tour {turn}")
+            local_wall.append((time.perf_counter() - wall_start) * 1e6)
+            local_cpu.append((time.thread_time() - cpu_start) * 1e6)
+        if pipeline:
+            pipeline.end_call(call_uuid)
+        with lock:
+            cpu_us.extend(local_cpu)
+            wall_us.extend(local_wall)
+
+    process_start, wall_start = time.process_time(), time.perf_counter()
+    threads = [threading.Thread(target=call_thread, args=(i,)) for i in range(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    calls_done = time.perf_counter() - wall_start
+    if pipeline:
+        pipeline.stop()  # Attendre que le thread écrivain ait tout écrit
+    total_wall = time.perf_counter() - wall_start
+    process_cpu = time.process_time() - process_start
+
+    for handler in list(log.handlers):
+        handler.close()
+    log.handlers.clear()
+
+    wall_sorted = sorted(wall_us)
+    return {
+        "mode": mode,
+        "cpu_turn": statistics.mean(cpu_us),
+        "p50": wall_sorted[len(wall_sorted) // 2],
+        "p99": wall_sorted[int(len(wall_sorted) * 0.99) - 1],
+        "calls_s": calls_done,
+        "total_s": total_wall,
+        "process_cpu_turn": process_cpu / len(cpu_us) * 1e6,
+        "file_kb": sum(f.stat().st_size for f in log_dir.glob(f"{mode}.log*")) / 1024,
+        "stats": pipeline.get_stats() if pipeline else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark logging synchrone vs pipeline asynchrone")
+    parser.add_argument("--calls", type=int, default=20, help="Appels concurrents (threads)")
+    parser.add_argument("--turns", type=int, default=30, help="Tours par appel")
+    parser.add_argument("--sample-rate", type=float, default=0.05, help="Part des appels écrits en entier")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_logging_") as tmp, open(os.devnull, "w", encoding="utf-8") as console:
+        log_dir = Path(tmp)
+        results = [
+            run_mode(mode, args.calls, args.turns, args.sample_rate, log_dir, console)
+            for mode in ("legacy", "legacy-async", "async")
+        ]
+
+    print(f"\n{args.calls} calls x {args.turns} turns (sample rate {args.sample_rate:.0%})\n")
+    print(f"{'Mode':<14} {'CPU/turn':>10} {'p50':>9} {'p99':>9} {'Calls':>8} {'Drained':>8} {'CPU/turn':>10} {'File':>9}")
+    print(f"{'':<14} {'(call)':>10} {'(call)':>9} {'(call)':>9} {'':>8} {'':>8} {'(process)':>10} {'':>9}")
+    print("-" * 84)
+    for r in results:
+        print(
+            f"{r['mode']:<14} {r['cpu_turn']:>8.0f}µs {r['p50']:>7.0f}µs {r['p99']:>7.0f}µs "
+            f"{r['calls_s']:>7.2f}s {r['total_s']:>7.2f}s {r['process_cpu_turn']:>8.0f}µs {r['file_kb']:>7.0f}KB"
+        )
+    for r in results:
+        if r["stats"]:
+            s = r["stats"]
+            print(
+                f"\n{r['mode']}: {s['calls_flushed']} calls flushed, {s['calls_discarded']} discarded "
+                f"({s['records_discarded']} records never formatted), {s['dropped']} dropped"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark du routage par tour: scénario JSON brut vs CompiledScenario
+=====================================================================
+
+Rejoue des tours (étape, intent) tirés du scénario et mesure le coût des
+appels faits par le robot à chaque tour:
+get_step_config, get_next_step, get_theme_file, get_max_autonomous_turns,
+is_determinant_step, get_qualification_weight, get_next_rail_step.
+
+Les deux chemins doivent donner exactement les mêmes résultats (vérifié
+avant la mesure).
+
+Exemples:
+  python scripts/benchmark_scenario_routing.py
+  python scripts/benchmark_scenario_routing.py --scenario scen_test --turns 200000
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import logging
+from pathlib import Path
+
+# Ajouter le répertoire parent au path pour imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from system.config import config
+from system.scenarios import ScenarioManager, CompiledScenario
+
+logging.basicConfig(level=logging.ERROR)
+
+logger = logging.getLogger(__name__)
+
+# Intents hors mapping (chemin wildcard "*" / fallback)
+EXTRA_INTENTS = ["unknown", "not_understood", "insult", "time"]
+
+
+def route_turn(manager: ScenarioManager, scenario, step: str, intent: str):
+    """Un tour de routage tel que fait par le robot"""
+    return (
+        manager.get_step_config(scenario, step) is not None,
+        manager.get_next_step(scenario, step, intent),
+        manager.get_theme_file(scenario),
+        manager.get_max_autonomous_turns(scenario, step),
+        manager.is_determinant_step(scenario, step),
+        manager.get_qualification_weight(scenario, step),
+        manager.get_next_rail_step(scenario, step),
+    )
+
+
+def build_turns(raw: dict, count: int, seed: int):
+    """Tours (étape, intent) aléatoires: intents mappés + inconnus, casse variée"""
+    rng = random.Random(seed)
+    steps = list(raw["steps"].keys())
+    turns = []
+    for _ in range(count):
+        step = rng.choice(steps)
+        intents = list(raw["steps"][step].get("intent_mapping", {}).keys()) + EXTRA_INTENTS
+        if rng.random() < 0.1:
+            step = step.upper()  # lookup insensible à la casse
+        turns.append((step, rng.choice(intents)))
+    return turns
+
+
+def bench(manager: ScenarioManager, scenario, turns, repeat: int) -> float:
+    """Meilleur temps (ns/tour) sur `repeat` passes"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for step, intent in turns:
+            route_turn(manager, scenario, step, intent)
+        best = min(best, (time.perf_counter_ns() - start) / len(turns))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark routage scénario (brut vs compilé)')
+    parser.add_argument('--scenario', default='scenario_reference', help='Nom du scénario (scenarios/*.json)')
+    parser.add_argument('--turns', type=int, default=50000, help='Nombre de tours simulés')
+    parser.add_argument('--repeat', type=int, default=5, help='Passes (meilleur temps retenu)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    path = config.BASE_DIR / "scenarios" / f"{args.scenario}.json"
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+
+    manager = ScenarioManager()
+    if not manager._validate_scenario(raw):
+        # load_scenario() le refuserait, mais le routage reste mesurable
+        print(f"⚠️  Scénario non valide pour load_scenario(): {path.name} (benchmark du routage seulement)")
+
+    compile_start = time.perf_counter()
+    compiled = CompiledScenario(args.scenario, raw)
+    compile_ms = (time.perf_counter() - compile_start) * 1000
+
+    turns = build_turns(raw, args.turns, args.seed)
+
+    # Équivalence avant mesure
+    mismatches = [
+        (step, intent) for step, intent in turns
+        if route_turn(manager, raw, step, intent) != route_turn(manager, compiled, step, intent)
+    ]
+    if mismatches:
+        print(f"❌ {len(mismatches)} tours divergents, ex: {mismatches[:3]}")
+        return 1
+
+    raw_ns = bench(manager, raw, turns, args.repeat)
+    compiled_ns = bench(manager, compiled, turns, args.repeat)
+
+    print("=" * 60)
+    print(f"Routage scénario '{args.scenario}' - {len(turns)} tours")
+    print("=" * 60)
+    print(f"Étapes: {len(compiled.step_names)} | Intents: {len(compiled.intent_ids)} | Compilation: {compile_ms:.2f}ms")
+    print(f"JSON brut:  {raw_ns / 1000:8.2f} µs/tour")
+    print(f"Compilé:    {compiled_ns / 1000:8.2f} µs/tour  (x{raw_ns / compiled_ns:.1f})")
+    print("✅ Résultats identiques sur tous les tours")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Budgets d'import des points d'entrée CLI/API
+============================================
+
+Lance `python -X importtime -c "import <module>"` pour chaque point d'entrée
+(process neuf, cwd = racine du projet) et vérifie:
+1. le temps d'import cumulé (meilleur de N essais) <= budget en ms
+2. aucun module "lourd" (modèles IA, robot, ESL) n'est importé
+
+Code retour 1 si un budget est dépassé ou un module interdit est chargé:
+utilisable tel quel en CI ou en hook pre-commit.
+
+Options:
+  --runs N          Essais par point d'entrée, on garde le meilleur (défaut: 3)
+  --scale X         Multiplie tous les budgets (machine lente: --scale 2)
+  --only MODULE     Vérifier un seul point d'entrée (répétable)
+  --top N           Affiche les N imports les plus coûteux de chaque point d'entrée
+
+Exemples:
+  # Vérifier tous les points d'entrée
+  python scripts/check_import_budget.py
+
+  # CI sur runner partagé (budgets x2)
+  python scripts/check_import_budget.py --scale 2
+
+  # Diagnostiquer l'API
+  python scripts/check_import_budget.py --only system.api.main --top 15
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+LOADED_MARKER = "@@loaded-modules@@"
+
+# Point d'entrée → budget (ms, import cumulé). Le socle incompressible est
+# SQLAlchemy (~300ms) pour les CLI et FastAPI + SQLAlchemy (~600ms) pour l'API.
+# Budget = 1.5 x la plus haute médiane mesurée (15 essais par run, plusieurs
+# runs/machines), arrondi à la centaine: une régression réelle dépasse, le
+# bruit d'un runner chargé non. Médianes observées en commentaire.
+ENTRY_POINT_BUDGETS_MS: Dict[str, int] = {
+    "create_scenario": 100,           # 15-17ms
+    "import_contacts": 700,           # 300-460ms
+    "launch_campaign": 700,           # 310-450ms
+    "monitor_campaign": 700,          # 290-300ms
+    "export_campaign": 700,           # 290-305ms
+    "system.batch_caller": 700,       # 290-340ms
+    "system.campaign_manager": 700,   # 310ms
+    "system.api.main": 1200,          # 590-770ms
+}
+
+# Modules qui ne doivent jamais être importés par un point d'entrée
+# (chargés uniquement par le process robot, à la demande)
+FORBIDDEN_MODULES = (
+    "torch",
+    "ctranslate2",
+    "faster_whisper",
+    "vosk",
+    "webrtcvad",
+    "noisereduce",
+    "pyarrow",  # Export Parquet / Arrow: import paresseux
+    "ESL",
+    "system.robot_freeswitch",
+    "system.services.faster_whisper_stt",
+    "system.services.amd_service",
+    "system.services.vosk_asr",
+)
+
+
+def measure_import(module: str) -> Tuple[float, List[Tuple[int, str]], Set[str]]:
+    """
+    Import de `module` dans un process neuf avec -X importtime.
+
+    Returns:
+        (cumulé en ms, [(cumulé µs, nom), ...] de tous les imports,
+         modules effectivement chargés (sys.modules du process fils))
+    """
+    # -X importtime liste aussi les imports qui ont échoué (try/except ImportError):
+    # les modules interdits sont vérifiés sur sys.modules après l'import
+    code = (
+        f"import {module}, sys; "
+        f"sys.stderr.write({LOADED_MARKER!r} + ','.join(sys.modules) + '\\n')"
+    )
+    env = dict(os.environ, PYTHONPATH=str(BASE_DIR))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        last_line = proc.stderr.strip().splitlines()[-1:] or ["?"]
+        raise RuntimeError(f"import {module} failed: {last_line[0]}")
+
+    imports = []
+    loaded: Set[str] = set()
+    total_us = None
+    for line in proc.stderr.splitlines():
+        if line.startswith(LOADED_MARKER):
+            loaded = set(line[len(LOADED_MARKER):].split(","))
+            continue
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        try:
+            cumulative_us = int(cumulative)
+        except ValueError:
+            continue  # En-tête "self [us] | cumulative | imported package"
+        imports.append((cumulative_us, name.strip()))
+        if name.strip() == module:
+            total_us = cumulative_us
+
+    if total_us is None:
+        raise RuntimeError(f"import {module}: no importtime line for the module")
+    return total_us / 1000, imports, loaded
+
+
+def forbidden_in(loaded: Set[str]) -> List[str]:
+    """Modules interdits chargés (module exact ou sous-module)."""
+    return sorted(
+        forbidden for forbidden in FORBIDDEN_MODULES
+        if forbidden in loaded or any(name.startswith(forbidden + ".") for name in loaded)
+    )
+
+
+def check_entry_point(module: str, budget_ms: float, runs: int, top: int) -> Optional[str]:
+    """Mesure un point d'entrée, affiche le résultat. Retourne l'erreur éventuelle."""
+    best_ms = None
+    imports: List[Tuple[int, str]] = []
+    loaded: Set[str] = set()
+    for _ in range(runs):
+        elapsed_ms, run_imports, loaded = measure_import(module)
+        if best_ms is None or elapsed_ms < best_ms:
+            best_ms, imports = elapsed_ms, run_imports
+
+    forbidden = forbidden_in(loaded)
+    over = best_ms > budget_ms
+    status = "❌" if over or forbidden else "✅"
+    print(f"{status} {module:<26} {best_ms:>7.0f}ms / {budget_ms:>5.0f}ms")
+
+    if top:
+        for cumulative_us, name in sorted(imports, reverse=True)[1:top + 1]:
+            print(f"      {cumulative_us / 1000:>7.1f}ms  {name}")
+
+    if forbidden:
+        return f"{module}: forbidden imports {', '.join(forbidden)}"
+    if over:
+        return f"{module}: {best_ms:.0f}ms > budget {budget_ms:.0f}ms"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Vérifie les budgets d'import (python -X importtime) des points d'entrée",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Essais par point d'entrée (meilleur gardé)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplicateur des budgets")
+    parser.add_argument("--only", action="append", help="Point d'entrée à vérifier (répétable)")
+    parser.add_argument("--top", type=int, default=0, help="Afficher les N imports les plus coûteux")
+    args = parser.parse_args()
+
+    entry_points = args.only or list(ENTRY_POINT_BUDGETS_MS)
+    unknown = [module for module in entry_points if module not in ENTRY_POINT_BUDGETS_MS]
+    if unknown:
+        parser.error(f"unknown entry point(s): {', '.join(unknown)}")
+
+    errors = []
+    for module in entry_points:
+        try:
+            error = check_entry_point(
+                module, ENTRY_POINT_BUDGETS_MS[module] * args.scale, max(1, args.runs), args.top
+            )
+        except RuntimeError as e:
+            print(f"❌ {module:<26} {e}")
+            error = str(e)
+        if error:
+            errors.append(error)
+
+    if errors:
+        print(f"\n{len(errors)} entry point(s) over budget:")
+        for error in errors:
+            print(f"  - {error}")
+        return 1
+
+    print(f"\n✅ {len(entry_points)} entry points within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
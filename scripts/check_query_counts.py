@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Nombre de requêtes SQL par lot de la boucle d'appels (détection N+1)
+====================================================================
+
+Exécute les chemins par lot du BatchCaller sur une base SQLite temporaire,
+pour plusieurs tailles de lot, et compte les instructions SQL envoyées
+(événement before_cursor_execute; un executemany compte pour une):
+
+- _process_queue: campagnes RUNNING, compteurs d'appels actifs, réservation
+  (UPDATE ... RETURNING), appels + contacts, annulation des contacts en
+  blocklist et upsert du rollup des statistiques
+- _process_retry: UPDATE ... FROM campaigns ... RETURNING (un par statut
+  NO_ANSWER/BUSY sur SQLite, un seul sur PostgreSQL), upsert du rollup
+- _update_active_calls: fin d'un lot d'appels (un SELECT, un flush, upsert
+  du rollup). Les fins d'appel passent par le vrai RobotFreeSWITCH
+  (registre d'appels, _hangup_call, _handle_channel_hangup, get_call_info):
+  chaque appel doit finir avec le statut / résultat attendu, aucun ne doit
+  rester CALLING
+
+Le nombre d'instructions doit être le même quelle que soit la taille du
+lot, et le rollup (campaign_stats_rollup) égal aux comptages bruts après
+ces trois chemins. Code retour 1 sinon (un N+1 est revenu, une écriture
+n'a pas mis le rollup à jour, ou une fin d'appel est perdue).
+
+Seul le transport FreeSWITCH est simulé (pas de connexion ESL, événements
+CHANNEL_HANGUP_COMPLETE construits ici); aucun originate: les jobs restent
+dans le dispatcher, non démarré. L'écriture du résultat d'un originate
+reste un UPDATE par appel: chaque originate se termine à son rythme (voir
+CallDispatcher).
+
+Exemples:
+  python scripts/check_query_counts.py
+  python scripts/check_query_counts.py --sizes 2 5 25 100 --verbose
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+# Ajouter le répertoire parent au path pour imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import sessionmaker
+
+import system.batch_caller as batch_caller_module
+import system.logger as logger_module
+from system.batch_caller import BatchCaller
+from system.database import Base
+from system.models import Call, Campaign, Contact, CallStatus, CallResult, CampaignStatus
+from system.call_queue import CallQueue
+from system.call_dispatcher import CallDispatcher
+from system.call_session import CallRegistry, STATE_ANSWERED
+from system.robot_freeswitch import RobotFreeSWITCH
+from system import stats_rollup
+
+# Fin attendue par UUID "uuid-<id>-<0|1|2>": 0 = sonne sans réponse, 1 = décroché, lead
+# (raccroché par le robot), 2 = décroché, services robot indisponibles (raccroché en FAILED)
+EXPECTED_END = {
+    "0": (CallStatus.NO_ANSWER, None),
+    "1": (CallStatus.COMPLETED, CallResult.LEADS),
+    "2": (CallStatus.FAILED, None),
+}
+
+
+class FakeEvent:
+    """Événement ESL (seul getHeader est utilisé par les handlers)."""
+
+    def __init__(self, **headers):
+        self.headers = headers
+
+    def getHeader(self, name: str):
+        return self.headers.get(name)
+
+
+def build_robot() -> RobotFreeSWITCH:
+    """Vrai RobotFreeSWITCH sans FreeSWITCH ni modèles: registre et handlers d'événements réels."""
+    robot = RobotFreeSWITCH.__new__(RobotFreeSWITCH)
+    robot.calls = CallRegistry()
+    robot.streaming_asr = None
+    robot.esl_conn_api = None
+    robot.esl_api_lock = threading.Lock()
+    robot._execute_esl_command = lambda cmd: None  # uuid_kill / uuid_break: pas de connexion ESL
+    return robot
+
+
+def end_call(robot: RobotFreeSWITCH, uuid: str):
+    """Fin d'un appel comme en production: événements et registre du robot."""
+    if uuid.endswith("1"):
+        robot.calls.open(uuid, answered_at=time.time() - 30, state=STATE_ANSWERED)
+        robot._hangup_call(uuid, CallResult.LEADS)
+        cause = "NORMAL_CLEARING"
+    elif uuid.endswith("2"):
+        robot.calls.open(uuid, answered_at=time.time() - 5, state=STATE_ANSWERED)
+        robot._hangup_call(uuid, CallStatus.FAILED)
+        cause = "NORMAL_CLEARING"
+    else:
+        robot.calls.open(uuid)
+        cause = "NO_ANSWER"
+    robot._handle_channel_hangup(uuid, FakeEvent(**{"Hangup-Cause": cause}))
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.statements: List[str] = []
+        self.enabled = False
+        event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        if self.enabled:
+            self.statements.append(" ".join(statement.split())[:100])
+
+    def measure(self, func) -> List[str]:
+        self.statements = []
+        self.enabled = True
+        try:
+            func()
+        finally:
+            self.enabled = False
+        return self.statements
+
+
+def build_caller(robot: RobotFreeSWITCH) -> BatchCaller:
+    """BatchCaller sans FreeSWITCH: seuls les chemins DB sont exercés."""
+    caller = BatchCaller.__new__(BatchCaller)
+    caller.robot = robot
+    caller.running = True
+    caller.max_concurrent = 10 ** 6
+    caller.delay_between_calls = 0.0
+    caller.queue = CallQueue(worker_id="query-count")
+    caller.worker_id = caller.queue.worker_id
+    caller.dispatcher = CallDispatcher(robot, queue=caller.queue)  # Non démarré: submit() ne fait que stocker
+    caller.active_calls = {}
+    caller._active_lock = threading.Lock()
+    caller.total_launched = 0
+    return caller
+
+
+def run_size(size: int, tmp_dir: str) -> Dict[str, List[str]]:
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, f'batch_{size}.db')}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    batch_caller_module.SessionLocal = Session
+    counter = StatementCounter(engine)
+
+    # Une campagne RUNNING de `size` appels PENDING (1 sur 4 en blocklist, dès le 2e)
+    db = Session()
+    try:
+        campaign = Campaign(
+            name=f"query_count_{size}", scenario="bench", status=CampaignStatus.RUNNING,
+            max_concurrent_calls=size, batch_size=size, retry_enabled=True
+        )
+        db.add(campaign)
+        db.flush()
+        contact_ids = db.execute(insert(Contact).returning(Contact.id), [
+            {"phone": f"+3397{i:08d}", "blacklist": i % 4 == 1} for i in range(size)
+        ]).scalars().all()
+        db.execute(insert(Call), [
+            {"uuid": f"qc-{size}-{i}", "contact_id": contact_id, "campaign_id": campaign.id,
+             "status": CallStatus.PENDING, "max_retries": 3}
+            for i, contact_id in enumerate(contact_ids)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+    robot = build_robot()
+    caller = build_caller(robot)
+    results = {}
+    results["_process_queue"] = counter.measure(caller._process_queue)
+    claimed = caller.dispatcher.get_stats()["pending"]
+
+    # Les jobs réservés passent en CALLING et sont suivis (comme après l'originate)
+    db = Session()
+    try:
+        launched = db.execute(select(Call.id).where(Call.status == CallStatus.QUEUED)).scalars().all()
+        for index, call_id in enumerate(launched):
+            db.query(Call).filter(Call.id == call_id).update({"status": CallStatus.CALLING})
+            caller.active_calls[f"uuid-{call_id}-{index % 3}"] = {
+                "call_id": call_id, "campaign_id": 1, "started_at": time.time()
+            }
+        db.commit()
+    finally:
+        db.close()
+
+    for uuid in list(caller.active_calls):
+        end_call(robot, uuid)
+
+    expected = {info["call_id"]: EXPECTED_END[uuid[-1]] for uuid, info in caller.active_calls.items()}
+    results["_update_active_calls"] = counter.measure(caller._update_active_calls)
+
+    db = Session()
+    try:
+        ended = dict(
+            (call_id, (status, result)) for call_id, status, result in
+            db.execute(select(Call.id, Call.status, Call.result).where(Call.id.in_(list(expected))))
+        )
+        results["_lost_call_ends"] = sum(1 for call_id, end in expected.items() if ended.get(call_id) != end)
+    finally:
+        db.close()
+    results["_process_retry"] = counter.measure(caller._process_retry)
+    results["_claimed"] = claimed
+
+    db = Session()
+    try:
+        results["_rollup_differences"] = len(stats_rollup.check(db))
+    finally:
+        db.close()
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requêtes SQL par lot dans la boucle d'appels (N+1)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 10, 50], help="Tailles de lot testées")
+    parser.add_argument("--verbose", action="store_true", help="Afficher les instructions du plus grand lot")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)  # Logs "Call ended" par appel: seules les requêtes comptent ici
+
+    with tempfile.TemporaryDirectory(prefix="query_counts_") as tmp:
+        # Fichiers de log par appel (get_logger("calls", call_uuid=...) dans
+        # _handle_calls_end): dans tmp, pas dans le logs/ du dépôt
+        logger_module.LOGS_DIR = Path(tmp) / "logs"
+        logger_module.LOG_DIRS = {category: logger_module.LOGS_DIR / category for category in logger_module.LOG_DIRS}
+        for log_dir in logger_module.LOG_DIRS.values():
+            log_dir.mkdir(parents=True, exist_ok=True)
+
+        runs = {size: run_size(size, tmp) for size in args.sizes}
+
+    paths = ("_process_queue", "_update_active_calls", "_process_retry")
+    print(f"\n{'Path':<22}" + "".join(f"{f'batch {size}':>10}" for size in args.sizes))
+    print("-" * (22 + 10 * len(args.sizes)))
+    for path in paths:
+        print(f"{path:<22}" + "".join(f"{len(runs[size][path]):>10}" for size in args.sizes))
+    print(f"{'(calls claimed)':<22}" + "".join(f"{runs[size]['_claimed']:>10}" for size in args.sizes))
+    print(f"{'(rollup differences)':<22}" + "".join(f"{runs[size]['_rollup_differences']:>10}" for size in args.sizes))
+    print(f"{'(lost call ends)':<22}" + "".join(f"{runs[size]['_lost_call_ends']:>10}" for size in args.sizes))
+
+    if args.verbose:
+        largest = max(args.sizes)
+        for path in paths:
+            print(f"\n{path} (batch {largest}):")
+            for statement in runs[largest][path]:
+                print(f"  {statement}")
+
+    failures = [
+        path for path in paths
+        if len({len(runs[size][path]) for size in args.sizes}) > 1
+    ]
+    if failures:
+        print(f"\n❌ Statement count grows with batch size: {', '.join(failures)}")
+        return 1
+    if any(runs[size]["_lost_call_ends"] for size in args.sizes):
+        print("\n❌ Ended calls not recorded with their final status (robot.get_call_info / _handle_calls_end)")
+        return 1
+    if any(runs[size]["_rollup_differences"] for size in args.sizes):
+        print("\n❌ Stats rollup differs from raw call counts (see system/stats_rollup.py)")
+        return 1
+
+    print(f"\n✅ Constant statements per batch ({', '.join(str(size) for size in args.sizes)} calls)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
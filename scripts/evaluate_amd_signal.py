@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Évaluation offline du pré-classifieur AMD signal
+=================================================
+
+Rejoue des WAV étiquetés à travers AMDService.classify_signal() comme en
+production: analyse toutes les 200ms dès AMD_SIGNAL_MIN_WINDOW_S secondes
+d'audio, jusqu'à AMD_SIGNAL_MAX_WINDOW_S (première décision HUMAN/MACHINE
+retenue, sinon UNSURE → l'ASR décide).
+
+Étiquettes:
+- sous-dossiers:   <dossier>/human/*.wav, <dossier>/machine/*.wav
+- ou préfixe:      human_xxx.wav, machine_xxx.wav
+
+Mesures:
+- matrice de confusion, précision sur les appels décidés, taux UNSURE
+- temps d'audio nécessaire à la décision (moyen/p95)
+- coût CPU d'une analyse (moyen/p95)
+
+En production le pré-classifieur tourne en AMD_SIGNAL_MODE=shadow (décision
+loggée "AMD signal shadow: X vs Y", jamais appliquée): passer à
+AMD_SIGNAL_MODE=on seulement si les faux MACHINE mesurés ici sur des
+appels étiquetés sont acceptables.
+
+Exemples:
+  python scripts/evaluate_amd_signal.py recordings/amd_labeled
+  python scripts/evaluate_amd_signal.py recordings/amd_labeled --verbose
+  python scripts/evaluate_amd_signal.py recordings/amd_labeled --json results.json
+"""
+
+import sys
+import json
+import wave
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Ajouter le répertoire parent au path pour imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from system.config import config
+from system.services.amd_service import AMDService
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s | %(levelname)-8s | %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+LABELS = ("HUMAN", "MACHINE")
+RESULTS = ("HUMAN", "MACHINE", "UNSURE")
+SAMPLE_RATE = 16000
+STEP_S = 0.2
+
+
+def label_for(path: Path) -> Optional[str]:
+    """Étiquette depuis le dossier parent ou le préfixe du fichier"""
+    for name in (path.parent.name, path.stem.split("_")[0]):
+        if name.upper() in LABELS:
+            return name.upper()
+    return None
+
+
+def load_pcm(path: Path) -> np.ndarray:
+    """Charge un WAV en int16 mono 16kHz (resample linéaire si besoin)"""
+    try:
+        import soundfile as sf
+        data, rate = sf.read(str(path), dtype="int16", always_2d=True)
+        data = data[:, 0]
+    except Exception:
+        with wave.open(str(path), "rb") as wav:
+            rate = wav.getframerate()
+            channels = wav.getnchannels()
+            data = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+            data = data[::channels]
+
+    if rate != SAMPLE_RATE and len(data):
+        positions = np.arange(0, len(data), rate / SAMPLE_RATE)
+        data = np.interp(positions, np.arange(len(data)), data).astype(np.int16)
+    return data
+
+
+def evaluate_file(amd: AMDService, pcm: np.ndarray) -> Tuple[Dict, List[float]]:
+    """Analyse incrémentale d'un fichier, retourne (décision, latences CPU ms)"""
+    latencies = []
+    window_s = config.AMD_SIGNAL_MIN_WINDOW_S
+    result = {"result": "UNSURE", "reason": "empty", "confidence": 0.0}
+
+    while True:
+        head = pcm[:int(window_s * SAMPLE_RATE)]
+        result = amd.classify_signal(head, SAMPLE_RATE)
+        latencies.append(result["latency_ms"])
+        result["decision_s"] = len(head) / SAMPLE_RATE
+        if result["result"] != "UNSURE" or window_s >= config.AMD_SIGNAL_MAX_WINDOW_S or len(head) >= len(pcm):
+            return result, latencies
+        window_s = min(window_s + STEP_S, config.AMD_SIGNAL_MAX_WINDOW_S)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Évaluation offline du pré-classifieur AMD signal (WAV étiquetés)'
+    )
+    parser.add_argument('folder', help='Dossier de WAV (human/, machine/ ou préfixes)')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Détail par fichier')
+    parser.add_argument('--json', metavar='FILE', help='Export des résultats en JSON')
+    args = parser.parse_args()
+
+    folder = Path(args.folder)
+    files = [(path, label_for(path)) for path in sorted(folder.rglob("*.wav"))]
+    skipped = [path for path, label in files if not label]
+    files = [(path, label) for path, label in files if label]
+
+    if not files:
+        print(f"❌ Aucun WAV étiqueté dans {folder} (human/, machine/ ou human_*.wav)")
+        return 1
+
+    amd = AMDService()
+    confusion = {label: {result: 0 for result in RESULTS} for label in LABELS}
+    decision_times = []
+    cpu_latencies = []
+    details = []
+
+    for path, label in files:
+        result, latencies = evaluate_file(amd, load_pcm(path))
+        confusion[label][result["result"]] += 1
+        cpu_latencies.extend(latencies)
+        if result["result"] != "UNSURE":
+            decision_times.append(result["decision_s"])
+
+        details.append({
+            "file": str(path.relative_to(folder)),
+            "label": label,
+            "result": result["result"],
+            "reason": result["reason"],
+            "decision_s": round(result["decision_s"], 2),
+        })
+        if args.verbose:
+            status = "  " if result["result"] == "UNSURE" else ("✅" if result["result"] == label else "❌")
+            print(
+                f"{status} {path.name:40s} {label:8s} → {result['result']:8s} "
+                f"({result['reason']}, {result['decision_s']:.1f}s)"
+            )
+
+    total = len(files)
+    decided = sum(confusion[label][result] for label in LABELS for result in LABELS)
+    correct = sum(confusion[label][label] for label in LABELS)
+
+    print("\n" + "=" * 60)
+    print(f"AMD signal - {total} fichiers ({len(skipped)} non étiquetés ignorés)")
+    print("=" * 60)
+    header = "réel / prédit"
+    print(f"{header:14s}" + "".join(f"{result:>10s}" for result in RESULTS))
+    for label in LABELS:
+        print(f"{label:14s}" + "".join(f"{confusion[label][result]:>10d}" for result in RESULTS))
+
+    print(f"\nDécidés:        {decided}/{total} ({decided / total:.0%}) - le reste passe par l'ASR")
+    if decided:
+        print(f"Précision:      {correct}/{decided} ({correct / decided:.1%}) sur les décidés")
+        print(
+            f"Audio requis:   moyen {np.mean(decision_times):.2f}s | "
+            f"p95 {np.percentile(decision_times, 95):.2f}s "
+            f"(fenêtre AMD: {config.AMD_MAX_DURATION}s)"
+        )
+    print(
+        f"CPU/analyse:    moyen {np.mean(cpu_latencies):.2f}ms | "
+        f"p95 {np.percentile(cpu_latencies, 95):.2f}ms ({len(cpu_latencies)} analyses)"
+    )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "total": total,
+                "decided": decided,
+                "correct": correct,
+                "confusion": confusion,
+                "mean_decision_s": float(np.mean(decision_times)) if decision_times else None,
+                "mean_cpu_ms": float(np.mean(cpu_latencies)),
+                "files": details,
+            }, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Résultats: {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Soak test des ressources par appel (détection de fuites)
+========================================================
+
+Enchaîne des milliers d'appels synthétiques sur le vrai code du robot et de
+StreamingASR, sans FreeSWITCH ni modèles:
+
+- CallRegistry: originate → answer → hangup (_handle_channel_hangup)
+- StreamingASR: register_callback (closure qui capture un état de phase),
+  _initialize_stream (connexion WebSocket), puis sortie propre
+  (unregister + _cleanup_stream) ou sortie anticipée (rien: fork échoué,
+  hangup pendant la phase, WebSocket pas encore fermé)
+- Fichiers temporaires (_call_temp_file) laissés ou non par la phase
+- Threads de monitoring (_start_call_worker) qui attendent le hangup
+- Bilan de fin d'appel (get_call_info) lu puis oublié comme par BatchCaller
+
+Après un échauffement, une baseline est prise (tracemalloc, RSS, threads,
+FDs, tailles des dicts par appel); à la fin, tout doit être revenu à plat.
+Code retour 1 si une ressource a grossi au-delà des seuils.
+
+--no-release désactive la libération au hangup (_release_call_resources)
+pour reproduire la fuite d'avant: callbacks, streams et fichiers s'accumulent.
+
+Exemples:
+  python scripts/soak_call_resources.py
+  python scripts/soak_call_resources.py --calls 10000 --concurrency 50
+  python scripts/soak_call_resources.py --no-release --calls 2000
+"""
+
+import gc
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+# Ajouter le répertoire parent au path pour imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import system.robot_freeswitch as robot_module
+import system.services.streaming_asr as streaming_asr_module
+from system.robot_freeswitch import RobotFreeSWITCH
+from system.services.streaming_asr import StreamingASR
+from system.call_session import CallRegistry
+
+PHASE_STATE_BYTES = 16 * 1024  # État capturé par chaque callback (detection_state, amd_state)
+
+
+class SyntheticEvent:
+    """Événement ESL minimal (en-têtes d'un CHANNEL_HANGUP_COMPLETE)."""
+
+    def __init__(self, headers: Dict[str, str]):
+        self.headers = headers
+
+    def getHeader(self, name: str):
+        return self.headers.get(name)
+
+
+def build_streaming_asr() -> StreamingASR:
+    """StreamingASR sans modèle Vosk ni serveur: seuls les dicts par appel sont exercés."""
+    asr = StreamingASR.__new__(StreamingASR)
+    asr.is_available = True
+    asr.model = None  # _initialize_stream: pas de recognizer, stream_info seulement
+    asr.sample_rate = 16000
+    asr.recognizers = {}
+    asr.active_streams = {}
+    asr.callbacks = {}
+    asr.loop = None  # Pas de serveur: release_call nettoie directement (voir _call_on_loop)
+    asr.stats = {"active_streams": 0}
+    return asr
+
+
+def build_robot(asr: StreamingASR, release: bool) -> RobotFreeSWITCH:
+    """Robot sans connexion ESL (les commandes uuid_break échouent proprement)."""
+    robot = RobotFreeSWITCH.__new__(RobotFreeSWITCH)
+    robot.calls = CallRegistry()
+    robot.streaming_asr = asr
+    robot.esl_conn_api = None
+    robot.esl_api_lock = threading.Lock()
+    if not release:
+        robot._release_call_resources = lambda call_uuid, session: "release disabled"
+    return robot
+
+
+def monitor_worker(session):
+    """Thread de monitoring: tourne jusqu'au hangup (comme les moniteurs VAD)."""
+    while not session.hangup_detected:
+        time.sleep(0.005)
+
+
+def run_phase(robot: RobotFreeSWITCH, asr: StreamingASR, call_uuid: str, rng: random.Random, tmp_dir: str):
+    """Une phase streaming (AMD / Phase 2 / Phase 3), sortie propre ou anticipée."""
+    phase_state = {"transcription": "", "audio": bytearray(PHASE_STATE_BYTES)}
+
+    def phase_callback(event_data):
+        phase_state["transcription"] = event_data.get("text", "")
+
+    asr.register_callback(call_uuid, phase_callback)
+    asr._initialize_stream(call_uuid)
+
+    # os.path plutôt que Path: pathlib interne chaque nom de fichier (sys.intern),
+    # la table des chaînes internées grossirait et fausserait la mesure
+    record_file = robot._call_temp_file(call_uuid, os.path.join(tmp_dir, f"phase_{call_uuid}_{rng.random():.6f}.wav"))
+    with open(record_file, "wb") as audio:
+        audio.write(b"\0" * 512)
+
+    if rng.random() < 0.6:
+        # Sortie propre: la phase nettoie elle-même
+        asr.unregister_callback(call_uuid, phase_callback)
+        asr._cleanup_stream(call_uuid)
+        os.unlink(record_file)
+    # Sinon: sortie anticipée, tout reste à la charge du hangup
+
+
+def run_batch(robot: RobotFreeSWITCH, asr: StreamingASR, first: int, size: int, rng: random.Random, tmp_dir: str):
+    """`size` appels simultanés: originate, answer, phases, puis hangup de tous."""
+    uuids = [f"{first + i:08x}-50a4-4c11-9e6f-{rng.getrandbits(48):012x}" for i in range(size)]
+    workers: List[threading.Thread] = []
+
+    for call_uuid in uuids:
+        robot.calls.open(call_uuid, phone_number="33600000000", lead_id=0, scenario_name="soak")
+        session = robot.calls.open(call_uuid, answered_at=time.time())
+        workers.append(robot._start_call_worker(call_uuid, monitor_worker, session))
+        for _ in range(rng.randint(1, 3)):
+            run_phase(robot, asr, call_uuid, rng, tmp_dir)
+        session.add_transcript("oui bonjour")
+
+    for call_uuid in uuids:
+        robot._handle_channel_hangup(call_uuid, SyntheticEvent({"Hangup-Cause": "NORMAL_CLEARING"}))
+
+    for worker in workers:
+        worker.join(timeout=1.0)
+
+    # BatchCaller: bilan lu puis oublié après le commit (_handle_calls_end)
+    for call_uuid in uuids:
+        robot.get_call_info(call_uuid)
+    robot.forget_call_info(uuids)
+
+
+def measure(robot: RobotFreeSWITCH, asr: StreamingASR, tmp_dir: str) -> Dict[str, int]:
+    gc.collect()
+    with open("/proc/self/statm") as statm:
+        rss_pages = int(statm.read().split()[1])
+    return {
+        "traced_kb": tracemalloc.get_traced_memory()[0] // 1024,
+        "rss_kb": rss_pages * os.sysconf("SC_PAGE_SIZE") // 1024,
+        "threads": threading.active_count(),
+        "fds": len(os.listdir("/proc/self/fd")),
+        "sessions": len(robot.calls),
+        "callbacks": len(asr.callbacks),
+        "streams": len(asr.active_streams),
+        "recognizers": len(asr.recognizers),
+        "tmp_files": len(os.listdir(tmp_dir)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak test des ressources par appel (fuites)")
+    parser.add_argument("--calls", type=int, default=5000, help="Appels synthétiques (hors échauffement)")
+    parser.add_argument("--warmup", type=int, default=200, help="Appels avant la baseline")
+    parser.add_argument("--concurrency", type=int, default=20, help="Appels simultanés par lot")
+    parser.add_argument("--max-growth-kb", type=int, default=512, help="Croissance tracemalloc tolérée")
+    parser.add_argument("--max-rss-mb", type=int, default=16, help="Croissance RSS tolérée")
+    parser.add_argument("--no-release", action="store_true", help="Sans libération au hangup (comportement d'avant)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # Pas d'I/O de log pendant le soak: seules les ressources d'appel sont mesurées
+    robot_module.logger.setLevel(logging.CRITICAL)
+    streaming_asr_module.logger.logger.setLevel(logging.CRITICAL)  # ContextLogger
+
+    rng = random.Random(args.seed)
+    asr = build_streaming_asr()
+    robot = build_robot(asr, release=not args.no_release)
+
+    with tempfile.TemporaryDirectory(prefix="soak_calls_") as tmp:
+        tmp_dir = tmp
+        tracemalloc.start(10)
+
+        done = 0
+        while done < args.warmup:
+            size = min(args.concurrency, args.warmup - done)
+            run_batch(robot, asr, done, size, rng, tmp_dir)
+            done += size
+        baseline = measure(robot, asr, tmp_dir)
+        snapshot_start = tracemalloc.take_snapshot()
+
+        start = time.perf_counter()
+        report_every = max(args.calls // 5, args.concurrency)
+        next_report = report_every
+        print(f"{'calls':>7} {'traced':>9} {'rss':>9} {'thr':>4} {'fds':>4} {'sess':>5} {'cb':>5} {'strm':>5} {'tmp':>5}")
+        while done < args.warmup + args.calls:
+            size = min(args.concurrency, args.warmup + args.calls - done)
+            run_batch(robot, asr, done, size, rng, tmp_dir)
+            done += size
+            if done - args.warmup >= next_report:
+                m = measure(robot, asr, tmp_dir)
+                print(
+                    f"{done - args.warmup:>7} {m['traced_kb']:>7}KB {m['rss_kb'] // 1024:>7}MB {m['threads']:>4} "
+                    f"{m['fds']:>4} {m['sessions']:>5} {m['callbacks']:>5} {m['streams']:>5} {m['tmp_files']:>5}"
+                )
+                next_report += report_every
+        elapsed = time.perf_counter() - start
+
+        final = measure(robot, asr, tmp_dir)
+        top = tracemalloc.take_snapshot().compare_to(snapshot_start, "lineno")[:5]
+        tracemalloc.stop()
+
+    print(f"\n{args.calls} calls in {elapsed:.1f}s ({args.calls / elapsed:.0f} calls/s), release={'off' if args.no_release else 'on'}")
+    print("Top allocations since baseline:")
+    for stat in top:
+        print(f"  {stat}")
+
+    failures = []
+    growth_kb = final["traced_kb"] - baseline["traced_kb"]
+    if growth_kb > args.max_growth_kb:
+        failures.append(f"tracemalloc +{growth_kb}KB > {args.max_growth_kb}KB")
+    rss_growth_mb = (final["rss_kb"] - baseline["rss_kb"]) / 1024
+    if rss_growth_mb > args.max_rss_mb:
+        failures.append(f"RSS +{rss_growth_mb:.1f}MB > {args.max_rss_mb}MB")
+    for key in ("threads", "fds", "sessions", "callbacks", "streams", "recognizers", "tmp_files"):
+        if final[key] > baseline[key]:
+            failures.append(f"{key}: {baseline[key]} → {final[key]}")
+
+    if failures:
+        print("\n❌ Per-call resources are leaking:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print(f"\n✅ Flat: tracemalloc {growth_kb:+d}KB, RSS {rss_growth_mb:+.1f}MB, threads/FDs/dicts/tmp files unchanged")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
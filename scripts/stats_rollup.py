@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Rollup des statistiques de campagne (table campaign_stats_rollup)
+=================================================================
+
+- backfill: reconstruit le rollup depuis l'historique de la table calls
+  (toutes les campagnes, ou une seule avec --campaign-id). PostgreSQL: la
+  table est verrouillée pendant la reconstruction, les workers attendent
+  le commit
+- check: compare le rollup aux comptages bruts (GROUP BY sur calls) et
+  affiche les écarts; code retour 1 si le rollup a dérivé
+
+La migration 0004_campaign_stats_rollup_backfill fait le premier
+remplissage; backfill sert après une écriture hors application (SQL
+manuel, restauration partielle).
+
+Exemples:
+  python scripts/stats_rollup.py check
+  python scripts/stats_rollup.py check --campaign-id 42
+  python scripts/stats_rollup.py backfill --campaign-id 42
+  python scripts/stats_rollup.py backfill
+"""
+
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+
+# Ajouter le répertoire parent au path pour imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from system.database import Base, SessionLocal, engine
+from system.models import CampaignStatsRollup
+from system import stats_rollup
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s')
+logger = logging.getLogger(__name__)
+
+MAX_PRINTED = 20
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Reconstruction / vérification du rollup des statistiques de campagne",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("command", choices=["backfill", "check"], help="Action")
+    parser.add_argument("--campaign-id", type=int, help="Campagne (défaut: toutes)")
+    args = parser.parse_args()
+
+    # Base antérieure au rollup: créer la table
+    Base.metadata.create_all(bind=engine, tables=[CampaignStatsRollup.__table__])
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        if args.command == "backfill":
+            rows = stats_rollup.rebuild(db, args.campaign_id)
+            logger.info(f"✅ Backfill done: {rows} rollup rows ({time.perf_counter() - start:.1f}s)")
+            return 0
+
+        differences = stats_rollup.check(db, args.campaign_id)
+        elapsed = time.perf_counter() - start
+        if not differences:
+            logger.info(f"✅ Rollup matches raw call counts ({elapsed:.1f}s)")
+            return 0
+
+        logger.error(f"❌ {len(differences)} rollup rows differ from raw call counts "
+                     f"(calls, duration_sum, duration_count):")
+        for difference in differences[:MAX_PRINTED]:
+            key = difference["key"]
+            logger.error(
+                f"  campaign {key['campaign_id']} {key['bucket']} "
+                f"{key['status']}/{key['result'] or '-'}/{key['sentiment'] or '-'}/{key['amd_result'] or '-'}: "
+                f"expected {difference['expected']}, rollup {difference['rollup']}"
+            )
+        if len(differences) > MAX_PRINTED:
+            logger.error(f"  ... {len(differences) - MAX_PRINTED} more")
+        logger.error(f"   Fix: python scripts/stats_rollup.py backfill"
+                     f"{' --campaign-id ' + str(args.campaign_id) if args.campaign_id else ''}")
+        return 1
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -588,6 +588,20 @@ Exemples:
     # Traiter
     success = processor.process_all()
 
+    # Recompiler les objections (durées audio + chemins FreeSWITCH dans les artefacts)
+    if success and not args.dry_run:
+        try:
+            from system.objections_db.compiler import compile_all_themes
+            logger.info(f"\n{Colors.BOLD}🧩 Compiling objections artifacts...{Colors.END}")
+            # Un artefact par voix (source audio/{voice}/objections/)
+            voices = sorted(
+                d.name for d in Path(args.source).iterdir() if (d / "objections").is_dir()
+            ) or ["julie"]
+            for voice in voices:
+                compile_all_themes(voice)
+        except Exception as e:
+            logger.warning(f"{Colors.YELLOW}Objections compilation skipped: {e}{Colors.END}")
+
     # Exit code
     sys.exit(0 if success else 1)
 
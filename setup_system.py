@@ -30,6 +30,7 @@ from sqlalchemy import text
 
 from system.database import engine, SessionLocal, init_database, test_connection
 from system.models import Base, Contact, Campaign
+from system.migrations import apply_migrations
 from system.config import config
 
 logging.basicConfig(
@@ -45,6 +46,7 @@ def create_tables():
 
     try:
         Base.metadata.create_all(bind=engine)
+        apply_migrations(engine)
         logger.info("✅ Tables créées avec succès")
         return True
     except Exception as e:
@@ -14,6 +14,7 @@ import argparse
 import requests
 import sys
 import os
+import time
 from datetime import datetime
 from collections import defaultdict
 
@@ -242,6 +243,11 @@ class CallSimulator:
         self.scenario = self._load_scenario(scenario_path)
         self.matcher = ObjectionMatcher.load_objections_for_theme(theme)
 
+        # Pré-scoring batch de tous les exemples des profils (réutilisé à chaque tour)
+        self.match_cache = self._prescore_examples()
+        self.match_phrases = 0
+        self.match_time = 0.0
+
         # State
         self.current_step = "hello"
         self.call_log = []
@@ -254,6 +260,27 @@ class CallSimulator:
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
+    def _prescore_examples(self) -> dict:
+        """Score en un seul appel batch les exemples fixes de tous les profils."""
+        examples = [
+            ex.lower() for profile in TEST_PROFILES.values()
+            for ex in profile.get("examples", []) if ex and ex.strip()
+        ]
+        results = self.matcher.find_best_matches(examples, min_score=0.70)
+        return {ex.strip(): (r._asdict() if r else None) for ex, r in zip(examples, results)}
+
+    def _match(self, user_response: str):
+        """Match un input: cache batch si connu, sinon find_best_match."""
+        text = user_response.lower()
+        start = time.perf_counter()
+        if not self.verbose and text.strip() in self.match_cache:
+            result = self.match_cache[text.strip()]
+        else:
+            result = self.matcher.find_best_match(text, min_score=0.70, silent=not self.verbose)
+        self.match_time += time.perf_counter() - start
+        self.match_phrases += 1
+        return result
+
     def _log(self, level: str, message: str):
         """Ajoute une entrée au log."""
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
@@ -308,11 +335,7 @@ class CallSimulator:
                 self._log("INPUT", f"🎤 User: '{user_response}'")
 
                 # Process through matcher
-                match_result = self.matcher.find_best_match(
-                    user_response.lower(),
-                    min_score=0.70,
-                    silent=not self.verbose
-                )
+                match_result = self._match(user_response)
 
                 if match_result:
                     entry_type = match_result.get("entry_type", "objection")
@@ -376,6 +399,8 @@ class CallSimulator:
             "retries": self.stats["retries"],
             "no_matches": self.stats["no_matches"],
             "autonomous_turns": dict(self.autonomous_turns),
+            "match_phrases": self.match_phrases,
+            "match_time": self.match_time,
             "log": self.call_log
         }
 
@@ -449,12 +474,16 @@ def run_simulation(scenario_path: str, profile_name: str, num_runs: int = 1, ver
     total_steps = 0
     total_retries = 0
     total_silences = 0
+    total_phrases = 0
+    total_match_time = 0.0
 
     for r in results:
         outcomes[r["result"]] += 1
         total_steps += r["steps"]
         total_retries += r["retries"]
         total_silences += r["silences"]
+        total_phrases += r["match_phrases"]
+        total_match_time += r["match_time"]
 
     print(f"\nRésultats des appels:")
     for outcome, count in outcomes.items():
@@ -466,6 +495,11 @@ def run_simulation(scenario_path: str, profile_name: str, num_runs: int = 1, ver
     print(f"  Retries/appel: {total_retries / len(results):.1f}")
     print(f"  Silences/appel: {total_silences / len(results):.1f}")
 
+    if total_phrases:
+        rate = total_phrases / total_match_time if total_match_time > 0 else float("inf")
+        print(f"\nMatching:")
+        print(f"  Phrases: {total_phrases} en {total_match_time * 1000:.1f}ms ({rate:,.0f} phrases/s)")
+
     print("\n" + "=" * 70)
     print("✅ Simulation terminée")
     print("=" * 70)
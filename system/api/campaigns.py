@@ -11,11 +11,12 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query
 from pydantic import BaseModel, Field, validator
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, update
 
 from system.database import get_db
-from system.models import Campaign, Call, Contact, CampaignStatus, CallStatus
+from system.models import Campaign, Call, Contact, CampaignStatus, CallStatus, CampaignStatsRollup
 from system.campaign_manager import CampaignManager
+from system.stats_rollup import RollupDelta, rollup_columns
 from system.config import config
 
 logger = logging.getLogger(__name__)
@@ -503,14 +504,24 @@ def stop_campaign(
     campaign.status = CampaignStatus.CANCELLED
     campaign.completed_at = datetime.utcnow()
 
-    # Marquer appels PENDING comme CANCELLED
-    db.query(Call).filter(
-        and_(
-            Call.campaign_id == campaign_id,
-            Call.status == CallStatus.PENDING
+    # Marquer appels PENDING comme CANCELLED (RETURNING: comptés dans le rollup)
+    cancelled = db.execute(
+        update(Call)
+        .where(
+            and_(
+                Call.campaign_id == campaign_id,
+                Call.status == CallStatus.PENDING
+            )
         )
-    ).update({"status": CallStatus.CANCELLED})
-
+        .values(status=CallStatus.CANCELLED)
+        .returning(*rollup_columns())
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    rollup = RollupDelta()
+    for row in cancelled:
+        rollup.add(row)
+    rollup.apply(db)
     db.commit()
 
     logger.info(f"Campaign {campaign_id} stopped")
@@ -551,8 +562,9 @@ def delete_campaign(
             detail="Cannot delete a campaign that has been started"
         )
 
-    # Supprimer appels associés
+    # Supprimer appels associés (et leurs compteurs agrégés)
     db.query(Call).filter(Call.campaign_id == campaign_id).delete()
+    db.query(CampaignStatsRollup).filter(CampaignStatsRollup.campaign_id == campaign_id).delete()
 
     # Supprimer campagne
     db.delete(campaign)
@@ -2,13 +2,16 @@
 Exports API - MiniBotPanel v3
 
 Endpoints pour exports CSV et téléchargements audio/transcriptions.
+
+Les exports de campagne (CSV, JSON, Parquet, Arrow) sont rendus en flux
+depuis un curseur par lots (system/call_export.py): mémoire constante,
+premier octet envoyé sans attendre la lecture de toute la campagne.
+Parquet / Arrow (colonnes typées, JSON aplati) nécessitent pyarrow.
 """
 
 import logging
-import csv
-import io
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Depends, Response
@@ -16,15 +19,65 @@ from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
-from system.database import get_db
+from system.database import SessionLocal, get_db
 from system.models import Campaign, Call, Contact, CallStatus, CallResult
 from system.config import config
+from system.call_stats import campaign_call_stats
+from system.call_export import iter_call_batches, iter_csv, iter_json, iter_columnar, check_columnar
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/exports", tags=["exports"])
 
 
+CSV_COLUMNS = [
+    "phone", "first_name", "last_name", "email", "company",
+    "status", "result", "duration", "sentiment", "confidence",
+    "amd_result", "created_at", "ended_at"
+]
+
+# Colonnes lues pour les exports (lignes Core, pas d'objets ORM)
+EXPORT_COLUMNS = [
+    Call.uuid, Call.status, Call.result, Call.duration, Call.sentiment, Call.sentiment_score,
+    Call.amd_result, Call.call_metadata, Call.recording_path, Call.transcription_path,
+    Call.created_at, Call.answered_at, Call.ended_at,
+    Contact.phone, Contact.first_name, Contact.last_name, Contact.email, Contact.company,
+]
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _enum_value(value) -> Optional[str]:
+    return value.value if value else None
+
+
+def _get_campaign(db: Session, campaign_id: int) -> Campaign:
+    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    if not campaign:
+        raise HTTPException(status_code=404, detail=f"Campaign {campaign_id} not found")
+    return campaign
+
+
+def _stream(chunks_factory, campaign_id: int) -> Iterator[bytes]:
+    """
+    Morceaux d'un export, lus dans une session propre au flux.
+
+    La session de la requête (get_db) peut être fermée avant la fin de
+    l'envoi: le flux ouvre la sienne et la ferme à la fin (ou si le client
+    se déconnecte).
+    """
+    db = SessionLocal()
+    try:
+        yield from chunks_factory(db)
+    except Exception as e:
+        logger.error(f"❌ Export of campaign {campaign_id} interrupted: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+
 @router.get("/campaign/{campaign_id}/csv")
 def export_campaign_csv(
     campaign_id: int,
@@ -34,6 +87,9 @@ def export_campaign_csv(
     """
     Exporte les résultats d'une campagne en CSV.
 
+    Rendu en flux: appels lus par lots (EXPORT_BATCH_SIZE) et envoyés au
+    fur et à mesure, mémoire constante quelle que soit la campagne.
+
     Args:
         campaign_id: ID de la campagne
         include_links: Inclure liens audio/transcriptions
@@ -42,76 +98,44 @@ def export_campaign_csv(
         StreamingResponse avec CSV
     """
     # Vérifier que campagne existe
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail=f"Campaign {campaign_id} not found")
-
-    # Récupérer tous les appels de la campagne avec contacts
-    calls = (
-        db.query(Call, Contact)
-        .join(Contact, Call.contact_id == Contact.id)
-        .filter(Call.campaign_id == campaign_id)
-        .order_by(Call.created_at)
-        .all()
-    )
-
-    # Créer CSV en mémoire
-    output = io.StringIO()
+    _get_campaign(db, campaign_id)
 
     # Colonnes CSV
-    fieldnames = [
-        "phone", "first_name", "last_name", "email", "company",
-        "status", "result", "duration", "sentiment", "confidence",
-        "amd_result", "created_at", "ended_at"
-    ]
-
+    header = list(CSV_COLUMNS)
     if include_links:
-        fieldnames.extend(["audio_link", "transcript_link"])
-
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
+        header.extend(["audio_link", "transcript_link"])
 
-    # Écrire les lignes
     base_url = f"http://{config.API_HOST}:{config.API_PORT}"
 
-    for call, contact in calls:
-        row = {
-            "phone": contact.phone,
-            "first_name": contact.first_name or "",
-            "last_name": contact.last_name or "",
-            "email": contact.email or "",
-            "company": contact.company or "",
-            "status": call.status.value if call.status else "",
-            "result": call.result.value if call.result else "",
-            "duration": call.duration or 0,
-            "sentiment": call.sentiment.value if call.sentiment else "",
-            "confidence": call.confidence or 0.0,
-            "amd_result": call.amd_result or "",
-            "created_at": call.created_at.isoformat() if call.created_at else "",
-            "ended_at": call.ended_at.isoformat() if call.ended_at else ""
-        }
-
+    def to_row(row):
+        values = [
+            row.phone,
+            row.first_name or "",
+            row.last_name or "",
+            row.email or "",
+            row.company or "",
+            _enum_value(row.status) or "",
+            _enum_value(row.result) or "",
+            row.duration or 0,
+            _enum_value(row.sentiment) or "",
+            row.sentiment_score or 0.0,
+            row.amd_result or "",
+            _isoformat(row.created_at) or "",
+            _isoformat(row.ended_at) or "",
+        ]
         if include_links:
-            # Ajouter liens vers audio et transcriptions
-            if call.recording_path:
-                row["audio_link"] = f"{base_url}/api/exports/audio/{call.uuid}"
-            else:
-                row["audio_link"] = ""
-
-            if call.transcription_path:
-                row["transcript_link"] = f"{base_url}/api/exports/transcript/{call.uuid}"
-            else:
-                row["transcript_link"] = ""
-
-        writer.writerow(row)
+            # Liens vers audio et transcriptions
+            values.append(f"{base_url}/api/exports/audio/{row.uuid}" if row.recording_path else "")
+            values.append(f"{base_url}/api/exports/transcript/{row.uuid}" if row.transcription_path else "")
+        return values
 
-    # Créer response
-    output.seek(0)
+    def chunks(stream_db):
+        return iter_csv(header, iter_call_batches(stream_db, campaign_id, EXPORT_COLUMNS), to_row)
 
     filename = f"campaign_{campaign_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
     return StreamingResponse(
-        io.BytesIO(output.read().encode('utf-8')),
+        _stream(chunks, campaign_id),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
@@ -123,70 +147,134 @@ def export_campaign_csv(
 def export_campaign_json(
     campaign_id: int,
     db: Session = Depends(get_db)
-):
+) -> StreamingResponse:
     """
     Exporte les résultats d'une campagne en JSON.
 
+    Document {"campaign": {...}, "calls": [...]} rendu en flux (appels lus
+    et encodés par lots).
+
     Args:
         campaign_id: ID de la campagne
 
     Returns:
-        Dict avec toutes les données
+        StreamingResponse avec le document JSON
     """
     # Vérifier que campagne existe
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail=f"Campaign {campaign_id} not found")
-
-    # Récupérer tous les appels
-    calls = (
-        db.query(Call, Contact)
-        .join(Contact, Call.contact_id == Contact.id)
-        .filter(Call.campaign_id == campaign_id)
-        .order_by(Call.created_at)
-        .all()
-    )
+    campaign = _get_campaign(db, campaign_id)
 
-    # Construire réponse
-    result = {
+    document = {
         "campaign": {
             "id": campaign.id,
             "name": campaign.name,
             "description": campaign.description,
             "scenario": campaign.scenario,
-            "status": campaign.status.value if campaign.status else None,
+            "status": _enum_value(campaign.status),
             "stats": campaign.stats,
-            "created_at": campaign.created_at.isoformat() if campaign.created_at else None,
-            "started_at": campaign.started_at.isoformat() if campaign.started_at else None,
-            "completed_at": campaign.completed_at.isoformat() if campaign.completed_at else None
-        },
-        "calls": []
+            "created_at": _isoformat(campaign.created_at),
+            "started_at": _isoformat(campaign.started_at),
+            "completed_at": _isoformat(campaign.completed_at)
+        }
     }
 
-    for call, contact in calls:
-        call_data = {
-            "uuid": call.uuid,
+    def to_item(row):
+        return {
+            "uuid": row.uuid,
             "contact": {
-                "phone": contact.phone,
-                "first_name": contact.first_name,
-                "last_name": contact.last_name,
-                "email": contact.email,
-                "company": contact.company
+                "phone": row.phone,
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "email": row.email,
+                "company": row.company
             },
-            "status": call.status.value if call.status else None,
-            "result": call.result.value if call.result else None,
-            "duration": call.duration,
-            "sentiment": call.sentiment.value if call.sentiment else None,
-            "confidence": call.confidence,
-            "amd_result": call.amd_result,
-            "metadata": call.metadata,
-            "created_at": call.created_at.isoformat() if call.created_at else None,
-            "answered_at": call.answered_at.isoformat() if call.answered_at else None,
-            "ended_at": call.ended_at.isoformat() if call.ended_at else None
+            "status": _enum_value(row.status),
+            "result": _enum_value(row.result),
+            "duration": row.duration,
+            "sentiment": _enum_value(row.sentiment),
+            "confidence": row.sentiment_score,
+            "amd_result": row.amd_result,
+            "metadata": row.call_metadata,
+            "created_at": _isoformat(row.created_at),
+            "answered_at": _isoformat(row.answered_at),
+            "ended_at": _isoformat(row.ended_at)
         }
-        result["calls"].append(call_data)
 
-    return result
+    def chunks(stream_db):
+        return iter_json(document, "calls", iter_call_batches(stream_db, campaign_id, EXPORT_COLUMNS), to_item)
+
+    return StreamingResponse(
+        _stream(chunks, campaign_id),
+        media_type="application/json"
+    )
+
+
+COLUMNAR_MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+def _columnar_response(db: Session, campaign_id: int, fmt: str, compression: Optional[str]) -> StreamingResponse:
+    """Export Parquet / Arrow en flux (400: compression inconnue, 501: pyarrow absent)."""
+    _get_campaign(db, campaign_id)
+    try:
+        compression = check_columnar(fmt, compression)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    filename = f"campaign_{campaign_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+
+    return StreamingResponse(
+        _stream(lambda stream_db: iter_columnar(stream_db, campaign_id, fmt, compression), campaign_id),
+        media_type=COLUMNAR_MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}"
+        }
+    )
+
+
+@router.get("/campaign/{campaign_id}/parquet")
+def export_campaign_parquet(
+    campaign_id: int,
+    compression: Optional[str] = None,
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Exporte les résultats d'une campagne en Parquet.
+
+    Colonnes typées (enums en dictionnaire, timestamps natifs), champs
+    qualification_data / call_metadata aplatis; un row group envoyé dès
+    qu'il est écrit.
+
+    Args:
+        campaign_id: ID de la campagne
+        compression: none, snappy, zstd, gzip, lz4, brotli (défaut: EXPORT_COLUMNAR_COMPRESSION)
+
+    Returns:
+        StreamingResponse avec le fichier Parquet
+    """
+    return _columnar_response(db, campaign_id, "parquet", compression)
+
+
+@router.get("/campaign/{campaign_id}/arrow")
+def export_campaign_arrow(
+    campaign_id: int,
+    compression: Optional[str] = None,
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Exporte les résultats d'une campagne en flux Arrow IPC (mêmes colonnes que Parquet).
+
+    Args:
+        campaign_id: ID de la campagne
+        compression: none, zstd, lz4 (défaut: EXPORT_COLUMNAR_COMPRESSION)
+
+    Returns:
+        StreamingResponse avec le flux Arrow
+    """
+    return _columnar_response(db, campaign_id, "arrow", compression)
 
 
 @router.get("/audio/{call_uuid}")
@@ -302,38 +390,19 @@ def export_summary(
     if not campaign:
         raise HTTPException(status_code=404, detail=f"Campaign {campaign_id} not found")
 
-    # Statistiques détaillées
-    total_calls = db.query(Call).filter(Call.campaign_id == campaign_id).count()
-
-    completed_calls = db.query(Call).filter(
-        and_(
-            Call.campaign_id == campaign_id,
-            Call.status == CallStatus.COMPLETED
-        )
-    ).count()
+    # Statistiques détaillées (une seule requête)
+    counts = campaign_call_stats(db, campaign_id)
+    total_calls = counts["total"]
+    completed_calls = counts["status"][CallStatus.COMPLETED.value]
 
     # Résultats par type
-    results_count = {}
-    for result in CallResult:
-        count = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.result == result
-            )
-        ).count()
-        results_count[result.value] = count
+    results_count = counts["results"]
 
     # Durée moyenne
-    from sqlalchemy import func
-    avg_duration = db.query(func.avg(Call.duration)).filter(
-        and_(
-            Call.campaign_id == campaign_id,
-            Call.duration > 0
-        )
-    ).scalar() or 0
+    avg_duration = counts["avg_duration"]
 
     # Taux de conversion
-    leads_count = results_count.get("lead", 0)
+    leads_count = results_count.get(CallResult.LEADS.value, 0)
     conversion_rate = (leads_count / completed_calls * 100) if completed_calls > 0 else 0
 
     return {
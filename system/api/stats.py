@@ -8,13 +8,14 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 
 from system.database import get_db
 from system.models import Campaign, Call, Contact, CallStatus, CallResult, Sentiment, CampaignStatus
 from system.config import config
+from system.call_stats import campaign_call_stats, campaign_timeline
 from system.stats_collector import StatsCollector
 
 logger = logging.getLogger(__name__)
@@ -59,68 +60,19 @@ def get_campaign_stats(
     if not campaign:
         raise HTTPException(status_code=404, detail=f"Campaign {campaign_id} not found")
 
-    # Stats de base
-    total_calls = db.query(Call).filter(Call.campaign_id == campaign_id).count()
-
-    # Stats par statut
-    status_counts = {}
-    for status in CallStatus:
-        count = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.status == status
-            )
-        ).count()
-        status_counts[status.value] = count
-
-    # Stats par résultat
-    result_counts = {}
-    for result in CallResult:
-        count = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.result == result
-            )
-        ).count()
-        result_counts[result.value] = count
-
-    # Stats sentiment
-    sentiment_counts = {}
-    for sentiment in Sentiment:
-        count = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.sentiment == sentiment
-            )
-        ).count()
-        sentiment_counts[sentiment.value] = count
-
-    # Durées moyennes
-    avg_duration = db.query(func.avg(Call.duration)).filter(
-        and_(
-            Call.campaign_id == campaign_id,
-            Call.duration > 0
-        )
-    ).scalar() or 0
-
-    # AMD stats
-    amd_human = db.query(Call).filter(
-        and_(
-            Call.campaign_id == campaign_id,
-            Call.amd_result == "human"
-        )
-    ).count()
-
-    amd_machine = db.query(Call).filter(
-        and_(
-            Call.campaign_id == campaign_id,
-            Call.amd_result == "machine"
-        )
-    ).count()
+    # Tous les compteurs en une requête (COUNT(*) FILTER)
+    counts = campaign_call_stats(db, campaign_id)
+    total_calls = counts["total"]
+    status_counts = counts["status"]
+    result_counts = counts["results"]
+    sentiment_counts = counts["sentiment"]
+    avg_duration = counts["avg_duration"]
+    amd_human = counts["amd"]["human"]
+    amd_machine = counts["amd"]["machine"]
 
     # Taux de conversion
-    completed = status_counts.get("completed", 0)
-    leads = result_counts.get("lead", 0)
+    completed = status_counts.get(CallStatus.COMPLETED.value, 0)
+    leads = result_counts.get(CallResult.LEADS.value, 0)
     conversion_rate = (leads / completed * 100) if completed > 0 else 0
 
     # Temps écoulé
@@ -190,82 +142,27 @@ def get_live_stats(
 
     # Si pas de cache ou trop vieux, recalculer
     if not cached_stats or not cached_stats.get("last_update"):
-        # Calculer stats fraîches
-        total = db.query(Call).filter(Call.campaign_id == campaign_id).count()
-
-        completed = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.status == CallStatus.COMPLETED
-            )
-        ).count()
-
-        in_progress = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.status == CallStatus.IN_PROGRESS
-            )
-        ).count()
+        # Calculer stats fraîches (une seule requête)
+        counts = campaign_call_stats(db, campaign_id)
+        total = counts["total"]
+        completed = counts["status"][CallStatus.COMPLETED.value]
+        in_progress = counts["status"][CallStatus.IN_PROGRESS.value]
 
         # Résultats principaux (3 status seulement)
-        leads = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.result == CallResult.LEADS
-            )
-        ).count()
-
-        not_interested = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.result == CallResult.NOT_INTERESTED
-            )
-        ).count()
-
-        no_answer = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.result == CallResult.NO_ANSWER
-            )
-        ).count()
+        leads = counts["results"][CallResult.LEADS.value]
+        not_interested = counts["results"][CallResult.NOT_INTERESTED.value]
+        no_answer = counts["results"][CallResult.NO_ANSWER.value]
 
         # AMD stats (detection répondeur)
-        answering_machines = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.amd_result == "machine"
-            )
-        ).count()
+        answering_machines = counts["amd"]["machine"]
 
         # Durée moyenne
-        avg_duration = db.query(func.avg(Call.duration)).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.duration > 0
-            )
-        ).scalar() or 0
+        avg_duration = counts["avg_duration"]
 
         # Sentiment global
-        positive = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.sentiment == Sentiment.POSITIVE
-            )
-        ).count()
-
-        neutral = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.sentiment == Sentiment.NEUTRAL
-            )
-        ).count()
-
-        negative = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.sentiment == Sentiment.NEGATIVE
-            )
-        ).count()
+        positive = counts["sentiment"][Sentiment.POSITIVE.value]
+        neutral = counts["sentiment"][Sentiment.NEUTRAL.value]
+        negative = counts["sentiment"][Sentiment.NEGATIVE.value]
 
         # Calculer ETA
         eta_completion = None
@@ -327,7 +224,7 @@ def get_live_stats(
 @router.get("/campaign/{campaign_id}/timeline")
 def get_campaign_timeline(
     campaign_id: int,
-    interval: int = 60,
+    interval: int = Query(60, ge=1, description="Intervalle en minutes"),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -348,41 +245,14 @@ def get_campaign_timeline(
     if not campaign.started_at:
         return {"timeline": [], "message": "Campaign not started yet"}
 
-    # Calculer intervalles
-    start_time = campaign.started_at
+    # Intervalles terminés depuis TIMELINE_FINAL_AFTER_MINUTES (ou avant la fin de campagne): en cache
     end_time = campaign.completed_at or datetime.utcnow()
+    final_before = None
+    if config.TIMELINE_FINAL_AFTER_MINUTES > 0:
+        final_before = campaign.completed_at or end_time - timedelta(minutes=config.TIMELINE_FINAL_AFTER_MINUTES)
 
-    timeline = []
-    current_time = start_time
-
-    while current_time < end_time:
-        next_time = current_time + timedelta(minutes=interval)
-
-        # Compter appels dans cet intervalle
-        calls_count = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.created_at >= current_time,
-                Call.created_at < next_time
-            )
-        ).count()
-
-        leads_count = db.query(Call).filter(
-            and_(
-                Call.campaign_id == campaign_id,
-                Call.created_at >= current_time,
-                Call.created_at < next_time,
-                Call.result == CallResult.LEADS
-            )
-        ).count()
-
-        timeline.append({
-            "timestamp": current_time.isoformat(),
-            "calls": calls_count,
-            "leads": leads_count
-        })
-
-        current_time = next_time
+    # Une requête GROUP BY intervalle, intervalles vides complétés à 0
+    timeline = campaign_timeline(db, campaign_id, campaign.started_at, end_time, interval, final_before)
 
     return {
         "campaign_id": campaign_id,
@@ -399,39 +269,35 @@ def get_system_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
     Returns:
         Dict avec stats système
     """
-    # Total campagnes
-    total_campaigns = db.query(Campaign).count()
-    active_campaigns = db.query(Campaign).filter(
-        Campaign.status == CampaignStatus.RUNNING
-    ).count()
-
-    # Total appels
-    total_calls = db.query(Call).count()
-    calls_today = db.query(Call).filter(
-        Call.created_at >= datetime.utcnow().replace(hour=0, minute=0, second=0)
-    ).count()
+    # Campagnes: total et actives en une requête
+    total_campaigns, active_campaigns = db.query(
+        func.count(),
+        func.count().filter(Campaign.status == CampaignStatus.RUNNING)
+    ).one()
+
+    # Appels: tous les compteurs en une requête
+    calls = db.query(
+        func.count().label("total"),
+        func.count().filter(
+            Call.created_at >= datetime.utcnow().replace(hour=0, minute=0, second=0)
+        ).label("today"),
+        func.count().filter(Call.status == CallStatus.IN_PROGRESS).label("active"),
+        func.count().filter(Call.status == CallStatus.COMPLETED).label("completed"),
+        func.count().filter(Call.result == CallResult.LEADS).label("leads"),
+        func.avg(Call.duration).label("avg_duration")
+    ).one()
+    total_calls = calls.total
+    calls_today = calls.today
+    active_calls = calls.active
+    total_completed = calls.completed
+    total_leads = calls.leads
+    avg_duration = float(calls.avg_duration or 0)
 
     # Total contacts
     total_contacts = db.query(Contact).count()
 
-    # Appels en cours (toutes campagnes)
-    active_calls = db.query(Call).filter(
-        Call.status == CallStatus.IN_PROGRESS
-    ).count()
-
-    # Performance moyenne
-    avg_duration = db.query(func.avg(Call.duration)).scalar() or 0
-    avg_conversion = 0
-
     # Taux conversion global
-    total_completed = db.query(Call).filter(
-        Call.status == CallStatus.COMPLETED
-    ).count()
-
-    total_leads = db.query(Call).filter(
-        Call.result == CallResult.LEADS
-    ).count()
-
+    avg_conversion = 0
     if total_completed > 0:
         avg_conversion = (total_leads / total_completed) * 100
 
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Audio Index - MiniBotPanel v3
+
+Index persistant des métadonnées audio (un fichier JSON, une seule lecture
+au démarrage) à la place du scan rglob + soundfile.info de chaque WAV.
+
+Par fichier: chemin absolu, taille, mtime, durée, format/subtype,
+sample rate, canaux.
+
+Rafraîchissement incrémental:
+- parcours os.scandir des racines (stat uniquement)
+- seuls les fichiers nouveaux ou modifiés (taille/mtime) sont analysés,
+  en parallèle (AUDIO_INDEX_WORKERS threads)
+- les fichiers supprimés sont retirés
+- écriture atomique (fichier temporaire + os.replace) si quelque chose a changé
+
+Racines indexées: AUDIO_DIR et FREESWITCH_SOUNDS_DIR (chemins joués par le robot).
+
+Usage:
+    from system.audio_index import get_audio_index
+
+    index = get_audio_index()          # charge AUDIO_INDEX_PATH
+    index.refresh()                    # scan incrémental + sauvegarde
+    index.push_durations(get_cache())  # durées → CacheManager
+    index.duration("/usr/share/freeswitch/sounds/minibot/julie/base/hello.wav")
+
+    # CLI
+    python3 -m system.audio_index            # refresh + résumé
+    python3 -m system.audio_index --rebuild  # ré-analyse tout
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple, Iterable
+
+from system.config import config
+
+logger = logging.getLogger(__name__)
+
+# Incrémenter si le format des entrées change (index reconstruit)
+INDEX_VERSION = 1
+AUDIO_EXTENSIONS = (".wav",)
+
+
+@dataclass(frozen=True)
+class AudioMeta:
+    """Métadonnées d'un fichier audio indexé."""
+    path: str
+    size: int
+    mtime_ns: int
+    duration: Optional[float] = None
+    format: Optional[str] = None
+    subtype: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+
+
+def probe_file(path: str, size: int, mtime_ns: int) -> AudioMeta:
+    """
+    Analyse un fichier (soundfile, fallback wave pour le PCM simple).
+
+    Les champs audio restent à None si le fichier est illisible.
+    """
+    try:
+        import soundfile as sf
+        info = sf.info(path)
+        return AudioMeta(
+            path=path, size=size, mtime_ns=mtime_ns,
+            duration=info.duration, format=info.format, subtype=info.subtype,
+            sample_rate=info.samplerate, channels=info.channels,
+        )
+    except Exception as e:
+        logger.debug(f"soundfile failed for {path}: {e}")
+
+    try:
+        import wave
+        with wave.open(path, 'rb') as wav:
+            rate = wav.getframerate()
+            return AudioMeta(
+                path=path, size=size, mtime_ns=mtime_ns,
+                duration=wav.getnframes() / float(rate), format="WAV",
+                subtype=f"PCM_{wav.getsampwidth() * 8}",
+                sample_rate=rate, channels=wav.getnchannels(),
+            )
+    except Exception as e:
+        logger.debug(f"wave module failed for {path}: {e}")
+
+    return AudioMeta(path=path, size=size, mtime_ns=mtime_ns)
+
+
+def scan_tree(root: Path) -> Dict[str, Tuple[int, int]]:
+    """
+    {chemin absolu: (taille, mtime_ns)} des fichiers audio sous root (os.scandir).
+
+    Les liens symboliques vers des répertoires sont suivis, chaque répertoire
+    (st_dev, st_ino) n'est parcouru qu'une fois: pas de boucle sur un cycle.
+    """
+    found = {}
+    visited = set()
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            stat = os.stat(directory)
+            if (stat.st_dev, stat.st_ino) in visited:
+                continue
+            visited.add((stat.st_dev, stat.st_ino))
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=True):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                            stat = entry.stat()
+                            found[os.path.abspath(entry.path)] = (stat.st_size, stat.st_mtime_ns)
+                    except OSError:
+                        continue  # Supprimé pendant le scan
+        except OSError:
+            continue
+    return found
+
+
+def default_roots() -> List[Path]:
+    """Racines indexées: audio/ du projet + sons FreeSWITCH (si présents)."""
+    return [Path(config.AUDIO_DIR), Path(config.FREESWITCH_SOUNDS_DIR)]
+
+
+class AudioIndex:
+    """Index {chemin absolu: AudioMeta} persisté en JSON."""
+
+    def __init__(self, index_path: Optional[Path] = None):
+        self.index_path = Path(index_path or config.AUDIO_INDEX_PATH)
+        self._entries: Dict[str, AudioMeta] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ========== PERSISTANCE ==========
+
+    def load(self) -> int:
+        """Charge l'index (une lecture). Retourne le nombre d'entrées (0 si absent/obsolète)."""
+        try:
+            data = json.loads(self.index_path.read_bytes())
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            logger.warning(f"⚠️ Audio index unreadable ({self.index_path}): {e}, rebuilding")
+            return 0
+
+        if data.get("version") != INDEX_VERSION:
+            logger.info(f"Audio index version {data.get('version')} != {INDEX_VERSION}, rebuilding")
+            return 0
+
+        fields = AudioMeta.__dataclass_fields__.keys()
+        entries = {
+            row[0]: AudioMeta(**dict(zip(fields, row)))
+            for row in data.get("entries", [])
+        }
+        with self._lock:
+            self._entries = entries
+            self._dirty = False
+        return len(entries)
+
+    def save(self, force: bool = False) -> bool:
+        """Écrit l'index si modifié (écriture atomique). Retourne True si écrit."""
+        with self._lock:
+            if not self._dirty and not force:
+                return False
+            # Lignes compactes (tuples dans l'ordre des champs)
+            rows = [list(asdict(meta).values()) for meta in self._entries.values()]
+            self._dirty = False
+
+        payload = json.dumps({"version": INDEX_VERSION, "entries": rows}, separators=(",", ":"))
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        # Nom temporaire unique (threads d'un même process compris), même répertoire pour os.replace
+        tmp = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.index_path.parent,
+            prefix=f"{self.index_path.name}.", suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(payload)
+            os.replace(tmp.name, self.index_path)
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            with self._lock:
+                self._dirty = True  # Réessayé au prochain save()
+            raise
+        return True
+
+    # ========== REFRESH ==========
+
+    def refresh(
+        self,
+        roots: Optional[Iterable[Path]] = None,
+        workers: Optional[int] = None,
+        rebuild: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Met l'index à jour: stat de tous les fichiers, analyse (parallèle)
+        des nouveaux/modifiés, retrait des supprimés, sauvegarde si changement.
+
+        Args:
+            roots: Répertoires à indexer (défaut: default_roots())
+            workers: Threads d'analyse (défaut: config.AUDIO_INDEX_WORKERS)
+            rebuild: Ré-analyser tous les fichiers
+
+        Returns:
+            {"files", "probed", "removed", "unchanged", "scan_ms", "probe_ms"}
+        """
+        roots = [Path(root) for root in (roots or default_roots())]
+        workers = workers or config.AUDIO_INDEX_WORKERS
+
+        start = time.time()
+        found: Dict[str, Tuple[int, int]] = {}
+        for root in roots:
+            if root.is_dir():
+                found.update(scan_tree(root))
+        scan_ms = (time.time() - start) * 1000
+
+        prefixes = tuple(os.path.join(os.path.abspath(root), "") for root in roots)
+        with self._lock:
+            removed = [
+                path for path in self._entries
+                if path.startswith(prefixes) and path not in found
+            ]
+            to_probe = [
+                (path, size, mtime_ns) for path, (size, mtime_ns) in found.items()
+                if rebuild or self._is_changed(path, size, mtime_ns)
+            ]
+
+        start = time.time()
+        if len(to_probe) > 1 and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="audio-index") as pool:
+                probed = list(pool.map(lambda args: probe_file(*args), to_probe))
+        else:
+            probed = [probe_file(*args) for args in to_probe]
+        probe_ms = (time.time() - start) * 1000
+
+        with self._lock:
+            for path in removed:
+                del self._entries[path]
+            for meta in probed:
+                self._entries[meta.path] = meta
+            if removed or probed:
+                self._dirty = True
+
+        self.save()
+
+        return {
+            "files": len(found),
+            "probed": len(probed),
+            "removed": len(removed),
+            "unchanged": len(found) - len(probed),
+            "scan_ms": scan_ms,
+            "probe_ms": probe_ms,
+        }
+
+    def _is_changed(self, path: str, size: int, mtime_ns: int) -> bool:
+        meta = self._entries.get(path)
+        return meta is None or meta.size != size or meta.mtime_ns != mtime_ns
+
+    # ========== LOOKUPS ==========
+
+    def get(self, path: str) -> Optional[AudioMeta]:
+        """Métadonnées indexées (aucun accès disque)."""
+        return self._entries.get(os.path.abspath(path))
+
+    def duration(self, path: str) -> Optional[float]:
+        """Durée indexée en secondes (aucun accès disque), None si inconnue."""
+        meta = self.get(path)
+        return meta.duration if meta else None
+
+    def probe(self, path: str) -> Optional[AudioMeta]:
+        """
+        Métadonnées à jour d'un fichier: un stat, analyse seulement si le
+        fichier n'est pas indexé ou a changé. None si le fichier n'existe pas.
+        """
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        meta = self._entries.get(path)
+        if meta and meta.size == stat.st_size and meta.mtime_ns == stat.st_mtime_ns:
+            return meta
+
+        meta = probe_file(path, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            self._entries[path] = meta
+            self._dirty = True
+        return meta
+
+    def push_durations(self, cache) -> int:
+        """Pousse toutes les durées connues dans le CacheManager. Retourne le nombre poussé."""
+        count = 0
+        for meta in list(self._entries.values()):
+            if meta.duration is not None:
+                cache.cache_audio_duration(meta.path, meta.duration)
+                count += 1
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        entries = list(self._entries.values())
+        return {
+            "entries": len(entries),
+            "unreadable": sum(1 for meta in entries if meta.duration is None),
+            "total_duration_s": round(sum(meta.duration or 0.0 for meta in entries), 1),
+            "index_path": str(self.index_path),
+        }
+
+
+_index: Optional[AudioIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_audio_index() -> AudioIndex:
+    """Index global (chargé depuis AUDIO_INDEX_PATH au premier appel)."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = AudioIndex()
+                index.load()
+                _index = index
+    return _index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index des métadonnées audio (durée, format, sample rate)")
+    parser.add_argument("--rebuild", action="store_true", help="Ré-analyse tous les fichiers")
+    parser.add_argument("--root", action="append", help="Racine à indexer (défaut: audio/ + sons FreeSWITCH)")
+    parser.add_argument("--workers", type=int, help="Threads d'analyse")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    index = AudioIndex()
+    start = time.perf_counter()
+    loaded = index.load()
+    load_ms = (time.perf_counter() - start) * 1000
+
+    result = index.refresh(roots=args.root, workers=args.workers, rebuild=args.rebuild)
+    stats = index.get_stats()
+
+    print(f"📂 Index: {stats['index_path']} ({loaded} entries loaded in {load_ms:.1f}ms)")
+    print(
+        f"🔍 {result['files']} files: {result['probed']} probed, {result['removed']} removed, "
+        f"{result['unchanged']} unchanged (scan {result['scan_ms']:.0f}ms, probe {result['probe_ms']:.0f}ms)"
+    )
+    print(f"🎵 {stats['entries']} indexed, {stats['total_duration_s']}s total, {stats['unreadable']} unreadable")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
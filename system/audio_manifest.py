@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Audio Manifest - MiniBotPanel v3
+
+Résolution unique, au chargement du scénario, de tous les fichiers audio
+qu'un appel peut jouer:
+- audio de chaque étape (BASE_DIR/sounds/{theme}/{voice}/{audio_file})
+- variantes retry (retry_silence_1.wav ... _9.wav) des étapes retry
+- réponses audio des objections du theme_file
+avec durée, sample rate et rapport des fichiers manquants.
+
+Pendant l'appel, les lookups sont purement en mémoire (aucun stat disque).
+Le manifest est reconstruit si le mtime d'un des répertoires audio change
+(vérifié au plus toutes les AUDIO_MANIFEST_CHECK_INTERVAL secondes).
+
+Utilisation:
+    from system.audio_manifest import build_manifest
+
+    manifest = build_manifest(scenario, "objections_general", objection_files)
+    manifest.step_path("hello")              # chemin absolu ou None
+    manifest.objection_path("obj_1.wav")     # chemin absolu ou None
+    manifest.missing                         # fichiers introuvables
+"""
+
+import os
+import time
+import random
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple, Iterable
+
+from system.config import config
+from system.cache_manager import get_cache
+from system.audio_index import get_audio_index
+
+logger = logging.getLogger(__name__)
+
+# Étapes pour lesquelles une variante aléatoire est choisie (_1 ... _9)
+RANDOM_RETRY_STEPS = ("retry_silence", "retry_global")
+MAX_RETRY_VARIANTS = 9
+
+
+@dataclass(frozen=True)
+class AudioEntry:
+    """Fichier audio résolu (chemin absolu + métadonnées)."""
+    path: str
+    exists: bool
+    duration: Optional[float] = None
+    sample_rate: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class StepAudio:
+    """Audio d'une étape et ses variantes retry éventuelles."""
+    step: str
+    audio: Optional[AudioEntry]
+    variants: Tuple[AudioEntry, ...] = ()
+
+
+@dataclass
+class AudioManifest:
+    """Manifest audio d'un scénario (lookups en mémoire uniquement)."""
+    scenario_name: str
+    theme_file: str
+    steps: Dict[str, StepAudio]
+    objections: Dict[str, AudioEntry]
+    missing: List[str]
+    signature: Tuple[Tuple[str, Optional[int]], ...]
+    built_at: float = field(default_factory=time.time)
+    checked_at: float = field(default_factory=time.time)
+    build_ms: float = 0.0
+
+    def step_path(self, step_name: str) -> Optional[str]:
+        """
+        Chemin absolu de l'audio d'une étape (variante aléatoire si retry).
+
+        Returns:
+            Chemin ou None si l'étape n'a pas d'audio existant
+        """
+        step_audio = self.steps.get(step_name)
+        if not step_audio:
+            return None
+
+        if step_audio.variants:
+            selected = random.choice(step_audio.variants)
+            logger.info(f"Random retry selection: {Path(selected.path).name} (from {len(step_audio.variants)} variants)")
+            return selected.path
+
+        if step_audio.audio and step_audio.audio.exists:
+            return step_audio.audio.path
+        return None
+
+    def objection_path(self, audio_file: str) -> Optional[str]:
+        """Chemin absolu de la réponse audio d'une objection (None si manquant)."""
+        entry = self.objections.get(audio_file)
+        return entry.path if entry and entry.exists else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Résumé du manifest (compteurs + fichiers manquants)."""
+        return {
+            "scenario": self.scenario_name,
+            "theme_file": self.theme_file,
+            "steps": len(self.steps),
+            "retry_variants": sum(len(s.variants) for s in self.steps.values()),
+            "objections": len(self.objections),
+            "missing": list(self.missing),
+            "build_ms": round(self.build_ms, 1),
+        }
+
+
+def probe_audio(path: Path) -> AudioEntry:
+    """
+    Stat + durée/sample rate d'un fichier via l'index audio persistant
+    (analyse soundfile/wave seulement si le fichier est nouveau ou modifié).
+
+    La durée est aussi poussée dans le cache audio_durations du CacheManager
+    pour que _get_audio_duration() n'ait plus d'I/O.
+    """
+    meta = get_audio_index().probe(str(path))
+    if meta is None:
+        return AudioEntry(path=str(path), exists=False)
+
+    if meta.duration is not None:
+        get_cache().cache_audio_duration(str(path), meta.duration)
+
+    return AudioEntry(path=str(path), exists=True, duration=meta.duration, sample_rate=meta.sample_rate)
+
+
+def _dir_signature(directories: Iterable[Path]) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """mtime_ns de chaque répertoire (None si absent)."""
+    signature = []
+    for directory in sorted(set(directories)):
+        try:
+            signature.append((str(directory), os.stat(directory).st_mtime_ns))
+        except OSError:
+            signature.append((str(directory), None))
+    return tuple(signature)
+
+
+def _scenario_name(scenario: Dict[str, Any]) -> str:
+    name = getattr(scenario, "name", None)
+    if name:
+        return name
+    return scenario.get("name") or scenario.get("metadata", {}).get("name", "unknown")
+
+
+def _step_audio_dir(scenario: Dict[str, Any], step_config: Dict[str, Any]) -> Path:
+    theme = scenario.get("theme", "general")
+    voice = scenario.get("voice", step_config.get("voice", "julie"))
+    return config.BASE_DIR / "sounds" / theme / voice
+
+
+def _objections_dir(theme_file: str) -> Path:
+    return Path(config.FREESWITCH_SOUNDS_DIR) / theme_file / "objections"
+
+
+def manifest_directories(
+    scenario: Dict[str, Any],
+    theme_file: str,
+    objection_audio_files: Iterable[str] = ()
+) -> List[Path]:
+    """Répertoires surveillés (mtime) pour un scénario et ses objections."""
+    directories = {_objections_dir(theme_file)}
+    for audio_file in objection_audio_files:
+        if audio_file:
+            directories.add((_objections_dir(theme_file) / audio_file).parent)
+    for step_config in scenario.get("steps", {}).values():
+        filename = step_config.get("audio_file")
+        if not filename:
+            continue
+        if os.path.isabs(filename):
+            directories.add(Path(filename).parent)
+        else:
+            directories.add(_step_audio_dir(scenario, step_config))
+    return sorted(directories)
+
+
+def build_manifest(
+    scenario: Dict[str, Any],
+    theme_file: str,
+    objection_audio_files: Iterable[str] = ()
+) -> AudioManifest:
+    """
+    Construit le manifest audio d'un scénario.
+
+    Même résolution que RobotFreeSWITCH._get_audio_path_for_step et la
+    lecture des réponses d'objection, faite une seule fois.
+
+    Args:
+        scenario: Scénario chargé (CompiledScenario ou dict)
+        theme_file: Fichier d'objections (ex: "objections_general")
+        objection_audio_files: audio_path des objections du theme_file
+
+    Returns:
+        AudioManifest
+    """
+    start = time.time()
+    objection_audio_files = list(objection_audio_files)
+    steps: Dict[str, StepAudio] = {}
+    objections: Dict[str, AudioEntry] = {}
+    missing: List[str] = []
+
+    # Signature AVANT la résolution: un fichier ajouté pendant le build
+    # déclenchera un rebuild au prochain check
+    signature = _dir_signature(manifest_directories(scenario, theme_file, objection_audio_files))
+
+    for step_name, step_config in scenario.get("steps", {}).items():
+        filename = step_config.get("audio_file")
+        if not filename:
+            steps[step_name] = StepAudio(step=step_name, audio=None)
+            continue
+
+        if os.path.isabs(filename):
+            audio_dir = Path(filename).parent
+            audio_path = Path(filename)
+        else:
+            audio_dir = _step_audio_dir(scenario, step_config)
+            audio_path = audio_dir / filename
+
+        # Variantes retry: base_name_1.wav, base_name_2.wav, ... (arrêt au premier trou)
+        variants = []
+        if step_name in RANDOM_RETRY_STEPS:
+            base_name = Path(filename).stem
+            ext = Path(filename).suffix
+            for i in range(1, MAX_RETRY_VARIANTS + 1):
+                variant = probe_audio(audio_dir / f"{base_name}_{i}{ext}")
+                if not variant.exists:
+                    break
+                variants.append(variant)
+
+        audio = probe_audio(audio_path)
+        if not audio.exists and not variants:
+            missing.append(audio.path)
+
+        steps[step_name] = StepAudio(step=step_name, audio=audio, variants=tuple(variants))
+
+    for audio_file in dict.fromkeys(f for f in objection_audio_files if f):
+        entry = probe_audio(_objections_dir(theme_file) / audio_file)
+        objections[audio_file] = entry
+        if not entry.exists:
+            missing.append(entry.path)
+
+    manifest = AudioManifest(
+        scenario_name=_scenario_name(scenario),
+        theme_file=theme_file,
+        steps=steps,
+        objections=objections,
+        missing=missing,
+        signature=signature,
+        build_ms=(time.time() - start) * 1000,
+    )
+
+    logger.info(
+        f"🎵 Audio manifest '{manifest.scenario_name}': {len(steps)} steps, "
+        f"{len(objections)} objections, {len(missing)} missing ({manifest.build_ms:.0f}ms)"
+    )
+    for path in missing[:10]:
+        logger.warning(f"   ⚠️ Missing audio: {path}")
+    if len(missing) > 10:
+        logger.warning(f"   ⚠️ ... and {len(missing) - 10} more")
+
+    return manifest
+
+
+def is_stale(manifest: AudioManifest, force: bool = False) -> bool:
+    """
+    True si un répertoire audio a changé (mtime) depuis le build.
+
+    Le stat des répertoires n'est fait qu'une fois par
+    AUDIO_MANIFEST_CHECK_INTERVAL secondes (sauf force=True).
+    """
+    now = time.time()
+    if not force and (now - manifest.checked_at) < config.AUDIO_MANIFEST_CHECK_INTERVAL:
+        return False
+
+    manifest.checked_at = now
+    return _dir_signature(Path(directory) for directory, _ in manifest.signature) != manifest.signature
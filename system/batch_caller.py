@@ -8,7 +8,11 @@ Worker qui gère la file d'attente et lance les appels par batch.
 
 Fonctionnalités:
 - Lecture de la file d'attente DB
+- Réservation atomique (FOR UPDATE SKIP LOCKED + bail): plusieurs
+  workers / nœuds robot peuvent vider la même campagne sans double appel
 - Lancement par batch configurable
+- Cadencement sans connexion DB (CallDispatcher: token bucket par
+  campagne + plafond global, originate dans un pool de threads)
 - Gestion des retry NO_ANSWER
 - Respect des limites de concurrence
 - Logs détaillés
@@ -26,31 +30,37 @@ Utilisation:
 import time
 import threading
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import signal
 import sys
 
-from sqlalchemy import or_, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, update
 
 from system.database import SessionLocal, engine
-from system.models import Call, Campaign, Contact, CallStatus, CallResult, CampaignStatus
+from system.models import Call, Campaign, CallStatus, CallResult, CampaignStatus
+from system.call_queue import CallQueue, schedule_retries
+from system.call_dispatcher import CallDispatcher, DispatchJob, claim_jobs
+from system.stats_rollup import RollupDelta
 from system.config import config
 from system.logger import get_logger
-from system.robot_freeswitch import RobotFreeSWITCH
 
 # Logger
 logger = get_logger("system", name="batch_caller")
 
+# Appels qui occupent un slot de la campagne (QUEUED: réservés par un worker, tous nœuds confondus)
+ACTIVE_STATUSES = (CallStatus.QUEUED, CallStatus.IN_PROGRESS, CallStatus.CALLING)
+
 
 class BatchCaller:
     """
     Worker qui gère la file d'attente des appels.
 
     Cycle:
-    1. Récupère les appels à lancer (PENDING/RETRY)
+    1. Remet en file les appels dont le bail a expiré (worker mort)
     2. Vérifie les limites (concurrent calls, batch size)
-    3. Lance les appels via robot_freeswitch
+    3. Réserve les appels à lancer (PENDING/RETRY → QUEUED) et les confie
+       au dispatcher, qui les lance via robot_freeswitch à la cadence de
+       chaque campagne
     4. Gère les retry pour NO_ANSWER
     5. Met à jour les stats
     """
@@ -67,16 +77,32 @@ class BatchCaller:
         self.max_concurrent = config.MAX_CONCURRENT_CALLS
         self.delay_between_calls = config.DELAY_BETWEEN_CALLS
         self.queue_check_interval = config.QUEUE_CHECK_INTERVAL
+        self.retry_check_interval = config.RETRY_CHECK_INTERVAL
+        self._next_retry_check = 0.0  # time.monotonic() du prochain passage retry
+
+        # File partagée entre workers (réservation par worker_id + bail)
+        self.queue = CallQueue()
+        self.worker_id = self.queue.worker_id
 
-        # Robot FreeSWITCH
+        # Robot FreeSWITCH (import lazy: modèles IA chargés seulement ici,
+        # pas à l'import du module par les CLI/API)
+        from system.robot_freeswitch import RobotFreeSWITCH
         self.robot = RobotFreeSWITCH()
 
+        # Cadencement des originate (aucune session DB pendant l'attente)
+        self.dispatcher = CallDispatcher(self.robot, queue=self.queue, on_launched=self._on_call_launched)
+
         # Stats
         self.total_launched = 0
         self.total_retry = 0
+        self.total_recovered = 0
         self.active_calls = {}
+        self._active_lock = threading.Lock()  # active_calls: écrit par les threads d'originate
 
-        logger.info(f"✅ BatchCaller initialized (batch_size={self.batch_size}, max_concurrent={self.max_concurrent})")
+        logger.info(
+            f"✅ BatchCaller initialized (worker={self.worker_id}, batch_size={self.batch_size}, "
+            f"max_concurrent={self.max_concurrent})"
+        )
 
     def start(self):
         """Démarre le worker."""
@@ -92,6 +118,7 @@ class BatchCaller:
             return False
 
         self.running = True
+        self.dispatcher.start()
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
 
@@ -106,6 +133,11 @@ class BatchCaller:
         if self.thread:
             self.thread.join(timeout=5)
 
+        # Appels réservés mais pas encore lancés: rendus à la file
+        released = self.dispatcher.stop()
+        if released:
+            logger.info(f"↩️ Released {released} unsent calls back to the queue")
+
         # Arrêter robot
         self.robot.stop()
 
@@ -117,18 +149,25 @@ class BatchCaller:
 
         while self.running:
             try:
-                # Process queue
-                launched = self._process_queue()
-
-                if launched > 0:
-                    logger.info(f"📞 Launched {launched} calls")
-                    self.total_launched += launched
-
-                # Check retry
-                retried = self._process_retry()
-                if retried > 0:
-                    logger.info(f"🔁 Scheduled {retried} retry")
-                    self.total_retry += retried
+                # Baux expirés (worker arrêté entre réservation et originate)
+                recovered = self._recover_expired_leases()
+                if recovered > 0:
+                    logger.warning(f"♻️ Recovered {recovered} calls with expired lease")
+                    self.total_recovered += recovered
+
+                # Process queue (réservation; les originate partent du dispatcher)
+                claimed = self._process_queue()
+
+                if claimed > 0:
+                    logger.info(f"📥 Claimed {claimed} calls for dispatch")
+
+                # Check retry (cadence propre: RETRY_CHECK_INTERVAL, pas à chaque tour)
+                if time.monotonic() >= self._next_retry_check:
+                    self._next_retry_check = time.monotonic() + self.retry_check_interval
+                    retried = self._process_retry()
+                    if retried > 0:
+                        logger.info(f"🔁 Scheduled {retried} retry")
+                        self.total_retry += retried
 
                 # Update active calls
                 self._update_active_calls()
@@ -144,63 +183,73 @@ class BatchCaller:
 
     def _process_queue(self) -> int:
         """
-        Process la file d'attente.
+        Process la file d'attente: réserve des appels et les confie au dispatcher.
+
+        La session ne sert qu'aux requêtes (aucune attente pendant qu'elle
+        est ouverte): le cadencement est fait par le dispatcher.
 
         Returns:
-            Nombre d'appels lancés
+            Nombre d'appels réservés
         """
         db = SessionLocal()
-        launched = 0
+        claimed = 0
 
         try:
-            # Récupérer campagnes actives
-            campaigns = db.query(Campaign).filter(
+            # Récupérer campagnes actives (lignes: pas d'objets expirés/rechargés après chaque commit de claim)
+            campaigns = db.query(
+                Campaign.id,
+                Campaign.scenario,
+                Campaign.max_concurrent_calls,
+                Campaign.batch_size,
+                Campaign.delay_between_calls
+            ).filter(
                 Campaign.status == CampaignStatus.RUNNING
             ).all()
 
+            # Jobs en attente de campagnes arrêtées / en pause: retirés du dispatcher
+            stopped = set(self.dispatcher.pending_campaigns()) - {campaign.id for campaign in campaigns}
+            if stopped:
+                withdrawn = self.dispatcher.withdraw_campaigns(stopped)
+                logger.info(f"⏏️ Withdrew {withdrawn} pending calls of stopped campaigns {sorted(stopped)}")
+
+            if not campaigns:
+                return 0
+
+            # Appels actifs de toutes les campagnes en une requête
+            active_counts = dict(
+                db.query(Call.campaign_id, func.count(Call.id)).filter(
+                    Call.campaign_id.in_([campaign.id for campaign in campaigns]),
+                    Call.status.in_(ACTIVE_STATUSES)
+                ).group_by(Call.campaign_id).all()
+            )
+
             for campaign in campaigns:
                 # Vérifier limites campagne
-                active_campaign_calls = db.query(Call).filter(
-                    Call.campaign_id == campaign.id,
-                    Call.status.in_([CallStatus.IN_PROGRESS, CallStatus.CALLING])
-                ).count()
+                active_campaign_calls = active_counts.get(campaign.id, 0)
 
                 if active_campaign_calls >= campaign.max_concurrent_calls:
                     logger.debug(f"Campaign {campaign.id} at limit ({active_campaign_calls}/{campaign.max_concurrent_calls})")
                     continue
 
-                # Calculer nombre à lancer
+                # Calculer nombre à lancer (jobs en attente dans le dispatcher compris)
                 available_slots = min(
                     campaign.max_concurrent_calls - active_campaign_calls,
-                    self.max_concurrent - len(self.active_calls),
+                    self.max_concurrent - len(self.active_calls) - self.dispatcher.pending(),
                     campaign.batch_size
                 )
 
                 if available_slots <= 0:
                     continue
 
-                # Récupérer appels à lancer
-                now = datetime.utcnow()
-                calls = db.query(Call).filter(
-                    Call.campaign_id == campaign.id,
-                    Call.status.in_([CallStatus.PENDING, CallStatus.RETRY]),
-                    or_(
-                        Call.scheduled_at == None,
-                        Call.scheduled_at <= now
-                    )
-                ).order_by(
-                    Call.queue_priority.desc(),
-                    Call.scheduled_at.asc()
-                ).limit(available_slots).all()
-
-                # Lancer les appels
-                for call in calls:
-                    success = self._launch_call(call, campaign, db)
-                    if success:
-                        launched += 1
-                        time.sleep(self.delay_between_calls)
-
-                db.commit()
+                # Réserver (transaction courte, commitée) puis confier au dispatcher
+                jobs = claim_jobs(db, self.queue, campaign, available_slots)
+                if not jobs:
+                    continue
+
+                delay = campaign.delay_between_calls
+                self.dispatcher.set_campaign_rate(campaign.id, self.delay_between_calls if delay is None else delay)
+                self.dispatcher.submit(jobs)
+                claimed += len(jobs)
 
         except Exception as e:
             logger.error(f"Error processing queue: {e}", exc_info=True)
@@ -209,223 +258,227 @@ class BatchCaller:
         finally:
             db.close()
 
-        return launched
-
-    def _launch_call(self, call: Call, campaign: Campaign, db: Session) -> bool:
+        return claimed
+
+    def _on_call_launched(self, job: DispatchJob, call_uuid: str):
+        """Originate réussi (thread du dispatcher): suivi jusqu'au hangup."""
+        with self._active_lock:
+            self.active_calls[call_uuid] = {
+                "call_id": job.call_id,
+                "campaign_id": job.campaign_id,
+                "started_at": time.time()
+            }
+            self.total_launched += 1
+
+        call_logger = get_logger("calls", call_uuid=call_uuid)
+        call_logger.info(f"Call launched to {job.phone}", extra={
+            "campaign_id": job.campaign_id,
+            "contact_id": job.contact_id,
+            "scenario": job.scenario
+        })
+
+    def _recover_expired_leases(self) -> int:
         """
-        Lance un appel individuel.
-
-        Args:
-            call: Appel à lancer
-            campaign: Campagne
-            db: Session DB
+        Remet en file les appels QUEUED dont le bail a expiré.
 
         Returns:
-            True si succès
+            Nombre d'appels remis en PENDING/RETRY
         """
-        try:
-            # Récupérer contact
-            contact = db.query(Contact).filter(Contact.id == call.contact_id).first()
-            if not contact:
-                logger.error(f"Contact {call.contact_id} not found for call {call.id}")
-                call.status = CallStatus.FAILED
-                return False
-
-            # Logger
-            call_logger = get_logger("calls", call_uuid=call.uuid)
-            call_logger.info(f"Launching call to {contact.phone}", extra={
-                "campaign_id": campaign.id,
-                "contact_id": contact.id,
-                "retry_count": call.retry_count,
-                "scenario": campaign.scenario
-            })
-
-            # Lancer via FreeSWITCH
-            result = self.robot.originate_call(
-                uuid=call.uuid,
-                phone_number=contact.phone,
-                campaign_id=campaign.id,
-                contact_id=contact.id,
-                scenario=campaign.scenario,
-                caller_id="+33123456789",  # TODO: From config
-                retry_count=call.retry_count,
-                variables={
-                    "first_name": contact.first_name,
-                    "last_name": contact.last_name,
-                    "company": contact.company,
-                    "email": contact.email
-                }
-            )
+        db = SessionLocal()
 
-            if result:
-                # Mettre à jour statut
-                call.status = CallStatus.CALLING
-                call.started_at = datetime.utcnow()
-                call.retry_count += 1
-                call.last_attempt_at = datetime.utcnow()
-
-                # Ajouter aux appels actifs
-                self.active_calls[call.uuid] = {
-                    "call_id": call.id,
-                    "campaign_id": campaign.id,
-                    "started_at": time.time()
-                }
-
-                call_logger.info("Call launched successfully")
-                return True
-            else:
-                call_logger.error("Failed to launch call")
-                call.status = CallStatus.FAILED
-                return False
+        try:
+            return self.queue.recover_expired(db)
 
         except Exception as e:
-            logger.error(f"Error launching call {call.id}: {e}", exc_info=True)
-            call.status = CallStatus.FAILED
-            return False
+            logger.error(f"Error recovering expired leases: {e}", exc_info=True)
+            db.rollback()
+            return 0
+
+        finally:
+            db.close()
 
     def _process_retry(self) -> int:
         """
         Process les retry pour NO_ANSWER et BUSY.
 
+        Un seul UPDATE ... FROM campaigns, calls AS before ... RETURNING
+        (schedule_retries, un par statut sur SQLite): scheduled_at calculé en
+        SQL, statut d'avant rendu pour le rollup, aucun appel chargé en Python.
+
         Returns:
             Nombre de retry planifiés
         """
         db = SessionLocal()
-        retried = 0
 
         try:
-            # Récupérer appels NO_ANSWER ou BUSY
-            calls = db.query(Call).filter(
-                Call.status.in_([CallStatus.NO_ANSWER, CallStatus.BUSY]),
-                Call.retry_count < Call.max_retries
-            ).all()
-
-            for call in calls:
-                campaign = db.query(Campaign).filter(Campaign.id == call.campaign_id).first()
-                if not campaign or not campaign.retry_enabled:
-                    continue
-
-                # Calculer prochaine tentative
-                if call.status == CallStatus.NO_ANSWER:
-                    delay_minutes = campaign.retry_delay_minutes
-                elif call.status == CallStatus.BUSY:
-                    delay_minutes = config.RETRY_BUSY_DELAY_MINUTES
-                else:
-                    continue
-
-                next_attempt = datetime.utcnow() + timedelta(minutes=delay_minutes)
-
-                # Planifier retry
-                call.status = CallStatus.RETRY
-                call.scheduled_at = next_attempt
-                call.queue_priority = 1  # Priorité plus haute
+            rows = schedule_retries(db)
 
-                logger.info(f"Scheduled retry for call {call.id} at {next_attempt}")
-                retried += 1
-
-            db.commit()
+            for call_id, campaign_id, scheduled_at in rows:
+                logger.debug(f"Scheduled retry for call {call_id} (campaign {campaign_id}) at {scheduled_at}")
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Error processing retry: {e}", exc_info=True)
             db.rollback()
+            return 0
 
         finally:
             db.close()
 
-        return retried
-
     def _update_active_calls(self):
         """Met à jour la liste des appels actifs."""
         # Récupérer statut depuis FreeSWITCH
-        active_uuids = self.robot.get_active_calls()
+        active_uuids = set(self.robot.get_active_calls())
 
         # Nettoyer les appels terminés
-        for uuid in list(self.active_calls.keys()):
-            if uuid not in active_uuids:
-                call_info = self.active_calls.pop(uuid)
-                duration = time.time() - call_info["started_at"]
+        with self._active_lock:
+            ended = [uuid for uuid in self.active_calls if uuid not in active_uuids]
+            ended_calls = [(uuid, self.active_calls.pop(uuid)) for uuid in ended]
 
-                logger.info(f"Call {uuid} ended (duration: {duration:.1f}s)")
+        for uuid, call_info in ended_calls:
+            duration = time.time() - call_info["started_at"]
+            logger.info(f"Call {uuid} ended (duration: {duration:.1f}s)")
 
-                # Mettre à jour DB
-                self._handle_call_end(call_info["call_id"], uuid)
+        # Mettre à jour DB (une session et un commit pour tous les appels terminés)
+        if ended_calls:
+            self._handle_calls_end(ended_calls)
 
-    def _handle_call_end(self, call_id: int, uuid: str):
+    def _handle_calls_end(self, ended_calls: List[Tuple[str, Dict]]):
         """
-        Gère la fin d'un appel.
+        Gère la fin d'un lot d'appels.
+
+        Un SELECT pour tous les appels, puis un UPDATE par clé primaire en
+        executemany (mêmes colonnes pour chaque appel: une instruction quel
+        que soit le mélange décrochés / sans réponse); le rollup des
+        statistiques est mis à jour dans la même transaction.
 
         Args:
-            call_id: ID de l'appel
-            uuid: UUID FreeSWITCH
+            ended_calls: [(uuid FreeSWITCH, {"call_id", "campaign_id", "started_at"})]
         """
         db = SessionLocal()
 
         try:
-            call = db.query(Call).filter(Call.id == call_id).first()
-            if not call:
-                return
-
-            # Récupérer infos depuis FreeSWITCH
-            call_info = self.robot.get_call_info(uuid)
-
-            if call_info:
-                # Mettre à jour statut
-                hangup_cause = call_info.get("hangup_cause", "NORMAL_CLEARING")
-
-                if hangup_cause == "NO_ANSWER":
-                    call.status = CallStatus.NO_ANSWER
-                elif hangup_cause == "BUSY":
-                    call.status = CallStatus.BUSY
-                elif hangup_cause == "NORMAL_CLEARING":
-                    call.status = CallStatus.COMPLETED
-                else:
-                    call.status = CallStatus.FAILED
-
-                # Durée
-                call.ended_at = datetime.utcnow()
-                if call.started_at:
-                    call.duration = int((call.ended_at - call.started_at).total_seconds())
-
-                # AMD result
-                if "amd_result" in call_info:
-                    call.amd_result = call_info["amd_result"]
-
-                # Qualification result
-                if "qualification_result" in call_info:
-                    if call_info["qualification_result"] == "LEADS":
-                        call.result = CallResult.LEADS
-                    else:
-                        call.result = CallResult.NOT_INTERESTED
-            else:
-                call.status = CallStatus.FAILED
-                call.ended_at = datetime.utcnow()
+            calls = {
+                call.id: call
+                for call in db.query(Call).filter(
+                    Call.id.in_([call_info["call_id"] for _, call_info in ended_calls])
+                )
+            }
+
+            ended = []
+            rows = []
+            rollup = RollupDelta()
+            for uuid, call_info in ended_calls:
+                call = calls.get(call_info["call_id"])
+                if not call:
+                    continue
+
+                # Bilan de l'appel gardé par le robot après le hangup
+                values = self._call_end_values(call, self.robot.get_call_info(uuid))
+                rollup.remove(call)
+                rollup.add(call, **values)
+                rows.append(values)
+                ended.append((uuid, values))
 
+            if rows:
+                db.execute(update(Call), rows)
+            rollup.apply(db)
             db.commit()
 
+            # Enregistré: le robot peut oublier le bilan (gardé en cas d'échec: réessai)
+            self.robot.forget_call_info([uuid for uuid, _ in ended_calls])
+
             # Logger
-            call_logger = get_logger("calls", call_uuid=uuid)
-            call_logger.info(f"Call ended: {call.status}", extra={
-                "duration": call.duration,
-                "result": call.result,
-                "amd_result": call.amd_result
-            })
+            for uuid, values in ended:
+                call_logger = get_logger("calls", call_uuid=uuid)
+                call_logger.info(f"Call ended: {values['status']}", extra={
+                    "duration": values["duration"],
+                    "result": values["result"],
+                    "amd_result": values["amd_result"]
+                })
 
         except Exception as e:
             logger.error(f"Error handling call end: {e}", exc_info=True)
             db.rollback()
+            # Réessayés au prochain tour (sinon restés CALLING: comptés dans max_concurrent)
+            with self._active_lock:
+                self.active_calls.update(ended_calls)
 
         finally:
             db.close()
 
+    def _call_end_values(self, call: Call, call_info: Optional[dict]) -> Dict:
+        """
+        Statut final, durée, AMD et qualification d'un appel terminé.
+
+        Args:
+            call: Appel (chargé dans la session du lot)
+            call_info: Bilan de l'appel (robot.get_call_info: hangup_cause,
+                failed, amd_result, qualification_result, duration), None si inconnu
+
+        Returns:
+            Valeurs de l'UPDATE (toujours les mêmes clés, "id" compris)
+        """
+        ended_at = datetime.utcnow()
+        values = {
+            "id": call.id,
+            "status": CallStatus.FAILED,
+            "ended_at": ended_at,
+            "duration": call.duration,
+            "talk_duration": call.talk_duration,
+            "amd_result": call.amd_result,
+            "result": call.result,
+        }
+        if not call_info:
+            return values
+
+        # Statut
+        hangup_cause = call_info.get("hangup_cause") or "NORMAL_CLEARING"
+
+        if hangup_cause in ("NO_ANSWER", "NO_USER_RESPONSE"):
+            values["status"] = CallStatus.NO_ANSWER
+        elif hangup_cause in ("BUSY", "USER_BUSY"):
+            values["status"] = CallStatus.BUSY
+        elif hangup_cause == "NORMAL_CLEARING":
+            values["status"] = CallStatus.COMPLETED
+
+        # Raccroché par le robot sur échec technique (services non chargés...)
+        if call_info.get("failed"):
+            values["status"] = CallStatus.FAILED
+
+        # Durée
+        if call.started_at:
+            values["duration"] = int((ended_at - call.started_at).total_seconds())
+        if call_info.get("duration") is not None:
+            values["talk_duration"] = call_info["duration"]
+
+        # AMD result
+        if "amd_result" in call_info:
+            values["amd_result"] = call_info["amd_result"]
+
+        # Qualification result
+        if "qualification_result" in call_info:
+            if call_info["qualification_result"] == "LEADS":
+                values["result"] = CallResult.LEADS
+            elif call_info["qualification_result"] == "NO_ANSWER":
+                values["result"] = CallResult.NO_ANSWER
+            else:
+                values["result"] = CallResult.NOT_INTERESTED
+
+        return values
+
     def get_stats(self) -> dict:
         """Retourne les statistiques du batch caller."""
         return {
             "running": self.running,
+            "worker_id": self.worker_id,
             "active_calls": len(self.active_calls),
             "total_launched": self.total_launched,
             "total_retry": self.total_retry,
+            "total_recovered": self.total_recovered,
             "batch_size": self.batch_size,
-            "max_concurrent": self.max_concurrent
+            "max_concurrent": self.max_concurrent,
+            "dispatcher": self.dispatcher.get_stats()
         }
 
 
@@ -476,7 +529,9 @@ if __name__ == "__main__":
     logger.info(f"  Batch size: {config.DEFAULT_BATCH_SIZE}")
     logger.info(f"  Max concurrent: {config.MAX_CONCURRENT_CALLS}")
     logger.info(f"  Check interval: {config.QUEUE_CHECK_INTERVAL}s")
+    logger.info(f"  Retry check interval: {config.RETRY_CHECK_INTERVAL}s")
     logger.info(f"  Delay between calls: {config.DELAY_BETWEEN_CALLS}s")
+    logger.info(f"  Call lease: {config.CALL_LEASE_SECONDS}s")
     logger.info("")
 
     # Start
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Cache Core - MiniBotPanel v3
+
+Primitive de cache générique utilisée par CacheManager (un TypedCache par
+namespace: scenarios, objections, models, audio_durations).
+
+Fonctionnalités:
+- Limites en octets (taille estimée par deep_sizeof) et/ou en nombre d'entrées
+- LRU par segment + lock striping (N segments indépendants, hash(clé) % N)
+- TTL par entrée, expiration en arrière-plan via une timing wheel partagée
+  (un seul thread daemon pour tous les caches), vérifiée aussi à la lecture
+- Compteurs par namespace: hits, misses, sets, evictions, expirations, loads
+- get_or_load() / aget_or_load(): loader sync ou async avec single-flight
+  (N misses concurrents sur la même clé → 1 seul chargement)
+
+Usage:
+    from system.cache_core import TypedCache
+
+    durations = TypedCache("audio_durations", max_entries=5000, max_bytes=2_000_000,
+                           default_ttl=3600, stripes=8)
+    durations.set("/path/hello.wav", 2.4)
+    durations.get("/path/hello.wav")                       # 2.4
+    durations.get_or_load("/path/bye.wav", probe_duration)  # chargé une seule fois
+"""
+
+import sys
+import time
+import asyncio
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+# Arrêt du parcours deep_sizeof (objets très volumineux: estimation suffisante)
+SIZEOF_MAX_OBJECTS = 200_000
+
+
+def deep_sizeof(value: Any, max_objects: int = SIZEOF_MAX_OBJECTS) -> int:
+    """
+    Taille mémoire approximative (octets) d'un objet et de son contenu.
+
+    Parcourt dicts, séquences, sets, __dict__ et __slots__ (objets partagés
+    comptés une fois). Les chaînes/nombres internés sont comptés comme les
+    autres: c'est une estimation pour le budget mémoire, pas un profiler.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+
+    while stack and len(seen) < max_objects:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj, 0)
+
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            if hasattr(obj, "__dict__"):
+                stack.append(vars(obj))
+            for klass in type(obj).__mro__:
+                for slot in getattr(klass, "__slots__", ()):
+                    if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                        stack.append(getattr(obj, slot))
+
+    return total
+
+
+class TimingWheel:
+    """
+    Timing wheel (1 niveau + compteur de tours) pour l'expiration des TTL.
+
+    schedule() est O(1); le thread daemon avance d'un slot par tick et
+    n'examine que les entrées de ce slot. Les entrées dont l'échéance a
+    changé (re-set, TTL modifié) sont ignorées par TypedCache._expire().
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 512):
+        self.tick = tick
+        self.slots = slots
+        self._buckets: List[List[Tuple[int, 'TypedCache', Hashable, float]]] = [[] for _ in range(slots)]
+        self._lock = threading.Lock()
+        self._current = int(time.monotonic() / tick)
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, cache: 'TypedCache', key: Hashable, expires_at: float):
+        """Programme l'expiration de `key` à `expires_at` (time.monotonic)."""
+        with self._lock:
+            if self._thread is None:
+                # Démarrage paresseux: repartir de maintenant (aucun slot en attente)
+                self._current = int(time.monotonic() / self.tick)
+                self._thread = threading.Thread(target=self._run, name="CacheTimingWheel", daemon=True)
+                self._thread.start()
+            target = max(int(expires_at / self.tick) + 1, self._current + 1)
+            rounds = (target - self._current - 1) // self.slots
+            self._buckets[target % self.slots].append((rounds, cache, key, expires_at))
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Traite les slots échus jusqu'à `now`; retourne le nombre d'entrées expirées."""
+        now_tick = int((time.monotonic() if now is None else now) / self.tick)
+        expired = 0
+
+        while self._current < now_tick:
+            with self._lock:
+                self._current += 1
+                slot = self._current % self.slots
+                due = []
+                pending = []
+                for rounds, cache, key, expires_at in self._buckets[slot]:
+                    if rounds > 0:
+                        pending.append((rounds - 1, cache, key, expires_at))
+                    else:
+                        due.append((cache, key, expires_at))
+                self._buckets[slot] = pending
+
+            # Hors du lock de la wheel (chaque cache prend son propre lock)
+            for cache, key, expires_at in due:
+                expired += cache._expire(key, expires_at)
+
+        return expired
+
+    def _run(self):
+        while True:
+            time.sleep(self.tick)
+            try:
+                self.advance()
+            except Exception as e:
+                logger.error(f"❌ Cache timing wheel error: {e}")
+
+
+_default_wheel: Optional[TimingWheel] = None
+_default_wheel_lock = threading.Lock()
+
+
+def get_timing_wheel() -> TimingWheel:
+    """Timing wheel partagée par tous les TypedCache (un seul thread)."""
+    global _default_wheel
+    if _default_wheel is None:
+        with _default_wheel_lock:
+            if _default_wheel is None:
+                _default_wheel = TimingWheel()
+    return _default_wheel
+
+
+class _Entry:
+    __slots__ = ("value", "size", "cached_at", "expires_at", "last_accessed", "access_count")
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]):
+        self.value = value
+        self.size = size
+        self.cached_at = time.monotonic()
+        self.expires_at = expires_at
+        self.last_accessed = self.cached_at
+        self.access_count = 0
+
+
+_STRIPE_COUNTERS = ("hits", "misses", "sets", "evictions", "expirations")
+
+
+class _Stripe:
+    __slots__ = ("lock", "entries", "counters")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: OrderedDict = OrderedDict()
+        # Compteurs modifiés sous self.lock (sommés dans get_stats)
+        self.counters = dict.fromkeys(_STRIPE_COUNTERS, 0)
+
+
+class TypedCache(Generic[K, V]):
+    """
+    Cache typé thread-safe (un namespace).
+
+    Les limites (octets, entrées) sont globales au cache; l'éviction LRU
+    commence par le segment qui vient de recevoir l'entrée puis parcourt
+    les autres segments.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        default_ttl: float = 0,
+        stripes: int = 1,
+        sizer: Optional[Callable[[Any], int]] = deep_sizeof,
+        wheel: Optional[TimingWheel] = None,
+    ):
+        """
+        Args:
+            name: Nom du namespace (logs/stats)
+            max_entries: Nombre max d'entrées (0 = illimité)
+            max_bytes: Taille max estimée en octets (0 = illimité)
+            default_ttl: TTL par défaut en secondes (0 = infini)
+            stripes: Nombre de segments (locks indépendants)
+            sizer: Estimation de taille d'une valeur (None = pas de comptage)
+            wheel: Timing wheel (défaut: wheel partagée)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sizer = sizer
+        self._wheel = wheel
+        self._stripes = [_Stripe() for _ in range(max(1, stripes))]
+
+        self._size_lock = threading.Lock()
+        self._entries = 0
+        self._bytes = 0
+
+        self._inflight: Dict[K, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Compteurs single-flight (modifiés sous _inflight_lock)
+        self._load_counters = {"loads": 0, "load_errors": 0, "singleflight_waits": 0}
+
+    # ========== ACCÈS ==========
+
+    def _stripe(self, key: K) -> _Stripe:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Valeur en cache (LRU mis à jour) ou `default` si absente/expirée."""
+        stripe = self._stripe(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is not None:
+                now = time.monotonic()
+                if entry.expires_at is None or now < entry.expires_at:
+                    entry.last_accessed = now
+                    entry.access_count += 1
+                    stripe.entries.move_to_end(key)
+                    stripe.counters["hits"] += 1
+                    return entry.value
+                # Expirée mais pas encore passée par la wheel
+                self._remove_locked(stripe, key)
+                stripe.counters["expirations"] += 1
+            stripe.counters["misses"] += 1
+            return default
+
+    def peek(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Comme get() sans compteurs ni mise à jour LRU."""
+        stripe = self._stripe(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is None or (entry.expires_at is not None and time.monotonic() >= entry.expires_at):
+                return default
+            return entry.value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None, size: Optional[int] = None):
+        """
+        Met une valeur en cache (remplace atomiquement l'ancienne).
+
+        Args:
+            key: Clé
+            value: Valeur
+            ttl: TTL en secondes (None = default_ttl, 0 = infini)
+            size: Taille en octets (None = sizer(value))
+        """
+        if size is None:
+            size = self.sizer(value) if self.sizer else 0
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl > 0 else None
+
+        stripe = self._stripe(key)
+        with stripe.lock:
+            self._remove_locked(stripe, key)
+            stripe.entries[key] = _Entry(value, size, expires_at)
+            with self._size_lock:
+                self._entries += 1
+                self._bytes += size
+            stripe.counters["sets"] += 1
+
+        if expires_at is not None:
+            (self._wheel or get_timing_wheel()).schedule(self, key, expires_at)
+
+        self._enforce_limits(stripe)
+
+    def invalidate(self, key: K) -> bool:
+        """Supprime une entrée; True si elle existait."""
+        stripe = self._stripe(key)
+        with stripe.lock:
+            return self._remove_locked(stripe, key) is not None
+
+    def clear(self) -> int:
+        """Vide le cache; retourne le nombre d'entrées supprimées."""
+        count = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                for key in list(stripe.entries):
+                    self._remove_locked(stripe, key)
+                    count += 1
+        return count
+
+    def keys(self) -> List[K]:
+        """Clés présentes (ordre LRU par segment, sans compteurs)."""
+        keys = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                keys.extend(stripe.entries.keys())
+        return keys
+
+    def entry_info(self, key: K) -> Optional[Dict[str, Any]]:
+        """Métadonnées d'une entrée (taille, âge, accès, TTL restant)."""
+        stripe = self._stripe(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is None:
+                return None
+            now = time.monotonic()
+            return {
+                "size_bytes": entry.size,
+                "age_s": now - entry.cached_at,
+                "access_count": entry.access_count,
+                "ttl_remaining_s": None if entry.expires_at is None else max(0.0, entry.expires_at - now),
+            }
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def __contains__(self, key: K) -> bool:
+        return self.peek(key, _MISSING) is not _MISSING
+
+    # ========== TTL ==========
+
+    def set_default_ttl(self, ttl: float):
+        """
+        Change le TTL par défaut et l'applique aux entrées présentes
+        (échéance = mise en cache + ttl, 0 = infini).
+        """
+        self.default_ttl = ttl
+        for stripe in self._stripes:
+            with stripe.lock:
+                for key, entry in stripe.entries.items():
+                    entry.expires_at = entry.cached_at + ttl if ttl > 0 else None
+                    if entry.expires_at is not None:
+                        (self._wheel or get_timing_wheel()).schedule(self, key, entry.expires_at)
+
+    def _expire(self, key: K, expires_at: float) -> int:
+        """Appelé par la timing wheel: expire l'entrée si l'échéance n'a pas changé."""
+        stripe = self._stripe(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is None or entry.expires_at != expires_at:
+                return 0
+            self._remove_locked(stripe, key)
+            stripe.counters["expirations"] += 1
+        logger.debug(f"Cache EXPIRED: {self.name} '{key}'")
+        return 1
+
+    # ========== LIMITES ==========
+
+    def _remove_locked(self, stripe: _Stripe, key: K) -> Optional[_Entry]:
+        entry = stripe.entries.pop(key, None)
+        if entry is not None:
+            with self._size_lock:
+                self._entries -= 1
+                self._bytes -= entry.size
+        return entry
+
+    def _over_limits(self) -> bool:
+        return (
+            (self.max_entries > 0 and self._entries > self.max_entries)
+            or (self.max_bytes > 0 and self._bytes > self.max_bytes)
+        )
+
+    def _enforce_limits(self, first: _Stripe):
+        """Éviction LRU tant qu'une limite est dépassée (un segment à la fois)."""
+        if not self._over_limits():
+            return
+
+        start = self._stripes.index(first)
+        order = self._stripes[start:] + self._stripes[:start]
+        for stripe in order:
+            with stripe.lock:
+                # Garder au moins l'entrée la plus récente du segment courant
+                while self._over_limits() and len(stripe.entries) > (1 if stripe is first else 0):
+                    key = next(iter(stripe.entries))
+                    self._remove_locked(stripe, key)
+                    stripe.counters["evictions"] += 1
+                    logger.debug(f"Cache EVICT: {self.name} '{key}' (LRU)")
+            if not self._over_limits():
+                return
+
+    # ========== SINGLE-FLIGHT ==========
+
+    def _claim(self, key: K) -> Tuple[Future, bool]:
+        """
+        (future, True) si l'appelant doit charger, (future, False) s'il attend.
+
+        Le cache est relu sous le verrou avant de désigner un chargeur: un
+        chargement terminé entre le miss de l'appelant et ce claim (valeur
+        stockée puis future retirée) ne relance pas le loader.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._load_counters["singleflight_waits"] += 1
+                return future, False
+            value = self.peek(key, _MISSING)
+            future = Future()
+            if value is not _MISSING:
+                future.set_result(value)
+                return future, False
+            self._inflight[key] = future
+            return future, True
+
+    def _finish(self, key: K, future: Future, value: Any = None, error: Optional[BaseException] = None):
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+            self._load_counters["loads" if error is None else "load_errors"] += 1
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def _store_loaded(self, key: K, value: Any, ttl: Optional[float]):
+        if value is not None:  # None = échec du loader, jamais mis en cache
+            self.set(key, value, ttl=ttl)
+
+    def get_or_load(self, key: K, loader: Callable[[K], Optional[V]], ttl: Optional[float] = None) -> Optional[V]:
+        """
+        Valeur en cache, sinon loader(key) exécuté une seule fois même si
+        plusieurs threads ratent la clé en même temps (les autres attendent).
+        Un loader qui retourne None n'est pas mis en cache.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        future, leader = self._claim(key)
+        if not leader:
+            return future.result()
+
+        try:
+            value = loader(key)
+            self._store_loaded(key, value, ttl)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, value)
+        return value
+
+    async def aget_or_load(self, key: K, loader: Callable[[K], Any], ttl: Optional[float] = None) -> Optional[V]:
+        """
+        Version async de get_or_load(): loader sync ou coroutine, single-flight
+        partagé avec get_or_load() (threads et tâches asyncio).
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        future, leader = self._claim(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            value = loader(key)
+            if inspect.isawaitable(value):
+                value = await value
+            self._store_loaded(key, value, ttl)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, value)
+        return value
+
+    # ========== STATS ==========
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Compteurs + taille courante du namespace."""
+        counters = dict(self._load_counters)
+        for name in _STRIPE_COUNTERS:
+            counters[name] = sum(stripe.counters[name] for stripe in self._stripes)
+
+        total = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "total_requests": total,
+            "hit_rate_pct": round(counters["hits"] / total * 100, 1) if total else 0,
+            "cache_size": self._entries,
+            "size_bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "default_ttl": self.default_ttl,
+            "stripes": len(self._stripes),
+        }
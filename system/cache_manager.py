@@ -14,8 +14,9 @@ Fonctionnalités:
 
 Architecture:
 - Singleton pattern pour instance unique
-- Thread-safe (locks)
-- LRU eviction policy
+- Un TypedCache (system/cache_core.py) par namespace: limites en octets,
+  TTL expirés en arrière-plan (timing wheel), lock striping, compteurs
+  hits/misses/evictions et chargement single-flight (get_or_load_*)
 - Monitoring intégré
 
 Usage:
@@ -36,16 +37,20 @@ Usage:
         cache.set_objections("finance", objections)
 """
 
-import time
-import threading
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
-from collections import OrderedDict
 import logging
+import threading
+from typing import Dict, Any, Optional, List, Callable
+
+from system.cache_core import TypedCache
 
 logger = logging.getLogger(__name__)
 
 
+def _audio_duration_size(duration: float) -> int:
+    """Taille fixe d'une durée: float (24) + entrée/slot LRU (~160), sans deep_sizeof"""
+    return 184
+
+
 class CacheManager:
     """
     Gestionnaire de cache centralisé (Singleton).
@@ -71,52 +76,41 @@ class CacheManager:
             "audio_duration_ttl": 3600,  # 1h (fichiers audio changent rarement)
             "max_scenarios": 50,  # Max scénarios en cache
             "max_objections": 20,  # Max thématiques objections
-            "max_audio_durations": 100,  # Max fichiers audio en cache
+            "max_audio_durations": 5000,  # Max fichiers audio (bibliothèque de prompts complète)
+            "max_scenarios_bytes": 64 * 1024 * 1024,  # Budget mémoire estimé (deep_sizeof)
+            "max_objections_bytes": 128 * 1024 * 1024,
+            "max_audio_durations_bytes": 4 * 1024 * 1024,
             "enable_stats": True
         }
 
-        # Caches (OrderedDict pour LRU)
-        self._scenarios_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
-        self._objections_cache: OrderedDict[str, List[Any]] = OrderedDict()
-        self._models_cache: Dict[str, Any] = {}  # Models pré-chargés
-        self._audio_duration_cache: OrderedDict[str, float] = OrderedDict()  # Path → duration (seconds)
-
-        # Metadata (timestamps, hits, etc.)
-        self._scenarios_meta: Dict[str, Dict[str, Any]] = {}
-        self._objections_meta: Dict[str, Dict[str, Any]] = {}
-        self._audio_duration_meta: Dict[str, Dict[str, Any]] = {}
-
-        # Statistics
-        self.stats = {
-            "scenarios": {
-                "hits": 0,
-                "misses": 0,
-                "total_requests": 0,
-                "cache_size": 0
-            },
-            "objections": {
-                "hits": 0,
-                "misses": 0,
-                "total_requests": 0,
-                "cache_size": 0
-            },
-            "models": {
-                "preloaded": [],
-                "cache_size": 0
-            },
-            "audio_durations": {
-                "hits": 0,
-                "misses": 0,
-                "total_requests": 0,
-                "cache_size": 0
-            }
-        }
-
-        # Thread locks pour thread-safety
-        self._scenarios_lock = threading.Lock()
-        self._objections_lock = threading.Lock()
-        self._models_lock = threading.Lock()
-        self._audio_duration_lock = threading.Lock()
+        # Un TypedCache par namespace (LRU + TTL + limites octets)
+        self.scenarios: TypedCache[str, Dict[str, Any]] = TypedCache(
+            "scenarios",
+            max_entries=self.config["max_scenarios"],
+            max_bytes=self.config["max_scenarios_bytes"],
+            default_ttl=self.config["scenario_ttl"],
+        )
+        self.objections: TypedCache[str, Any] = TypedCache(
+            "objections",
+            max_entries=self.config["max_objections"],
+            max_bytes=self.config["max_objections_bytes"],
+            default_ttl=self.config["objections_ttl"],
+        )
+        # Modèles: pas de limite ni de taille (instances natives, non mesurables)
+        self.models: TypedCache[str, Any] = TypedCache(
+            "models",
+            default_ttl=self.config["models_ttl"],
+            sizer=None,
+        )
+        # Lus à chaque lecture audio par tous les appels: segments pour limiter la contention
+        self.audio_durations: TypedCache[str, float] = TypedCache(
+            "audio_durations",
+            max_entries=self.config["max_audio_durations"],
+            max_bytes=self.config["max_audio_durations_bytes"],
+            default_ttl=self.config["audio_duration_ttl"],
+            stripes=8,
+            sizer=_audio_duration_size,
+        )
 
         # Marquer comme initialisé
         CacheManager._initialized = True
@@ -151,37 +145,9 @@ class CacheManager:
         Returns:
             Scénario dict ou None si pas en cache/expiré
         """
-        with self._scenarios_lock:
-            self.stats["scenarios"]["total_requests"] += 1
-
-            if scenario_name not in self._scenarios_cache:
-                self.stats["scenarios"]["misses"] += 1
-                logger.debug(f"Cache MISS: scenario '{scenario_name}'")
-                return None
-
-            # Vérifier TTL
-            meta = self._scenarios_meta.get(scenario_name, {})
-            cached_at = meta.get("cached_at", 0)
-            ttl = self.config["scenario_ttl"]
-
-            if ttl > 0 and (time.time() - cached_at) > ttl:
-                # Expiré
-                logger.debug(f"Cache EXPIRED: scenario '{scenario_name}'")
-                del self._scenarios_cache[scenario_name]
-                del self._scenarios_meta[scenario_name]
-                self.stats["scenarios"]["misses"] += 1
-                return None
-
-            # Hit
-            self.stats["scenarios"]["hits"] += 1
-            meta["last_accessed"] = time.time()
-            meta["access_count"] = meta.get("access_count", 0) + 1
-
-            # LRU: move to end
-            self._scenarios_cache.move_to_end(scenario_name)
-
-            logger.debug(f"Cache HIT: scenario '{scenario_name}' (accessed {meta['access_count']} times)")
-            return self._scenarios_cache[scenario_name]
+        scenario = self.scenarios.get(scenario_name)
+        logger.debug(f"Cache {'HIT' if scenario is not None else 'MISS'}: scenario '{scenario_name}'")
+        return scenario
 
     def set_scenario(self, scenario_name: str, scenario_data: Dict[str, Any]):
         """
@@ -191,45 +157,36 @@ class CacheManager:
             scenario_name: Nom du scénario
             scenario_data: Données du scénario (dict)
         """
-        with self._scenarios_lock:
-            # LRU eviction si nécessaire
-            max_size = self.config["max_scenarios"]
-            if len(self._scenarios_cache) >= max_size:
-                # Supprimer le plus ancien (FIFO car OrderedDict)
-                oldest_key = next(iter(self._scenarios_cache))
-                logger.debug(f"Cache EVICT: scenario '{oldest_key}' (LRU)")
-                del self._scenarios_cache[oldest_key]
-                del self._scenarios_meta[oldest_key]
-
-            # Ajouter au cache
-            self._scenarios_cache[scenario_name] = scenario_data
-            self._scenarios_meta[scenario_name] = {
-                "cached_at": time.time(),
-                "last_accessed": time.time(),
-                "access_count": 0,
-                "size_bytes": len(str(scenario_data))
-            }
-
-            self.stats["scenarios"]["cache_size"] = len(self._scenarios_cache)
-            logger.info(f"Cache SET: scenario '{scenario_name}' (size: {len(self._scenarios_cache)}/{max_size})")
+        self.scenarios.set(scenario_name, scenario_data)
+        logger.info(
+            f"Cache SET: scenario '{scenario_name}' "
+            f"(size: {len(self.scenarios)}/{self.config['max_scenarios']})"
+        )
+
+    def get_or_load_scenario(
+        self,
+        scenario_name: str,
+        loader: Callable[[str], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Scénario en cache, sinon loader(scenario_name) exécuté une seule fois
+        pour tous les threads qui le demandent en même temps (None = pas de cache).
+        """
+        return self.scenarios.get_or_load(scenario_name, loader)
 
     def invalidate_scenario(self, scenario_name: str):
         """Invalide un scénario du cache"""
-        with self._scenarios_lock:
-            if scenario_name in self._scenarios_cache:
-                del self._scenarios_cache[scenario_name]
-                del self._scenarios_meta[scenario_name]
-                self.stats["scenarios"]["cache_size"] = len(self._scenarios_cache)
-                logger.info(f"Cache INVALIDATE: scenario '{scenario_name}'")
+        if self.scenarios.invalidate(scenario_name):
+            logger.info(f"Cache INVALIDATE: scenario '{scenario_name}'")
+
+    def scenario_names(self) -> List[str]:
+        """Noms des scénarios actuellement en cache (sans toucher aux stats/TTL)"""
+        return self.scenarios.keys()
 
     def clear_scenarios(self):
         """Vide tout le cache scénarios"""
-        with self._scenarios_lock:
-            count = len(self._scenarios_cache)
-            self._scenarios_cache.clear()
-            self._scenarios_meta.clear()
-            self.stats["scenarios"]["cache_size"] = 0
-            logger.info(f"Cache CLEAR: {count} scenarios removed")
+        count = self.scenarios.clear()
+        logger.info(f"Cache CLEAR: {count} scenarios removed")
 
     # ========== OBJECTIONS CACHE ==========
 
@@ -241,39 +198,11 @@ class CacheManager:
             theme: Thématique (finance, crypto, energie, general, etc.)
 
         Returns:
-            Liste ObjectionEntry ou None si pas en cache
+            Liste ObjectionEntry (ou CompiledObjections) ou None si pas en cache
         """
-        with self._objections_lock:
-            self.stats["objections"]["total_requests"] += 1
-
-            if theme not in self._objections_cache:
-                self.stats["objections"]["misses"] += 1
-                logger.debug(f"Cache MISS: objections '{theme}'")
-                return None
-
-            # Vérifier TTL
-            meta = self._objections_meta.get(theme, {})
-            cached_at = meta.get("cached_at", 0)
-            ttl = self.config["objections_ttl"]
-
-            if ttl > 0 and (time.time() - cached_at) > ttl:
-                # Expiré
-                logger.debug(f"Cache EXPIRED: objections '{theme}'")
-                del self._objections_cache[theme]
-                del self._objections_meta[theme]
-                self.stats["objections"]["misses"] += 1
-                return None
-
-            # Hit
-            self.stats["objections"]["hits"] += 1
-            meta["last_accessed"] = time.time()
-            meta["access_count"] = meta.get("access_count", 0) + 1
-
-            # LRU
-            self._objections_cache.move_to_end(theme)
-
-            logger.debug(f"Cache HIT: objections '{theme}' ({len(self._objections_cache[theme])} entries)")
-            return self._objections_cache[theme]
+        objections = self.objections.get(theme)
+        logger.debug(f"Cache {'HIT' if objections is not None else 'MISS'}: objections '{theme}'")
+        return objections
 
     def set_objections(self, theme: str, objections_list: List[Any]):
         """
@@ -281,46 +210,39 @@ class CacheManager:
 
         Args:
             theme: Thématique
-            objections_list: Liste ObjectionEntry
+            objections_list: Liste ObjectionEntry (ou CompiledObjections)
         """
-        with self._objections_lock:
-            # LRU eviction
-            max_size = self.config["max_objections"]
-            if len(self._objections_cache) >= max_size:
-                oldest_key = next(iter(self._objections_cache))
-                logger.debug(f"Cache EVICT: objections '{oldest_key}'")
-                del self._objections_cache[oldest_key]
-                del self._objections_meta[oldest_key]
-
-            # Ajouter
-            self._objections_cache[theme] = objections_list
-            self._objections_meta[theme] = {
-                "cached_at": time.time(),
-                "last_accessed": time.time(),
-                "access_count": 0,
-                "count": len(objections_list)
-            }
-
-            self.stats["objections"]["cache_size"] = len(self._objections_cache)
-            logger.info(f"Cache SET: objections '{theme}' ({len(objections_list)} entries)")
+        self.objections.set(theme, objections_list)
+        logger.info(f"Cache SET: objections '{theme}' ({len(objections_list)} entries)")
+
+    def get_or_load_objections(self, theme: str, loader: Callable[[str], Optional[Any]]) -> Optional[Any]:
+        """Objections en cache, sinon loader(theme) en single-flight (None = pas de cache)."""
+        return self.objections.get_or_load(theme, loader)
 
     def invalidate_objections(self, theme: str):
         """Invalide les objections d'une thématique"""
-        with self._objections_lock:
-            if theme in self._objections_cache:
-                del self._objections_cache[theme]
-                del self._objections_meta[theme]
-                self.stats["objections"]["cache_size"] = len(self._objections_cache)
-                logger.info(f"Cache INVALIDATE: objections '{theme}'")
+        if self.objections.invalidate(theme):
+            logger.info(f"Cache INVALIDATE: objections '{theme}'")
+
+    def objection_themes(self) -> List[str]:
+        """Thématiques d'objections actuellement en cache (sans toucher aux stats/TTL)"""
+        return self.objections.keys()
 
     def clear_objections(self):
         """Vide tout le cache objections"""
-        with self._objections_lock:
-            count = len(self._objections_cache)
-            self._objections_cache.clear()
-            self._objections_meta.clear()
-            self.stats["objections"]["cache_size"] = 0
-            logger.info(f"Cache CLEAR: {count} objection themes removed")
+        count = self.objections.clear()
+        logger.info(f"Cache CLEAR: {count} objection themes removed")
+
+    def set_scenario_ttl(self, ttl_seconds: int):
+        """
+        Configure le TTL des scénarios dynamiquement.
+
+        Args:
+            ttl_seconds: Durée en secondes (0 = infini, ex: hot reload actif)
+        """
+        self.config["scenario_ttl"] = ttl_seconds
+        self.scenarios.set_default_ttl(ttl_seconds)
+        logger.info(f"Cache CONFIG: scenario_ttl set to {ttl_seconds}s ({ttl_seconds/3600:.1f}h)")
 
     def set_objections_ttl(self, ttl_seconds: int):
         """
@@ -335,6 +257,7 @@ class CacheManager:
             >>> cache.set_objections_ttl(0)     # Infini
         """
         self.config["objections_ttl"] = ttl_seconds
+        self.objections.set_default_ttl(ttl_seconds)
         logger.info(f"Cache CONFIG: objections_ttl set to {ttl_seconds}s ({ttl_seconds/3600:.1f}h)")
 
     # ========== MODELS CACHE ==========
@@ -347,14 +270,8 @@ class CacheManager:
             model_name: Nom du modèle (ex: "faster_whisper", "vosk_asr")
             model_instance: Instance du modèle
         """
-        with self._models_lock:
-            self._models_cache[model_name] = {
-                "instance": model_instance,
-                "loaded_at": time.time()
-            }
-            self.stats["models"]["preloaded"] = list(self._models_cache.keys())
-            self.stats["models"]["cache_size"] = len(self._models_cache)
-            logger.info(f"Model REGISTERED: '{model_name}' (total: {len(self._models_cache)})")
+        self.models.set(model_name, model_instance)
+        logger.info(f"Model REGISTERED: '{model_name}' (total: {len(self.models)})")
 
     def get_model(self, model_name: str) -> Optional[Any]:
         """
@@ -366,19 +283,12 @@ class CacheManager:
         Returns:
             Instance du modèle ou None
         """
-        with self._models_lock:
-            if model_name in self._models_cache:
-                return self._models_cache[model_name]["instance"]
-            return None
+        return self.models.get(model_name)
 
     def unregister_model(self, model_name: str):
         """Désenregistre un modèle"""
-        with self._models_lock:
-            if model_name in self._models_cache:
-                del self._models_cache[model_name]
-                self.stats["models"]["preloaded"] = list(self._models_cache.keys())
-                self.stats["models"]["cache_size"] = len(self._models_cache)
-                logger.info(f"Model UNREGISTERED: '{model_name}'")
+        if self.models.invalidate(model_name):
+            logger.info(f"Model UNREGISTERED: '{model_name}'")
 
     # ========== AUDIO DURATION CACHE ==========
 
@@ -392,37 +302,7 @@ class CacheManager:
         Returns:
             Durée en secondes ou None si pas en cache/expiré
         """
-        with self._audio_duration_lock:
-            self.stats["audio_durations"]["total_requests"] += 1
-
-            if audio_path not in self._audio_duration_cache:
-                self.stats["audio_durations"]["misses"] += 1
-                return None
-
-            # Vérifier TTL
-            meta = self._audio_duration_meta.get(audio_path, {})
-            cached_at = meta.get("cached_at", 0)
-            ttl = self.config["audio_duration_ttl"]
-
-            if ttl > 0 and (time.time() - cached_at) > ttl:
-                # Expiré
-                logger.debug(f"Cache EXPIRED: audio duration '{audio_path}'")
-                del self._audio_duration_cache[audio_path]
-                del self._audio_duration_meta[audio_path]
-                self.stats["audio_durations"]["misses"] += 1
-                return None
-
-            # Hit
-            self.stats["audio_durations"]["hits"] += 1
-            meta["last_accessed"] = time.time()
-            meta["access_count"] = meta.get("access_count", 0) + 1
-
-            # LRU: move to end
-            self._audio_duration_cache.move_to_end(audio_path)
-
-            duration = self._audio_duration_cache[audio_path]
-            logger.debug(f"Cache HIT: audio duration '{audio_path}' = {duration:.2f}s")
-            return duration
+        return self.audio_durations.get(audio_path)
 
     def cache_audio_duration(self, audio_path: str, duration: float):
         """
@@ -432,48 +312,26 @@ class CacheManager:
             audio_path: Chemin complet vers le fichier audio
             duration: Durée en secondes
         """
-        with self._audio_duration_lock:
-            # LRU eviction si nécessaire
-            max_size = self.config["max_audio_durations"]
-            if len(self._audio_duration_cache) >= max_size:
-                # Supprimer le plus ancien (FIFO car OrderedDict)
-                oldest_key = next(iter(self._audio_duration_cache))
-                logger.debug(f"Cache EVICT: audio duration '{oldest_key}' (LRU)")
-                del self._audio_duration_cache[oldest_key]
-                del self._audio_duration_meta[oldest_key]
-
-            # Ajouter au cache
-            self._audio_duration_cache[audio_path] = duration
-            self._audio_duration_meta[audio_path] = {
-                "cached_at": time.time(),
-                "last_accessed": time.time(),
-                "access_count": 0,
-                "duration_seconds": duration
-            }
-
-            self.stats["audio_durations"]["cache_size"] = len(self._audio_duration_cache)
-            logger.debug(
-                f"Cache SET: audio duration '{audio_path}' = {duration:.2f}s "
-                f"(size: {len(self._audio_duration_cache)}/{max_size})"
-            )
+        self.audio_durations.set(audio_path, duration)
+        logger.debug(f"Cache SET: audio duration '{audio_path}' = {duration:.2f}s")
+
+    def get_or_load_audio_duration(
+        self,
+        audio_path: str,
+        loader: Callable[[str], Optional[float]]
+    ) -> Optional[float]:
+        """Durée en cache, sinon loader(audio_path) en single-flight (None = pas de cache)."""
+        return self.audio_durations.get_or_load(audio_path, loader)
 
     def invalidate_audio_duration(self, audio_path: str):
         """Invalide la durée d'un fichier audio du cache"""
-        with self._audio_duration_lock:
-            if audio_path in self._audio_duration_cache:
-                del self._audio_duration_cache[audio_path]
-                del self._audio_duration_meta[audio_path]
-                self.stats["audio_durations"]["cache_size"] = len(self._audio_duration_cache)
-                logger.info(f"Cache INVALIDATE: audio duration '{audio_path}'")
+        if self.audio_durations.invalidate(audio_path):
+            logger.info(f"Cache INVALIDATE: audio duration '{audio_path}'")
 
     def clear_audio_durations(self):
         """Vide tout le cache des durées audio"""
-        with self._audio_duration_lock:
-            count = len(self._audio_duration_cache)
-            self._audio_duration_cache.clear()
-            self._audio_duration_meta.clear()
-            self.stats["audio_durations"]["cache_size"] = 0
-            logger.info(f"Cache CLEAR: {count} audio durations removed")
+        count = self.audio_durations.clear()
+        logger.info(f"Cache CLEAR: {count} audio durations removed")
 
     # ========== STATISTICS & MONITORING ==========
 
@@ -482,49 +340,28 @@ class CacheManager:
         Retourne statistiques complètes du cache.
 
         Returns:
-            Dict avec stats détaillées
+            Dict avec stats détaillées (compteurs TypedCache par namespace)
         """
-        with self._scenarios_lock, self._objections_lock, self._models_lock, self._audio_duration_lock:
-            # Calcul hit rates
-            scenarios_total = self.stats["scenarios"]["total_requests"]
-            scenarios_hit_rate = (
-                (self.stats["scenarios"]["hits"] / scenarios_total * 100)
-                if scenarios_total > 0 else 0
-            )
-
-            objections_total = self.stats["objections"]["total_requests"]
-            objections_hit_rate = (
-                (self.stats["objections"]["hits"] / objections_total * 100)
-                if objections_total > 0 else 0
-            )
-
-            audio_durations_total = self.stats["audio_durations"]["total_requests"]
-            audio_durations_hit_rate = (
-                (self.stats["audio_durations"]["hits"] / audio_durations_total * 100)
-                if audio_durations_total > 0 else 0
-            )
-
-            return {
-                "scenarios": {
-                    **self.stats["scenarios"],
-                    "hit_rate_pct": round(scenarios_hit_rate, 1),
-                    "cached_names": list(self._scenarios_cache.keys())
-                },
-                "objections": {
-                    **self.stats["objections"],
-                    "hit_rate_pct": round(objections_hit_rate, 1),
-                    "cached_themes": list(self._objections_cache.keys())
-                },
-                "models": {
-                    **self.stats["models"]
-                },
-                "audio_durations": {
-                    **self.stats["audio_durations"],
-                    "hit_rate_pct": round(audio_durations_hit_rate, 1),
-                    "cached_count": len(self._audio_duration_cache)
-                },
-                "config": self.config
-            }
+        models = self.models.keys()
+        return {
+            "scenarios": {
+                **self.scenarios.get_stats(),
+                "cached_names": self.scenarios.keys()
+            },
+            "objections": {
+                **self.objections.get_stats(),
+                "cached_themes": self.objections.keys()
+            },
+            "models": {
+                "preloaded": models,
+                "cache_size": len(models)
+            },
+            "audio_durations": {
+                **self.audio_durations.get_stats(),
+                "cached_count": len(self.audio_durations)
+            },
+            "config": dict(self.config)
+        }
 
     def print_stats(self):
         """Affiche statistiques formatées"""
@@ -536,14 +373,14 @@ class CacheManager:
 
         print(f"\n🎬 SCENARIOS CACHE:")
         print(f"  • Hit rate: {stats['scenarios']['hit_rate_pct']}%")
-        print(f"  • Hits: {stats['scenarios']['hits']} / Misses: {stats['scenarios']['misses']}")
-        print(f"  • Cache size: {stats['scenarios']['cache_size']}/{self.config['max_scenarios']}")
+        print(f"  • Hits: {stats['scenarios']['hits']} / Misses: {stats['scenarios']['misses']} / Evictions: {stats['scenarios']['evictions']}")
+        print(f"  • Cache size: {stats['scenarios']['cache_size']}/{self.config['max_scenarios']} ({stats['scenarios']['size_bytes'] / 1024:.0f} KB)")
         print(f"  • Cached: {', '.join(stats['scenarios']['cached_names'][:5])}{'...' if len(stats['scenarios']['cached_names']) > 5 else ''}")
 
         print(f"\n🛡️ OBJECTIONS CACHE:")
         print(f"  • Hit rate: {stats['objections']['hit_rate_pct']}%")
-        print(f"  • Hits: {stats['objections']['hits']} / Misses: {stats['objections']['misses']}")
-        print(f"  • Cache size: {stats['objections']['cache_size']}/{self.config['max_objections']}")
+        print(f"  • Hits: {stats['objections']['hits']} / Misses: {stats['objections']['misses']} / Evictions: {stats['objections']['evictions']}")
+        print(f"  • Cache size: {stats['objections']['cache_size']}/{self.config['max_objections']} ({stats['objections']['size_bytes'] / 1024:.0f} KB)")
         print(f"  • Themes: {', '.join(stats['objections']['cached_themes'])}")
 
         print(f"\n🤖 MODELS CACHE:")
@@ -552,7 +389,7 @@ class CacheManager:
 
         print(f"\n🎵 AUDIO DURATIONS CACHE:")
         print(f"  • Hit rate: {stats['audio_durations']['hit_rate_pct']}%")
-        print(f"  • Hits: {stats['audio_durations']['hits']} / Misses: {stats['audio_durations']['misses']}")
+        print(f"  • Hits: {stats['audio_durations']['hits']} / Misses: {stats['audio_durations']['misses']} / Expired: {stats['audio_durations']['expirations']}")
         print(f"  • Cache size: {stats['audio_durations']['cache_size']}/{self.config['max_audio_durations']}")
         print(f"  • Cached files: {stats['audio_durations']['cached_count']}")
 
@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Call Dispatcher - MiniBotPanel v3
+
+Cadencement des originate sans tenir de connexion DB.
+
+Avant: BatchCaller et CampaignManager faisaient time.sleep(delay_between_calls)
+après chaque originate, session et transaction ouvertes: 10 appels x 2s =
+une connexion "idle in transaction" pendant 20s, et une campagne lente
+retardait toutes les autres (boucle séquentielle).
+
+Maintenant:
+- La boucle de file réserve un lot (CallQueue.claim, transaction courte),
+  lit les contacts, ferme la session et remet des DispatchJob (données
+  seules, aucun objet ORM) au dispatcher
+- Le dispatcher (un thread) cadence les départs avec un token bucket par
+  campagne (1 / delay_between_calls) et un token bucket global
+  (DISPATCH_MAX_CALLS_PER_SECOND), en round-robin entre campagnes: une
+  campagne lente n'en bloque aucune autre
+- Les originate (bloquants côté ESL) partent dans un pool de threads
+  (DISPATCH_MAX_INFLIGHT); juste avant, CallQueue.start_dispatch passe
+  l'appel en CALLING seulement s'il est encore QUEUED pour ce worker (un
+  appel annulé ou repris ailleurs n'est pas composé); le résultat est
+  écrit par un UPDATE gardé de la même façon, dans une transaction courte
+- Jobs en attente: bail renouvelé tous les CALL_LEASE_SECONDS / 3 (les
+  jobs dont l'appel n'est plus réservé sont retirés); retirés aussi quand
+  leur campagne est arrêtée (withdraw_campaigns)
+- Jobs non envoyés à l'arrêt: rendus à la file (CallQueue.release)
+
+Utilisation:
+    from system.call_dispatcher import CallDispatcher, claim_jobs
+
+    dispatcher = CallDispatcher(robot, queue=call_queue)
+    dispatcher.start()
+
+    db = SessionLocal()
+    try:
+        jobs = claim_jobs(db, call_queue, campaign, limit=5)
+    finally:
+        db.close()
+    dispatcher.set_campaign_rate(campaign.id, campaign.delay_between_calls)
+    dispatcher.submit(jobs)
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from system.database import SessionLocal
+from system.models import Call, Campaign, CallStatus, CallResult
+from system.call_queue import CallQueue
+from system.stats_rollup import RollupDelta, rollup_columns
+from system.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket (rate jetons/s, capacity jetons max). Non thread-safe: un seul thread dispatcher."""
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        else:
+            self.tokens = self.capacity  # rate 0 = pas de limite
+        self.updated = now
+
+    def ready(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= 1.0
+
+    def take(self, now: float):
+        self._refill(now)
+        self.tokens -= 1.0
+
+    def wait_time(self, now: float) -> float:
+        """Secondes avant le prochain jeton (0 si disponible)."""
+        self._refill(now)
+        if self.tokens >= 1.0 or self.rate <= 0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def set_rate(self, rate: float):
+        self._refill(time.monotonic())
+        self.rate = rate
+
+
+class DispatchJob:
+    """Un appel réservé à lancer (copie des champs utiles, sans session DB)."""
+    __slots__ = ("call_id", "campaign_id", "contact_id", "phone", "scenario", "claimed_at")
+
+    def __init__(self, call_id: int, campaign_id: int, contact_id: int, phone: str, scenario: str):
+        self.call_id = call_id
+        self.campaign_id = campaign_id
+        self.contact_id = contact_id
+        self.phone = phone
+        self.scenario = scenario
+        self.claimed_at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<DispatchJob call={self.call_id} campaign={self.campaign_id}>"
+
+
+def claim_jobs(db: Session, queue: CallQueue, campaign: Campaign, limit: int) -> List[DispatchJob]:
+    """
+    Réserve jusqu'à `limit` appels de la campagne et prépare leurs jobs.
+
+    Nombre de requêtes constant quelle que soit la taille du lot: réservation
+    (UPDATE ... RETURNING), appels + contacts (un SELECT avec JOIN), puis un
+    UPDATE groupé pour les contacts en blocklist / opt-out (CANCELLED), et
+    leur upsert dans le rollup des statistiques. Tout est commité: la session peut être fermée avant le dispatch.
+
+    Args:
+        campaign: Campagne, ou toute ligne avec `id` et `scenario`
+    """
+    calls = queue.claim(db, campaign.id, limit, with_contact=True)
+    if not calls:
+        return []
+
+    jobs = []
+    skipped = []
+    for call in calls:
+        contact = call.contact
+        if contact is None:
+            logger.error(f"Contact {call.contact_id} not found for call {call.id}")
+            skipped.append((call, {"id": call.id, "status": CallStatus.FAILED, "lease_expires_at": None}))
+        elif contact.blacklist or contact.opt_out:
+            skipped.append((call, {
+                "id": call.id,
+                "status": CallStatus.CANCELLED,
+                "result": CallResult.NOT_INTERESTED,
+                "notes": "Contact in blocklist",
+                "lease_expires_at": None,
+            }))
+        else:
+            jobs.append(DispatchJob(call.id, campaign.id, contact.id, contact.phone, campaign.scenario))
+
+    if skipped:
+        # UPDATE par clé primaire en executemany (une instruction pour tout le lot)
+        db.execute(update(Call), [values for _, values in skipped])
+        rollup = RollupDelta()
+        for call, values in skipped:
+            rollup.add(call, status=values["status"], result=values.get("result", call.result))
+        rollup.apply(db)
+    db.commit()
+    return jobs
+
+
+class CallDispatcher:
+    """Thread de cadencement + pool d'originate (aucune connexion DB pendant l'attente)."""
+
+    def __init__(
+        self,
+        robot,
+        queue: Optional[CallQueue] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_calls_per_second: Optional[float] = None,
+        max_inflight: Optional[int] = None,
+        on_launched: Optional[Callable[[DispatchJob, str], None]] = None
+    ):
+        """
+        Args:
+            robot: RobotFreeSWITCH (originate_call)
+            queue: File des appels (release() des jobs non envoyés à l'arrêt)
+            session_factory: Sessions courtes pour écrire le résultat des originate
+            max_calls_per_second: Plafond global (défaut: config.DISPATCH_MAX_CALLS_PER_SECOND, 0 = aucun)
+            max_inflight: Originate simultanés max (défaut: config.DISPATCH_MAX_INFLIGHT)
+            on_launched: Appelé (thread du pool) après un originate réussi: (job, call_uuid)
+        """
+        self.robot = robot
+        self.queue = queue or CallQueue()
+        self.session_factory = session_factory
+        self.on_launched = on_launched
+
+        rate = config.DISPATCH_MAX_CALLS_PER_SECOND if max_calls_per_second is None else max_calls_per_second
+        self.global_bucket = TokenBucket(rate, capacity=max(1.0, rate))
+        self.max_inflight = max_inflight or config.DISPATCH_MAX_INFLIGHT
+
+        self._cond = threading.Condition()
+        self._pending: Dict[int, Deque[DispatchJob]] = {}
+        self._buckets: Dict[int, TokenBucket] = {}
+        self._next_campaigns: Deque[int] = deque()  # round-robin
+        self._inflight = 0
+        self._renew_interval = max(1.0, self.queue.lease_seconds / 3)
+        self._next_renewal = time.monotonic() + self._renew_interval
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.stats = {
+            "submitted": 0,
+            "dispatched": 0,
+            "launched": 0,
+            "failed": 0,
+            "skipped": 0,    # plus réservés au départ (annulés, bail perdu)
+            "withdrawn": 0,  # retirés de la file (campagne arrêtée, bail perdu)
+            "released": 0,
+            "max_wait_ms": 0.0,  # réservation → départ de l'originate
+        }
+
+    # ========== LIFECYCLE ==========
+
+    def start(self):
+        """Démarre le thread de cadencement (idempotent)."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=self.max_inflight, thread_name_prefix="originate")
+        self._thread = threading.Thread(target=self._run, name="call-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> int:
+        """
+        Arrête le dispatch, attend les originate en cours et rend les jobs non envoyés à la file.
+
+        Returns:
+            Nombre d'appels rendus à la file
+        """
+        with self._cond:
+            self._running = False
+            unsent = [job for jobs in self._pending.values() for job in jobs]
+            self._pending.clear()
+            self._next_campaigns.clear()
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+        released = 0
+        if unsent:
+            db = self.session_factory()
+            try:
+                released = self.queue.release(db, [job.call_id for job in unsent])
+            except Exception as e:
+                logger.error(f"❌ Failed to release {len(unsent)} unsent calls: {e}")
+                db.rollback()
+            finally:
+                db.close()
+        self.stats["released"] += released
+        return released
+
+    # ========== FILE ==========
+
+    def set_campaign_rate(self, campaign_id: int, delay_between_calls: Optional[float]):
+        """Cadence d'une campagne: un originate toutes les `delay_between_calls` secondes."""
+        rate = 1.0 / delay_between_calls if delay_between_calls and delay_between_calls > 0 else 0.0
+        with self._cond:
+            bucket = self._buckets.get(campaign_id)
+            if bucket is None:
+                self._buckets[campaign_id] = TokenBucket(rate)
+            elif bucket.rate != rate:
+                bucket.set_rate(rate)
+                self._cond.notify()
+
+    def submit(self, jobs: List[DispatchJob]):
+        """Ajoute des jobs (déjà réservés en base) à la file de leur campagne."""
+        if not jobs:
+            return
+        with self._cond:
+            for job in jobs:
+                queue = self._pending.get(job.campaign_id)
+                if queue is None:
+                    queue = self._pending[job.campaign_id] = deque()
+                    self._buckets.setdefault(job.campaign_id, TokenBucket(0.0))
+                if not queue:
+                    self._next_campaigns.append(job.campaign_id)
+                queue.append(job)
+            self.stats["submitted"] += len(jobs)
+            self._cond.notify()
+
+    def _remove_pending(self, keep: Callable[[DispatchJob], bool]) -> List[DispatchJob]:
+        """Retire les jobs en attente pour lesquels keep() est faux (verrou tenu par l'appelant)."""
+        removed = []
+        for campaign_id in list(self._pending):
+            kept = deque()
+            for job in self._pending[campaign_id]:
+                (kept if keep(job) else removed).append(job)
+            if kept:
+                self._pending[campaign_id] = kept
+            else:
+                del self._pending[campaign_id]
+                if campaign_id in self._next_campaigns:
+                    self._next_campaigns.remove(campaign_id)
+        self.stats["withdrawn"] += len(removed)
+        return removed
+
+    def pending_campaigns(self) -> List[int]:
+        """Campagnes qui ont des jobs en attente de départ."""
+        with self._cond:
+            return list(self._pending)
+
+    def withdraw_campaigns(self, campaign_ids) -> int:
+        """
+        Retire les jobs en attente de campagnes arrêtées ou en pause.
+
+        Les appels encore QUEUED pour ce worker (pause) sont rendus à la file;
+        ceux déjà annulés par stop_campaign restent CANCELLED.
+
+        Returns:
+            Nombre de jobs retirés
+        """
+        campaign_ids = set(campaign_ids)
+        with self._cond:
+            removed = self._remove_pending(lambda job: job.campaign_id not in campaign_ids)
+        if removed:
+            db = self.session_factory()
+            try:
+                self.stats["released"] += self.queue.release(db, [job.call_id for job in removed])
+            except Exception as e:
+                logger.error(f"❌ Failed to release {len(removed)} withdrawn calls: {e}")
+                db.rollback()
+            finally:
+                db.close()
+        return len(removed)
+
+    def pending(self, campaign_id: Optional[int] = None) -> int:
+        """Jobs en attente de départ (une campagne ou toutes) + originate en cours si toutes."""
+        with self._cond:
+            if campaign_id is not None:
+                return len(self._pending.get(campaign_id, ()))
+            return sum(len(jobs) for jobs in self._pending.values()) + self._inflight
+
+    # ========== DISPATCH ==========
+
+    def _next_ready(self, now: float):
+        """
+        Prochain job envoyable (round-robin entre campagnes).
+
+        Returns:
+            (job, 0.0) ou (None, secondes à attendre; None = rien en attente)
+        """
+        if not self._next_campaigns:
+            return None, None
+        if self._inflight >= self.max_inflight:
+            return None, None  # Réveillé par la fin d'un originate
+        global_wait = self.global_bucket.wait_time(now)
+        if global_wait > 0:
+            return None, global_wait
+
+        wait = None
+        for _ in range(len(self._next_campaigns)):
+            campaign_id = self._next_campaigns.popleft()
+            jobs = self._pending.get(campaign_id)
+            if not jobs:
+                self._pending.pop(campaign_id, None)
+                continue
+            bucket = self._buckets[campaign_id]
+            if bucket.ready(now):
+                bucket.take(now)
+                self.global_bucket.take(now)
+                job = jobs.popleft()
+                if jobs:
+                    self._next_campaigns.append(campaign_id)
+                else:
+                    self._pending.pop(campaign_id, None)
+                return job, 0.0
+            self._next_campaigns.append(campaign_id)
+            campaign_wait = bucket.wait_time(now)
+            wait = campaign_wait if wait is None else min(wait, campaign_wait)
+        return None, wait
+
+    def _renew_leases(self):
+        """
+        Renouvelle le bail des jobs en attente (thread dispatcher, hors verrou).
+
+        Sans renouvellement, un job qui attend plus de CALL_LEASE_SECONDS
+        serait remis en file par recover_expired, réservé à nouveau et
+        composé deux fois. Les jobs dont l'appel n'est plus réservé par ce
+        worker (annulé, repris) sont retirés.
+        """
+        with self._cond:
+            call_ids = [job.call_id for jobs in self._pending.values() for job in jobs]
+        if not call_ids:
+            return
+        db = self.session_factory()
+        try:
+            renewed = set(self.queue.renew(db, call_ids))
+        except Exception as e:
+            logger.error(f"❌ Failed to renew {len(call_ids)} call leases: {e}")
+            db.rollback()
+            return
+        finally:
+            db.close()
+        lost = set(call_ids) - renewed
+        if lost:
+            with self._cond:
+                removed = self._remove_pending(lambda job: job.call_id not in lost)
+            logger.warning(f"⚠️ Dropped {len(removed)} queued calls no longer leased by this worker")
+
+    def _run(self):
+        logger.info(f"🚦 CallDispatcher started (max {self.max_inflight} in flight, {self.global_bucket.rate or '∞'} calls/s)")
+        while True:
+            if time.monotonic() >= self._next_renewal:
+                self._next_renewal = time.monotonic() + self._renew_interval
+                self._renew_leases()
+            with self._cond:
+                if not self._running:
+                    break
+                job, wait = self._next_ready(time.monotonic())
+                if job is None:
+                    if self._pending:
+                        # Réveil au plus tard pour le prochain renouvellement des baux
+                        renewal_in = max(0.0, self._next_renewal - time.monotonic())
+                        wait = renewal_in if wait is None else min(wait, renewal_in)
+                    self._cond.wait(timeout=wait)
+                    continue
+                self._inflight += 1
+                wait_ms = (time.monotonic() - job.claimed_at) * 1000
+                self.stats["dispatched"] += 1
+                self.stats["max_wait_ms"] = max(self.stats["max_wait_ms"], wait_ms)
+            self._executor.submit(self._originate, job)
+        logger.info("🚦 CallDispatcher stopped")
+
+    def _originate(self, job: DispatchJob):
+        """Thread du pool: départ gardé, originate (bloquant) puis écriture du résultat (transactions courtes)."""
+        call_uuid = None
+        outcome = "failed"
+        try:
+            if not self._start(job):
+                outcome = "skipped"
+                logger.info(f"⏭️ Call {job.call_id} no longer queued for this worker (cancelled or re-leased): not dialed")
+                return
+
+            try:
+                call_uuid = self.robot.originate_call(job.phone, job.contact_id, job.scenario)
+            except Exception as e:
+                logger.error(f"❌ Originate failed for call {job.call_id}: {e}")
+            if call_uuid:
+                outcome = "launched"
+
+            if self._record_result(job, call_uuid) and call_uuid and self.on_launched:
+                self.on_launched(job, call_uuid)
+        except Exception as e:
+            logger.error(f"❌ Failed to record originate of call {job.call_id}: {e}", exc_info=True)
+        finally:
+            with self._cond:
+                self._inflight -= 1
+                self.stats[outcome] += 1
+                self._cond.notify()
+
+    def _start(self, job: DispatchJob) -> bool:
+        """QUEUED → CALLING si l'appel est encore réservé par ce worker (transaction courte)."""
+        db = self.session_factory()
+        try:
+            return self.queue.start_dispatch(db, job.call_id)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _record_result(self, job: DispatchJob, call_uuid: Optional[str]) -> bool:
+        """
+        Uuid FreeSWITCH (reste CALLING) ou FAILED, en un UPDATE (+ rollup si FAILED).
+
+        Gardé comme le départ: seulement si l'appel est toujours CALLING pour
+        ce worker (un statut posé entre-temps n'est pas écrasé).
+
+        Returns:
+            True si le résultat a été écrit
+        """
+        now = datetime.utcnow()
+        if call_uuid:
+            values = dict(
+                uuid=call_uuid,
+                started_at=now,
+                last_attempt_at=now,
+                retry_count=Call.retry_count + 1,
+            )
+        else:
+            values = dict(status=CallStatus.FAILED, last_attempt_at=now)
+
+        db = self.session_factory()
+        try:
+            row = db.execute(
+                update(Call)
+                .where(
+                    Call.id == job.call_id,
+                    Call.status == CallStatus.CALLING,
+                    Call.worker_id == self.queue.worker_id,
+                )
+                .values(**values)
+                .returning(*rollup_columns())
+                .execution_options(synchronize_session=False)
+            ).first()
+            if row is None:
+                logger.warning(f"⚠️ Call {job.call_id} changed while dialing: originate result not recorded")
+            elif not call_uuid:
+                # CALLING (hors rollup) → FAILED: la ligne n'était pas comptée
+                rollup = RollupDelta()
+                rollup.add(row)
+                rollup.apply(db)
+            db.commit()
+            return row is not None
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def get_stats(self) -> dict:
+        with self._cond:
+            return {
+                **self.stats,
+                "pending": sum(len(jobs) for jobs in self._pending.values()),
+                "inflight": self._inflight,
+                "campaigns": len(self._pending),
+            }
@@ -0,0 +1,407 @@
+"""
+Call Export - MiniBotPanel v3
+
+Lecture en flux des appels d'une campagne pour les exports (API et CLI).
+
+Les appels (+ contact) sont lus par lots de EXPORT_BATCH_SIZE lignes
+(yield_per: curseur serveur sous PostgreSQL, aucun .all()), seules les
+colonnes exportées sont sélectionnées (pas d'objets ORM), et chaque lot
+est encodé puis rendu aussitôt: la mémoire reste constante quelle que
+soit la taille de la campagne.
+
+Formats colonnes (iter_columnar, pyarrow optionnel): Parquet ou flux Arrow
+IPC, colonnes typées (enums en dictionnaire, timestamps natifs, entiers et
+flottants), champs JSON qualification_data / call_metadata aplatis en
+colonnes ("qualification.<clé>", "metadata.<clé>.<sous-clé>"). Un premier
+parcours (colonnes JSON seules) fixe le schéma, le second écrit les row
+groups (EXPORT_PARQUET_ROW_GROUP_SIZE lignes) au fur et à mesure. Une
+valeur écrite entre les deux parcours (campagne RUNNING) qui ne correspond
+plus au type découvert n'interrompt pas l'export (réponse 200 déjà
+envoyée: un fichier sans footer sinon): texte JSON dans une colonne
+texte, null ailleurs; les clés apparues entre-temps sont ignorées.
+
+Utilisation:
+    from system.call_export import iter_call_batches, iter_csv, iter_columnar
+
+    batches = iter_call_batches(db, campaign_id, [Call.uuid, Contact.phone])
+    for chunk in iter_csv(["uuid", "phone"], batches, lambda row: (row.uuid, row.phone)):
+        output.write(chunk)           # bytes UTF-8, un morceau par lot
+
+    for chunk in iter_columnar(db, campaign_id, "parquet", compression="zstd"):
+        output.write(chunk)           # un morceau par row group, puis le footer
+"""
+
+import csv
+import io
+import json
+import logging
+import importlib.util
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from system.models import Call, Contact
+from system.config import config
+
+logger = logging.getLogger(__name__)
+
+# pyarrow (optionnel): importé au premier export colonnes, pas au démarrage de l'API
+ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+COMPRESSIONS = {
+    "parquet": ("none", "snappy", "zstd", "gzip", "lz4", "brotli"),
+    "arrow": ("none", "zstd", "lz4"),
+}
+
+
+def iter_call_batches(
+    db: Session,
+    campaign_id: int,
+    columns: Sequence,
+    batch_size: Optional[int] = None
+) -> Iterator[Sequence[Row]]:
+    """
+    Appels d'une campagne (JOIN contacts, ordre de création), par lots.
+
+    Args:
+        db: Session DB (gardée ouverte tant que l'itérateur est consommé)
+        campaign_id: Campagne
+        columns: Colonnes de Call / Contact à lire (attributs des lignes)
+        batch_size: Lignes par lot (défaut: config.EXPORT_BATCH_SIZE)
+
+    Yields:
+        Lots de lignes (au plus batch_size)
+    """
+    query = (
+        select(*columns)
+        .select_from(Call)
+        .join(Contact, Call.contact_id == Contact.id)
+        .where(Call.campaign_id == campaign_id)
+        .order_by(Call.created_at)  # ix_calls_campaign_created
+        .execution_options(yield_per=batch_size or config.EXPORT_BATCH_SIZE)
+    )
+    yield from db.execute(query).partitions()
+
+
+def iter_csv(
+    header: Sequence[str],
+    batches: Iterable[Sequence[Row]],
+    to_row: Callable[[Row], Sequence[Any]]
+) -> Iterator[bytes]:
+    """
+    CSV encodé (UTF-8) morceau par morceau: l'en-tête, puis un morceau par lot.
+
+    Args:
+        header: Noms de colonnes
+        batches: Lots de lignes (iter_call_batches)
+        to_row: Valeurs CSV d'une ligne, dans l'ordre de `header`
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for batch in batches:
+        writer.writerows(to_row(row) for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")  # Aucun appel: en-tête seul
+
+
+def iter_json(
+    document: Dict[str, Any],
+    array_key: str,
+    batches: Iterable[Sequence[Row]],
+    to_item: Callable[[Row], Dict[str, Any]]
+) -> Iterator[bytes]:
+    """
+    Document JSON {**document, array_key: [...]} encodé morceau par morceau.
+
+    Args:
+        document: Champs fixes du document (rendus en premier)
+        array_key: Clé du tableau rendu en flux
+        batches: Lots de lignes (iter_call_batches)
+        to_item: Objet JSON d'une ligne
+    """
+    head = json.dumps(document, ensure_ascii=False)[:-1]
+    yield f"{head}{', ' if document else ''}{json.dumps(array_key)}: [".encode("utf-8")
+    separator = ""
+    for batch in batches:
+        items = ", ".join(json.dumps(to_item(row), ensure_ascii=False) for row in batch)
+        if items:
+            yield f"{separator}{items}".encode("utf-8")
+            separator = ", "
+    yield b"]}"
+
+
+class _ChunkSink(io.RawIOBase):
+    """Fichier en écriture seule dont on vide le contenu au fil de l'eau (tell() reste absolu)."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _enum_value(value) -> Optional[str]:
+    return value.value if value is not None else None
+
+
+# (nom, type, colonne, conversion) - "dictionary": chaîne encodée en dictionnaire
+COLUMNAR_COLUMNS: List[Tuple[str, str, Any, Callable[[Any], Any]]] = [
+    ("call_id", "int64", Call.id, None),
+    ("uuid", "string", Call.uuid, None),
+    ("phone", "string", Contact.phone, None),
+    ("first_name", "string", Contact.first_name, None),
+    ("last_name", "string", Contact.last_name, None),
+    ("email", "string", Contact.email, None),
+    ("company", "string", Contact.company, None),
+    ("status", "dictionary", Call.status, _enum_value),
+    ("result", "dictionary", Call.result, _enum_value),
+    ("sentiment", "dictionary", Call.sentiment, _enum_value),
+    ("sentiment_score", "float64", Call.sentiment_score, None),
+    ("amd_result", "dictionary", Call.amd_result, None),
+    ("amd_duration", "float64", Call.amd_duration, None),
+    ("duration", "int32", Call.duration, None),
+    ("talk_duration", "int32", Call.talk_duration, None),
+    ("retry_count", "int32", Call.retry_count, None),
+    ("recording_path", "string", Call.recording_path, None),
+    ("transcription_path", "string", Call.transcription_path, None),
+    ("notes", "string", Call.notes, None),
+    ("created_at", "timestamp", Call.created_at, None),
+    ("started_at", "timestamp", Call.started_at, None),
+    ("answered_at", "timestamp", Call.answered_at, None),
+    ("ended_at", "timestamp", Call.ended_at, None),
+]
+
+# Champs JSON aplatis: colonne → préfixe des colonnes produites
+JSON_FIELDS = [(Call.qualification_data, "qualification"), (Call.call_metadata, "metadata")]
+
+
+def _flatten(value: Any, prefix: str, out: Dict[str, Any]) -> Dict[str, Any]:
+    """{"a": {"b": 1}} → {"<prefix>.a.b": 1} (les listes et scalaires sont des feuilles)."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _flatten(item, f"{prefix}.{key}", out)
+    elif value is not None:
+        out[prefix] = value
+    return out
+
+
+def _flatten_row(row) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for column, prefix in JSON_FIELDS:
+        if isinstance(getattr(row, column.key), dict):
+            _flatten(getattr(row, column.key), prefix, out)
+    return out
+
+
+def _json_leaf_type(kinds: set) -> str:
+    """Type d'une feuille JSON d'après les types Python rencontrés."""
+    if kinds == {bool}:
+        return "bool"
+    if kinds == {int}:
+        return "int64"
+    if kinds <= {int, float}:
+        return "float64"
+    if kinds == {str}:
+        return "string"
+    if kinds == {"list[str]"}:
+        return "list<string>"
+    return "json"  # Types mélangés: texte JSON
+
+
+def _discover_json_columns(db: Session, campaign_id: int, batch_size: Optional[int]) -> List[Tuple[str, str]]:
+    """Premier parcours (colonnes JSON seules): clés aplaties et leur type."""
+    kinds: Dict[str, set] = {}
+    columns = [Call.id] + [column for column, _ in JSON_FIELDS]
+    for batch in iter_call_batches(db, campaign_id, columns, batch_size):
+        for row in batch:
+            for key, value in _flatten_row(row).items():
+                if isinstance(value, list):
+                    kind = "list[str]" if all(isinstance(item, str) for item in value) else list
+                else:
+                    kind = type(value)
+                kinds.setdefault(key, set()).add(kind)
+    return [(key, _json_leaf_type(kinds[key])) for key in sorted(kinds)]
+
+
+def _arrow_type(pa, name: str):
+    return {
+        "int64": pa.int64(),
+        "int32": pa.int32(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "string": pa.string(),
+        "json": pa.string(),
+        "dictionary": pa.dictionary(pa.int32(), pa.string()),
+        "timestamp": pa.timestamp("us"),
+        "list<string>": pa.list_(pa.string()),
+    }[name]
+
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+_MISMATCH = object()
+
+
+def _json_cell(kind: str, value: Any) -> Any:
+    """
+    Cellule d'une colonne JSON aplatie, au type découvert au premier parcours.
+
+    Returns:
+        Valeur, ou _MISMATCH si elle a changé de type depuis (écrite null)
+    """
+    if value is None:
+        return None
+    if kind == "json":
+        return json.dumps(value, ensure_ascii=False)
+    if kind == "string":
+        return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+    if kind == "bool":
+        return value if isinstance(value, bool) else _MISMATCH
+    if kind == "int64":
+        if isinstance(value, int) and not isinstance(value, bool) and INT64_MIN <= value <= INT64_MAX:
+            return value
+        return _MISMATCH
+    if kind == "float64":
+        return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else _MISMATCH
+    if kind == "list<string>":
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            return value
+        return _MISMATCH
+    return _MISMATCH
+
+
+def check_columnar(fmt: str, compression: Optional[str]) -> str:
+    """
+    Vérifie format et compression d'un export colonnes.
+
+    Returns:
+        Compression effective (défaut: EXPORT_COLUMNAR_COMPRESSION)
+
+    Raises:
+        ValueError: Format ou compression inconnus
+        RuntimeError: pyarrow non installé
+    """
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format '{fmt}' (expected: {', '.join(COLUMNAR_FORMATS)})")
+    compression = (compression or config.EXPORT_COLUMNAR_COMPRESSION).lower()
+    if compression not in COMPRESSIONS[fmt]:
+        raise ValueError(
+            f"Unsupported {fmt} compression '{compression}' (expected: {', '.join(COMPRESSIONS[fmt])})"
+        )
+    if not ARROW_AVAILABLE:
+        raise RuntimeError("Parquet/Arrow export requires pyarrow (pip install pyarrow)")
+    return compression
+
+
+def iter_columnar(
+    db: Session,
+    campaign_id: int,
+    fmt: str = "parquet",
+    compression: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    row_group_size: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Appels d'une campagne en Parquet (ou flux Arrow IPC), morceau par morceau.
+
+    Parquet: un morceau par row group (row_group_size lignes), puis le
+    footer; Arrow: un morceau par lot lu en base.
+
+    Args:
+        db: Session DB (gardée ouverte tant que l'itérateur est consommé)
+        campaign_id: Campagne
+        fmt: "parquet" ou "arrow"
+        compression: Codec (défaut: EXPORT_COLUMNAR_COMPRESSION, "none" = aucun)
+        batch_size: Lignes lues par lot (défaut: EXPORT_BATCH_SIZE)
+        row_group_size: Lignes par row group Parquet (défaut: EXPORT_PARQUET_ROW_GROUP_SIZE)
+    """
+    compression = check_columnar(fmt, compression)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    json_columns = _discover_json_columns(db, campaign_id, batch_size)
+    schema = pa.schema(
+        [pa.field(name, _arrow_type(pa, kind)) for name, kind, _, _ in COLUMNAR_COLUMNS]
+        + [pa.field(name, _arrow_type(pa, kind)) for name, kind in json_columns]
+    )
+
+    mismatched = 0
+
+    def to_batch(rows) -> "pa.RecordBatch":
+        nonlocal mismatched
+        arrays = []
+        by_column = list(zip(*rows))  # Lignes → colonnes (même ordre que columns)
+        for (name, kind, column, convert), values in zip(COLUMNAR_COLUMNS, by_column):
+            if convert:
+                values = [convert(value) for value in values]
+            if kind == "dictionary":
+                arrays.append(pa.array(values, pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, _arrow_type(pa, kind)))
+        flattened = [_flatten_row(row) for row in rows]
+        for name, kind in json_columns:
+            cells = [_json_cell(kind, item.get(name)) for item in flattened]
+            if any(cell is _MISMATCH for cell in cells):
+                mismatched += sum(1 for cell in cells if cell is _MISMATCH)
+                cells = [None if cell is _MISMATCH else cell for cell in cells]
+            arrays.append(pa.array(cells, _arrow_type(pa, kind)))
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def report_mismatches():
+        if mismatched:
+            logger.warning(
+                f"⚠️ Campaign {campaign_id} {fmt} export: {mismatched} JSON values changed type "
+                f"after schema discovery, written as null"
+            )
+
+    columns = [column for _, _, column, _ in COLUMNAR_COLUMNS] + [column for column, _ in JSON_FIELDS]
+    batches = iter_call_batches(db, campaign_id, columns, batch_size)
+    sink = _ChunkSink()
+    codec = None if compression == "none" else compression
+
+    if fmt == "arrow":
+        options = pa.ipc.IpcWriteOptions(compression=codec)
+        with pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema, options=options) as writer:
+            for rows in batches:
+                writer.write_batch(to_batch(rows))
+                yield sink.drain()
+        yield sink.drain()
+        report_mismatches()
+        return
+
+    row_group_size = row_group_size or config.EXPORT_PARQUET_ROW_GROUP_SIZE
+    pending: List["pa.RecordBatch"] = []
+    pending_rows = 0
+    with pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema, compression=codec or "NONE") as writer:
+        for rows in batches:
+            pending.append(to_batch(rows))
+            pending_rows += len(rows)
+            if pending_rows >= row_group_size:
+                writer.write_table(pa.Table.from_batches(pending, schema), row_group_size=pending_rows)
+                pending, pending_rows = [], 0
+                yield sink.drain()
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending, schema), row_group_size=pending_rows)
+    yield sink.drain()  # Dernier row group + footer
+    report_mismatches()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Call Queue - MiniBotPanel v3
+
+Réservation atomique des appels à lancer, partagée entre plusieurs workers
+BatchCaller (un par nœud robot) sur la même base PostgreSQL.
+
+Une seule instruction par réservation:
+
+    UPDATE calls SET status='QUEUED', worker_id=..., lease_expires_at=now+bail
+    WHERE id IN (SELECT id FROM calls
+                 WHERE campaign_id=... AND status IN ('PENDING','RETRY')
+                   AND (scheduled_at IS NULL OR scheduled_at <= now)
+                 ORDER BY queue_priority DESC, scheduled_at
+                 LIMIT n FOR UPDATE SKIP LOCKED)
+    RETURNING id
+
+- SKIP LOCKED: deux workers qui réservent en même temps obtiennent des
+  appels disjoints, sans s'attendre (les lignes verrouillées par l'autre
+  sont sautées)
+- Transaction courte: commit juste après la réservation, aucun verrou
+  n'est gardé pendant les originate
+- Bail (CALL_LEASE_SECONDS): un appel QUEUED dont le worker est mort avant
+  l'originate est remis en PENDING/RETRY par recover_expired(); le worker
+  vivant renouvelle (renew) le bail des appels qui attendent leur départ
+- Départ gardé (start_dispatch): QUEUED → CALLING seulement si l'appel est
+  encore QUEUED et réservé par ce worker. Un appel annulé (stop_campaign)
+  ou repris par un autre worker après expiration du bail n'est pas composé
+
+Cycle de vie d'un appel:
+    PENDING/RETRY → claim() → QUEUED (worker_id, lease_expires_at)
+                  → renew() tant qu'il attend son départ
+                  → start_dispatch() / mark_launched() → CALLING (bail levé)
+                  → release() / bail expiré → PENDING/RETRY
+    NO_ANSWER/BUSY → schedule_retries() → RETRY (scheduled_at, priorité 1)
+
+Planification des retry (schedule_retries): un UPDATE ... FROM campaigns,
+calls AS before ... RETURNING, qui rend le statut d'avant (contribution au
+rollup des statistiques retirée); scheduled_at est calculé en SQL selon le statut
+(délai de la campagne pour NO_ANSWER, RETRY_BUSY_DELAY_MINUTES pour BUSY).
+L'index partiel ix_calls_retryable (NO_ANSWER/BUSY avec retry restant)
+limite le coût aux appels à replanifier, pas à tout l'historique.
+
+Utilisation:
+    from system.call_queue import CallQueue
+
+    queue = CallQueue()                     # worker_id = "<hostname>:<pid>"
+    calls = queue.claim(db, campaign.id, 5)
+    for call in calls:
+        ...originate...
+        queue.mark_launched(call)
+    db.commit()
+"""
+
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+
+from sqlalchemy import DateTime, case, cast, literal, or_, select, update
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql.functions import FunctionElement
+
+from system.models import Call, Campaign, CallStatus
+from system.config import config
+from system.stats_rollup import RollupDelta, rollup_columns
+
+CLAIMABLE_STATUSES = (CallStatus.PENDING, CallStatus.RETRY)
+RETRYABLE_STATUSES = (CallStatus.NO_ANSWER, CallStatus.BUSY)
+CALLS = Call.__table__
+
+
+class minutes_after(FunctionElement):
+    """minutes_after(start, minutes): start + minutes (expression SQL, par dialecte)."""
+    type = DateTime()
+    name = "minutes_after"
+    inherit_cache = True
+
+
+@compiles(minutes_after, "postgresql")
+def _minutes_after_postgresql(element, compiler, **kw):
+    start, minutes = list(element.clauses)
+    return (
+        f"CAST({compiler.process(start, **kw)} AS TIMESTAMP WITHOUT TIME ZONE)"
+        f" + make_interval(mins => {compiler.process(minutes, **kw)})"
+    )
+
+
+@compiles(minutes_after, "sqlite")
+def _minutes_after_sqlite(element, compiler, **kw):
+    # Base de test / scripts: datetime() SQLite, format relu par SQLAlchemy
+    start, minutes = list(element.clauses)
+    return f"datetime({compiler.process(start, **kw)}, '+' || ({compiler.process(minutes, **kw)}) || ' minutes')"
+
+
+def default_worker_id() -> str:
+    """Identifiant du worker: BATCH_WORKER_ID, sinon "<hostname>:<pid>"."""
+    return config.BATCH_WORKER_ID or f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _requeued_status():
+    """PENDING si jamais lancé, RETRY sinon (retry_count est incrémenté à l'originate)."""
+    # CAST explicite: un CASE de littéraux est du text pour PostgreSQL, pas l'enum callstatus
+    status_type = Call.__table__.c.status.type
+    return cast(
+        case(
+            (Call.retry_count > 0, literal(CallStatus.RETRY, status_type)),
+            else_=literal(CallStatus.PENDING, status_type),
+        ),
+        status_type,
+    )
+
+
+class CallQueue:
+    """Réservation des appels d'une campagne par un worker (bail + SKIP LOCKED)."""
+
+    def __init__(self, worker_id: Optional[str] = None, lease_seconds: Optional[int] = None):
+        """
+        Args:
+            worker_id: Identifiant du worker (défaut: default_worker_id())
+            lease_seconds: Durée du bail (défaut: config.CALL_LEASE_SECONDS)
+        """
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds or config.CALL_LEASE_SECONDS
+
+    def claim(self, db: Session, campaign_id: int, limit: int, with_contact: bool = False) -> List[Call]:
+        """
+        Réserve jusqu'à `limit` appels prêts de la campagne (commit inclus).
+
+        Args:
+            db: Session DB (la transaction en cours est commitée)
+            campaign_id: Campagne à vider
+            limit: Nombre max d'appels réservés
+            with_contact: Charger aussi les contacts (JOIN, même requête)
+
+        Returns:
+            Appels réservés (QUEUED pour ce worker), par priorité puis date planifiée
+        """
+        if limit <= 0:
+            return []
+
+        now = datetime.utcnow()
+        ready = (
+            select(Call.id)
+            .where(
+                Call.campaign_id == campaign_id,
+                Call.status.in_(CLAIMABLE_STATUSES),
+                or_(Call.scheduled_at == None, Call.scheduled_at <= now),
+            )
+            .order_by(Call.queue_priority.desc(), Call.scheduled_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed_ids = db.execute(
+            update(Call)
+            .where(Call.id.in_(ready.scalar_subquery()))
+            .values(
+                status=CallStatus.QUEUED,
+                worker_id=self.worker_id,
+                lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+            )
+            .returning(Call.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        db.commit()
+
+        if not claimed_ids:
+            return []
+
+        # Une seule requête pour charger les appels réservés (pas de refresh par objet)
+        query = db.query(Call)
+        if with_contact:
+            query = query.options(joinedload(Call.contact))
+        return query.filter(Call.id.in_(claimed_ids)).order_by(
+            Call.queue_priority.desc(),
+            Call.scheduled_at.asc(),
+            Call.id.asc()
+        ).all()
+
+    def mark_launched(self, call: Call):
+        """Originate envoyé: l'appel quitte la file (le commit reste à l'appelant)."""
+        call.status = CallStatus.CALLING
+        call.lease_expires_at = None
+
+    def start_dispatch(self, db: Session, call_id: int) -> bool:
+        """
+        Passe un appel réservé en CALLING juste avant l'originate (commit inclus).
+
+        Returns:
+            False si l'appel n'est plus QUEUED pour ce worker (annulé, ou bail
+            expiré et repris ailleurs): ne pas le composer
+        """
+        started = db.execute(
+            update(Call)
+            .where(
+                Call.id == call_id,
+                Call.status == CallStatus.QUEUED,
+                Call.worker_id == self.worker_id,
+            )
+            .values(status=CallStatus.CALLING, lease_expires_at=None)
+            .returning(Call.id)
+            .execution_options(synchronize_session=False)
+        ).first()
+        db.commit()
+        return started is not None
+
+    def renew(self, db: Session, call_ids: Sequence[int]) -> List[int]:
+        """
+        Prolonge le bail d'appels réservés qui attendent leur départ (commit inclus).
+
+        Returns:
+            Ids encore réservés par ce worker (les autres ont été annulés ou repris)
+        """
+        if not call_ids:
+            return []
+        renewed = db.execute(
+            update(Call)
+            .where(
+                Call.id.in_(list(call_ids)),
+                Call.status == CallStatus.QUEUED,
+                Call.worker_id == self.worker_id,
+            )
+            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=self.lease_seconds))
+            .returning(Call.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        db.commit()
+        return renewed
+
+    def release(self, db: Session, call_ids: Sequence[int]) -> int:
+        """
+        Rend à la file des appels réservés mais pas lancés (arrêt du worker).
+
+        Returns:
+            Nombre d'appels rendus
+        """
+        if not call_ids:
+            return 0
+        result = db.execute(
+            update(Call)
+            .where(
+                Call.id.in_(list(call_ids)),
+                Call.status == CallStatus.QUEUED,
+                Call.worker_id == self.worker_id,
+            )
+            .values(status=_requeued_status(), worker_id=None, lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+
+    def recover_expired(self, db: Session) -> int:
+        """
+        Remet en file les appels QUEUED dont le bail a expiré (tous workers confondus).
+
+        Returns:
+            Nombre d'appels récupérés
+        """
+        result = db.execute(
+            update(Call)
+            .where(
+                Call.status == CallStatus.QUEUED,
+                Call.lease_expires_at < datetime.utcnow(),
+            )
+            .values(status=_requeued_status(), worker_id=None, lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+
+
+def schedule_retries(db: Session, busy_delay_minutes: Optional[int] = None) -> List:
+    """
+    Passe en RETRY les appels NO_ANSWER/BUSY qui ont encore des tentatives (commit inclus).
+
+    Un seul UPDATE ... FROM campaigns, calls AS before ... RETURNING, scheduled_at
+    calculé en SQL: l'auto-jointure rend le statut d'avant l'UPDATE (et les
+    colonnes du rollup des statistiques: l'appel quitte son état final).
+    Coût proportionnel aux appels à replanifier (index partiel
+    ix_calls_retryable), aucun appel chargé en Python.
+
+    SQLite n'accepte dans RETURNING que les colonnes de la table modifiée:
+    un UPDATE par statut replanifiable (statut d'avant connu par construction).
+
+    Args:
+        db: Session DB
+        busy_delay_minutes: Délai après BUSY (défaut: config.RETRY_BUSY_DELAY_MINUTES)
+
+    Returns:
+        Lignes (id, campaign_id, scheduled_at) des appels replanifiés
+    """
+    busy_delay = config.RETRY_BUSY_DELAY_MINUTES if busy_delay_minutes is None else busy_delay_minutes
+
+    if db.get_bind().dialect.name == "postgresql":
+        before = CALLS.alias("before").c
+        # before.status = calls.status: revérifié si la ligne a changé entre-temps
+        # (relecture READ COMMITTED), le statut rendu est bien celui remplacé
+        statements = [(_retry_update(before, busy_delay, CALLS.c.id == before.id, before.status == CALLS.c.status), {})]
+    else:
+        statements = [
+            (_retry_update(CALLS.c, busy_delay, CALLS.c.status == status), {"status": status})
+            for status in RETRYABLE_STATUSES
+        ]
+
+    rows = []
+    rollup = RollupDelta()
+    for statement, before_values in statements:
+        for row in db.execute(statement):
+            rollup.remove(row, **before_values)
+            rows.append((row.id, row.campaign_id, row.scheduled_at))
+    rollup.apply(db)
+    db.commit()
+    return rows
+
+
+def _retry_update(before, busy_delay: int, *where):
+    """
+    UPDATE ... RETURNING de schedule_retries (`before`: colonnes de l'appel avant l'UPDATE).
+
+    Sur la table (Core): un UPDATE ORM ne rend pas les colonnes d'un alias.
+    """
+    delay_minutes = case(
+        (before.status == CallStatus.NO_ANSWER, Campaign.retry_delay_minutes),
+        else_=literal(busy_delay),
+    )
+    return (
+        update(CALLS)
+        .where(
+            *where,
+            before.campaign_id == Campaign.id,
+            Campaign.retry_enabled == True,
+            before.status.in_(RETRYABLE_STATUSES),
+            before.retry_count < before.max_retries,
+        )
+        .values({
+            # Colonnes (pas de mots-clés): UPDATE multi-tables, status existe aussi dans campaigns
+            CALLS.c.status: CallStatus.RETRY,
+            CALLS.c.scheduled_at: minutes_after(literal(datetime.utcnow(), DateTime()), delay_minutes),
+            CALLS.c.queue_priority: 1,  # Priorité plus haute
+        })
+        .returning(CALLS.c.id, CALLS.c.scheduled_at, *rollup_columns(before))
+    )
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Call Session - MiniBotPanel v3
+
+État d'un appel en cours: un objet CallSession (__slots__, champs typés)
+par appel, dans un registre unique (CallRegistry) protégé par un verrou.
+
+Remplace les 4 dicts parallèles du robot (active_calls, call_threads,
+call_sessions, barge_in_active) indexés par UUID.
+
+Cycle de vie:
+    originate_call()        → registry.open(uuid)        state=ORIGINATED
+    CHANNEL_ANSWER          → registry.open(uuid)        state=ANSWERED (answered_at)
+    _handle_call()          → lit/écrit sa session (référence gardée)
+    CHANNEL_HANGUP_COMPLETE → session.mark_hangup()      hangup_detected=True
+                            → registry.close(uuid)       state=CLOSED, retirée
+    BatchCaller             → registry.ended_info(uuid)  bilan gardé après close
+
+Les threads (appel, monitoring VAD, callbacks ASR) gardent une référence
+sur l'objet: le retrait du registre au hangup ne leur fait plus lever de
+KeyError, ils voient hangup_detected / closed et s'arrêtent.
+
+Ressources par appel: la session possède ses fichiers temporaires
+(track_file) et ses threads de monitoring (track_worker); le robot les
+libère en un seul endroit au hangup (release_files, live_workers).
+
+Usage:
+    from system.call_session import CallRegistry
+
+    calls = CallRegistry()
+    session = calls.open(call_uuid, phone_number="33612345678", state="ORIGINATED")
+    session = calls.get(call_uuid)      # None si inconnu / terminé
+    calls.is_active(call_uuid)          # décroché et pas encore raccroché
+    calls.close(call_uuid)
+    calls.ended_info(call_uuid)         # cause, AMD, qualification, durée
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+STATE_ORIGINATED = "ORIGINATED"
+STATE_ANSWERED = "ANSWERED"
+STATE_HANGUP = "HANGUP"
+STATE_CLOSED = "CLOSED"
+
+# Bilans d'appels terminés gardés pour le BatchCaller (les plus anciens sont oubliés)
+ENDED_INFO_MAX = 10_000
+
+
+class BargeInState:
+    """Détection barge-in pendant une lecture audio (monitoring VAD)."""
+    __slots__ = ("detected", "speech_start", "speech_duration", "barge_in_at", "stop_monitoring")
+
+    def __init__(self):
+        self.detected = False
+        self.speech_start: Optional[float] = None
+        self.speech_duration = 0.0
+        self.barge_in_at = 0.0
+        self.stop_monitoring = False
+
+
+class CallSession:
+    """État d'un appel (un objet par UUID, partagé par tous ses threads)."""
+    __slots__ = (
+        # Identité / contexte
+        "uuid", "phone_number", "caller", "callee", "lead_id",
+        "scenario_name", "scenario", "state",
+        # Timestamps (time.time())
+        "start_time", "answered_at",
+        "phase1_end_timestamp", "phase2_end_timestamp", "phase3_end_timestamp",
+        # Audio
+        "noise_floor_rms", "barge_in",
+        # Fin d'appel
+        "hangup_detected", "hangup_timestamp", "hangup_cause", "robot_hangup", "final_status",
+        "amd_machine_detected",
+        # Conversation
+        "qualification_score", "steps_executed", "return_step", "transcripts",
+        "objection_matchers",
+        # Exécution / ressources possédées par l'appel
+        "thread", "workers", "temp_files",
+    )
+
+    def __init__(self, uuid: str):
+        self.uuid = uuid
+        self.phone_number: Optional[str] = None
+        self.caller: Optional[str] = None
+        self.callee: Optional[str] = None
+        self.lead_id = 0
+        self.scenario_name: Optional[str] = None
+        self.scenario: Optional[Any] = None
+        self.state = STATE_ORIGINATED
+
+        self.start_time = time.time()
+        self.answered_at: Optional[float] = None
+        self.phase1_end_timestamp: Optional[float] = None
+        self.phase2_end_timestamp: Optional[float] = None
+        self.phase3_end_timestamp: Optional[float] = None
+
+        self.noise_floor_rms = 0.0
+        self.barge_in: Optional[BargeInState] = None
+
+        self.hangup_detected = False
+        self.hangup_timestamp = 0.0
+        self.hangup_cause: Optional[str] = None
+        self.robot_hangup = False
+        self.final_status: Optional[Any] = None
+        self.amd_machine_detected = False
+
+        self.qualification_score = 0.0
+        self.steps_executed: List[Dict[str, Any]] = []
+        self.return_step: Optional[str] = None
+        self.transcripts: List[Tuple[float, str]] = []
+        self.objection_matchers: Dict[str, Any] = {}
+
+        self.thread: Optional[threading.Thread] = None
+        self.workers: List[threading.Thread] = []
+        self.temp_files: Set[str] = set()
+
+    def __repr__(self) -> str:
+        return f"<CallSession {self.uuid[:8]} state={self.state} steps={len(self.steps_executed)}>"
+
+    @property
+    def short_uuid(self) -> str:
+        return self.uuid[:8]
+
+    @property
+    def is_answered(self) -> bool:
+        return self.answered_at is not None
+
+    @property
+    def closed(self) -> bool:
+        return self.state == STATE_CLOSED
+
+    def mark_hangup(self, timestamp: Optional[float] = None, cause: Optional[str] = None):
+        """Raccroché (événement FreeSWITCH): visible immédiatement par tous les threads."""
+        self.hangup_timestamp = timestamp or time.time()
+        self.hangup_cause = cause or self.hangup_cause
+        self.hangup_detected = True
+        self.state = STATE_HANGUP
+        if self.barge_in is not None:
+            self.barge_in.stop_monitoring = True
+
+    def end_info(self) -> Dict[str, Any]:
+        """
+        Bilan de l'appel pour la base (BatchCaller._call_end_values).
+
+        Returns:
+            {"hangup_cause", "failed", "amd_result", "qualification_result", "duration"}
+            (failed: raccroché par le robot en échec technique; amd /
+            qualification / durée seulement si l'appel a décroché)
+        """
+        # final_status: CallResult (LEADS, NOT_INTERESTED, NO_ANSWER) ou CallStatus
+        name = getattr(self.final_status, "name", None)
+        info: Dict[str, Any] = {"hangup_cause": self.hangup_cause}
+        if self.robot_hangup and name == "FAILED":
+            info["failed"] = True
+        if self.answered_at is not None:
+            info["amd_result"] = "machine" if self.amd_machine_detected else "human"
+            ended_at = self.hangup_timestamp or time.time()
+            info["duration"] = max(0, int(ended_at - self.answered_at))
+            if name in ("LEADS", "NOT_INTERESTED", "NO_ANSWER"):
+                info["qualification_result"] = name
+        return info
+
+    def add_transcript(self, text: str):
+        """Historique des transcriptions client (horodatées)."""
+        self.transcripts.append((time.time(), text))
+
+    def start_barge_in(self) -> BargeInState:
+        """Nouvel état barge-in pour une lecture (remplace le précédent)."""
+        self.barge_in = BargeInState()
+        return self.barge_in
+
+    def track_file(self, path: str) -> str:
+        """Fichier temporaire de l'appel (supprimé au plus tard au hangup)."""
+        self.temp_files.add(path)
+        return path
+
+    def track_worker(self, thread: threading.Thread) -> threading.Thread:
+        """Thread de monitoring de l'appel (les threads terminés sont oubliés)."""
+        self.workers = [worker for worker in self.workers if worker.is_alive()]
+        self.workers.append(thread)
+        return thread
+
+    def live_workers(self) -> List[threading.Thread]:
+        return [worker for worker in self.workers if worker.is_alive()]
+
+    def release_files(self) -> int:
+        """Supprime les fichiers temporaires encore présents. Retourne le nombre supprimé."""
+        removed = 0
+        for path in self.temp_files:
+            try:
+                os.unlink(path)
+                removed += 1
+            except OSError:
+                pass  # Déjà supprimé par la phase
+        self.temp_files.clear()
+        return removed
+
+
+class CallRegistry:
+    """Registre {uuid: CallSession}; toutes les mutations sous un seul verrou."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, CallSession] = {}
+        self._ended: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, call_uuid: str) -> bool:
+        return call_uuid in self._sessions
+
+    def open(self, call_uuid: str, **fields) -> CallSession:
+        """
+        Session de l'appel (créée si absente) puis mise à jour des champs.
+
+        Raises:
+            AttributeError: champ inconnu (pas de clé libre comme avec un dict)
+        """
+        with self._lock:
+            session = self._sessions.get(call_uuid)
+            if session is None:
+                session = CallSession(call_uuid)
+                self._sessions[call_uuid] = session
+            for name, value in fields.items():
+                setattr(session, name, value)
+            return session
+
+    def get(self, call_uuid: Optional[str]) -> Optional[CallSession]:
+        """Session en cours (None si inconnue ou déjà fermée)."""
+        return self._sessions.get(call_uuid) if call_uuid else None
+
+    def is_active(self, call_uuid: str) -> bool:
+        """Appel décroché et pas encore fermé (ex-`uuid in active_calls`)."""
+        session = self._sessions.get(call_uuid)
+        return session is not None and session.answered_at is not None
+
+    def is_hung_up(self, call_uuid: str) -> bool:
+        """Raccroché (flag posé par l'événement hangup) ou déjà fermé."""
+        session = self._sessions.get(call_uuid)
+        return session is None or session.hangup_detected
+
+    def close(self, call_uuid: str) -> Optional[CallSession]:
+        """
+        Retire la session (atomique). Les références existantes restent lisibles.
+
+        Le bilan (end_info) est enregistré sous le même verrou: un appel absent
+        de uuids() a toujours son ended_info().
+        """
+        with self._lock:
+            session = self._sessions.pop(call_uuid, None)
+            if session is not None:
+                self._ended[call_uuid] = session.end_info()
+                while len(self._ended) > ENDED_INFO_MAX:
+                    self._ended.popitem(last=False)
+        if session is not None:
+            session.state = STATE_CLOSED
+            if session.barge_in is not None:
+                session.barge_in.stop_monitoring = True
+        return session
+
+    def ended_info(self, call_uuid: str) -> Optional[Dict[str, Any]]:
+        """Bilan d'un appel fermé (None si inconnu ou trop ancien)."""
+        with self._lock:
+            info = self._ended.get(call_uuid)
+            return dict(info) if info is not None else None
+
+    def forget_ended(self, call_uuids: List[str]) -> int:
+        """
+        Oublie le bilan d'appels fermés une fois enregistrés en base.
+
+        ENDED_INFO_MAX ne borne que le pire cas (consommateur absent ou en
+        échec): en régime normal le bilan ne vit que jusqu'au commit.
+
+        Returns:
+            Nombre de bilans oubliés
+        """
+        with self._lock:
+            return sum(self._ended.pop(call_uuid, None) is not None for call_uuid in call_uuids)
+
+    def uuids(self) -> List[str]:
+        """UUIDs des appels en cours, en sonnerie ou décrochés (copie)."""
+        with self._lock:
+            return list(self._sessions)
+
+    def sessions(self) -> List[CallSession]:
+        """Copie de toutes les sessions ouvertes."""
+        with self._lock:
+            return list(self._sessions.values())
@@ -0,0 +1,238 @@
+"""
+Call Stats - MiniBotPanel v3
+
+Agrégats de la table calls pour les endpoints de statistiques et d'export.
+
+Les compteurs d'une campagne (par statut, résultat, sentiment, AMD) et la
+durée moyenne ne relisent pas tout l'historique des appels:
+
+- appels terminés: table campaign_stats_rollup, tenue à jour dans la
+  transaction qui termine l'appel (system/stats_rollup.py), une ligne par
+  minute et combinaison statut/résultat/sentiment/AMD
+- appels en file ou en cours: GROUP BY sur la table calls, limité aux
+  statuts non finaux (index ix_calls_campaign_status)
+
+Deux requêtes pour une ou plusieurs campagnes (moniteurs), quel que soit
+le nombre d'appels.
+
+La timeline d'une campagne (appels et leads par intervalle) est elle aussi
+une seule requête: numéro d'intervalle calculé en SQL (bucket_index, secondes
+écoulées depuis le début / durée de l'intervalle), GROUP BY, puis intervalles
+vides complétés en Python. Les intervalles définitifs (terminés depuis
+TIMELINE_FINAL_AFTER_MINUTES) sont gardés en cache: seuls les récents sont
+relus.
+
+Utilisation:
+    from system.call_stats import campaign_call_stats, campaigns_call_stats, campaign_timeline
+
+    stats = campaign_call_stats(db, campaign_id)
+    running = campaigns_call_stats(db, [1, 2, 3])   # {campaign_id: stats}
+    stats["status"]["completed"], stats["results"]["leads"], stats["avg_duration"]
+
+    points = campaign_timeline(db, campaign_id, started_at, datetime.utcnow(), 15)
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import DateTime, Integer, func, literal, literal_column, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import FunctionElement
+
+from system.models import Call, CallStatus, CallResult, Sentiment, CampaignStatsRollup
+from system.stats_rollup import FINAL_STATUSES
+from system.cache_core import TypedCache
+
+AMD_RESULTS = ("human", "machine")
+
+# Intervalles définitifs par (campagne, début, durée): tuple de (appels, leads)
+_timeline_cache: TypedCache[tuple, tuple] = TypedCache("timeline_buckets", max_entries=256, default_ttl=3600)
+
+
+class bucket_index(FunctionElement):
+    """bucket_index(ts, origin, seconds): numéro de l'intervalle de `ts` (0 = [origin, origin + seconds[)."""
+    type = Integer()
+    name = "bucket_index"
+    inherit_cache = True
+
+
+@compiles(bucket_index, "postgresql")
+def _bucket_index_postgresql(element, compiler, **kw):
+    ts, origin, seconds = (compiler.process(clause, **kw) for clause in element.clauses)
+    return (
+        f"CAST(floor(EXTRACT(EPOCH FROM ({ts} - CAST({origin} AS TIMESTAMP WITHOUT TIME ZONE)))"
+        f" / {seconds}) AS INTEGER)"
+    )
+
+
+@compiles(bucket_index, "sqlite")
+def _bucket_index_sqlite(element, compiler, **kw):
+    # Base de test / scripts: microsecondes entières (julianday() arrondit à la milliseconde),
+    # format de stockage SQLAlchemy "YYYY-MM-DD HH:MM:SS.ffffff"; ts >= origin: division entière = floor
+    ts, origin, seconds = (compiler.process(clause, **kw) for clause in element.clauses)
+
+    def micros(value):
+        return f"(strftime('%s', {value}) * 1000000 + CAST(substr({value}, 21, 6) AS INTEGER))"
+
+    return f"(({micros(ts)} - {micros(origin)}) / CAST(({seconds}) * 1000000 AS INTEGER))"
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {
+        "total": 0,
+        "status": {status.value: 0 for status in CallStatus},
+        "results": {result.value: 0 for result in CallResult},
+        "sentiment": {sentiment.value: 0 for sentiment in Sentiment},
+        "amd": {amd: 0 for amd in AMD_RESULTS},
+        "duration_sum": 0,
+        "duration_count": 0,
+    }
+
+
+def _add_group(stats: Dict[str, Any], status, result, sentiment, amd, calls, duration_sum, duration_count):
+    """Ajoute un groupe (statut, résultat, sentiment, AMD) aux compteurs; dimensions en noms d'enum."""
+    stats["total"] += calls
+    if status:
+        stats["status"][CallStatus[status].value] += calls
+    if result:
+        stats["results"][CallResult[result].value] += calls
+    if sentiment:
+        stats["sentiment"][Sentiment[sentiment].value] += calls
+    if amd in stats["amd"]:
+        stats["amd"][amd] += calls
+    stats["duration_sum"] += duration_sum or 0
+    stats["duration_count"] += duration_count or 0
+
+
+def _enum_name(value) -> str:
+    return value.name if value is not None else ""
+
+
+def campaigns_call_stats(db: Session, campaign_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Compteurs des appels de plusieurs campagnes, en deux requêtes GROUP BY.
+
+    - Appels terminés: table campaign_stats_rollup (O(minutes x combinaisons))
+    - Appels en file / en cours: table calls, statuts non finaux seulement
+
+    Args:
+        db: Session DB
+        campaign_ids: Campagnes
+
+    Returns:
+        {campaign_id: {total, status, results, sentiment, amd, avg_duration}};
+        les compteurs par statut/résultat/sentiment sont indexés par valeur
+        d'enum (ex: status["completed"]) et valent 0 si aucun appel
+    """
+    campaign_ids = list(campaign_ids)
+    stats = {campaign_id: _empty_stats() for campaign_id in campaign_ids}
+    if not campaign_ids:
+        return {}
+
+    rollup = db.query(
+        CampaignStatsRollup.campaign_id,
+        CampaignStatsRollup.status,
+        CampaignStatsRollup.result,
+        CampaignStatsRollup.sentiment,
+        CampaignStatsRollup.amd_result,
+        func.sum(CampaignStatsRollup.calls),
+        func.sum(CampaignStatsRollup.duration_sum),
+        func.sum(CampaignStatsRollup.duration_count),
+    ).filter(
+        CampaignStatsRollup.campaign_id.in_(campaign_ids)
+    ).group_by(
+        CampaignStatsRollup.campaign_id,
+        CampaignStatsRollup.status,
+        CampaignStatsRollup.result,
+        CampaignStatsRollup.sentiment,
+        CampaignStatsRollup.amd_result,
+    )
+    for campaign_id, *group in rollup:
+        _add_group(stats[campaign_id], *group)
+
+    live = db.query(
+        Call.campaign_id,
+        Call.status,
+        Call.result,
+        Call.sentiment,
+        Call.amd_result,
+        func.count(),
+        func.sum(Call.duration).filter(Call.duration > 0),
+        func.count().filter(Call.duration > 0),
+    ).filter(
+        Call.campaign_id.in_(campaign_ids),
+        or_(Call.status == None, Call.status.notin_(FINAL_STATUSES))
+    ).group_by(Call.campaign_id, Call.status, Call.result, Call.sentiment, Call.amd_result)
+    for campaign_id, status, result, sentiment, amd, *counts in live:
+        _add_group(stats[campaign_id], _enum_name(status), _enum_name(result), _enum_name(sentiment), amd, *counts)
+
+    for counts in stats.values():
+        duration_sum, duration_count = counts.pop("duration_sum"), counts.pop("duration_count")
+        counts["avg_duration"] = duration_sum / duration_count if duration_count else 0.0
+    return stats
+
+
+def campaign_call_stats(db: Session, campaign_id: int) -> Dict[str, Any]:
+    """Compteurs des appels d'une campagne (voir campaigns_call_stats)."""
+    return campaigns_call_stats(db, [campaign_id])[campaign_id]
+
+
+def campaign_timeline(
+    db: Session,
+    campaign_id: int,
+    start: datetime,
+    end: datetime,
+    interval_minutes: int,
+    final_before: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Appels et leads par intervalle de `interval_minutes` entre start et end, en une requête.
+
+    Args:
+        db: Session DB
+        campaign_id: Campagne
+        start: Début du premier intervalle
+        end: Fin de la timeline (le dernier intervalle la contient)
+        interval_minutes: Durée d'un intervalle (minutes, >= 1)
+        final_before: Les intervalles terminés avant cette date sont
+            définitifs et mis en cache (None = pas de cache)
+
+    Returns:
+        Liste [{timestamp, calls, leads}], un point par intervalle (0 si vide)
+    """
+    step = timedelta(minutes=interval_minutes)
+    buckets = math.ceil((end - start) / step)
+    if buckets <= 0:
+        return []
+
+    key = (campaign_id, start.isoformat(), interval_minutes)
+    counts = list(_timeline_cache.get(key, ())) if final_before else []
+    first = min(len(counts), buckets)
+    del counts[first:]
+
+    # Intervalles pas encore en cache: une requête GROUP BY numéro d'intervalle
+    if first < buckets:
+        bucket = bucket_index(Call.created_at, literal(start, DateTime()), step.total_seconds())
+        rows = db.query(
+            bucket.label("bucket"),
+            func.count(),
+            func.count().filter(Call.result == CallResult.LEADS)
+        ).filter(
+            Call.campaign_id == campaign_id,
+            Call.created_at >= start + first * step,
+            Call.created_at < start + buckets * step
+        ).group_by(literal_column("bucket")).all()  # Alias: l'expression a ses propres paramètres
+        by_bucket = {index: (calls, leads) for index, calls, leads in rows}
+        counts.extend(by_bucket.get(index, (0, 0)) for index in range(first, buckets))
+
+    if final_before:
+        final = min(buckets, max(0, math.floor((final_before - start) / step)))
+        if final > first:
+            _timeline_cache.set(key, tuple(counts[:final]))
+
+    return [
+        {"timestamp": (start + index * step).isoformat(), "calls": calls, "leads": leads}
+        for index, (calls, leads) in enumerate(counts)
+    ]
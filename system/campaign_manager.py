@@ -23,14 +23,19 @@ Utilisation:
     manager.start_campaign(campaign_id)
 """
 
+import time
 import logging
+import threading
 from typing import List, Optional
 from datetime import datetime, timedelta
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 
 from system.database import SessionLocal
 from system.models import Campaign, Call, Contact, CampaignStatus, CallStatus, CallResult
+from system.call_queue import CallQueue
+from system.call_dispatcher import CallDispatcher, claim_jobs
+from system.stats_rollup import RollupDelta, rollup_columns
 from system.config import config
 from system.logger import get_logger
 
@@ -48,21 +53,53 @@ class CampaignManager:
         """
         logger.info("Initializing CampaignManager...")
 
-        # Référence vers robot FreeSWITCH
-        self.robot = robot
+        # Référence vers robot FreeSWITCH (construit au premier lancement
+        # d'appel si non injecté: création de campagne, import de contacts
+        # et API n'ont pas à charger les modèles IA)
+        self._robot = robot
+        self._robot_failed = False
+        self._robot_lock = threading.Lock()
 
-        if not self.robot:
-            # Import lazy pour éviter circular imports
-            try:
-                from system.robot_freeswitch import RobotFreeSWITCH
-                self.robot = RobotFreeSWITCH()
-                logger.info("✅ Robot FreeSWITCH initialized internally")
-            except Exception as e:
-                logger.warning(f"⚠️ Robot not available: {e}")
-                self.robot = None
+        # File partagée (réservation SKIP LOCKED) et dispatcher, créé avec le robot
+        self.queue = CallQueue()
+        self._dispatcher: Optional[CallDispatcher] = None
 
         logger.info("✅ CampaignManager initialized")
 
+    @property
+    def robot(self):
+        """Robot FreeSWITCH, initialisé au premier accès (None si indisponible)."""
+        if self._robot is None and not self._robot_failed:
+            with self._robot_lock:
+                if self._robot is None and not self._robot_failed:
+                    # Import lazy: évite circular imports et le coût des modèles
+                    try:
+                        from system.robot_freeswitch import RobotFreeSWITCH
+                        self._robot = RobotFreeSWITCH()
+                        logger.info("✅ Robot FreeSWITCH initialized internally")
+                    except Exception as e:
+                        logger.warning(f"⚠️ Robot not available: {e}")
+                        self._robot_failed = True
+        return self._robot
+
+    @robot.setter
+    def robot(self, robot):
+        self._robot = robot
+        self._robot_failed = False
+
+    @property
+    def dispatcher(self) -> Optional[CallDispatcher]:
+        """Dispatcher des originate (démarré au premier accès, None sans robot)."""
+        if self._dispatcher is None:
+            robot = self.robot
+            if robot is None:
+                return None
+            with self._robot_lock:
+                if self._dispatcher is None:
+                    self._dispatcher = CallDispatcher(robot, queue=self.queue)
+                    self._dispatcher.start()
+        return self._dispatcher
+
     def get_eligible_contacts(self, limit: Optional[int] = None, include_no_answer: bool = False) -> List[int]:
         """
         Récupère les contacts éligibles pour être appelés.
@@ -188,120 +225,74 @@ class CampaignManager:
             campaign.status = CampaignStatus.RUNNING
             campaign.started_at = datetime.now()
             db.commit()
+        finally:
+            db.close()
 
-            # Boucle de traitement de la file d'attente
-            while campaign.status == CampaignStatus.RUNNING:
-                # Compter appels en cours
-                active_calls = db.query(Call).filter(
-                    Call.campaign_id == campaign_id,
-                    Call.status.in_([CallStatus.CALLING, CallStatus.RINGING,
-                                     CallStatus.ANSWERED, CallStatus.IN_PROGRESS])
-                ).count()
-
-                # Si on peut lancer plus d'appels
-                available_slots = campaign.max_concurrent_calls - active_calls
-
-                if available_slots > 0:
-                    # Prendre un batch depuis la file
-                    batch_size = min(campaign.batch_size, available_slots)
-
-                    # Récupérer appels à lancer (PENDING ou RETRY, triés par priorité et scheduled_at)
-                    now = datetime.now()
-                    calls_to_make = db.query(Call).filter(
-                        Call.campaign_id == campaign_id,
-                        Call.status.in_([CallStatus.PENDING, CallStatus.RETRY]),
-                        or_(Call.scheduled_at == None, Call.scheduled_at <= now)
-                    ).order_by(
-                        Call.queue_priority.desc(),  # Priorité d'abord
-                        Call.scheduled_at.asc()       # Puis par date planifiée
-                    ).limit(batch_size).all()
-
-                    # Lancer les appels du batch
-                    for call in calls_to_make:
-                        # Vérifier contact pas en blocklist
-                        contact = db.query(Contact).filter(Contact.id == call.contact_id).first()
-
-                        if contact.blacklist or contact.opt_out:
-                            call.status = CallStatus.CANCELLED
-                            call.result = CallResult.NOT_INTERESTED
-                            call.notes = "Contact in blocklist"
-                            db.commit()
-                            continue
-
-                        # Marquer comme en cours
-                        call.status = CallStatus.QUEUED
-                        call.last_attempt_at = datetime.now()
-                        call.retry_count += 1
+        try:
+            # Boucle de traitement de la file d'attente: une session courte par
+            # tour, jamais ouverte pendant le cadencement (fait par le dispatcher)
+            while True:
+                db = SessionLocal()
+                try:
+                    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+                    if not campaign or campaign.status != CampaignStatus.RUNNING:
+                        # Pause / arrêt: jobs pas encore partis retirés du dispatcher
+                        if self._dispatcher:
+                            self._dispatcher.withdraw_campaigns([campaign_id])
+                        break
+
+                    # Compter les appels par statut (une requête pour tous les compteurs)
+                    counts = dict(
+                        db.query(Call.status, func.count(Call.id)).filter(
+                            Call.campaign_id == campaign_id
+                        ).group_by(Call.status).all()
+                    )
+                    active_calls = sum(counts.get(status, 0) for status in (
+                        CallStatus.CALLING, CallStatus.RINGING, CallStatus.ANSWERED, CallStatus.IN_PROGRESS
+                    ))
+                    queued_calls = counts.get(CallStatus.QUEUED, 0)
+
+                    # Si on peut lancer plus d'appels
+                    available_slots = campaign.max_concurrent_calls - active_calls - queued_calls
+                    dispatcher = self.dispatcher
+
+                    if available_slots > 0 and dispatcher:
+                        # Réserver un batch (PENDING ou RETRY, triés par priorité et scheduled_at);
+                        # contacts en blocklist annulés au passage
+                        # Départs cadencés par le dispatcher (delay_between_calls); lu avant
+                        # claim_jobs, dont le commit expire l'objet campagne
+                        dispatcher.set_campaign_rate(campaign_id, campaign.delay_between_calls)
+                        batch_size = min(campaign.batch_size, available_slots)
+                        dispatcher.submit(claim_jobs(db, self.queue, campaign, batch_size))
+
+                    # Vérifier si campagne terminée (compteurs du début de tour)
+                    pending_count = sum(counts.get(status, 0) for status in (
+                        CallStatus.PENDING, CallStatus.RETRY, CallStatus.QUEUED
+                    ))
+
+                    if pending_count == 0 and active_calls == 0:
+                        # Plus rien à faire
+                        campaign.status = CampaignStatus.COMPLETED
+                        campaign.completed_at = datetime.now()
                         db.commit()
+                        logger.info(f"✅ Campaign {campaign_id} completed")
+                        break
+                finally:
+                    db.close()
 
-                        # Lancer appel via robot
-                        if self.robot:
-                            try:
-                                # Générer UUID unique
-                                import uuid as uuid_lib
-                                call_uuid = str(uuid_lib.uuid4())
-                                call.uuid = call_uuid
-                                call.status = CallStatus.CALLING
-                                call.started_at = datetime.now()
-                                db.commit()
-
-                                # Originate via FreeSWITCH
-                                result_uuid = self.robot.originate_call(
-                                    phone_number=contact.phone,
-                                    campaign_id=campaign_id,
-                                    scenario=campaign.scenario,
-                                    uuid=call_uuid,
-                                    contact_id=contact.id,
-                                    caller_id=campaign.caller_id or config.DEFAULT_CALLER_ID,
-                                    retry_count=call.retry_count,
-                                    variables={
-                                        "first_name": contact.first_name or "",
-                                        "last_name": contact.last_name or "",
-                                        "company": contact.company or "",
-                                        "email": contact.email or ""
-                                    }
-                                )
-
-                                if result_uuid:
-                                    logger.info(f"✅ Call initiated: {result_uuid} to {contact.phone}")
-                                else:
-                                    logger.error(f"Failed to originate call to {contact.phone}")
-                                    call.status = CallStatus.FAILED
-                                    db.commit()
-
-                            except Exception as e:
-                                logger.error(f"Failed to originate call: {e}")
-                                call.status = CallStatus.FAILED
-                                db.commit()
-
-                        # Délai entre appels
-                        import time
-                        time.sleep(campaign.delay_between_calls)
-
-                # Vérifier si campagne terminée
-                pending_count = db.query(Call).filter(
-                    Call.campaign_id == campaign_id,
-                    Call.status.in_([CallStatus.PENDING, CallStatus.RETRY, CallStatus.QUEUED])
-                ).count()
-
-                if pending_count == 0 and active_calls == 0:
-                    # Plus rien à faire
-                    campaign.status = CampaignStatus.COMPLETED
-                    campaign.completed_at = datetime.now()
-                    db.commit()
-                    logger.info(f"✅ Campaign {campaign_id} completed")
-                    break
-
-                # Pause entre checks
-                import time
+                # Pause entre checks (aucune session ouverte)
                 time.sleep(5)  # Check toutes les 5 secondes
 
         except Exception as e:
             logger.error(f"Error in campaign {campaign_id}: {e}")
-            campaign.status = CampaignStatus.FAILED
-            db.commit()
-        finally:
-            db.close()
+            db = SessionLocal()
+            try:
+                db.query(Campaign).filter(Campaign.id == campaign_id).update(
+                    {Campaign.status: CampaignStatus.FAILED}, synchronize_session=False
+                )
+                db.commit()
+            finally:
+                db.close()
 
     def pause_campaign(self, campaign_id: int):
         """
@@ -399,18 +390,29 @@ class CampaignManager:
             campaign.status = CampaignStatus.CANCELLED
             campaign.stopped_at = datetime.now()
 
-            # Annuler tous les appels PENDING/RETRY
-            cancelled_count = db.query(Call).filter(
-                Call.campaign_id == campaign_id,
-                Call.status.in_([CallStatus.PENDING, CallStatus.RETRY, CallStatus.QUEUED])
-            ).update({
-                "status": CallStatus.CANCELLED,
-                "ended_at": datetime.now(),
-                "notes": "Campaign stopped by user"
-            }, synchronize_session=False)
-
+            # Annuler tous les appels PENDING/RETRY (RETURNING: comptés dans le rollup)
+            cancelled = db.execute(
+                update(Call)
+                .where(
+                    Call.campaign_id == campaign_id,
+                    Call.status.in_([CallStatus.PENDING, CallStatus.RETRY, CallStatus.QUEUED])
+                )
+                .values(status=CallStatus.CANCELLED, ended_at=datetime.now(), notes="Campaign stopped by user")
+                .returning(*rollup_columns())
+                .execution_options(synchronize_session=False)
+            ).all()
+            cancelled_count = len(cancelled)
+
+            rollup = RollupDelta()
+            for row in cancelled:
+                rollup.add(row)
+            rollup.apply(db)
             db.commit()
 
+            # Jobs déjà réservés par ce processus: ne pas les composer
+            if self._dispatcher:
+                self._dispatcher.withdraw_campaigns([campaign_id])
+
             logger.info(f"✅ Campaign {campaign_id} stopped ({cancelled_count} calls cancelled)")
             return True
 
@@ -517,7 +519,9 @@ class CampaignManager:
             if not campaign:
                 return
 
-            # Mettre à jour appel
+            # Mettre à jour appel (et rollup des stats, même transaction)
+            rollup = RollupDelta()
+            rollup.remove(call)
             call.status = status
             if result:
                 call.result = result
@@ -552,6 +556,8 @@ class CampaignManager:
 
                 logger.info(f"📞 Call {call_id} BUSY, retry in 5 minutes")
 
+            rollup.add(call)
+            rollup.apply(db)
             db.commit()
 
             # Mettre à jour stats campagne
@@ -103,6 +103,10 @@ def init_database():
         # Créer toutes les tables
         Base.metadata.create_all(bind=engine)
 
+        # Colonnes / index ajoutés aux tables existantes
+        from system.migrations import apply_migrations
+        apply_migrations(engine)
+
         logger.info("✅ Database initialized successfully")
         return True
 
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Hot Reload - MiniBotPanel v3
+
+Surveillance des scénarios et des thématiques d'objections, recompilation en
+arrière-plan et swap atomique dans le CacheManager.
+
+Fichiers surveillés (scan mtime/taille toutes les HOT_RELOAD_INTERVAL secondes):
+- scenarios/*.json                          → ScenarioManager.reload_scenario()
+- system/objections_db/objections_*.py      → importlib.reload + recompilation
+                                              de l'artefact + set_objections()
+
+Activé par défaut (HOT_RELOAD_ENABLED=false pour le désactiver).
+
+Seules les versions déjà en cache sont rechargées (les autres seront chargées
+normalement au premier appel). Tant que le watcher tourne, les TTL scénarios
+et objections du CacheManager sont désactivés: plus aucun rechargement à froid
+sur le chemin critique d'un appel après expiration.
+
+Atomicité:
+- la nouvelle version est entièrement construite (validation, compilation,
+  manifest audio) AVANT le set dans le cache
+- un fichier invalide (JSON cassé, SyntaxError) laisse l'ancienne version
+- les appels en cours gardent leur snapshot (scénario compilé immuable et
+  ObjectionMatcher épinglés dans la session d'appel)
+
+Usage:
+    from system.hot_reload import HotReloader
+
+    reloader = HotReloader(scenario_manager)
+    reloader.start()
+    ...
+    reloader.stop()
+"""
+
+import sys
+import time
+import logging
+import importlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+
+from system.config import config
+from system.cache_manager import get_cache
+
+logger = logging.getLogger(__name__)
+
+OBJECTIONS_PACKAGE = "system.objections_db"
+GENERAL_THEME_FILE = "objections_general"
+
+FileSnapshot = Dict[Path, Tuple[int, int]]
+
+
+def _theme_file_for_key(cache_key: str) -> str:
+    """Clé de cache objections ("finance", "objections_finance", "finance@marc") → theme_file"""
+    theme = cache_key.split("@", 1)[0]
+    return theme if theme.startswith("objections_") else f"objections_{theme}"
+
+
+def _voice_for_key(cache_key: str) -> str:
+    """Voix d'une clé de cache objections (voir objections_cache_key, défaut: julie)"""
+    return cache_key.split("@", 1)[1] if "@" in cache_key else "julie"
+
+
+class HotReloader:
+    """
+    Watcher (thread daemon, polling) des scénarios et objections.
+
+    Le polling ne coûte que quelques stat() par intervalle et fonctionne
+    partout (volumes Docker/NFS où inotify ne remonte pas les événements).
+    """
+
+    def __init__(self, scenario_manager=None, interval: Optional[float] = None):
+        """
+        Args:
+            scenario_manager: ScenarioManager utilisé pour recompiler les scénarios
+            interval: Secondes entre deux scans (défaut: config.HOT_RELOAD_INTERVAL)
+        """
+        self.scenario_manager = scenario_manager
+        self.interval = interval if interval is not None else config.HOT_RELOAD_INTERVAL
+        self.cache = get_cache()
+
+        self.scenarios_dir = config.BASE_DIR / "scenarios"
+        self.objections_dir = config.BASE_DIR / "system" / "objections_db"
+
+        self._snapshot: FileSnapshot = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._previous_ttls: Optional[Tuple[int, int]] = None
+
+        self.stats = {
+            "scans": 0,
+            "scenarios_reloaded": 0,
+            "objections_reloaded": 0,
+            "errors": 0,
+            "last_reload_ms": 0.0,
+        }
+
+    # ========== LIFECYCLE ==========
+
+    def start(self) -> bool:
+        """Démarre le watcher (idempotent). TTL scénarios/objections → infini."""
+        if self.is_running():
+            return True
+
+        self._snapshot = self._scan()
+        self._stop_event.clear()
+
+        self._previous_ttls = (self.cache.config["scenario_ttl"], self.cache.config["objections_ttl"])
+        self.cache.set_scenario_ttl(0)
+        self.cache.set_objections_ttl(0)
+
+        self._thread = threading.Thread(target=self._watch_loop, name="HotReloader", daemon=True)
+        self._thread.start()
+
+        logger.info(
+            f"👀 Hot reload started: {len(self._snapshot)} files watched "
+            f"(every {self.interval:.1f}s)"
+        )
+        return True
+
+    def stop(self):
+        """Arrête le watcher et restaure les TTL du cache."""
+        if not self.is_running():
+            return
+
+        self._stop_event.set()
+        self._thread.join(timeout=self.interval + 5)
+        self._thread = None
+
+        if self._previous_ttls:
+            scenario_ttl, objections_ttl = self._previous_ttls
+            self.cache.set_scenario_ttl(scenario_ttl)
+            self.cache.set_objections_ttl(objections_ttl)
+            self._previous_ttls = None
+
+        logger.info("👀 Hot reload stopped")
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _watch_loop(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check_once()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"❌ Hot reload scan failed: {e}", exc_info=True)
+
+    # ========== SCAN ==========
+
+    def _scan(self) -> FileSnapshot:
+        """(mtime_ns, taille) de chaque fichier surveillé"""
+        snapshot = {}
+        patterns = (
+            (self.scenarios_dir, "*.json"),
+            (self.objections_dir, "objections_*.py"),
+        )
+        for directory, pattern in patterns:
+            for path in directory.glob(pattern):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue  # Supprimé entre glob et stat
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def check_once(self) -> Dict[str, List[str]]:
+        """
+        Un scan: détecte les fichiers modifiés/supprimés et recharge.
+
+        Returns:
+            {"scenarios": [...], "objections": [...]} éléments rechargés
+        """
+        self.stats["scans"] += 1
+        current = self._scan()
+        changed = [path for path, sig in current.items() if self._snapshot.get(path) != sig]
+        removed = [path for path in self._snapshot if path not in current]
+        self._snapshot = current
+
+        reloaded = {"scenarios": [], "objections": []}
+        if not changed and not removed:
+            return reloaded
+
+        start = time.time()
+
+        for path in removed:
+            if path.parent == self.scenarios_dir:
+                # Nouveaux appels: "scenario not found", comme sans cache
+                self.cache.invalidate_scenario(path.stem)
+                logger.info(f"🗑️  Scenario file removed: {path.name} (cache invalidated)")
+            else:
+                # Garder la version chargée: un module supprimé ne doit pas casser les appels
+                logger.warning(f"⚠️ Objections file removed: {path.name} (cached version kept)")
+
+        changed_modules = [path.stem for path in changed if path.parent == self.objections_dir]
+        if changed_modules:
+            reloaded["objections"] = self.reload_objections(changed_modules)
+
+        for path in changed:
+            if path.parent == self.scenarios_dir and self.reload_scenario(path.stem):
+                reloaded["scenarios"].append(path.stem)
+
+        self.stats["last_reload_ms"] = (time.time() - start) * 1000
+        if reloaded["scenarios"] or reloaded["objections"]:
+            logger.info(
+                f"🔄 Hot reload: {len(reloaded['scenarios'])} scenarios, "
+                f"{len(reloaded['objections'])} objection themes "
+                f"({self.stats['last_reload_ms']:.0f}ms)"
+            )
+        return reloaded
+
+    # ========== SCENARIOS ==========
+
+    def reload_scenario(self, scenario_name: str) -> bool:
+        """Recompile et swap un scénario s'il est en cache (sinon rien à faire)."""
+        if not self.scenario_manager or scenario_name not in self.cache.scenario_names():
+            return False
+
+        if self.scenario_manager.reload_scenario(scenario_name) is None:
+            self.stats["errors"] += 1
+            return False
+
+        self.stats["scenarios_reloaded"] += 1
+        return True
+
+    # ========== OBJECTIONS ==========
+
+    def reload_objections(self, module_names: List[str]) -> List[str]:
+        """
+        Recharge des modules objections_*.py puis les thématiques en cache
+        qui les utilisent (objections_general → toutes).
+
+        Args:
+            module_names: Modules modifiés (ex: ["objections_finance"])
+
+        Returns:
+            Clés de cache objections rechargées
+        """
+        for module_name in module_names:
+            if not self._reload_module(module_name):
+                self.stats["errors"] += 1
+                return []  # Module cassé: on garde toutes les versions actuelles
+
+        affected = [
+            key for key in self.cache.objection_themes()
+            if GENERAL_THEME_FILE in module_names or _theme_file_for_key(key) in module_names
+        ]
+
+        reloaded = []
+        theme_files = set()
+        for key in affected:
+            theme_file = _theme_file_for_key(key)
+            objections = self._build_objections(theme_file, _voice_for_key(key))
+            if not objections:
+                self.stats["errors"] += 1
+                continue
+            self.cache.set_objections(key, objections)
+            theme_files.add(theme_file)
+            reloaded.append(key)
+            self.stats["objections_reloaded"] += 1
+            logger.info(f"🔄 Objections '{key}' reloaded ({len(objections)} entries)")
+
+        if theme_files:
+            self._rebuild_manifests(theme_files)
+        return reloaded
+
+    @staticmethod
+    def _reload_module(module_name: str) -> bool:
+        """importlib.reload du module s'il est déjà importé (False si erreur)"""
+        module = sys.modules.get(f"{OBJECTIONS_PACKAGE}.{module_name}")
+        if module is None:
+            return True  # Pas encore importé: load_objections() lira la version disque
+
+        try:
+            importlib.reload(module)
+            return True
+        except Exception as e:
+            logger.error(f"❌ Hot reload of '{module_name}' failed, keeping current version: {e}")
+            return False
+
+    def _build_objections(self, theme_file: str, voice: str = "julie") -> Optional[Any]:
+        """
+        Nouvelle version d'une thématique: artefact recompilé (même format que
+        le chargement normal), sinon liste ObjectionEntry depuis les modules.
+        """
+        try:
+            from system.objections_db.compiler import compile_theme, load_compiled
+            compile_theme(theme_file, voice)
+            compiled = load_compiled(theme_file, voice)
+            if compiled:
+                for audio_path, duration in compiled.audio_durations.items():
+                    self.cache.cache_audio_duration(audio_path, duration)
+                return compiled
+        except Exception as e:
+            logger.warning(f"⚠️ Objections compiler unavailable for '{theme_file}': {e}")
+
+        try:
+            from system.objections_db import load_objections
+            return load_objections(theme_file, voice=voice)
+        except Exception as e:
+            logger.error(f"❌ Failed to reload objections '{theme_file}': {e}")
+            return None
+
+    def _rebuild_manifests(self, theme_files: set):
+        """Manifests audio des scénarios en cache dont le theme_file a changé"""
+        if not self.scenario_manager:
+            return
+
+        for name in self.cache.scenario_names():
+            scenario = self.cache.get_scenario(name)
+            if scenario and self.scenario_manager.get_theme_file(scenario) in theme_files:
+                self.scenario_manager.get_audio_manifest(scenario, rebuild=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "running": self.is_running(), "watched_files": len(self._snapshot)}
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Log Pipeline - MiniBotPanel v3
+
+Logging asynchrone pour le chemin critique des appels.
+
+Les threads d'appel (et la boucle asyncio de l'ASR) ne font plus d'I/O de
+log: un QueueHandler met le LogRecord dans une queue, un thread écrivain
+unique formate et écrit (fichiers, console, panels rich).
+
+- Formatage lazy: le message (%-args) n'est formaté que par le thread
+  écrivain, et jamais pour les records d'un appel qui ne sont pas écrits
+- Buffer circulaire par appel: les records DEBUG/INFO d'un appel restent
+  en mémoire (LOG_CALL_BUFFER_SIZE derniers) et ne sont écrits sur disque
+  en entier que si l'appel a loggé une erreur ou est échantillonné
+  (LOG_CALL_SAMPLE_RATE); WARNING+ sont toujours écrits immédiatement
+- Queue bornée (LOG_QUEUE_SIZE): si le disque ne suit pas, DEBUG/INFO
+  sont abandonnés (compteur "dropped") au lieu de bloquer un appel
+- CompactJsonFormatter: une ligne JSON valide et courte par record
+
+Usage:
+    from system.log_pipeline import get_log_pipeline
+
+    pipeline = get_log_pipeline()
+    pipeline.attach(logger)                               # handlers du logger → writer
+    pipeline.attach(logging.getLogger(), buffer_calls=False)  # console root
+
+    pipeline.begin_call(call_uuid)    # dans le thread d'appel
+    ...
+    pipeline.end_call(call_uuid)      # flush si erreur / échantillonné, sinon jeté
+"""
+
+import sys
+import json
+import queue
+import atexit
+import random
+import logging
+import threading
+import logging.handlers
+from collections import deque
+from typing import Dict, Any, Optional, Callable, Sequence
+
+from system.config import config
+
+logger = logging.getLogger(__name__)
+
+_RECORD = 0
+_TASK = 1
+
+
+class CompactJsonFormatter(logging.Formatter):
+    """Une ligne JSON compacte par record (formatée dans le thread écrivain)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "t": round(record.created, 3),
+            "lvl": record.levelname,
+            "mod": record.name,
+            "msg": record.getMessage(),
+            "fn": record.funcName,
+            "ln": record.lineno,
+        }
+        call_uuid = getattr(record, "call_uuid", None)
+        if call_uuid:
+            data["call"] = call_uuid
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class _CallBuffer:
+    """Records en attente d'un appel (buffer circulaire)."""
+    __slots__ = ("records", "had_error", "overflow")
+
+    def __init__(self, size: int):
+        self.records = deque(maxlen=size)
+        self.had_error = False
+        self.overflow = 0
+
+
+class PipelineQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler d'un logger: ses anciens handlers sont exécutés par le
+    thread écrivain. Aucun formatage dans le thread appelant.
+    """
+
+    def __init__(self, pipeline: "LogPipeline", targets: Sequence[logging.Handler], buffer_calls: bool):
+        super().__init__(pipeline.queue)
+        self.pipeline = pipeline
+        self.targets = tuple(targets)
+        self.buffer_calls = buffer_calls
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # Pas de verrou de handler: la queue est thread-safe (aucune contention
+        # entre threads d'appel)
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            call_uuid = getattr(record, "call_uuid", None) or self.pipeline.current_call()
+            if call_uuid:
+                record.call_uuid = call_uuid
+                if self.buffer_calls:
+                    if record.levelno < logging.WARNING:
+                        if self.pipeline.buffer_record(call_uuid, self.targets, record):
+                            return
+                    elif record.levelno >= logging.ERROR:
+                        self.pipeline.mark_error(call_uuid)
+            self.pipeline.put(self.targets, record)
+        except Exception:
+            self.handleError(record)
+
+
+class _WriterListener(logging.handlers.QueueListener):
+    """Thread écrivain: exécute les handlers cibles et les tâches (panels rich)."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue, respect_handler_level=True)
+
+    def handle(self, item):
+        try:
+            if item[0] == _TASK:
+                _, func, args = item
+                func(*args)
+                return
+            _, targets, record = item
+            for handler in targets:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        except Exception as e:
+            sys.stderr.write(f"log pipeline writer error: {e}\n")
+
+
+class LogPipeline:
+    """Queue + thread écrivain + buffers par appel."""
+
+    def __init__(
+        self,
+        queue_size: Optional[int] = None,
+        call_buffer_size: Optional[int] = None,
+        sample_rate: Optional[float] = None
+    ):
+        """
+        Args:
+            queue_size: Taille max de la queue (défaut: config.LOG_QUEUE_SIZE)
+            call_buffer_size: Records gardés par appel (défaut: config.LOG_CALL_BUFFER_SIZE)
+            sample_rate: Part des appels sans erreur écrits en entier (défaut: config.LOG_CALL_SAMPLE_RATE)
+        """
+        self.queue: queue.Queue = queue.Queue(queue_size or config.LOG_QUEUE_SIZE)
+        self.call_buffer_size = call_buffer_size or config.LOG_CALL_BUFFER_SIZE
+        self.sample_rate = config.LOG_CALL_SAMPLE_RATE if sample_rate is None else sample_rate
+
+        self._listener = _WriterListener(self.queue)
+        self._running = False
+        self._lock = threading.Lock()
+        self._buffers: Dict[str, _CallBuffer] = {}
+        self._local = threading.local()
+
+        self.stats = {
+            "enqueued": 0,
+            "dropped": 0,
+            "buffered": 0,
+            "calls_flushed": 0,
+            "calls_discarded": 0,
+            "records_discarded": 0,
+        }
+
+    # ========== LIFECYCLE ==========
+
+    def start(self):
+        """Démarre le thread écrivain (idempotent)."""
+        with self._lock:
+            if self._running:
+                return
+            self._listener.start()
+            self._running = True
+
+    def stop(self):
+        """Écrit les appels encore ouverts, vide la queue et arrête le thread écrivain."""
+        for call_uuid in list(self._buffers):
+            self.end_call(call_uuid, flush=True)
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self._listener.stop()  # Sentinelle en fin de queue: tout est écrit avant l'arrêt
+
+    def attach(self, target_logger: logging.Logger, buffer_calls: bool = True) -> bool:
+        """
+        Remplace les handlers du logger par un PipelineQueueHandler.
+
+        Args:
+            target_logger: Logger dont les handlers passent derrière la queue
+            buffer_calls: Garder DEBUG/INFO des appels dans leur buffer
+                          (False pour la console: affichage en direct)
+
+        Returns:
+            False si le logger est déjà branché ou n'a aucun handler
+        """
+        handlers = [h for h in target_logger.handlers if not isinstance(h, PipelineQueueHandler)]
+        if len(handlers) != len(target_logger.handlers) or not handlers:
+            return False
+
+        for handler in handlers:
+            target_logger.removeHandler(handler)
+        target_logger.addHandler(PipelineQueueHandler(self, handlers, buffer_calls))
+        self.start()
+        return True
+
+    # ========== QUEUE ==========
+
+    def put(self, targets: Sequence[logging.Handler], record: logging.LogRecord):
+        """Met un record en queue. DEBUG/INFO abandonnés si la queue est pleine."""
+        if not self._running:
+            # Arrêté (atexit): écriture directe plutôt que perdue dans la queue
+            self._listener.handle((_RECORD, targets, record))
+            return
+        try:
+            self.queue.put_nowait((_RECORD, targets, record))
+        except queue.Full:
+            if record.levelno < logging.WARNING:
+                self.stats["dropped"] += 1
+                return
+            self.queue.put((_RECORD, targets, record))  # WARNING+: on attend le writer
+        self.stats["enqueued"] += 1
+
+    def submit(self, func: Callable, *args) -> bool:
+        """Exécute func(*args) dans le thread écrivain (rendu console). False si non démarré/plein."""
+        if not self._running:
+            return False
+        try:
+            self.queue.put_nowait((_TASK, func, args))
+            return True
+        except queue.Full:
+            self.stats["dropped"] += 1
+            return True
+
+    # ========== APPELS ==========
+
+    def begin_call(self, call_uuid: str, bind: bool = True):
+        """Ouvre le buffer de l'appel et (bind=True) l'associe au thread courant."""
+        with self._lock:
+            self._buffers.setdefault(call_uuid, _CallBuffer(self.call_buffer_size))
+        if bind:
+            self._local.call_uuid = call_uuid
+
+    def current_call(self) -> Optional[str]:
+        """Appel associé au thread courant (begin_call)."""
+        return getattr(self._local, "call_uuid", None)
+
+    def buffer_record(self, call_uuid: str, targets, record: logging.LogRecord) -> bool:
+        """Ajoute au buffer de l'appel. False si l'appel n'a pas de buffer."""
+        buffer = self._buffers.get(call_uuid)
+        if buffer is None:
+            return False
+        if len(buffer.records) == buffer.records.maxlen:
+            buffer.overflow += 1
+        buffer.records.append((targets, record))
+        self.stats["buffered"] += 1
+        return True
+
+    def mark_error(self, call_uuid: str):
+        buffer = self._buffers.get(call_uuid)
+        if buffer is not None:
+            buffer.had_error = True
+
+    def end_call(self, call_uuid: str, flush: Optional[bool] = None) -> bool:
+        """
+        Ferme le buffer de l'appel.
+
+        Args:
+            flush: True/False pour forcer; None = écrit si erreur ou échantillonné
+
+        Returns:
+            True si les records ont été écrits
+        """
+        with self._lock:
+            buffer = self._buffers.pop(call_uuid, None)
+        if getattr(self._local, "call_uuid", None) == call_uuid:
+            self._local.call_uuid = None
+        if buffer is None:
+            return False
+
+        if flush is None:
+            flush = buffer.had_error or random.random() < self.sample_rate
+
+        if not flush:
+            self.stats["calls_discarded"] += 1
+            self.stats["records_discarded"] += len(buffer.records)
+            return False
+
+        self.stats["calls_flushed"] += 1
+        header = logging.LogRecord(
+            __name__, logging.INFO, __file__, 0,
+            "📼 Call log flush (%s): %d records, %d older records overwritten",
+            ("error" if buffer.had_error else "sampled", len(buffer.records), buffer.overflow),
+            None, func="end_call"
+        )
+        header.call_uuid = call_uuid
+
+        # En-tête dans chaque destination, puis les records dans l'ordre d'émission
+        for targets in dict.fromkeys(targets for targets, _ in buffer.records):
+            self.put(targets, header)
+        for targets, record in buffer.records:
+            self.put(targets, record)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "running": self._running,
+            "queue_size": self.queue.qsize(),
+            "open_calls": len(self._buffers),
+        }
+
+
+_pipeline: Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_log_pipeline() -> LogPipeline:
+    """Pipeline global (thread écrivain démarré au premier attach())."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = LogPipeline()
+                atexit.register(_pipeline.stop)
+    return _pipeline
+
+
+def active_pipeline() -> Optional[LogPipeline]:
+    """Pipeline global s'il tourne (sans le créer)."""
+    return _pipeline if _pipeline is not None and _pipeline._running else None
@@ -30,6 +30,8 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+from system.log_pipeline import active_pipeline
+
 logger = logging.getLogger(__name__)
 
 
@@ -92,6 +94,15 @@ class ColoredLogger:
                     "rich library not available, falling back to standard logging"
                 )
 
+    def _print(self, renderable):
+        """
+        Render to console; by the log pipeline writer thread when it runs
+        (rich rendering stays off the call threads)
+        """
+        pipeline = active_pipeline()
+        if pipeline is None or not pipeline.submit(self.console.print, renderable):
+            self.console.print(renderable)
+
     def _log_simple(
         self,
         message: str,
@@ -116,7 +127,7 @@ class ColoredLogger:
 
         if self.enabled and self.console:
             text = Text(full_message, style=color)
-            self.console.print(text)
+            self._print(text)
         else:
             log_method = getattr(logger, level.lower(), logger.info)
             log_method(full_message)
@@ -160,7 +171,7 @@ class ColoredLogger:
             padding=(0, 1)
         )
 
-        self.console.print(panel)
+        self._print(panel)
 
     # ========== PHASE 1: AMD ==========
 
@@ -441,7 +452,7 @@ class ColoredLogger:
                 Text(status, style=style)
             )
 
-        self.console.print(table)
+        self._print(table)
 
     # ========== SUCCESS / WARNING / ERROR ==========
 
@@ -0,0 +1,126 @@
+"""
+Schema Migrations - MiniBotPanel v3
+
+create_all() crée les tables manquantes mais ne modifie jamais une table
+existante: les colonnes et index ajoutés après coup sont appliqués ici.
+
+Chaque migration est une liste d'instructions SQL idempotentes (IF NOT
+EXISTS), identifiée par un nom unique et enregistrée dans la table
+schema_migrations une fois appliquée. Les migrations sont appliquées dans
+l'ordre de MIGRATIONS, chacune dans sa propre transaction.
+
+PostgreSQL uniquement (les autres dialectes sont ignorés: create_all suffit
+pour une base de test neuve).
+
+Utilisation:
+    from system.migrations import apply_migrations
+
+    apply_migrations()            # après Base.metadata.create_all()
+
+    # En ligne de commande
+    python -m system.migrations
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# (nom, instructions SQL) - ne jamais modifier une migration déjà livrée,
+# en ajouter une nouvelle à la fin
+MIGRATIONS: List[Tuple[str, List[str]]] = [
+    (
+        "0001_call_queue_lease",
+        [
+            "ALTER TABLE calls ADD COLUMN IF NOT EXISTS worker_id VARCHAR(100)",
+            "ALTER TABLE calls ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITHOUT TIME ZONE",
+            "CREATE INDEX IF NOT EXISTS ix_calls_lease_expires_at ON calls (lease_expires_at)",
+        ],
+    ),
+    (
+        "0002_calls_retryable_index",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_calls_retryable ON calls (campaign_id)"
+            " WHERE status IN ('NO_ANSWER', 'BUSY') AND retry_count < max_retries",
+        ],
+    ),
+    (
+        "0003_calls_access_indexes",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_calls_queue ON calls (campaign_id, queue_priority DESC, scheduled_at)"
+            " WHERE status IN ('PENDING', 'RETRY')",
+            "CREATE INDEX IF NOT EXISTS ix_calls_campaign_status ON calls (campaign_id, status)",
+            "CREATE INDEX IF NOT EXISTS ix_calls_campaign_created ON calls (campaign_id, created_at)",
+            "CREATE INDEX IF NOT EXISTS ix_calls_live ON calls (status, started_at)"
+            " WHERE status IN ('QUEUED', 'CALLING', 'RINGING', 'ANSWERED', 'IN_PROGRESS')",
+            "ANALYZE calls",
+        ],
+    ),
+    (
+        # Table créée par create_all(): remplie ici depuis l'historique (même calcul
+        # que system.stats_rollup.rebuild), ensuite tenue à jour par les écritures
+        "0004_campaign_stats_rollup_backfill",
+        [
+            "DELETE FROM campaign_stats_rollup",
+            "INSERT INTO campaign_stats_rollup"
+            " (campaign_id, bucket, status, result, sentiment, amd_result, calls, duration_sum, duration_count)"
+            " SELECT campaign_id, date_trunc('minute', COALESCE(ended_at, last_attempt_at, created_at)),"
+            " CAST(status AS VARCHAR), COALESCE(CAST(result AS VARCHAR), ''),"
+            " COALESCE(CAST(sentiment AS VARCHAR), ''), COALESCE(amd_result, ''),"
+            " count(*), COALESCE(sum(duration) FILTER (WHERE duration > 0), 0),"
+            " count(*) FILTER (WHERE duration > 0)"
+            " FROM calls"
+            " WHERE campaign_id IS NOT NULL"
+            " AND status IN ('COMPLETED', 'FAILED', 'NO_ANSWER', 'BUSY', 'CANCELLED')"
+            " GROUP BY 1, 2, 3, 4, 5, 6",
+        ],
+    ),
+]
+
+
+def apply_migrations(bind: Optional[Engine] = None) -> List[str]:
+    """
+    Applique les migrations pas encore enregistrées.
+
+    Args:
+        bind: Engine cible (défaut: engine de system.database)
+
+    Returns:
+        Noms des migrations appliquées
+    """
+    if bind is None:
+        from system.database import engine as bind
+
+    if bind.dialect.name != "postgresql":
+        logger.info(f"Migrations skipped ({bind.dialect.name}): create_all() schema only")
+        return []
+
+    with bind.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            " name VARCHAR(100) PRIMARY KEY,"
+            " applied_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'utc'))"
+        ))
+        done = set(conn.execute(text("SELECT name FROM schema_migrations")).scalars())
+
+    applied = []
+    for name, statements in MIGRATIONS:
+        if name in done:
+            continue
+        with bind.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.execute(text("INSERT INTO schema_migrations (name) VALUES (:name)"), {"name": name})
+        logger.info(f"✅ Migration applied: {name}")
+        applied.append(name)
+
+    return applied
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    names = apply_migrations()
+    print(f"{len(names)} migration(s) applied" + (f": {', '.join(names)}" if names else ""))
@@ -8,11 +8,13 @@ Modèles:
 - Campaign : Campagnes d'appels
 - Call : Appels individuels avec résultats
 - CallEvent : Événements durant l'appel (pour debugging)
+- CampaignStatsRollup : Compteurs des appels terminés par campagne et par minute
 
 Relations:
 - Campaign 1→N Call
 - Contact 1→N Call
 - Call 1→N CallEvent
+- Campaign 1→N CampaignStatsRollup
 
 Utilisation:
     from system.models import Contact, Campaign, Call
@@ -25,8 +27,8 @@ Utilisation:
 """
 
 from sqlalchemy import (
-    Column, Integer, String, Text, Boolean, Float, DateTime,
-    ForeignKey, JSON, Enum as SQLEnum
+    Column, Integer, BigInteger, String, Text, Boolean, Float, DateTime,
+    ForeignKey, JSON, Enum as SQLEnum, Index, text
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -241,6 +243,8 @@ class Call(Base):
     last_attempt_at = Column(DateTime, nullable=True)  # Dernière tentative
     scheduled_at = Column(DateTime, nullable=True, index=True)  # Planifié pour (file attente)
     queue_priority = Column(Integer, default=0)  # Priorité dans file (0=normal, 1+=urgent)
+    worker_id = Column(String(100), nullable=True)  # Worker BatchCaller qui a réservé l'appel
+    lease_expires_at = Column(DateTime, nullable=True, index=True)  # Fin du bail QUEUED (sinon remis en file)
 
     # Métadonnées (JSON flexible)
     call_metadata = Column(JSON, default={})
@@ -259,6 +263,28 @@ class Call(Base):
     campaign = relationship("Campaign", back_populates="calls")
     events = relationship("CallEvent", back_populates="call", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # File d'attente (CallQueue.claim): appels prêts d'une campagne, dans l'ordre de réservation
+        Index(
+            "ix_calls_queue", "campaign_id", queue_priority.desc(), "scheduled_at",
+            postgresql_where=text("status IN ('PENDING', 'RETRY')")
+        ),
+        # Compteurs par statut d'une campagne (stats, limites de concurrence)
+        Index("ix_calls_campaign_status", "campaign_id", "status"),
+        # Timeline et exports d'une campagne (ORDER BY created_at)
+        Index("ix_calls_campaign_created", "campaign_id", "created_at"),
+        # Appels en cours (monitoring): quelques lignes, même sur un historique de millions d'appels
+        Index(
+            "ix_calls_live", "status", "started_at",
+            postgresql_where=text("status IN ('QUEUED', 'CALLING', 'RINGING', 'ANSWERED', 'IN_PROGRESS')")
+        ),
+        # Index partiel: appels à replanifier (schedule_retries), sans l'historique terminé
+        Index(
+            "ix_calls_retryable", "campaign_id",
+            postgresql_where=text("status IN ('NO_ANSWER', 'BUSY') AND retry_count < max_retries")
+        ),
+    )
+
 # ============================================================================
 # MODÈLE: CallEvent
 # ============================================================================
@@ -297,3 +323,36 @@ class CallEvent(Base):
 
     # Relation
     call = relationship("Call", back_populates="events")
+
+# ============================================================================
+# MODÈLE: CampaignStatsRollup
+# ============================================================================
+class CampaignStatsRollup(Base):
+    """
+    Modèle CampaignStatsRollup - Compteurs des appels terminés
+
+    Une ligne par campagne × minute × (statut, résultat, sentiment, AMD):
+    nombre d'appels dans cet état final et somme des durées. Tenu à jour
+    dans la transaction qui fait entrer (ou sortir) un appel d'un état
+    final, voir system/stats_rollup.py. Les statistiques se lisent ici en
+    O(minutes) au lieu de parcourir tous les appels.
+
+    Colonnes principales:
+    - bucket : Minute de fin de l'appel (ended_at, sinon last_attempt_at/created_at)
+    - status / result / sentiment : Noms d'enum ("" si aucun)
+    - amd_result : human, machine, unknown ("" si aucun)
+    - calls : Nombre d'appels
+    - duration_sum / duration_count : Durées > 0 (moyenne = somme / nombre)
+    """
+    __tablename__ = "campaign_stats_rollup"
+
+    campaign_id = Column(Integer, ForeignKey("campaigns.id"), primary_key=True)
+    bucket = Column(DateTime, primary_key=True)
+    status = Column(String(20), primary_key=True)
+    result = Column(String(20), primary_key=True, default="")
+    sentiment = Column(String(20), primary_key=True, default="")
+    amd_result = Column(String(20), primary_key=True, default="")
+
+    calls = Column(Integer, nullable=False, default=0)
+    duration_sum = Column(BigInteger, nullable=False, default=0)
+    duration_count = Column(Integer, nullable=False, default=0)
@@ -31,13 +31,17 @@ Usage Phase 6+ (avec thématique):
 """
 
 import re
-from typing import Dict, Optional, List, Tuple, Union
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, List, NamedTuple, Sequence, Tuple, Union
 from difflib import SequenceMatcher
 import logging
 
 # RapidFuzz pour matching ultra-rapide (5-10x plus rapide que difflib)
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
     RAPIDFUZZ_AVAILABLE = True
 except ImportError:
     RAPIDFUZZ_AVAILABLE = False
@@ -54,9 +58,48 @@ except ImportError:
 # Phase 8: CacheManager pour cache objections par thématique
 from system.cache_manager import get_cache
 
+# Index phonétique (variantes d'orthographe ASR → lookup O(1))
+from system.phonetics import phonetic_key, is_indexable
+
 logger = logging.getLogger(__name__)
 
 
+def objections_cache_key(theme: str, voice: str = "julie") -> str:
+    """Clé CacheManager des objections: thème, suffixé de la voix si ce n'est pas julie."""
+    return theme if voice == "julie" else f"{theme}@{voice}"
+
+
+class BatchMatch(NamedTuple):
+    """
+    Résultat compact retourné par find_best_matches (un par input matché).
+
+    Mêmes valeurs que find_best_match (objection, entry_type, score, method,
+    matched_keyword) sans response/audio_path : les récupérer via
+    matcher.objections[match.objection] si nécessaire.
+    """
+    input: str
+    objection: str
+    entry_type: str
+    score: float
+    method: str
+    matched_keyword: str
+    alternatives: Tuple[Tuple[str, float], ...] = ()
+
+
+# Matcher partagé par les workers du ProcessPool (initialisé une fois par process)
+_POOL_MATCHER: Optional['ObjectionMatcher'] = None
+
+
+def _pool_init(matcher: 'ObjectionMatcher') -> None:
+    global _POOL_MATCHER
+    _POOL_MATCHER = matcher
+
+
+def _pool_score(args: Tuple[List[str], float, int]) -> List[Optional[BatchMatch]]:
+    texts, min_score, top_n = args
+    return _POOL_MATCHER._score_batch(texts, min_score, top_n, workers=1)
+
+
 class ObjectionMatcher:
     """
     Matcher intelligent pour détecter rapidement les objections
@@ -64,8 +107,20 @@ class ObjectionMatcher:
     Supporte deux formats:
     1. Dict classique: {objection_text: response_text}
     2. Liste ObjectionEntry (Phase 6+): avec keywords, response, audio_path
+
+    Étapes de résolution (dans l'ordre):
+    1. direct_lookup: keyword exact (dict)
+    2. phonetic_lookup: même clé phonétique qu'un keyword (dict, variantes ASR)
+    3. keyword_match: word boundary + fuzzy sur tous les keywords
     """
 
+    # Score attribué à un match phonétique (variante d'orthographe d'un keyword)
+    PHONETIC_MATCH_SCORE = 0.95
+
+    # Compteurs globaux par étape de résolution (tous matchers confondus)
+    _stage_stats: Counter = Counter()
+    _stage_lock = threading.Lock()
+
     def __init__(self, objections_input: Union[Dict[str, str], List['ObjectionEntry']]):
         """
         Initialize matcher avec dictionnaire d'objections OU liste ObjectionEntry.
@@ -78,6 +133,7 @@ class ObjectionMatcher:
         # Convertir ObjectionEntry en format interne unifié
         self.objections = {}  # {keywords_joined: response}
         self.audio_paths = {}  # {keywords_joined: audio_path}
+        self.audio_durations = {}  # {audio_path: duration_s} (artefacts compilés uniquement)
         self.entry_types = {}  # {keywords_joined: entry_type} (NEW: faq vs objection)
         self.objection_keys = []
 
@@ -120,10 +176,73 @@ class ObjectionMatcher:
                 if kw_lower not in self.keyword_lookup:
                     self.keyword_lookup[kw_lower] = objection_key
 
+        # LOOKUP PHONÉTIQUE O(1) - Hashmap phonetic_key -> (objection_key, keyword)
+        # Résout "ouai", "rapeler", "pas interessé" sans passe fuzzy
+        self.phonetic_lookup = self._build_phonetic_lookup(self.objection_keys)
+
+        # Index aplati pour find_best_matches (construit à la demande)
+        self._keyword_table = None
+        self._batch_index = None
+
         logger.info(f"ObjectionMatcher ready with {len(self.objections)} objections, {len(self.keyword_lookup)} keywords indexed")
 
+    @classmethod
+    def from_compiled(cls, compiled: 'CompiledObjections') -> 'ObjectionMatcher':
+        """
+        Crée un matcher depuis un artefact pré-compilé (system/objections_db/compiler.py).
+
+        Aucune re-dérivation: les structures (lookup, keywords_map, table des
+        keywords) sont reprises telles quelles et partagées en lecture seule.
+        """
+        matcher = cls.__new__(cls)
+        matcher.objections = compiled.objections
+        matcher.audio_paths = compiled.audio_paths
+        matcher.entry_types = compiled.entry_types
+        matcher.objection_keys = compiled.objection_keys
+        matcher.keywords_map = compiled.keywords_map
+        matcher.keyword_lookup = compiled.keyword_lookup
+        matcher.phonetic_lookup = compiled.phonetic_lookup
+        matcher.audio_durations = compiled.audio_durations
+        matcher._keyword_table = compiled.keyword_table
+        matcher._batch_index = None
+        return matcher
+
     @staticmethod
-    def load_objections_from_file(theme_file: str) -> Optional['ObjectionMatcher']:
+    def _load_cached_or_compiled(cache_key: str, theme_file: str, voice: str = "julie") -> Optional['ObjectionMatcher']:
+        """
+        Matcher depuis CacheManager, sinon depuis l'artefact compilé (mmap).
+
+        Returns:
+            ObjectionMatcher, ou None si rien en cache et artefact absent/périmé
+            (l'appelant charge alors les modules Python)
+        """
+        cache = get_cache()
+        cached_objections = cache.get_objections(cache_key)
+
+        if cached_objections:
+            logger.debug(f"Objections '{cache_key}' loaded from CacheManager (hit)")
+            if isinstance(cached_objections, list):
+                return ObjectionMatcher(cached_objections)
+            return ObjectionMatcher.from_compiled(cached_objections)
+
+        try:
+            from system.objections_db.compiler import load_compiled
+            compiled = load_compiled(theme_file, voice)
+        except Exception as e:
+            logger.warning(f"⚠️  Compiled objections unavailable for '{theme_file}': {e}")
+            return None
+
+        if not compiled:
+            return None
+
+        logger.info(f"📚 Loaded {len(compiled)} objections from compiled artifact '{theme_file}'")
+        cache.set_objections(cache_key, compiled)
+        for audio_path, duration in compiled.audio_durations.items():
+            cache.cache_audio_duration(audio_path, duration)
+        return ObjectionMatcher.from_compiled(compiled)
+
+    @staticmethod
+    def load_objections_from_file(theme_file: str, voice: str = "julie") -> Optional['ObjectionMatcher']:
         """
         Charge les objections depuis un fichier de la nouvelle structure modulaire.
 
@@ -135,6 +254,7 @@ class ObjectionMatcher:
         Args:
             theme_file: Nom du fichier (sans .py)
                        Ex: "objections_finance", "objections_crypto", "objections_energie"
+            voice: Voix des fichiers audio d'objection (défaut: julie)
 
         Returns:
             ObjectionMatcher initialisé ou None si erreur
@@ -150,16 +270,16 @@ class ObjectionMatcher:
             # Import du nouveau système
             from system.objections_db import load_objections
 
-            # Phase 8: Check CacheManager global
-            cache = get_cache()
-            cached_objections = cache.get_objections(theme_file)
+            # Phase 8: Check CacheManager global, puis artefact compilé
+            cache_key = objections_cache_key(theme_file, voice)
+            matcher = ObjectionMatcher._load_cached_or_compiled(cache_key, theme_file, voice)
+            if matcher:
+                return matcher
 
-            if cached_objections:
-                logger.debug(f"Objections '{theme_file}' loaded from CacheManager (hit)")
-                return ObjectionMatcher(cached_objections)
+            cache = get_cache()
 
             # Charger depuis nouveau système (inclut GENERAL automatiquement)
-            objections_list = load_objections(theme_file)
+            objections_list = load_objections(theme_file, voice=voice)
 
             if not objections_list:
                 logger.warning(f"⚠️  No objections found in '{theme_file}'")
@@ -168,7 +288,7 @@ class ObjectionMatcher:
             logger.info(f"📚 Loaded {len(objections_list)} objections from '{theme_file}'")
 
             # Phase 8: Mettre en cache via CacheManager
-            cache.set_objections(theme_file, objections_list)
+            cache.set_objections(cache_key, objections_list)
 
             # Créer et retourner le matcher
             return ObjectionMatcher(objections_list)
@@ -182,7 +302,7 @@ class ObjectionMatcher:
             return None
 
     @staticmethod
-    def load_objections_for_theme(theme: str = "general") -> Optional['ObjectionMatcher']:
+    def load_objections_for_theme(theme: str = "general", voice: str = "julie") -> Optional['ObjectionMatcher']:
         """
         Charge les objections pour une thématique spécifique (GENERAL + thématique).
 
@@ -196,6 +316,7 @@ class ObjectionMatcher:
         Args:
             theme: Thématique à charger ("general", "finance", "crypto", "energie", etc.)
                    Si "general", charge uniquement les objections générales.
+            voice: Voix des fichiers audio d'objection (défaut: julie)
 
         Returns:
             ObjectionMatcher initialisé ou None si erreur
@@ -212,19 +333,20 @@ class ObjectionMatcher:
             logger.error("❌ objections_database.py not available, cannot load objections")
             return None
 
-        # Phase 8: Check CacheManager global
-        cache = get_cache()
-        cached_objections = cache.get_objections(theme)
+        # Note: load_objections attend "objections_finance" pas juste "finance"
+        theme_file = theme if theme.startswith("objections_") else f"objections_{theme}"
 
-        if cached_objections:
-            logger.debug(f"Objections '{theme}' loaded from CacheManager (hit)")
-            return ObjectionMatcher(cached_objections)
+        # Phase 8: Check CacheManager global, puis artefact compilé
+        cache_key = objections_cache_key(theme, voice)
+        matcher = ObjectionMatcher._load_cached_or_compiled(cache_key, theme_file, voice)
+        if matcher:
+            return matcher
+
+        cache = get_cache()
 
         try:
             # Charger objections pour la thématique (inclut GENERAL automatiquement)
-            # Note: load_objections attend "objections_finance" pas juste "finance"
-            theme_file = theme if theme.startswith("objections_") else f"objections_{theme}"
-            objections_list = load_objections(theme_file)
+            objections_list = load_objections(theme_file, voice=voice)
 
             if not objections_list:
                 logger.warning(f"⚠️  No objections found for theme '{theme}'")
@@ -233,7 +355,7 @@ class ObjectionMatcher:
             logger.info(f"📚 Loaded {len(objections_list)} objections for theme '{theme}'")
 
             # Phase 8: Mettre en cache via CacheManager
-            cache.set_objections(theme, objections_list)
+            cache.set_objections(cache_key, objections_list)
 
             # Créer et retourner le matcher
             return ObjectionMatcher(objections_list)
@@ -242,6 +364,61 @@ class ObjectionMatcher:
             logger.error(f"❌ Error loading objections for theme '{theme}': {e}")
             return None
 
+    @staticmethod
+    def _build_phonetic_lookup(objection_keys: List[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        Construit l'index phonétique: clé phonétique -> (objection_key, keyword).
+
+        Premier keyword gagne (même priorité que keyword_lookup). Les clés trop
+        courtes ne sont pas indexées (collisions entre petits mots).
+        """
+        phonetic_lookup = {}
+        for objection_key in objection_keys:
+            for keyword in objection_key.split(" | "):
+                key = phonetic_key(keyword.lower().strip())
+                if is_indexable(key) and key not in phonetic_lookup:
+                    phonetic_lookup[key] = (objection_key, keyword)
+        return phonetic_lookup
+
+    def _match_phonetic(self, user_input: str, min_score: float) -> Optional[Tuple[str, str]]:
+        """Lookup phonétique O(1) de l'input complet -> (objection_key, keyword) ou None."""
+        if self.PHONETIC_MATCH_SCORE < min_score:
+            return None
+        key = phonetic_key(user_input)
+        if not is_indexable(key):
+            return None
+        return self.phonetic_lookup.get(key)
+
+    @classmethod
+    def _record_stage(cls, stage: str, count: int = 1) -> None:
+        with cls._stage_lock:
+            cls._stage_stats[stage] += count
+
+    @classmethod
+    def get_stage_stats(cls) -> Dict[str, Dict[str, float]]:
+        """
+        Part des utterances résolues par étape (tous matchers du process).
+
+        Returns:
+            {stage: {"count": n, "pct": %}} pour direct_lookup, phonetic_lookup,
+            keyword_match et no_match
+        """
+        with cls._stage_lock:
+            counts = dict(cls._stage_stats)
+        total = sum(counts.values())
+        return {
+            stage: {
+                "count": counts.get(stage, 0),
+                "pct": round(counts.get(stage, 0) / total * 100, 1) if total else 0.0
+            }
+            for stage in ("direct_lookup", "phonetic_lookup", "keyword_match", "no_match")
+        }
+
+    @classmethod
+    def reset_stage_stats(cls) -> None:
+        with cls._stage_lock:
+            cls._stage_stats.clear()
+
     def _extract_keywords(self, text: str) -> List[str]:
         """
         Extrait les mots-clés significatifs d'un texte.
@@ -336,7 +513,8 @@ class ObjectionMatcher:
             user_input: Ce que le prospect a dit
             min_score: Score minimum pour considérer un match (0.0-1.0)
             top_n: Nombre de candidats à évaluer en détail
-            silent: Si True, désactive les logs INFO (utile pour warmup)
+            silent: Si True, désactive la trace (utile pour warmup). La trace
+                    détaillée est en DEBUG: jamais construite si DEBUG est inactif
 
         Returns:
             Dict avec {objection, response, score, method, matched_keyword} ou None si pas de match
@@ -346,31 +524,35 @@ class ObjectionMatcher:
 
         user_input = user_input.strip().lower()
 
+        # Trace: f-strings évaluées seulement si DEBUG actif pour ce logger
+        silent = silent or not logger.isEnabledFor(logging.DEBUG)
+
         if not silent:
-            logger.info(f"")
-            logger.info(f"{'═'*60}")
-            logger.info(f"🔍 OBJECTION MATCHER - ANALYSE DÉTAILLÉE")
-            logger.info(f"{'═'*60}")
-            logger.info(f"📝 Input: '{user_input}'")
-            logger.info(f"⚙️  Config: min_score={min_score}, total_entries={len(self.objection_keys)}")
-            logger.info(f"{'─'*60}")
+            logger.debug(f"")
+            logger.debug(f"{'═'*60}")
+            logger.debug(f"🔍 OBJECTION MATCHER - ANALYSE DÉTAILLÉE")
+            logger.debug(f"{'═'*60}")
+            logger.debug(f"📝 Input: '{user_input}'")
+            logger.debug(f"⚙️  Config: min_score={min_score}, total_entries={len(self.objection_keys)}")
+            logger.debug(f"{'─'*60}")
 
         # ===== ÉTAPE 0: LOOKUP DIRECT O(1) - INSTANTANÉ =====
         # Comme intents_db - match exact immédiat
         if not silent:
-            logger.info(f"🔎 ÉTAPE 1: Lookup direct (O(1))...")
+            logger.debug(f"🔎 ÉTAPE 1: Lookup direct (O(1))...")
 
         if user_input in self.keyword_lookup:
+            self._record_stage("direct_lookup")
             objection_key = self.keyword_lookup[user_input]
             entry_type = self.entry_types.get(objection_key, "objection")
             if not silent:
-                logger.info(f"   ✅ TROUVÉ! Keyword exact dans lookup table")
-                logger.info(f"   → Entry: [{entry_type}] '{user_input}'")
-                logger.info(f"{'─'*60}")
-                logger.info(f"🏆 RÉSULTAT FINAL: [{entry_type}] '{user_input}'")
-                logger.info(f"   Score: 1.00 | Méthode: direct_lookup | Len: {len(user_input)}")
-                logger.info(f"{'═'*60}")
-                logger.info(f"")
+                logger.debug(f"   ✅ TROUVÉ! Keyword exact dans lookup table")
+                logger.debug(f"   → Entry: [{entry_type}] '{user_input}'")
+                logger.debug(f"{'─'*60}")
+                logger.debug(f"🏆 RÉSULTAT FINAL: [{entry_type}] '{user_input}'")
+                logger.debug(f"   Score: 1.00 | Méthode: direct_lookup | Len: {len(user_input)}")
+                logger.debug(f"{'═'*60}")
+                logger.debug(f"")
             return {
                 "objection": objection_key,
                 "response": self.objections[objection_key],
@@ -382,11 +564,39 @@ class ObjectionMatcher:
                 "confidence": "high"
             }
 
+        # ===== ÉTAPE 1b: LOOKUP PHONÉTIQUE O(1) - variantes ASR =====
+        if not silent:
+            logger.debug(f"   ❌ Pas de match direct")
+            logger.debug(f"🔎 ÉTAPE 1b: Lookup phonétique (O(1))...")
+
+        phonetic_match = self._match_phonetic(user_input, min_score)
+        if phonetic_match:
+            self._record_stage("phonetic_lookup")
+            objection_key, matched_keyword = phonetic_match
+            entry_type = self.entry_types.get(objection_key, "objection")
+            if not silent:
+                logger.debug(f"   ✅ TROUVÉ! Variante phonétique de '{matched_keyword}'")
+                logger.debug(f"{'─'*60}")
+                logger.debug(f"🏆 RÉSULTAT FINAL: [{entry_type}] '{matched_keyword}'")
+                logger.debug(f"   Score: {self.PHONETIC_MATCH_SCORE:.2f} | Méthode: phonetic_lookup")
+                logger.debug(f"{'═'*60}")
+                logger.debug(f"")
+            return {
+                "objection": objection_key,
+                "response": self.objections[objection_key],
+                "audio_path": self.audio_paths.get(objection_key),
+                "entry_type": entry_type,
+                "score": self.PHONETIC_MATCH_SCORE,
+                "method": "phonetic_lookup",
+                "matched_keyword": matched_keyword,
+                "confidence": "high"
+            }
+
         # Étape 2: Fuzzy matching sur tous les keywords
         if not silent:
-            logger.info(f"   ❌ Pas de match direct")
-            logger.info(f"{'─'*60}")
-            logger.info(f"🔎 ÉTAPE 2: Fuzzy matching (word boundary + RapidFuzz)...")
+            logger.debug(f"   ❌ Pas de variante phonétique")
+            logger.debug(f"{'─'*60}")
+            logger.debug(f"🔎 ÉTAPE 2: Fuzzy matching (word boundary + RapidFuzz)...")
 
         scores = []
         word_boundary_matches = []  # Pour logger les matches word boundary
@@ -430,13 +640,13 @@ class ObjectionMatcher:
 
         # Log word boundary matches found
         if not silent and word_boundary_matches:
-            logger.info(f"   📍 Word boundary matches trouvés ({len(word_boundary_matches)}):")
+            logger.debug(f"   📍 Word boundary matches trouvés ({len(word_boundary_matches)}):")
             for kw, et, ln in sorted(word_boundary_matches, key=lambda x: -x[2])[:5]:
-                logger.info(f"      • '{kw}' [{et}] (len={ln})")
+                logger.debug(f"      • '{kw}' [{et}] (len={ln})")
 
         if not silent:
-            logger.info(f"{'─'*60}")
-            logger.info(f"🔎 ÉTAPE 3: Tri par score DESC, puis longueur DESC...")
+            logger.debug(f"{'─'*60}")
+            logger.debug(f"🔎 ÉTAPE 3: Tri par score DESC, puis longueur DESC...")
 
         # Trier par: score DESC, puis longueur du keyword DESC
         # Le match le plus spécifique (plus long) gagne quand scores égaux
@@ -454,21 +664,21 @@ class ObjectionMatcher:
 
         # === LOGS DÉTAILLÉS TOP 5 ===
         if not silent:
-            logger.info(f"   📊 TOP {min(5, len(top_matches))} après tri:")
+            logger.debug(f"   📊 TOP {min(5, len(top_matches))} après tri:")
             for i, (obj, score, kw) in enumerate(top_matches[:5], 1):
                 entry_type = self.entry_types.get(obj, "objection")
                 status = "✓" if score >= min_score else "✗"
                 marker = "→" if i == 1 else " "
-                logger.info(f"   {marker} {i}. [{entry_type}] '{kw}' (len={len(kw)}) = {score:.2f} {status}")
+                logger.debug(f"   {marker} {i}. [{entry_type}] '{kw}' (len={len(kw)}) = {score:.2f} {status}")
 
             # Expliquer pourquoi le gagnant a gagné
             if len(top_matches) >= 2:
                 second_score = top_matches[1][1]
                 second_kw = top_matches[1][2]
                 if best_score == second_score:
-                    logger.info(f"   💡 Raison: scores égaux ({best_score:.2f}), '{matched_keyword}' (len={len(matched_keyword)}) > '{second_kw}' (len={len(second_kw)})")
+                    logger.debug(f"   💡 Raison: scores égaux ({best_score:.2f}), '{matched_keyword}' (len={len(matched_keyword)}) > '{second_kw}' (len={len(second_kw)})")
                 else:
-                    logger.info(f"   💡 Raison: score supérieur ({best_score:.2f} > {second_score:.2f})")
+                    logger.debug(f"   💡 Raison: score supérieur ({best_score:.2f} > {second_score:.2f})")
 
         if best_score >= min_score:
             # === FILTRE OVERLAP SÉMANTIQUE ===
@@ -485,26 +695,28 @@ class ObjectionMatcher:
                         overlap = len(input_chars & kw_chars) / max(len(input_chars), len(kw_chars))
                         if overlap < 0.25 and best_score < 0.8:
                             if not silent:
-                                logger.info(f"{'─'*60}")
-                                logger.info(f"❌ REJETÉ: overlap sémantique trop faible")
-                                logger.info(f"   Input: '{user_input}' | Keyword: '{matched_keyword}'")
-                                logger.info(f"   Overlap: {overlap:.2f} < 0.25 (seuil)")
-                                logger.info(f"{'═'*60}")
-                                logger.info(f"")
+                                logger.debug(f"{'─'*60}")
+                                logger.debug(f"❌ REJETÉ: overlap sémantique trop faible")
+                                logger.debug(f"   Input: '{user_input}' | Keyword: '{matched_keyword}'")
+                                logger.debug(f"   Overlap: {overlap:.2f} < 0.25 (seuil)")
+                                logger.debug(f"{'═'*60}")
+                                logger.debug(f"")
+                            self._record_stage("no_match")
                             return None
 
+            self._record_stage("keyword_match")
             entry_type = self.entry_types.get(best_objection, "objection")
             if not silent:
-                logger.info(f"{'─'*60}")
-                logger.info(f"🏆 RÉSULTAT FINAL: [{entry_type}] '{matched_keyword}'")
-                logger.info(f"   Score: {best_score:.2f} | Méthode: fuzzy | Len: {len(matched_keyword)}")
+                logger.debug(f"{'─'*60}")
+                logger.debug(f"🏆 RÉSULTAT FINAL: [{entry_type}] '{matched_keyword}'")
+                logger.debug(f"   Score: {best_score:.2f} | Méthode: fuzzy | Len: {len(matched_keyword)}")
                 audio = self.audio_paths.get(best_objection)
                 if audio:
-                    logger.info(f"   Audio: {audio.split('/')[-1] if '/' in str(audio) else audio}")
+                    logger.debug(f"   Audio: {audio.split('/')[-1] if '/' in str(audio) else audio}")
                 else:
-                    logger.info(f"   Audio: (aucun - intent de navigation)")
-                logger.info(f"{'═'*60}")
-                logger.info(f"")
+                    logger.debug(f"   Audio: (aucun - intent de navigation)")
+                logger.debug(f"{'═'*60}")
+                logger.debug(f"")
             return {
                 "objection": best_objection,
                 "response": self.objections[best_objection],
@@ -517,11 +729,233 @@ class ObjectionMatcher:
                 "top_alternatives": [(kw, score, self.entry_types.get(obj, "objection")) for obj, score, kw in top_matches[1:3]]
             }
         else:
+            self._record_stage("no_match")
             if not silent:
-                logger.info(f"Result: ❌ NO MATCH (best: {best_score:.2f} < {min_score})")
-                logger.info(f"═════════════════════════")
+                logger.debug(f"Result: ❌ NO MATCH (best: {best_score:.2f} < {min_score})")
+                logger.debug(f"═════════════════════════")
             return None
 
+    def _build_batch_index(self) -> Tuple:
+        """
+        Construit (une seule fois) l'index aplati des keywords pour le batch.
+
+        Réutilise la table des keywords pré-compilée si le matcher vient d'un artefact.
+
+        Returns:
+            (keywords_lower, keywords_orig, patterns, groups) où groups contient
+            (objection_key, start, end) pour chaque objection, dans l'ordre.
+        """
+        if self._batch_index is None:
+            if self._keyword_table is None:
+                keywords_lower = []
+                keywords_orig = []
+                groups = []
+                for objection_key in self.objection_keys:
+                    start = len(keywords_lower)
+                    for keyword in objection_key.split(" | "):
+                        keywords_lower.append(keyword.lower().strip())
+                        keywords_orig.append(keyword)
+                    groups.append((objection_key, start, len(keywords_lower)))
+                self._keyword_table = (keywords_lower, keywords_orig, groups)
+
+            keywords_lower, keywords_orig, groups = self._keyword_table
+            patterns = [re.compile(r'\b' + re.escape(kw) + r'\b') for kw in keywords_lower]
+            self._batch_index = (keywords_lower, keywords_orig, patterns, groups)
+        return self._batch_index
+
+    def reset_batch_index(self) -> None:
+        """
+        Repart à froid pour find_best_matches: index batch (regex) reconstruit
+        au prochain appel et cache phonetic_key vidé (partagé par le processus).
+
+        Pour mesurer le coût d'inputs nouveaux (benchmarks); inutile en
+        production (index immuable, cache phonetic_key borné à 8192 entrées).
+        """
+        self._batch_index = None
+        phonetic_key.cache_clear()
+
+    def __getstate__(self):
+        # L'index batch est reconstruit dans chaque worker (regex non partagées)
+        state = self.__dict__.copy()
+        state["_batch_index"] = None
+        return state
+
+    def _score_batch(
+        self,
+        texts: List[str],
+        min_score: float,
+        top_n: int,
+        workers: int = 1
+    ) -> List[Optional[BatchMatch]]:
+        """
+        Score une liste d'inputs déjà normalisés (strip + lower, non vides).
+
+        Reproduit exactement l'algorithme de find_best_match (lookup direct,
+        word boundary, inclusion, fuzzy, tri score/longueur, filtre overlap),
+        mais calcule tous les ratios fuzzy en un seul appel rapidfuzz.cdist.
+        """
+        keywords_lower, keywords_orig, patterns, groups = self._build_batch_index()
+        results: List[Optional[BatchMatch]] = [None] * len(texts)
+
+        # ÉTAPE 1: Lookup direct O(1), puis lookup phonétique O(1)
+        fuzzy_positions = []
+        for i, text in enumerate(texts):
+            objection_key = self.keyword_lookup.get(text)
+            if objection_key is not None:
+                results[i] = BatchMatch(
+                    input=text,
+                    objection=objection_key,
+                    entry_type=self.entry_types.get(objection_key, "objection"),
+                    score=1.0,
+                    method="direct_lookup",
+                    matched_keyword=text
+                )
+                continue
+
+            phonetic_match = self._match_phonetic(text, min_score)
+            if phonetic_match:
+                objection_key, matched_keyword = phonetic_match
+                results[i] = BatchMatch(
+                    input=text,
+                    objection=objection_key,
+                    entry_type=self.entry_types.get(objection_key, "objection"),
+                    score=self.PHONETIC_MATCH_SCORE,
+                    method="phonetic_lookup",
+                    matched_keyword=matched_keyword
+                )
+            else:
+                fuzzy_positions.append(i)
+
+        if not fuzzy_positions or not keywords_lower:
+            return results
+
+        # ÉTAPE 2: Ratios fuzzy de tous les inputs restants en une passe
+        fuzzy_texts = [texts[i] for i in fuzzy_positions]
+        if RAPIDFUZZ_AVAILABLE:
+            # float64 pour des scores identiques à fuzz.ratio (cdist renvoie float32 par défaut)
+            matrix = process.cdist(
+                fuzzy_texts, keywords_lower, scorer=fuzz.ratio, dtype="float64", workers=workers
+            )
+            rows = (row.tolist() for row in matrix)
+        else:
+            rows = (
+                [SequenceMatcher(None, text, kw).ratio() * 100.0 for kw in keywords_lower]
+                for text in fuzzy_texts
+            )
+
+        for i, text, row in zip(fuzzy_positions, fuzzy_texts, rows):
+            scores = []
+            for objection_key, start, end in groups:
+                best_keyword_score = 0.0
+                best_keyword = ""
+                for j in range(start, end):
+                    keyword_lower = keywords_lower[j]
+                    if keyword_lower == text:
+                        score = 1.0
+                    elif keyword_lower in text and patterns[j].search(text):
+                        score = 1.0
+                    elif text in keyword_lower:
+                        score = len(text) / len(keyword_lower)
+                    else:
+                        score = row[j] / 100.0
+
+                    if score > best_keyword_score:
+                        best_keyword_score = score
+                        best_keyword = keywords_orig[j]
+
+                scores.append((objection_key, best_keyword_score, best_keyword))
+
+            # ÉTAPE 3: Tri score DESC, puis longueur keyword DESC
+            scores.sort(key=lambda x: (-x[1], -len(x[2])))
+            best_objection, best_score, matched_keyword = scores[0]
+
+            if best_score < min_score:
+                continue
+
+            # Filtre overlap sémantique (identique à find_best_match)
+            if best_score < 1.0:
+                kw_lower = matched_keyword.lower()
+                if kw_lower not in text:
+                    input_chars = set(text.replace(" ", "").replace("'", ""))
+                    kw_chars = set(kw_lower.replace(" ", "").replace("'", ""))
+                    if input_chars and kw_chars:
+                        overlap = len(input_chars & kw_chars) / max(len(input_chars), len(kw_chars))
+                        if overlap < 0.25 and best_score < 0.8:
+                            continue
+
+            results[i] = BatchMatch(
+                input=text,
+                objection=best_objection,
+                entry_type=self.entry_types.get(best_objection, "objection"),
+                score=best_score,
+                method="keyword_match",
+                matched_keyword=matched_keyword,
+                alternatives=tuple((kw, score) for _, score, kw in scores[1:top_n])
+            )
+
+        return results
+
+    def find_best_matches(
+        self,
+        texts: Sequence[str],
+        min_score: float = 0.5,
+        top_n: int = 3,
+        workers: int = 1,
+        processes: int = 0
+    ) -> List[Optional[BatchMatch]]:
+        """
+        Version batch de find_best_match pour l'évaluation offline.
+
+        Mêmes décisions que find_best_match(silent=True) pour chaque input,
+        mais :
+        - normalisation + déduplication des inputs (chaque texte unique scoré une fois)
+        - index keywords/regex construit une seule fois par matcher
+        - ratios fuzzy calculés en un seul appel rapidfuzz.cdist
+        - aucun log par input
+
+        Args:
+            texts: Inputs prospect à scorer
+            min_score: Score minimum pour considérer un match (0.0-1.0)
+            top_n: Nombre de candidats retenus (top_n - 1 alternatives par résultat)
+            workers: Threads rapidfuzz pour cdist (-1 = tous les cœurs)
+            processes: Si > 1, répartit les inputs sur un ProcessPool de N process
+
+        Returns:
+            Liste alignée sur texts: BatchMatch ou None (pas de match / input vide)
+
+        Example:
+            >>> results = matcher.find_best_matches(["oui", "trop cher"], min_score=0.7)
+            >>> [r.entry_type if r else None for r in results]
+            ['affirm', 'objection']
+        """
+        start_time = time.perf_counter()
+
+        normalized = [text.strip().lower() if text else "" for text in texts]
+        unique_texts = list(dict.fromkeys(t for t in normalized if t))
+
+        if processes > 1 and len(unique_texts) >= processes * 2:
+            chunk_size = -(-len(unique_texts) // processes)
+            chunks = [unique_texts[i:i + chunk_size] for i in range(0, len(unique_texts), chunk_size)]
+            unique_results = []
+            with ProcessPoolExecutor(max_workers=processes, initializer=_pool_init, initargs=(self,)) as executor:
+                for chunk_results in executor.map(_pool_score, [(chunk, min_score, top_n) for chunk in chunks]):
+                    unique_results.extend(chunk_results)
+        else:
+            unique_results = self._score_batch(unique_texts, min_score, top_n, workers=workers)
+
+        by_text = dict(zip(unique_texts, unique_results))
+        results = [by_text.get(text) for text in normalized]
+
+        stages = Counter(r.method if r else "no_match" for text, r in zip(normalized, results) if text)
+        with self._stage_lock:
+            self._stage_stats.update(stages)
+
+        logger.debug(
+            f"Batch matching: {len(texts)} inputs ({len(unique_texts)} uniques) "
+            f"in {(time.perf_counter() - start_time) * 1000:.1f}ms"
+        )
+        return results
+
     def find_all_matches(
         self,
         user_input: str,
@@ -569,6 +1003,8 @@ class ObjectionMatcher:
         """Retourne statistiques du matcher."""
         return {
             "total_objections": len(self.objections),
+            "phonetic_keys": len(self.phonetic_lookup),
+            "stages": self.get_stage_stats(),
             "objections_list": list(self.objection_keys)[:10],  # 10 premières pour preview
             "avg_keywords_per_objection": sum(len(kw) for kw in self.keywords_map.values()) / len(self.keywords_map) if self.keywords_map else 0
         }
@@ -33,7 +33,7 @@ except ImportError:
         return Path(f"/usr/share/freeswitch/sounds/minibot/{voice}/{audio_type}/{filename}")
 
 # Définition de la classe ObjectionEntry
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 @dataclass
 class ObjectionEntry:
@@ -56,6 +56,10 @@ def _convert_audio_paths_to_freeswitch(objections: List[ObjectionEntry], voice:
     """
     Convertit les chemins audio des objections vers chemins FreeSWITCH.
 
+    Les entrées des modules (OBJECTIONS_DATABASE) ne sont pas modifiées: des
+    copies sont retournées, un chargement pour une autre voix repart des
+    chemins d'origine.
+
     Args:
         objections: Liste d'ObjectionEntry avec chemins relatifs
         voice: Nom de la voix (défaut: julie)
@@ -63,22 +67,25 @@ def _convert_audio_paths_to_freeswitch(objections: List[ObjectionEntry], voice:
     Returns:
         Liste d'ObjectionEntry avec chemins FreeSWITCH
     """
+    converted = []
     for objection in objections:
-        if objection.audio_path:
+        audio_path = objection.audio_path
+        if audio_path:
             # Si chemin relatif (audio/julie/objections/...)
-            if objection.audio_path.startswith("audio/"):
+            if audio_path.startswith("audio/"):
                 # Extraire juste le nom de fichier
-                filename = Path(objection.audio_path).name
+                filename = Path(audio_path).name
                 # Convertir vers chemin FreeSWITCH
-                objection.audio_path = str(get_freeswitch_audio_path(voice, "objections", filename))
+                audio_path = str(get_freeswitch_audio_path(voice, "objections", filename))
             # Si déjà un chemin absolu FreeSWITCH, ne rien faire
-            elif objection.audio_path.startswith("/usr/share/freeswitch"):
+            elif audio_path.startswith("/usr/share/freeswitch"):
                 pass
             # Sinon, assumer que c'est juste un nom de fichier
             else:
-                objection.audio_path = str(get_freeswitch_audio_path(voice, "objections", objection.audio_path))
+                audio_path = str(get_freeswitch_audio_path(voice, "objections", audio_path))
+        converted.append(replace(objection, audio_path=audio_path))
 
-    return objections
+    return converted
 
 
 def load_objections(theme_file: str, voice: str = "julie", use_freeswitch_paths: bool = True) -> List[ObjectionEntry]:
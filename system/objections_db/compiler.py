@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Objections Compiler - MiniBotPanel v3
+
+Pré-compile chaque thématique (GENERAL incluse) en artefact binaire versionné,
+chargé via mmap au démarrage du robot et des outils.
+
+Contenu d'un artefact:
+- Table des entrées (keywords, response, audio_path FreeSWITCH, entry_type, durée audio)
+- Keywords normalisés (lower/strip) + table aplatie keyword → objection
+- Structures du matcher pré-construites (keyword_lookup, phonetic_lookup, keywords_map)
+
+Format fichier:
+    MAGIC (8 octets) | FORMAT_VERSION (uint32) | len(meta) (uint32) | meta | payload
+    meta et payload sont sérialisés avec marshal (types natifs uniquement).
+
+L'artefact est considéré périmé (→ fallback modules Python) si:
+- FORMAT_VERSION, PHONETIC_VERSION ou version Python différente (marshal n'est pas portable)
+- Un fichier source objections_*.py a changé (mtime/taille)
+- Un fichier audio sondé pour les durées a changé, apparu ou disparu
+- La voix ou le dossier sons FreeSWITCH a changé
+
+Usage:
+    # Build (après modification des objections ou setup_audio.py)
+    python3 -m system.objections_db.compiler
+    python3 -m system.objections_db.compiler --theme objections_finance --voice julie
+
+    # Vérifier les artefacts sans reconstruire
+    python3 -m system.objections_db.compiler --check
+
+    # Chargement (fait automatiquement par ObjectionMatcher)
+    from system.objections_db.compiler import load_compiled
+    compiled = load_compiled("objections_finance", voice="julie")
+"""
+
+import argparse
+import logging
+import marshal
+import mmap
+import os
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from system.objections_db import (
+    ObjectionEntry,
+    get_freeswitch_audio_path,
+    list_available_themes,
+    load_objections,
+)
+from system.phonetics import PHONETIC_VERSION
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MBOBJDB\x00"
+FORMAT_VERSION = 2
+_HEADER = struct.Struct("<8sII")
+
+OBJECTIONS_DIR = Path(__file__).parent
+BASE_DIR = OBJECTIONS_DIR.parent.parent
+COMPILED_DIR = Path(os.getenv("OBJECTIONS_COMPILED_DIR", str(BASE_DIR / "cache" / "objections_db")))
+
+
+@dataclass
+class CompiledObjections:
+    """
+    Thématique compilée (GENERAL + thème), prête pour ObjectionMatcher.from_compiled.
+
+    Les structures sont partagées (lecture seule) entre tous les matchers créés
+    depuis le même artefact.
+    """
+    theme_file: str
+    entries: List[Tuple]  # (keywords, response, audio_path, entry_type, duration)
+    objection_keys: List[str]
+    objections: Dict[str, str]
+    audio_paths: Dict[str, Optional[str]]
+    entry_types: Dict[str, str]
+    audio_durations: Dict[str, float]  # audio_path -> durée (fichiers trouvés uniquement)
+    keyword_lookup: Dict[str, str]
+    phonetic_lookup: Dict[str, Tuple[str, str]]
+    keywords_map: Dict[str, List[str]]
+    keyword_table: Tuple[List[str], List[str], List[Tuple[str, int, int]]]
+    meta: Dict = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def to_entries(self) -> List[ObjectionEntry]:
+        """Reconstruit la liste ObjectionEntry (compatibilité ancien format)."""
+        return [
+            ObjectionEntry(
+                keywords=list(keywords),
+                response=response,
+                audio_path=audio_path,
+                entry_type=entry_type
+            )
+            for keywords, response, audio_path, entry_type, _ in self.entries
+        ]
+
+
+def artifact_path(theme_file: str, voice: str = "julie") -> Path:
+    """Chemin de l'artefact compilé pour (thème, voix)."""
+    return COMPILED_DIR / f"{theme_file}.{voice}.objdb"
+
+
+def _source_files(theme_file: str) -> List[Path]:
+    files = [OBJECTIONS_DIR / "__init__.py"]
+    if theme_file != "objections_general":
+        files.append(OBJECTIONS_DIR / "objections_general.py")
+    files.append(OBJECTIONS_DIR / f"{theme_file}.py")
+    return files
+
+
+def _file_stats(paths) -> Tuple[Tuple[str, int, int], ...]:
+    """(chemin, mtime_ns, taille) de chaque fichier; (chemin, 0, -1) si absent."""
+    stats = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            stats.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            stats.append((str(path), 0, -1))
+    return tuple(stats)
+
+
+def _audio_candidates(audio_path: str, voice: str) -> List[Path]:
+    """Chemin FreeSWITCH puis source locale audio/{voice}/objections/."""
+    return [Path(audio_path), BASE_DIR / "audio" / voice / "objections" / Path(audio_path).name]
+
+
+def _audio_files(entries: List[ObjectionEntry], voice: str) -> List[str]:
+    """Fichiers audio sondés par _probe_duration (ordre stable, sans doublon)."""
+    files = {}
+    for entry in entries:
+        if entry.audio_path:
+            for candidate in _audio_candidates(entry.audio_path, voice):
+                files[str(candidate)] = None
+    return list(files)
+
+
+def _fingerprint(theme_file: str, voice: str, audio_files=()) -> Dict:
+    """
+    Empreinte des sources et des fichiers audio: toute différence rend
+    l'artefact périmé (durées audio incluses dans l'artefact).
+    """
+    sources = tuple((Path(path).name, mtime, size) for path, mtime, size in _file_stats(_source_files(theme_file)))
+    return {
+        "format": FORMAT_VERSION,
+        "phonetic": PHONETIC_VERSION,
+        "python": f"{sys.version_info[0]}.{sys.version_info[1]}",
+        "theme_file": theme_file,
+        "voice": voice,
+        "sounds_dir": str(Path(get_freeswitch_audio_path(voice, "objections", "x")).parent),
+        "sources": sources,
+        "audio": _file_stats(audio_files),
+    }
+
+
+def _probe_duration(audio_path: Optional[str], voice: str) -> Optional[float]:
+    """
+    Durée d'un fichier audio d'objection (soundfile puis wave).
+
+    Essaie le chemin FreeSWITCH puis la source locale audio/{voice}/objections/.
+    """
+    if not audio_path:
+        return None
+
+    for candidate in _audio_candidates(audio_path, voice):
+        if not candidate.exists():
+            continue
+        try:
+            import soundfile as sf
+            return float(sf.info(str(candidate)).duration)
+        except Exception:
+            pass
+        try:
+            import wave
+            with wave.open(str(candidate), 'rb') as wav:
+                return wav.getnframes() / float(wav.getframerate())
+        except Exception as e:
+            logger.debug(f"Cannot read duration for {candidate}: {e}")
+    return None
+
+
+def _build_compiled(theme_file: str, voice: str, entries: List[ObjectionEntry]) -> CompiledObjections:
+    """Construit toutes les structures du matcher à partir des ObjectionEntry."""
+    table = []
+    objection_keys = []
+    objections = {}
+    audio_paths = {}
+    entry_types = {}
+    audio_durations = {}
+    keyword_lookup = {}
+    keywords_lower = []
+    keywords_orig = []
+    groups = []
+
+    # Import local: objection_matcher importe ce module à la demande
+    from system.objection_matcher import ObjectionMatcher
+
+    for entry in entries:
+        key = " | ".join(entry.keywords)
+        duration = _probe_duration(entry.audio_path, voice)
+        table.append((tuple(entry.keywords), entry.response, entry.audio_path, entry.entry_type, duration))
+
+        # Mêmes règles que ObjectionMatcher.__init__ (dernière entrée gagne sur clé dupliquée)
+        objection_keys.append(key)
+        objections[key] = entry.response
+        audio_paths[key] = entry.audio_path
+        entry_types[key] = entry.entry_type
+        if entry.audio_path and duration is not None:
+            audio_durations[entry.audio_path] = duration
+
+    for key in objection_keys:
+        start = len(keywords_lower)
+        for keyword in key.split(" | "):
+            keyword_lower = keyword.lower().strip()
+            keywords_lower.append(keyword_lower)
+            keywords_orig.append(keyword)
+            # Premier keyword gagne (priorité)
+            if keyword_lower not in keyword_lookup:
+                keyword_lookup[keyword_lower] = key
+        groups.append((key, start, len(keywords_lower)))
+
+    extractor = ObjectionMatcher.__new__(ObjectionMatcher)
+    keywords_map = {key: extractor._extract_keywords(key) for key in objection_keys}
+    phonetic_lookup = ObjectionMatcher._build_phonetic_lookup(objection_keys)
+
+    return CompiledObjections(
+        theme_file=theme_file,
+        entries=table,
+        objection_keys=objection_keys,
+        objections=objections,
+        audio_paths=audio_paths,
+        entry_types=entry_types,
+        audio_durations=audio_durations,
+        keyword_lookup=keyword_lookup,
+        phonetic_lookup=phonetic_lookup,
+        keywords_map=keywords_map,
+        keyword_table=(keywords_lower, keywords_orig, groups),
+    )
+
+
+def compile_theme(theme_file: str, voice: str = "julie") -> Path:
+    """
+    Compile une thématique (GENERAL + thème) en artefact binaire.
+
+    L'écriture est atomique (fichier temporaire + os.replace): un robot qui
+    charge l'artefact pendant le build voit l'ancienne ou la nouvelle version.
+
+    Args:
+        theme_file: Nom du fichier thème (ex: "objections_finance")
+        voice: Voix pour la résolution des chemins audio FreeSWITCH
+
+    Returns:
+        Chemin de l'artefact écrit
+    """
+    start = time.perf_counter()
+    # Empreintes prises avant lecture: une modification pendant le build rend l'artefact périmé
+    meta = _fingerprint(theme_file, voice)
+    entries = load_objections(theme_file, voice=voice, use_freeswitch_paths=True)
+    meta["audio"] = _file_stats(_audio_files(entries, voice))
+    compiled = _build_compiled(theme_file, voice, entries)
+
+    payload = marshal.dumps({
+        "entries": compiled.entries,
+        "objection_keys": compiled.objection_keys,
+        "objections": compiled.objections,
+        "audio_paths": compiled.audio_paths,
+        "entry_types": compiled.entry_types,
+        "audio_durations": compiled.audio_durations,
+        "keyword_lookup": compiled.keyword_lookup,
+        "phonetic_lookup": compiled.phonetic_lookup,
+        "keywords_map": compiled.keywords_map,
+        "keyword_table": compiled.keyword_table,
+    })
+    meta_bytes = marshal.dumps(meta)
+
+    path = artifact_path(theme_file, voice)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(meta_bytes)))
+        f.write(meta_bytes)
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+    missing = sum(1 for e in compiled.entries if e[2] and e[4] is None)
+    logger.info(
+        f"✅ Compiled '{theme_file}' ({voice}): {len(compiled.entries)} entries, "
+        f"{len(compiled.keyword_lookup)} keywords, {missing} audio missing, "
+        f"{path.stat().st_size / 1024:.1f}KB in {(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+    return path
+
+
+def compile_all_themes(voice: str = "julie") -> List[Path]:
+    """Compile toutes les thématiques disponibles."""
+    return [compile_theme(theme_file, voice) for theme_file in list_available_themes()]
+
+
+def _read_meta(mm: mmap.mmap) -> Tuple[Optional[Dict], int]:
+    if len(mm) < _HEADER.size:
+        return None, 0
+    magic, version, meta_len = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None, 0
+    with memoryview(mm)[_HEADER.size:_HEADER.size + meta_len] as view:
+        meta = marshal.loads(view)
+    return meta, _HEADER.size + meta_len
+
+
+def load_compiled(theme_file: str, voice: str = "julie") -> Optional[CompiledObjections]:
+    """
+    Charge un artefact compilé via mmap.
+
+    Returns:
+        CompiledObjections, ou None si absent/périmé/corrompu (l'appelant
+        retombe alors sur load_objections et les modules Python)
+    """
+    path = artifact_path(theme_file, voice)
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            meta, offset = _read_meta(mm)
+            if meta is None:
+                logger.info(f"Compiled objections '{path.name}' has incompatible format, ignoring")
+                return None
+            audio_files = [path for path, _, _ in meta.get("audio", ())]
+            if meta != _fingerprint(theme_file, voice, audio_files):
+                logger.info(
+                    f"Compiled objections '{path.name}' is stale, falling back to Python modules "
+                    f"(rebuild: python3 -m system.objections_db.compiler)"
+                )
+                return None
+            with memoryview(mm)[offset:] as view:
+                data = marshal.loads(view)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, EOFError, TypeError) as e:
+        logger.warning(f"Cannot load compiled objections '{path}': {e}")
+        return None
+
+    return CompiledObjections(theme_file=theme_file, meta=meta, **data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile les objections en artefacts binaires (mmap)")
+    parser.add_argument("--theme", help="Thème à compiler (défaut: tous), ex: objections_finance")
+    parser.add_argument("--voice", default="julie", help="Voix pour les chemins audio (défaut: julie)")
+    parser.add_argument("--check", action="store_true", help="Vérifie les artefacts sans reconstruire")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    themes = [args.theme] if args.theme else list_available_themes()
+
+    if args.check:
+        stale = 0
+        for theme_file in themes:
+            start = time.perf_counter()
+            compiled = load_compiled(theme_file, args.voice)
+            elapsed = (time.perf_counter() - start) * 1000
+            if compiled:
+                print(f"✅ {theme_file}: {len(compiled)} entries (load {elapsed:.2f}ms)")
+            else:
+                stale += 1
+                print(f"❌ {theme_file}: missing or stale")
+        sys.exit(1 if stale else 0)
+
+    for theme_file in themes:
+        compile_theme(theme_file, args.voice)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Phonetics FR - MiniBotPanel v3
+
+Normalisation phonétique légère pour les transcriptions ASR françaises.
+
+Les variantes d'orthographe produites par l'ASR ("ouais"/"ouai",
+"rappeler"/"rapeler", "intéressé"/"interessé") donnent la même clé,
+ce qui permet de les résoudre par simple lookup dans un dict au lieu
+d'un scan fuzzy sur tous les keywords.
+
+Deux niveaux:
+- fold_accents(): minuscules + suppression accents (unidecode, comme AMDService),
+  apostrophes supprimées ("d'accord" = "daccord"), ponctuation → espaces
+- phonetic_key(): fold_accents() puis règles type Phonex simplifiées, mot par mot
+
+Les règles sont volontairement conservatrices (pas de fusion m/n, b/p, etc.)
+pour éviter les collisions entre mots courants.
+
+Usage:
+    from system.phonetics import phonetic_key
+
+    phonetic_key("Rappeler")        # → "rapele"
+    phonetic_key("rapeler")         # → "rapele"
+    phonetic_key("pas intéressé")   # → "pa interese"
+"""
+
+import re
+from functools import lru_cache
+from typing import List
+
+from unidecode import unidecode
+
+# Incrémenter à chaque modification des règles (invalide les artefacts compilés)
+PHONETIC_VERSION = 1
+
+# Longueur minimale d'une clé (hors espaces) pour être indexée/cherchée
+MIN_KEY_LENGTH = 3
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# Règles appliquées dans l'ordre sur chaque mot (déjà sans accents)
+_WORD_RULES = [
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"ch"), "x"),
+    (re.compile(r"qu"), "k"),
+    (re.compile(r"c(?=[eiy])"), "s"),
+    (re.compile(r"ck|c"), "k"),
+    (re.compile(r"eau|au"), "o"),
+    (re.compile(r"ai|ei|ay|ey"), "e"),
+    (re.compile(r"(er|ez|et)$"), "e"),
+    (re.compile(r"h"), ""),
+    (re.compile(r"y"), "i"),
+    (re.compile(r"(.)\1+"), r"\1"),
+    (re.compile(r"(?<=..)[stdx]$"), ""),
+]
+
+
+def fold_accents(text: str) -> str:
+    """
+    Minuscules, sans accents ni apostrophes, ponctuation → espaces.
+
+    Example:
+        >>> fold_accents("Pas intéressé, j'ai dit !")
+        'pas interesse jai dit'
+    """
+    return _NON_ALNUM.sub(" ", unidecode(text.lower()).replace("'", "")).strip()
+
+
+def _word_key(word: str) -> str:
+    if word.isdigit():
+        return word
+    for pattern, replacement in _WORD_RULES:
+        word = pattern.sub(replacement, word)
+    return word
+
+
+@lru_cache(maxsize=8192)
+def phonetic_key(text: str) -> str:
+    """
+    Clé phonétique d'un texte (mots séparés par un espace).
+
+    Deux textes avec la même clé sont considérés comme la même
+    prononciation (variantes d'orthographe ASR).
+    """
+    return " ".join(_word_key(word) for word in fold_accents(text).split())
+
+
+def phonetic_keys(texts: List[str]) -> List[str]:
+    """Version liste de phonetic_key (préprocessing batch)."""
+    return [phonetic_key(text) for text in texts]
+
+
+def is_indexable(key: str) -> bool:
+    """True si la clé est assez longue pour un lookup fiable (évite collisions)."""
+    return len(key.replace(" ", "")) >= MIN_KEY_LENGTH
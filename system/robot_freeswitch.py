@@ -51,10 +51,15 @@ from system.services.streaming_asr import StreamingASR
 # Scenarios & Objections & Intents
 from system.scenarios import ScenarioManager
 from system.objection_matcher import ObjectionMatcher
+from system.hot_reload import HotReloader
+from system.audio_index import get_audio_index
+from system.startup import StartupOrchestrator, StartupError
+from system.call_session import CallRegistry, CallSession, BargeInState, STATE_ANSWERED
 # intents_db supprimé - tout passe par ObjectionMatcher maintenant
 
 # Colored Logger (Futuristic Design 🚀)
 from system.logger_colored import get_colored_logger
+from system.log_pipeline import get_log_pipeline, CompactJsonFormatter
 
 # Database
 from system.database import SessionLocal
@@ -65,7 +70,7 @@ from system.config import config
 
 # Logger avec fichier pour debug détaillé
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(getattr(logging, config.ROBOT_LOG_LEVEL.upper(), logging.DEBUG))
 
 # FileHandler pour logs détaillés dans fichier
 _logs_dir = config.BASE_DIR / "logs" / "misc"
@@ -79,12 +84,20 @@ _file_handler = logging.handlers.RotatingFileHandler(
     encoding='utf-8'
 )
 _file_handler.setLevel(logging.DEBUG)
-_file_handler.setFormatter(logging.Formatter(
-    '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "module": "%(name)s", '
-    '"message": "%(message)s", "function": "%(funcName)s", "line": %(lineno)d}'
-))
+_file_handler.setFormatter(CompactJsonFormatter())
 logger.addHandler(_file_handler)
 
+# Écriture par le thread du pipeline (buffer par appel), pas par les threads d'appel
+if config.LOG_ASYNC_ENABLED:
+    get_log_pipeline().attach(logger)
+
+# Séparateurs des traces DEBUG (construits une fois)
+_RULE = "═" * 60
+_THIN_RULE = "─" * 60
+
+# Étapes de démarrage nécessaires après la phase AMD (attendues par chaque appel)
+CALL_STAGES = ("faster_whisper", "scenarios", "objections")
+
 
 class RobotFreeSWITCH:
     """
@@ -109,6 +122,7 @@ class RobotFreeSWITCH:
         logger.info("=" * 80)
         logger.info("ROBOT FREESWITCH - INITIALIZATION")
         logger.info("=" * 80)
+        init_start = time.perf_counter()
 
         if not ESL_AVAILABLE:
             raise RuntimeError("ESL module not available - install python-ESL")
@@ -130,364 +144,333 @@ class RobotFreeSWITCH:
         self.event_thread = None
 
         # === CALL MANAGEMENT ===
-        self.active_calls = {}  # {call_uuid: call_info}
-        self.call_threads = {}  # {call_uuid: thread}
-        self.call_sessions = {}  # {call_uuid: session_data}
-
-        # === AUDIO TRACKING ===
-        self.barge_in_active = {}  # {call_uuid: bool}
+        # Une CallSession par appel (état, timestamps, barge-in, thread),
+        # registre unique protégé par un verrou
+        self.calls = CallRegistry()
 
         # === COLORED LOGGER (Futuristic Design 🚀) ===
         self.clog = get_colored_logger()
 
+        # === ASYNC LOGGING ===
+        # Console (handlers root) aussi derrière le thread écrivain; panels rich
+        # rendus par ce thread (voir ColoredLogger)
+        self.log_pipeline = get_log_pipeline() if config.LOG_ASYNC_ENABLED else None
+        if self.log_pipeline:
+            self.log_pipeline.attach(logging.getLogger(), buffer_calls=False)
+
         # ===================================================================
         # PRELOADING AI SERVICES (CRITICAL FOR LATENCY)
         # ===================================================================
-        logger.info("Loading AI services (PRELOAD optimization)...")
+        # Chargements indépendants en parallèle (threads), warmups dès que
+        # leur service est prêt. __init__ rend la main quand les services de
+        # la phase AMD sont prêts; le reste finit en arrière-plan et chaque
+        # appel attend CALL_STAGES avant la conversation.
+        logger.info("Loading AI services (PRELOAD optimization, parallel startup)...")
+
+        self.default_theme = default_theme
+        self.stt_service = None
+        self.amd_service = None
+        self.vad = None
+        self.streaming_asr = None
+        self.scenario_manager = None
+        self.objection_matcher_default = None
+        self.hot_reloader = None
+
+        self.startup = StartupOrchestrator("robot", parallel=config.STARTUP_PARALLEL)
+        self.startup.add("faster_whisper", self._load_stt)
+        self.startup.add("amd", self._load_amd)
+        self.startup.add("vad", self._load_vad)
+        self.startup.add("streaming_asr", self._load_streaming_asr, critical=False)
+        self.startup.add("scenarios", self._load_scenarios)
+        self.startup.add("objections", self._load_objections, critical=False)
+        self.startup.add("audio_index", self._preload_audio_index, critical=False)
+        self.startup.add("warmup_whisper", self._warmup_stt, deps=("faster_whisper",), critical=False)
+        self.startup.add("warmup_vad", self._warmup_vad, deps=("vad",), critical=False)
+        self.startup.add("warmup_objections", self._warmup_objections, deps=("objections",), critical=False)
+        self.startup.add("warmup_vosk", self._warmup_vosk, deps=("streaming_asr",), critical=False)
+        self.startup.start()
+
+        # Phase 1 (AMD): Vosk streaming + AMDService, ou Faster-Whisper en fallback
+        first_phase = ["amd", "vad", "scenarios", "streaming_asr"]
+        self.startup.wait(first_phase)
+        if not (self.streaming_asr and self.streaming_asr.is_available):
+            first_phase.append("faster_whisper")
+            self.startup.wait(first_phase)
 
-        # 1. Faster-Whisper STT (GPU-accelerated) - CRITICAL PRELOAD
-        try:
-            logger.info("Loading Faster-Whisper STT (GPU)...")
-            start_time = time.time()
+        logger.info(
+            f"✅ First-phase services ready in "
+            f"{(time.perf_counter() - init_start) * 1000:.0f}ms ({', '.join(first_phase)})"
+        )
 
-            self.stt_service = FasterWhisperSTT(
-                model_name=config.FASTER_WHISPER_MODEL,
-                device=config.FASTER_WHISPER_DEVICE,
-                compute_type=config.FASTER_WHISPER_COMPUTE_TYPE,
-                language=config.FASTER_WHISPER_LANGUAGE,
-                beam_size=config.FASTER_WHISPER_BEAM_SIZE,
-                noise_reduce=config.NOISE_REDUCE_ENABLED,
-                noise_reduce_strength=config.NOISE_REDUCE_STRENGTH
-            )
+        # Rapport complet quand tout est terminé (sans bloquer __init__)
+        threading.Thread(target=self._log_startup_report, name="startup-report", daemon=True).start()
 
-            load_time = (time.time() - start_time) * 1000
+        logger.info("=" * 80)
+        logger.info("ROBOT INITIALIZED - FIRST-PHASE SERVICES PRELOADED")
+        logger.info("=" * 80)
 
-            logger.info(
-                f"Faster-Whisper STT loaded in {load_time:.0f}ms "
-                f"(model={config.FASTER_WHISPER_MODEL}, device={config.FASTER_WHISPER_DEVICE})"
-            )
+    def __repr__(self):
+        return f"<RobotFreeSWITCH active_calls={len(self.calls)} running={self.running}>"
+
+    # ===================================================================
+    # STARTUP STAGES (run in parallel by StartupOrchestrator)
+    # ===================================================================
+
+    def _load_stt(self):
+        """Stage: Faster-Whisper STT (GPU-accelerated) - CRITICAL PRELOAD"""
+        logger.info("Loading Faster-Whisper STT (GPU)...")
+        start_time = time.time()
+
+        self.stt_service = FasterWhisperSTT(
+            model_name=config.FASTER_WHISPER_MODEL,
+            device=config.FASTER_WHISPER_DEVICE,
+            compute_type=config.FASTER_WHISPER_COMPUTE_TYPE,
+            language=config.FASTER_WHISPER_LANGUAGE,
+            beam_size=config.FASTER_WHISPER_BEAM_SIZE,
+            noise_reduce=config.NOISE_REDUCE_ENABLED,
+            noise_reduce_strength=config.NOISE_REDUCE_STRENGTH
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to load Faster-Whisper STT: {e}")
-            self.stt_service = None
-            raise
+        load_time = (time.time() - start_time) * 1000
 
-        # 2. AMD Service (keywords matching)
-        try:
-            logger.info("Loading AMD Service...")
-            self.amd_service = AMDService(
-                keywords_human=config.AMD_KEYWORDS_HUMAN,
-                keywords_machine=config.AMD_KEYWORDS_MACHINE,
-                min_confidence=config.AMD_MIN_CONFIDENCE
-            )
-            logger.info("AMD Service loaded")
-        except Exception as e:
-            logger.error(f"Failed to load AMD Service: {e}")
-            self.amd_service = None
-            raise
+        logger.info(
+            f"Faster-Whisper STT loaded in {load_time:.0f}ms "
+            f"(model={config.FASTER_WHISPER_MODEL}, device={config.FASTER_WHISPER_DEVICE})"
+        )
 
-        # 4. WebRTC VAD (barge-in detection - fallback si mod_vosk indisponible)
-        if VAD_AVAILABLE:
-            try:
-                self.vad = webrtcvad.Vad(config.WEBRTC_VAD_AGGRESSIVENESS)
-                logger.info(
-                    f"WebRTC VAD loaded "
-                    f"(aggressiveness={config.WEBRTC_VAD_AGGRESSIVENESS})"
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize VAD: {e}")
-                self.vad = None
-                raise
-        else:
+    def _load_amd(self):
+        """Stage: AMD Service (keywords matching)"""
+        logger.info("Loading AMD Service...")
+        self.amd_service = AMDService(
+            keywords_human=config.AMD_KEYWORDS_HUMAN,
+            keywords_machine=config.AMD_KEYWORDS_MACHINE,
+            min_confidence=config.AMD_MIN_CONFIDENCE
+        )
+        logger.info("AMD Service loaded")
+
+    def _load_vad(self):
+        """Stage: WebRTC VAD (barge-in detection - fallback si mod_vosk indisponible)"""
+        if not VAD_AVAILABLE:
             logger.error("WebRTC VAD not available - barge-in disabled!")
-            self.vad = None
             raise RuntimeError("VAD required for barge-in")
 
-        # 4.5. Streaming ASR (Vosk Python + mod_audio_fork WebSocket)
-        # Serveur WebSocket pour barge-in streaming temps réel
-        try:
-            if config.STREAMING_ASR_ENABLED:
-                logger.info("Loading Streaming ASR service...")
-                self.streaming_asr = StreamingASR()
-
-                if self.streaming_asr.is_available:
-                    # Démarrer serveur WebSocket dans thread asyncio
-                    self.asr_server_thread = threading.Thread(
-                        target=self._run_streaming_asr_server,
-                        daemon=True,
-                        name="StreamingASR-Server"
-                    )
-                    self.asr_server_thread.start()
+        self.vad = webrtcvad.Vad(config.WEBRTC_VAD_AGGRESSIVENESS)
+        logger.info(
+            f"WebRTC VAD loaded "
+            f"(aggressiveness={config.WEBRTC_VAD_AGGRESSIVENESS})"
+        )
 
-                    # HEALTH CHECK: Attendre que serveur démarre vraiment
-                    logger.info(
-                        f"⏳ Waiting for WebSocket server to start on "
-                        f"{config.STREAMING_ASR_HOST}:{config.STREAMING_ASR_PORT}..."
-                    )
+    def _load_streaming_asr(self):
+        """
+        Stage: Streaming ASR (Vosk Python + mod_audio_fork WebSocket)
 
-                    max_wait = 5.0  # 5 secondes max
-                    wait_start = time.time()
-                    server_started = False
+        Non-critical: on failure self.streaming_asr stays None and barge-in
+        falls back to WebRTC VAD.
+        """
+        if not config.STREAMING_ASR_ENABLED:
+            logger.info("ℹ️  Streaming ASR disabled, using WebRTC VAD fallback")
+            return
 
-                    while (time.time() - wait_start) < max_wait:
-                        try:
-                            # Tester connexion TCP sur port WebSocket
-                            import socket
-                            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                            sock.settimeout(0.1)
-                            result = sock.connect_ex((
-                                config.STREAMING_ASR_HOST,
-                                config.STREAMING_ASR_PORT
-                            ))
-                            sock.close()
-
-                            if result == 0:
-                                # Port accessible !
-                                server_started = True
-                                elapsed = time.time() - wait_start
-                                logger.info(
-                                    f"✅ Streaming ASR WebSocket server READY "
-                                    f"(started in {elapsed:.2f}s)"
-                                )
-                                break
-                        except Exception:
-                            pass
+        try:
+            logger.info("Loading Streaming ASR service...")
+            streaming_asr = StreamingASR()
 
-                        time.sleep(0.1)  # Poll every 100ms
+            if not streaming_asr.is_available:
+                logger.warning(
+                    "⚠️  Streaming ASR dependencies missing "
+                    "(check: websockets, webrtcvad, vosk, model path)"
+                )
+                return
 
-                    if not server_started:
-                        logger.error(
-                            f"❌ Streaming ASR server failed to start within {max_wait}s! "
-                            f"Falling back to WebRTC VAD."
-                        )
-                        self.streaming_asr = None
-                else:
-                    logger.warning(
-                        "⚠️  Streaming ASR dependencies missing "
-                        "(check: websockets, webrtcvad, vosk, model path)"
-                    )
-                    self.streaming_asr = None
-            else:
-                logger.info("ℹ️  Streaming ASR disabled, using WebRTC VAD fallback")
+            # Démarrer serveur WebSocket dans thread asyncio
+            self.streaming_asr = streaming_asr
+            self.asr_server_thread = threading.Thread(
+                target=self._run_streaming_asr_server,
+                daemon=True,
+                name="StreamingASR-Server"
+            )
+            self.asr_server_thread.start()
+
+            # HEALTH CHECK: Attendre que serveur démarre vraiment
+            logger.info(
+                f"⏳ Waiting for WebSocket server to start on "
+                f"{config.STREAMING_ASR_HOST}:{config.STREAMING_ASR_PORT}..."
+            )
+
+            max_wait = 5.0  # 5 secondes max
+            elapsed = self._wait_tcp_port(config.STREAMING_ASR_HOST, config.STREAMING_ASR_PORT, max_wait)
+            if elapsed is None:
+                logger.error(
+                    f"❌ Streaming ASR server failed to start within {max_wait}s! "
+                    f"Falling back to WebRTC VAD."
+                )
                 self.streaming_asr = None
+            else:
+                logger.info(
+                    f"✅ Streaming ASR WebSocket server READY "
+                    f"(started in {elapsed:.2f}s)"
+                )
 
         except Exception as e:
             logger.warning(f"⚠️  Streaming ASR initialization failed: {e}", exc_info=True)
             self.streaming_asr = None
             logger.info("Using WebRTC VAD fallback for barge-in")
 
-        # 5. ScenarioManager
-        try:
-            logger.info("Loading ScenarioManager...")
-            self.scenario_manager = ScenarioManager()
-            logger.info("ScenarioManager loaded")
-        except Exception as e:
-            logger.error(f"Failed to load ScenarioManager: {e}")
-            self.scenario_manager = None
-            raise
-
-        # 6. ObjectionMatcher (PRELOAD with scenario-specific theme)
-        try:
-            if default_theme:
-                logger.info(f"Loading ObjectionMatcher (theme: {default_theme})...")
-                # Load objections for the scenario's theme
-                self.objection_matcher_default = ObjectionMatcher.load_objections_for_theme(default_theme)
-                if self.objection_matcher_default:
-                    logger.info(
-                        f"ObjectionMatcher loaded ({default_theme}, "
-                        f"{len(self.objection_matcher_default.objections)} objections)"
-                    )
-                else:
-                    logger.warning(f"ObjectionMatcher not loaded (no objections found for {default_theme})")
-            else:
-                logger.info("No default theme specified, ObjectionMatcher warmup skipped")
-                self.objection_matcher_default = None
-        except Exception as e:
-            logger.warning(f"ObjectionMatcher not available: {e}")
-            self.objection_matcher_default = None
-
-        # 7. Intents Database supprimé - tout passe par ObjectionMatcher maintenant
-        # Les intents (affirm, deny, insult) sont dans objections_general.py
-
-        # ===================================================================
-        # WARMUP TESTS (CRITICAL - Avoid first-call latency spikes)
-        # ===================================================================
+    @staticmethod
+    def _wait_tcp_port(host: str, port: int, max_wait: float) -> Optional[float]:
+        """Poll a TCP port (20ms) until it accepts connections; elapsed seconds or None on timeout"""
+        import socket
 
-        # 1. GPU WARMUP (Faster-Whisper)
-        if self.stt_service and config.FASTER_WHISPER_DEVICE == "cuda":
-            logger.info("WARMUP 1/4: GPU Faster-Whisper test transcription...")
+        wait_start = time.time()
+        while (time.time() - wait_start) < max_wait:
             try:
-                # Create dummy 1s silence audio for warmup
-                import wave
-                import struct
-                import tempfile
-
-                warmup_audio = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-                warmup_path = warmup_audio.name
-
-                # Generate 1s silence @ 8kHz mono
-                with wave.open(warmup_path, 'w') as wf:
-                    wf.setnchannels(1)
-                    wf.setsampwidth(2)
-                    wf.setframerate(8000)
-                    # 1s = 8000 frames
-                    silence = struct.pack('<' + ('h' * 8000), *([0] * 8000))
-                    wf.writeframes(silence)
-
-                # Warmup transcription
-                warmup_start = time.time()
-                result = self.stt_service.transcribe_file(warmup_path)
-                warmup_time = (time.time() - warmup_start) * 1000
-
-                logger.info(f"GPU WARMUP 1/4: Completed in {warmup_time:.0f}ms - GPU is HOT!")
-
-                # Cleanup
-                Path(warmup_path).unlink()
+                with socket.create_connection((host, port), timeout=0.1):
+                    return time.time() - wait_start
+            except OSError:
+                pass
+            time.sleep(0.02)
+        return None
+
+    def _load_scenarios(self):
+        """Stage: ScenarioManager (+ hot reload watcher, started in start())"""
+        logger.info("Loading ScenarioManager...")
+        self.scenario_manager = ScenarioManager()
+        logger.info("ScenarioManager loaded")
+
+        # Hot reload scénarios/objections (démarré avec le robot dans start())
+        self.hot_reloader = HotReloader(self.scenario_manager) if config.HOT_RELOAD_ENABLED else None
+
+    def _load_objections(self):
+        """Stage: ObjectionMatcher (PRELOAD with scenario-specific theme)"""
+        default_theme = self.default_theme
+        if not default_theme:
+            logger.info("No default theme specified, ObjectionMatcher warmup skipped")
+            return
 
-            except Exception as e:
-                logger.warning(f"GPU warmup failed (non-critical): {e}")
+        logger.info(f"Loading ObjectionMatcher (theme: {default_theme})...")
+        # Load objections for the scenario's theme
+        self.objection_matcher_default = ObjectionMatcher.load_objections_for_theme(default_theme)
+        if self.objection_matcher_default:
+            logger.info(
+                f"ObjectionMatcher loaded ({default_theme}, "
+                f"{len(self.objection_matcher_default.objections)} objections)"
+            )
+        else:
+            logger.warning(f"ObjectionMatcher not loaded (no objections found for {default_theme})")
 
-        # 2. VAD WARMUP
-        if self.vad:
-            logger.info("WARMUP 2/4: VAD test detection...")
-            try:
-                # Test VAD on dummy audio frame
-                import struct
+    # WARMUP STAGES (CRITICAL - Avoid first-call latency spikes)
+    # Audio de warmup généré en mémoire (aucun WAV temporaire sur disque)
 
-                # 30ms frame @ 8kHz = 240 samples
-                frame_samples = 240
-                test_frame = struct.pack('<' + ('h' * frame_samples), *([100] * frame_samples))
+    def _warmup_stt(self):
+        """Stage: GPU WARMUP (Faster-Whisper)"""
+        if not (self.stt_service and config.FASTER_WHISPER_DEVICE == "cuda"):
+            return
 
-                warmup_start = time.time()
-                is_speech = self.vad.is_speech(test_frame, 8000)
-                warmup_time = (time.time() - warmup_start) * 1000
+        logger.info("WARMUP 1/4: GPU Faster-Whisper test transcription...")
+        warmup_time = self.stt_service.warmup(seconds=1.0)
+        logger.info(f"GPU WARMUP 1/4: Completed in {warmup_time:.0f}ms - GPU is HOT!")
 
-                logger.info(f"VAD WARMUP 2/4: Completed in {warmup_time:.2f}ms - VAD is READY!")
+    def _warmup_vad(self):
+        """Stage: VAD WARMUP"""
+        logger.info("WARMUP 2/4: VAD test detection...")
+        import struct
 
-            except Exception as e:
-                logger.warning(f"VAD warmup failed (non-critical): {e}")
+        # 30ms frame @ 8kHz = 240 samples
+        frame_samples = 240
+        test_frame = struct.pack('<' + ('h' * frame_samples), *([100] * frame_samples))
 
-        # 3. OBJECTION MATCHER WARMUP
-        if self.objection_matcher_default:
-            logger.info(f"WARMUP 3/4: ObjectionMatcher test match (theme: {default_theme})...")
-            try:
-                warmup_start = time.time()
-                # Test with a common objection phrase (silent mode to avoid ❌ log)
-                test_match = self.objection_matcher_default.find_best_match(
-                    "C'est trop cher pour moi",
-                    min_score=0.5,
-                    silent=True  # Silent mode for warmup (no ✅/❌ logs)
-                )
-                warmup_time = (time.time() - warmup_start) * 1000
+        warmup_start = time.time()
+        self.vad.is_speech(test_frame, 8000)
+        warmup_time = (time.time() - warmup_start) * 1000
 
-                match_status = "✅ MATCHED" if test_match else "⚠️ NO MATCH"
-                logger.info(
-                    f"ObjectionMatcher WARMUP 3/4: Completed in {warmup_time:.2f}ms - "
-                    f"Matcher is READY! ({match_status})"
-                )
+        logger.info(f"VAD WARMUP 2/4: Completed in {warmup_time:.2f}ms - VAD is READY!")
 
-            except Exception as e:
-                logger.warning(f"ObjectionMatcher warmup failed (non-critical): {e}")
-        else:
+    def _warmup_objections(self):
+        """Stage: OBJECTION MATCHER WARMUP"""
+        if not self.objection_matcher_default:
             logger.info("WARMUP 3/4: ObjectionMatcher skipped (no theme specified)")
+            return
 
-        # 4. VOSK WARMUP (Streaming ASR)
-        if self.streaming_asr and self.streaming_asr.is_available:
-            logger.info("WARMUP 4/4: Vosk ASR test transcription...")
-            try:
-                # Créer dummy audio 1s @ 16kHz (Vosk sample rate)
-                import wave
-                import struct
-                import tempfile
-                from vosk import KaldiRecognizer
-
-                warmup_audio = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-                warmup_path = warmup_audio.name
-
-                # Generate 1s silence @ 16kHz mono (Vosk sample rate)
-                with wave.open(warmup_path, 'w') as wf:
-                    wf.setnchannels(1)  # Mono
-                    wf.setsampwidth(2)  # 16-bit
-                    wf.setframerate(16000)  # 16kHz pour Vosk
-                    silence = struct.pack('<' + ('h' * 16000), *([0] * 16000))
-                    wf.writeframes(silence)
-
-                # Warmup transcription avec recognizer Vosk
-                warmup_start = time.time()
-
-                # Créer recognizer temporaire
-                recognizer = KaldiRecognizer(
-                    self.streaming_asr.model,
-                    16000
-                )
-
-                # Lire et transcrire
-                with wave.open(warmup_path, 'r') as wf:
-                    data = wf.readframes(16000)  # 1s
-                    recognizer.AcceptWaveform(data)
-                    result = recognizer.FinalResult()
-
-                warmup_time = (time.time() - warmup_start) * 1000
-
-                logger.info(
-                    f"Vosk ASR WARMUP 4/4: Completed in {warmup_time:.0f}ms - "
-                    f"Vosk is READY!"
-                )
+        logger.info(f"WARMUP 3/4: ObjectionMatcher test match (theme: {self.default_theme})...")
+        warmup_start = time.time()
+        # Test with a common objection phrase (silent mode to avoid ❌ log)
+        test_match = self.objection_matcher_default.find_best_match(
+            "C'est trop cher pour moi",
+            min_score=0.5,
+            silent=True  # Silent mode for warmup (no ✅/❌ logs)
+        )
+        warmup_time = (time.time() - warmup_start) * 1000
 
-                # Cleanup
-                Path(warmup_path).unlink()
+        match_status = "✅ MATCHED" if test_match else "⚠️ NO MATCH"
+        logger.info(
+            f"ObjectionMatcher WARMUP 3/4: Completed in {warmup_time:.2f}ms - "
+            f"Matcher is READY! ({match_status})"
+        )
 
-            except Exception as e:
-                logger.warning(f"Vosk warmup failed (non-critical): {e}")
-        else:
+    def _warmup_vosk(self):
+        """Stage: VOSK WARMUP (Streaming ASR)"""
+        if not (self.streaming_asr and self.streaming_asr.is_available):
             logger.info("WARMUP 4/4: Vosk ASR skipped (Streaming ASR not available)")
+            return
 
-        # ===================================================================
-        # PRELOAD AUDIO DURATIONS (Phase 3 - Zero latency on calls)
-        # ===================================================================
-        logger.info("PRELOAD 5/5: Caching audio file durations...")
-        try:
-            from pathlib import Path
-            from system.cache_manager import CacheManager
-
-            cache = CacheManager.get_instance()
-            audio_base_dir = Path("audio")
+        logger.info("WARMUP 4/4: Vosk ASR test transcription...")
+        from vosk import KaldiRecognizer
 
-            if audio_base_dir.exists():
-                # Scan tous les fichiers WAV dans audio/
-                audio_files = list(audio_base_dir.rglob("*.wav"))
-                total_duration = 0.0
-                cached_count = 0
+        # 1s de silence @ 16kHz mono 16-bit (Vosk sample rate), en mémoire
+        silence = bytes(2 * 16000)
 
-                preload_start = time.time()
+        warmup_start = time.time()
+        recognizer = KaldiRecognizer(self.streaming_asr.model, 16000)
+        recognizer.AcceptWaveform(silence)
+        recognizer.FinalResult()
+        warmup_time = (time.time() - warmup_start) * 1000
 
-                for audio_path in audio_files:
-                    try:
-                        # Utilise _get_audio_duration() qui cache automatiquement
-                        duration = self._get_audio_duration(str(audio_path))
-                        total_duration += duration
-                        cached_count += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to preload duration for {audio_path}: {e}")
+        logger.info(
+            f"Vosk ASR WARMUP 4/4: Completed in {warmup_time:.0f}ms - "
+            f"Vosk is READY!"
+        )
 
-                preload_time = (time.time() - preload_start) * 1000
+    def _preload_audio_index(self):
+        """Stage: PRELOAD AUDIO DURATIONS (Phase 3 - Zero latency on calls)"""
+        logger.info("PRELOAD 5/5: Loading audio metadata index...")
+        from system.cache_manager import CacheManager
 
-                logger.info(
-                    f"Audio durations cached: {cached_count} files "
-                    f"(total: {total_duration:.1f}s, preload: {preload_time:.0f}ms)"
-                )
-            else:
-                logger.warning(f"Audio directory not found: {audio_base_dir}")
+        # Index persistant: une lecture + stat des fichiers, seuls les
+        # WAV nouveaux/modifiés sont analysés (en parallèle)
+        preload_start = time.time()
+        audio_index = get_audio_index()
+        refresh = audio_index.refresh()
+        cached_count = audio_index.push_durations(CacheManager.get_instance())
+        preload_time = (time.time() - preload_start) * 1000
 
-        except Exception as e:
-            logger.warning(f"Audio duration preloading failed (non-critical): {e}")
+        logger.info(
+            f"Audio durations cached: {cached_count} files "
+            f"({refresh['probed']} probed, {refresh['removed']} removed, "
+            f"{refresh['unchanged']} from index, preload: {preload_time:.0f}ms)"
+        )
 
-        logger.info("=" * 80)
-        logger.info("ROBOT INITIALIZED - ALL SERVICES PRELOADED")
-        logger.info("=" * 80)
+    def _log_startup_report(self):
+        """Log the per-stage timing table once every startup stage has finished"""
+        try:
+            self.startup.wait_all()
+            logger.info("✅ All startup stages completed")
+        except StartupError as e:
+            logger.error(f"❌ {e}")
+        self.startup.log_report()
 
-    def __repr__(self):
-        return f"<RobotFreeSWITCH active_calls={len(self.active_calls)} running={self.running}>"
+    def _wait_for_call_services(self, short_uuid: str) -> bool:
+        """
+        Block a call until the services used after AMD are loaded
+        (no-op once startup is complete). False if a critical one failed.
+        """
+        try:
+            if not self.startup.wait(CALL_STAGES, timeout=config.STARTUP_CALL_WAIT_TIMEOUT):
+                logger.error(f"[{short_uuid}] Services still loading after {config.STARTUP_CALL_WAIT_TIMEOUT}s")
+                return False
+            return True
+        except StartupError as e:
+            logger.error(f"[{short_uuid}] {e}")
+            return False
 
     def _run_streaming_asr_server(self):
         """
@@ -604,6 +587,9 @@ class RobotFreeSWITCH:
         self.event_thread = threading.Thread(target=self._event_loop, daemon=True)
         self.event_thread.start()
 
+        if self.hot_reloader:
+            self.hot_reloader.start()
+
         logger.info("RobotFreeSWITCH started and listening for events")
         logger.info("Waiting for calls...")
 
@@ -615,6 +601,15 @@ class RobotFreeSWITCH:
 
         self.running = False
 
+        if self.hot_reloader:
+            self.hot_reloader.stop()
+
+        # Fichiers audio analysés pendant les appels → index persistant
+        try:
+            get_audio_index().save()
+        except Exception as e:
+            logger.warning(f"Audio index save failed: {e}")
+
         # Wait for event loop
         if self.event_thread and self.event_thread.is_alive():
             self.event_thread.join(timeout=5)
@@ -641,6 +636,13 @@ class RobotFreeSWITCH:
         """
         logger.info(f"Originating call to {phone_number} with scenario '{scenario_name}'...")
 
+        # Service critique en échec (ex: Faster-Whisper chargé en arrière-plan
+        # après __init__): chaque appel finirait en FAILED, on ne compose plus
+        failed_stages = self.startup.failed(CALL_STAGES)
+        if failed_stages:
+            logger.error(f"Not originating: startup failed for {', '.join(failed_stages)}")
+            return None
+
         try:
             # Load scenario
             scenario = self.scenario_manager.load_scenario(scenario_name)
@@ -650,6 +652,9 @@ class RobotFreeSWITCH:
 
             logger.info(f"Scenario loaded: {scenario.get('name', scenario_name)}")
 
+            # Manifest audio prêt (et revérifié si sounds/ a changé) avant l'appel
+            self.scenario_manager.get_audio_manifest(scenario)
+
             # Build originate command
             # Format: originate {variables}sofia/gateway/gateway_name/number &park()
 
@@ -690,14 +695,13 @@ class RobotFreeSWITCH:
                     logger.info(f"✅ Call originated successfully with UUID: {uuid}")
 
                     # Initialize session
-                    self.call_sessions[uuid] = {
-                        "phone_number": phone_number,
-                        "lead_id": lead_id,
-                        "scenario_name": scenario_name,
-                        "scenario": scenario,
-                        "start_time": time.time(),
-                        "state": "ORIGINATED"
-                    }
+                    self.calls.open(
+                        uuid,
+                        phone_number=phone_number,
+                        lead_id=lead_id,
+                        scenario_name=scenario_name,
+                        scenario=scenario
+                    )
 
                     return uuid
                 else:
@@ -713,6 +717,39 @@ class RobotFreeSWITCH:
             traceback.print_exc()
             return None
 
+    def get_active_calls(self) -> List[str]:
+        """
+        UUIDs of calls in progress (ringing or answered)
+
+        Returns:
+            List of call UUIDs (copy)
+        """
+        return self.calls.uuids()
+
+    def get_call_info(self, call_uuid: str) -> Optional[Dict[str, Any]]:
+        """
+        Call outcome for the database (BatchCaller, once the UUID left get_active_calls)
+
+        Kept by the registry after the hangup handler closed the session.
+
+        Returns:
+            {"hangup_cause", "amd_result", "qualification_result", "duration"}
+            or None if unknown (never seen, or forgotten after ENDED_INFO_MAX calls)
+        """
+        session = self.calls.get(call_uuid)
+        if session is not None:
+            return session.end_info()  # Still in progress
+        return self.calls.ended_info(call_uuid)
+
+    def forget_call_info(self, call_uuids: List[str]) -> int:
+        """
+        Release the outcome of ended calls once saved (BatchCaller, after commit)
+
+        Returns:
+            Number of outcomes released
+        """
+        return self.calls.forget_ended(call_uuids)
+
     def _event_loop(self):
         """
         Main event loop (runs in separate thread)
@@ -776,38 +813,37 @@ class RobotFreeSWITCH:
         lead_id = event.getHeader("variable_lead_id")
 
         # Load scenario if this is an outbound call
+        scenario_fields = {}
         if scenario_name:
             logger.info(f"[{call_uuid[:8]}] Loading scenario from channel variables: {scenario_name}")
             scenario = self.scenario_manager.load_scenario(scenario_name)
 
             if scenario:
-                # Store session data under this UUID
-                self.call_sessions[call_uuid] = {
+                scenario_fields = {
                     "phone_number": callee_number,
                     "lead_id": int(lead_id) if lead_id else 0,
                     "scenario_name": scenario_name,
                     "scenario": scenario,
-                    "start_time": time.time(),
-                    "state": "ANSWERED"
                 }
                 logger.info(f"[{call_uuid[:8]}] Session created with scenario: {scenario_name}")
 
-        # Store call info
-        self.active_calls[call_uuid] = {
-            "uuid": call_uuid,
-            "caller": caller_number,
-            "callee": callee_number,
-            "answered_at": time.time()
-        }
+        # Store call info (session created at originate, or now for inbound calls)
+        session = self.calls.open(
+            call_uuid,
+            caller=caller_number,
+            callee=callee_number,
+            answered_at=time.time(),
+            state=STATE_ANSWERED,
+            **scenario_fields
+        )
 
         # Start call thread
-        call_thread = threading.Thread(
+        session.thread = threading.Thread(
             target=self._handle_call,
             args=(call_uuid,),
             daemon=True
         )
-        self.call_threads[call_uuid] = call_thread
-        call_thread.start()
+        session.thread.start()
 
         logger.info(f"[{call_uuid[:8]}] Call thread started")
 
@@ -839,14 +875,13 @@ class RobotFreeSWITCH:
         # ===================================================================
 
         # Check if robot already set a final status
-        session = self.call_sessions.get(call_uuid, {})
-        robot_initiated_hangup = session.get("robot_hangup", False)
-        existing_status = session.get("final_status")
+        session = self.calls.get(call_uuid)
+        robot_initiated_hangup = session.robot_hangup if session else False
+        existing_status = session.final_status if session else None
 
         # ===== SET HANGUP DETECTION FLAG (CRITICAL for immediate detection) =====
-        if call_uuid in self.call_sessions:
-            self.call_sessions[call_uuid]["hangup_detected"] = True
-            self.call_sessions[call_uuid]["hangup_timestamp"] = hangup_timestamp
+        if session is not None:
+            session.mark_hangup(hangup_timestamp, hangup_cause)
             logger.info(
                 f"🚨 [{short_uuid}] HANGUP FLAG SET in session "
                 f"(timestamp: {hangup_timestamp:.6f})"
@@ -883,6 +918,10 @@ class RobotFreeSWITCH:
                 final_status = existing_status or CallResult.NO_ANSWER
                 logger.info(f"[{short_uuid}] 👤 CLIENT-INITIATED (non-standard) → {final_status.value}")
 
+            # Read back by get_call_info() after close (qualification_result)
+            if session is not None:
+                session.final_status = final_status
+
         # ===================================================================
         # Update database with final status
         # ===================================================================
@@ -892,7 +931,7 @@ class RobotFreeSWITCH:
 
             # Check if AMD detected answering machine
             status_display = final_status.value
-            if session.get("amd_machine_detected"):
+            if session is not None and session.amd_machine_detected:
                 status_display = "answering_machine"
 
             logger.info(
@@ -918,41 +957,58 @@ class RobotFreeSWITCH:
         # ===================================================================
         logger.info(f"[{short_uuid}] 🧹 Starting cleanup...")
 
-        cleanup_report = []
-
-        if call_uuid in self.active_calls:
-            del self.active_calls[call_uuid]
-            cleanup_report.append("active_calls ✓")
-            logger.info(f"[{short_uuid}]   ✓ Removed from active_calls")
+        # Retrait atomique: les threads de l'appel gardent leur référence
+        # (hangup_detected / closed) au lieu de lever KeyError
+        closed = self.calls.close(call_uuid)
+        released = self._release_call_resources(call_uuid, closed)
+        if closed is not None:
+            logger.info(f"[{short_uuid}] ✅ Cleanup completed: {closed!r} removed, {released}")
         else:
-            cleanup_report.append("active_calls (already removed)")
-            logger.info(f"[{short_uuid}]   ⚠️  Not in active_calls (already removed)")
+            logger.info(f"[{short_uuid}] ✅ Cleanup completed: session already removed, {released}")
+        logger.info("=" * 80)
 
-        if call_uuid in self.call_threads:
-            del self.call_threads[call_uuid]
-            cleanup_report.append("call_threads ✓")
-            logger.info(f"[{short_uuid}]   ✓ Removed from call_threads")
-        else:
-            cleanup_report.append("call_threads (already removed)")
-            logger.info(f"[{short_uuid}]   ⚠️  Not in call_threads (already removed)")
+    def _release_call_resources(self, call_uuid: str, session: Optional[CallSession]) -> str:
+        """
+        Release everything a call still owns (called once, on hangup)
 
-        if call_uuid in self.call_sessions:
-            del self.call_sessions[call_uuid]
-            cleanup_report.append("call_sessions ✓")
-            logger.info(f"[{short_uuid}]   ✓ Removed from call_sessions")
-        else:
-            cleanup_report.append("call_sessions (already removed)")
-            logger.info(f"[{short_uuid}]   ⚠️  Not in call_sessions (already removed)")
+        - StreamingASR: callback (and the phase state its closure captures),
+          stream info, Vosk recognizer
+        - Temp recordings/snapshots the phases did not delete (early exits)
+        - Worker threads: signalled through session.mark_hangup(); only
+          counted here, never joined (we are on the ESL event thread)
 
-        if call_uuid in self.barge_in_active:
-            del self.barge_in_active[call_uuid]
-            cleanup_report.append("barge_in_active ✓")
-            logger.info(f"[{short_uuid}]   ✓ Removed from barge_in_active")
-        else:
-            cleanup_report.append("barge_in_active (not set)")
+        Returns:
+            Short report for the cleanup log line
+        """
+        report = []
 
-        logger.info(f"[{short_uuid}] ✅ Cleanup completed: {', '.join(cleanup_report)}")
-        logger.info("=" * 80)
+        if self.streaming_asr and self.streaming_asr.is_available:
+            released = self.streaming_asr.release_call(call_uuid)
+            report.append("asr=" + (",".join(name for name, done in released.items() if done) or "-"))
+
+        if session is not None:
+            report.append(f"files={session.release_files()}")
+            alive = len(session.live_workers())
+            if alive:
+                report.append(f"workers_stopping={alive}")
+
+        return " ".join(report) or "nothing to release"
+
+    def _call_temp_file(self, call_uuid: str, path: str) -> str:
+        """Temp file owned by the call (deleted on hangup if a phase left it behind)"""
+        session = self.calls.get(call_uuid)
+        if session is not None:
+            session.track_file(path)
+        return path
+
+    def _start_call_worker(self, call_uuid: str, target, *args) -> threading.Thread:
+        """Start a daemon worker thread owned by the call"""
+        worker = threading.Thread(target=target, args=args, name=f"{target.__name__}-{call_uuid[:8]}", daemon=True)
+        session = self.calls.get(call_uuid)
+        if session is not None:
+            session.track_worker(worker)
+        worker.start()
+        return worker
 
     def _handle_dtmf(self, call_uuid: str, event):
         """Handle DTMF event (optional)"""
@@ -975,6 +1031,8 @@ class RobotFreeSWITCH:
         - MaxTurn + Qualification - TODO PART 6
         """
         short_uuid = call_uuid[:8]
+        if self.log_pipeline:
+            self.log_pipeline.begin_call(call_uuid)
         logger.info(f"[{short_uuid}] === CALL HANDLER START ===")
 
         try:
@@ -988,8 +1046,9 @@ class RobotFreeSWITCH:
                     f"[{short_uuid}] AMD: MACHINE detected -> Hangup call"
                 )
                 # Store AMD result in session for final status display
-                if call_uuid in self.call_sessions:
-                    self.call_sessions[call_uuid]["amd_machine_detected"] = True
+                session = self.calls.get(call_uuid)
+                if session is not None:
+                    session.amd_machine_detected = True
                 self._hangup_call(call_uuid, CallResult.NO_ANSWER)
                 return
 
@@ -1010,33 +1069,39 @@ class RobotFreeSWITCH:
                     f"[{short_uuid}] AMD: HUMAN detected -> Continue to Phase 2"
                 )
 
+            # Démarrage parallèle: services post-AMD encore en chargement ?
+            if not self._wait_for_call_services(short_uuid):
+                # Panne robot, pas un contact injoignable: FAILED (retry par le BatchCaller)
+                self._hangup_call(call_uuid, CallStatus.FAILED)
+                return
+
             # ================================================================
             # CONVERSATION LOOP (Phases 2 + 3 + Intent + Navigation)
             # ================================================================
             logger.info(f"[{short_uuid}] === CONVERSATION LOOP START ===")
 
             # Load scenario from call session
-            session = self.call_sessions.get(call_uuid)
+            session = self.calls.get(call_uuid)
             if not session:
                 logger.error(f"[{short_uuid}] No session data found!")
                 self._hangup_call(call_uuid, CallResult.NO_ANSWER)
                 return
 
-            scenario = session.get("scenario")
+            scenario = session.scenario
             if not scenario:
                 logger.error(f"[{short_uuid}] No scenario loaded!")
                 self._hangup_call(call_uuid, CallResult.NO_ANSWER)
                 return
 
-            scenario_name = session.get("scenario_name", "unknown")
+            scenario_name = session.scenario_name or "unknown"
             logger.info(
                 f"[{short_uuid}] Loaded scenario: {scenario_name} "
                 f"({len(scenario.get('steps', {}))} steps)"
             )
 
             # Initialize session tracking
-            session["qualification_score"] = 0.0
-            session["steps_executed"] = []
+            session.qualification_score = 0.0
+            session.steps_executed = []
 
             # Get first step (rail or default to "hello")
             rail = scenario.get("rail", [])
@@ -1078,11 +1143,7 @@ class RobotFreeSWITCH:
                     break
 
                 # Check if this is a terminal step (is_terminal property OR legacy names)
-                is_terminal = (
-                    step_config.get("is_terminal", False) or
-                    current_step.lower() in ["bye", "bye_failed", "end"] or
-                    current_step.lower().startswith("bye_")
-                )
+                is_terminal = self.scenario_manager.is_terminal_step(scenario, current_step)
 
                 if is_terminal:
                     logger.info(
@@ -1108,7 +1169,7 @@ class RobotFreeSWITCH:
                         logger.info(
                             f"[{short_uuid}] Call completed -> "
                             f"Final status: {final_status.value} "
-                            f"(qualification score: {session.get('qualification_score', 0):.1f})"
+                            f"(qualification score: {session.qualification_score:.1f})"
                         )
                     elif step_result == "failed":
                         # Explicit failure (refus/disqualification)
@@ -1159,7 +1220,7 @@ class RobotFreeSWITCH:
                     return
 
                 # Track step
-                session["steps_executed"].append({
+                session.steps_executed.append({
                     "step": current_step,
                     "intent": step_result.get("intent"),
                     "transcription": step_result.get("transcription", "")[:100]
@@ -1201,12 +1262,13 @@ class RobotFreeSWITCH:
             self._hangup_call(call_uuid, CallStatus.COMPLETED)
 
         except Exception as e:
-            logger.error(f"[{short_uuid}] Call handler error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"[{short_uuid}] Call handler error: {e}", exc_info=True)
 
         finally:
             logger.info(f"[{short_uuid}] === CALL HANDLER END ===")
+            if self.log_pipeline:
+                # Buffer de l'appel: écrit si erreur ou échantillonné, sinon jeté
+                self.log_pipeline.end_call(call_uuid)
 
     # ========================================================================
     # PHASE 1: AMD (Answering Machine Detection)
@@ -1251,7 +1313,7 @@ class RobotFreeSWITCH:
         )
 
         record_start = time.time()
-        audio_path = f"/tmp/amd_{call_uuid}.wav"
+        audio_path = self._call_temp_file(call_uuid, f"/tmp/amd_{call_uuid}.wav")
 
         record_success = self._record_audio(
             call_uuid,
@@ -1457,14 +1519,9 @@ class RobotFreeSWITCH:
         short_uuid = call_uuid[:8]
         play_start_time = time.time()
 
-        # Initialize barge-in tracking
-        self.barge_in_active[call_uuid] = {
-            "detected": False,
-            "speech_start": None,
-            "speech_duration": 0.0,
-            "barge_in_at": 0.0,
-            "stop_monitoring": False
-        }
+        # Initialize barge-in tracking (hors registre si l'appel est déjà fermé)
+        session = self.calls.get(call_uuid)
+        barge_in = session.start_barge_in() if session else BargeInState()
 
         # ===================================================================
         # STEP 1: Start audio playback (non-blocking)
@@ -1502,12 +1559,7 @@ class RobotFreeSWITCH:
 
         vad_start_time = time.time()
 
-        vad_thread = threading.Thread(
-            target=self._monitor_barge_in,
-            args=(call_uuid, play_start_time),
-            daemon=True
-        )
-        vad_thread.start()
+        self._start_call_worker(call_uuid, self._monitor_barge_in, call_uuid, play_start_time, barge_in)
 
         logger.debug(f"[{short_uuid}] VAD monitoring thread started")
 
@@ -1538,13 +1590,11 @@ class RobotFreeSWITCH:
             elapsed = time.time() - play_start_time
 
             # Check if barge-in detected
-            if self.barge_in_active[call_uuid]["detected"]:
-                barge_in_info = self.barge_in_active[call_uuid]
-
+            if barge_in.detected:
                 logger.info(
                     f"[{short_uuid}] BARGE-IN DETECTED! "
-                    f"Speech duration: {barge_in_info['speech_duration']:.1f}s, "
-                    f"At: {barge_in_info['barge_in_at']:.1f}s into audio"
+                    f"Speech duration: {barge_in.speech_duration:.1f}s, "
+                    f"At: {barge_in.barge_in_at:.1f}s into audio"
                 )
 
                 # Smooth delay before interruption
@@ -1559,7 +1609,7 @@ class RobotFreeSWITCH:
                 self._stop_audio(call_uuid)
 
                 # Stop VAD monitoring
-                self.barge_in_active[call_uuid]["stop_monitoring"] = True
+                barge_in.stop_monitoring = True
 
                 vad_overhead_ms = (time.time() - vad_start_time) * 1000
 
@@ -1571,8 +1621,8 @@ class RobotFreeSWITCH:
                 return {
                     "completed": False,
                     "interrupted": True,
-                    "barge_in_at": barge_in_info["barge_in_at"],
-                    "speech_duration": barge_in_info["speech_duration"],
+                    "barge_in_at": barge_in.barge_in_at,
+                    "speech_duration": barge_in.speech_duration,
                     "latencies": {
                         "play_start_ms": play_start_latency_ms,
                         "vad_overhead_ms": vad_overhead_ms
@@ -1580,7 +1630,7 @@ class RobotFreeSWITCH:
                 }
 
         # Playback completed without interruption
-        self.barge_in_active[call_uuid]["stop_monitoring"] = True
+        barge_in.stop_monitoring = True
 
         vad_overhead_ms = (time.time() - vad_start_time) * 1000
 
@@ -1600,7 +1650,7 @@ class RobotFreeSWITCH:
             }
         }
 
-    def _monitor_barge_in(self, call_uuid: str, playback_start_time: float):
+    def _monitor_barge_in(self, call_uuid: str, playback_start_time: float, barge_in: BargeInState):
         """
         Monitor audio stream for barge-in detection (VAD thread)
 
@@ -1610,9 +1660,10 @@ class RobotFreeSWITCH:
         Args:
             call_uuid: Call UUID
             playback_start_time: Time when playback started
+            barge_in: Barge-in state of this playback (session.barge_in)
 
         Updates:
-            self.barge_in_active[call_uuid] with detection results
+            barge_in with detection results
         """
         short_uuid = call_uuid[:8]
 
@@ -1650,7 +1701,7 @@ class RobotFreeSWITCH:
 
         try:
             # Start recording in parallel for VAD monitoring
-            vad_record_path = f"/tmp/vad_{call_uuid}.wav"
+            vad_record_path = self._call_temp_file(call_uuid, f"/tmp/vad_{call_uuid}.wav")
 
             # Record with short segments for real-time monitoring
             # In production, use streaming approach with mod_audio_stream
@@ -1663,7 +1714,7 @@ class RobotFreeSWITCH:
             last_check_size = 0
             check_interval = 0.1  # Check every 100ms
 
-            while not self.barge_in_active[call_uuid]["stop_monitoring"]:
+            while not barge_in.stop_monitoring:
                 time.sleep(check_interval)
                 total_frames += 1
 
@@ -1708,12 +1759,10 @@ class RobotFreeSWITCH:
                                         f"Duration: {speech_duration:.1f}s"
                                     )
 
-                                    self.barge_in_active[call_uuid].update({
-                                        "detected": True,
-                                        "speech_start": speech_start_time,
-                                        "speech_duration": speech_duration,
-                                        "barge_in_at": elapsed_time
-                                    })
+                                    barge_in.speech_start = speech_start_time
+                                    barge_in.speech_duration = speech_duration
+                                    barge_in.barge_in_at = elapsed_time
+                                    barge_in.detected = True
 
                                     # Stop monitoring (main thread will handle stop)
                                     break
@@ -1875,7 +1924,7 @@ class RobotFreeSWITCH:
         logger.info(f"[{short_uuid}] Waiting Step 1/3: Starting recording...")
 
         record_start = time.time()
-        audio_path = f"/tmp/waiting_{call_uuid}.wav"
+        audio_path = self._call_temp_file(call_uuid, f"/tmp/waiting_{call_uuid}.wav")
 
         # Record with silence detection
         record_result = self._record_with_silence_detection(
@@ -2012,8 +2061,9 @@ class RobotFreeSWITCH:
 
         # Calculate gap Phase 2→3
         gap_phase2_3 = 0
-        if call_uuid in self.call_sessions and "phase2_end_timestamp" in self.call_sessions[call_uuid]:
-            gap_phase2_3 = (phase_start - self.call_sessions[call_uuid]["phase2_end_timestamp"]) * 1000
+        session = self.calls.get(call_uuid)
+        if session is not None and session.phase2_end_timestamp is not None:
+            gap_phase2_3 = (phase_start - session.phase2_end_timestamp) * 1000
 
         self.clog.phase3_start(uuid=short_uuid)
 
@@ -2152,10 +2202,9 @@ class RobotFreeSWITCH:
             stream_init_latency = (time.time() - stream_wait_start) * 1000
 
             # === ENERGY GATE: Appliquer noise floor calibré (si disponible) ===
-            if call_uuid in self.call_sessions:
-                saved_noise_floor = self.call_sessions[call_uuid].get("noise_floor_rms", 0)
-                if saved_noise_floor > 0:
-                    self.streaming_asr.set_noise_floor(call_uuid, saved_noise_floor)
+            session = self.calls.get(call_uuid)
+            if session is not None and session.noise_floor_rms > 0:
+                self.streaming_asr.set_noise_floor(call_uuid, session.noise_floor_rms)
 
             # Définir monitoring_start APRÈS stream initialisé pour calculs précis
             monitoring_start = time.time()
@@ -2177,9 +2226,9 @@ class RobotFreeSWITCH:
 
                 # ===== ULTRA-FAST HANGUP DETECTION (20ms polling) =====
                 # Vérification 1: Flag session (setté par HANGUP handler)
-                session = self.call_sessions.get(call_uuid, {})
-                if session.get("hangup_detected", False):
-                    hangup_ts = session.get("hangup_timestamp", 0)
+                session = self.calls.get(call_uuid)
+                if session is not None and session.hangup_detected:
+                    hangup_ts = session.hangup_timestamp
                     detection_delay_ms = (current_time - hangup_ts) * 1000
                     logger.warning(
                         f"🚨 [{short_uuid}] HANGUP FLAG detected in Phase 3! "
@@ -2196,9 +2245,9 @@ class RobotFreeSWITCH:
                     break
 
                 # Legacy check (moins fiable)
-                if call_uuid not in self.active_calls:
+                if not self.calls.is_active(call_uuid):
                     logger.info(
-                        f"[{short_uuid}] Call removed from active_calls during Phase 3"
+                        f"[{short_uuid}] Call removed from registry during Phase 3"
                     )
                     break
 
@@ -2246,9 +2295,9 @@ class RobotFreeSWITCH:
 
                     while (time.time() - final_wait_start) < max_final_wait:
                         # HANGUP check even during FINAL wait!
-                        session = self.call_sessions.get(call_uuid, {})
-                        if session.get("hangup_detected", False):
-                            hangup_ts = session.get("hangup_timestamp", 0)
+                        session = self.calls.get(call_uuid)
+                        if session is not None and session.hangup_detected:
+                            hangup_ts = session.hangup_timestamp
                             detection_delay_ms = (time.time() - hangup_ts) * 1000
                             logger.warning(
                                 f"🚨 [{short_uuid}] HANGUP during FINAL wait! "
@@ -2323,8 +2372,9 @@ class RobotFreeSWITCH:
             self.clog.phase3_end(total_latency_ms, uuid=short_uuid)
 
             # Store end timestamp for gap calculation Phase 3→2
-            if call_uuid in self.call_sessions:
-                self.call_sessions[call_uuid]["phase3_end_timestamp"] = time.time()
+            session = self.calls.get(call_uuid)
+            if session is not None:
+                session.phase3_end_timestamp = time.time()
 
             return {
                 "transcription": detection_state["transcription"],
@@ -2456,7 +2506,7 @@ class RobotFreeSWITCH:
                 # ===================================================================
                 # PROACTIVE CHECK: Call still active?
                 # ===================================================================
-                if call_uuid not in self.active_calls:
+                if not self.calls.is_active(call_uuid):
                     logger.info(
                         f"[{short_uuid}] Call hung up during recording "
                         f"(elapsed: {elapsed:.1f}s), stopping immediately"
@@ -2544,7 +2594,7 @@ class RobotFreeSWITCH:
         call_uuid: str,
         scenario: Dict,
         step_name: str,
-        session: Dict,
+        session: CallSession,
         retry_count: int = 0,
         calibrate_noise: bool = False
     ) -> Dict[str, Any]:
@@ -2603,7 +2653,7 @@ class RobotFreeSWITCH:
         # par la valeur sauvegardée dans la session
         # FIX: Use .copy() to prevent mutation of original scenario dict
         intent_mapping = step_config.get("intent_mapping", {}).copy()
-        return_step = session.get("return_step")
+        return_step = session.return_step
 
         if return_step:
             # Remplacer {{return_step}} dans tous les mappings
@@ -2667,7 +2717,7 @@ class RobotFreeSWITCH:
         # ===================================================================
         # STEP 3: Analyze intent
         # ===================================================================
-        intent_result = self._analyze_intent(transcription, scenario, step_name)
+        intent_result = self._analyze_intent(transcription, scenario, step_name, call_uuid=call_uuid)
         intent = intent_result["intent"]
 
         logger.info(
@@ -2779,7 +2829,7 @@ class RobotFreeSWITCH:
                 logger.info(f"   → next_step = 'end'")
             else:
                 # Get default fallback from scenario metadata (or hardcoded "bye_failed")
-                default_silence_fallback = scenario.get("metadata", {}).get("fallbacks", {}).get("silence", "bye_failed")
+                default_silence_fallback = self.scenario_manager.get_fallback(scenario, "silence")
                 next_step = intent_mapping.get("silence", default_silence_fallback)
                 logger.info(f"   Fallback silence: {default_silence_fallback}")
                 logger.info(f"   → next_step = '{next_step}' (mapping 'silence')")
@@ -2791,7 +2841,7 @@ class RobotFreeSWITCH:
 
             # Get fallback from intent_mapping or scenario metadata
             # FIX: Utiliser clé "unknown" (pas "not_understood") pour matcher avec scénario fallbacks
-            default_not_understood = scenario.get("metadata", {}).get("fallbacks", {}).get("unknown", "bye_failed")
+            default_not_understood = self.scenario_manager.get_fallback(scenario, "unknown")
             next_step = intent_mapping.get("not_understood", default_not_understood)
             logger.info(f"   Fallback unknown (not_understood): {default_not_understood}")
             logger.info(f"   → next_step = '{next_step}'")
@@ -2814,7 +2864,7 @@ class RobotFreeSWITCH:
             if not next_step:
                 # No mapping -> try "unknown" fallback from metadata (or deny)
                 logger.warning(f"   ⚠️  Pas de mapping pour '{intent}'")
-                default_unknown_fallback = scenario.get("metadata", {}).get("fallbacks", {}).get("unknown", "bye_failed")
+                default_unknown_fallback = self.scenario_manager.get_fallback(scenario, "unknown")
                 next_step = intent_mapping.get("unknown", default_unknown_fallback)
                 logger.info(f"   Fallback unknown: {default_unknown_fallback}")
                 logger.info(f"   → next_step = '{next_step}'")
@@ -2842,11 +2892,11 @@ class RobotFreeSWITCH:
             elif intent == "deny":
                 qualification_delta = -weight
 
-            session["qualification_score"] = session.get("qualification_score", 0.0) + qualification_delta
+            session.qualification_score += qualification_delta
 
             logger.info(
                 f"[{short_uuid}] Qualification update: {qualification_delta:+.1f} "
-                f"(total: {session['qualification_score']:.1f})"
+                f"(total: {session.qualification_score:.1f})"
             )
 
         # ===================================================================
@@ -2859,7 +2909,7 @@ class RobotFreeSWITCH:
             # Cela permet de continuer le flow après retry ou incompréhension
             intended_next = intent_mapping.get("affirm")
             if intended_next:
-                session["return_step"] = intended_next
+                session.return_step = intended_next
                 logger.info(
                     f"[{short_uuid}] Saved return_step='{intended_next}' for {next_step}"
                 )
@@ -2867,7 +2917,7 @@ class RobotFreeSWITCH:
                 # Si pas de mapping affirm, sauvegarder le next step par défaut (wildcard)
                 default_next = intent_mapping.get("*")
                 if default_next and default_next not in ["{{return_step}}", "retry_silence", "retry_global"]:
-                    session["return_step"] = default_next
+                    session.return_step = default_next
                     logger.info(
                         f"[{short_uuid}] Saved return_step='{default_next}' (from wildcard) for {next_step}"
                     )
@@ -2877,8 +2927,7 @@ class RobotFreeSWITCH:
                     )
         else:
             # Effacer return_step si on n'est plus dans un retry
-            if "return_step" in session:
-                del session["return_step"]
+            session.return_step = None
 
         # ===================================================================
         # Summary
@@ -2954,8 +3003,8 @@ class RobotFreeSWITCH:
             f"MaxTurn: {max_turns}"
         )
 
-        # Get session from call_sessions
-        session = self.call_sessions.get(call_uuid, {})
+        # Get session from registry
+        session = self.calls.get(call_uuid)
         if not session:
             logger.error(f"[{short_uuid}] Session not found for call_uuid")
             return {
@@ -2999,7 +3048,7 @@ class RobotFreeSWITCH:
 
             if match_to_use:
                 # Utiliser le match déjà trouvé par _analyze_intent
-                objection_matcher = ObjectionMatcher.load_objections_for_theme(theme)
+                objection_matcher = self._get_objection_matcher(theme, call_uuid)
                 matched_id = match_to_use.get("matched_response_id", "")
 
                 objection_result = {
@@ -3017,14 +3066,16 @@ class RobotFreeSWITCH:
                     objection_result = self._find_objection_response(
                         current_objection,
                         theme=theme,
-                        min_score=config.OBJECTION_MIN_SCORE
+                        min_score=config.OBJECTION_MIN_SCORE,
+                        call_uuid=call_uuid
                     )
             else:
                 # Pas de match pré-calculé: rechercher normalement
                 objection_result = self._find_objection_response(
                     current_objection,
                     theme=theme,
-                    min_score=config.OBJECTION_MIN_SCORE
+                    min_score=config.OBJECTION_MIN_SCORE,
+                    call_uuid=call_uuid
                 )
 
             if not objection_result.get("found"):
@@ -3088,12 +3139,19 @@ class RobotFreeSWITCH:
                 logger.error(f"[{short_uuid}] Objection response has no audio file")
                 break
 
-            # Build full audio path for objection
-            audio_path = Path(config.FREESWITCH_SOUNDS_DIR) / theme / "objections" / audio_file
+            # Build full audio path for objection (manifest d'abord, sinon disque)
+            manifest = self.scenario_manager.get_audio_manifest(scenario)
+            if manifest and audio_file in manifest.objections:
+                audio_path = manifest.objection_path(audio_file)
+                if not audio_path:
+                    logger.error(f"[{short_uuid}] Objection audio not found: {audio_file} (manifest)")
+                    break
+            else:
+                audio_path = Path(config.FREESWITCH_SOUNDS_DIR) / theme / "objections" / audio_file
 
-            if not audio_path.exists():
-                logger.error(f"[{short_uuid}] Objection audio not found: {audio_path}")
-                break
+                if not audio_path.exists():
+                    logger.error(f"[{short_uuid}] Objection audio not found: {audio_path}")
+                    break
 
             # Play objection response (with barge-in)
             playing_result = self._execute_phase_2_auto(
@@ -3108,7 +3166,7 @@ class RobotFreeSWITCH:
             reaction = waiting_result.get("transcription", "").strip()
 
             # Analyze reaction intent
-            intent_result = self._analyze_intent(reaction, scenario, step_name)
+            intent_result = self._analyze_intent(reaction, scenario, step_name, call_uuid=call_uuid)
             intent = intent_result["intent"]
             last_intent = intent  # Track for final_intent return
 
@@ -3175,7 +3233,7 @@ class RobotFreeSWITCH:
 
     def _calculate_final_status(
         self,
-        session: Dict,
+        session: CallSession,
         scenario: Dict
     ) -> CallResult:
         """
@@ -3188,7 +3246,7 @@ class RobotFreeSWITCH:
         Returns:
             CallResult enum (LEADS, NOT_INTERESTED, NO_ANSWER)
         """
-        qualification_score = session.get("qualification_score", 0.0)
+        qualification_score = session.qualification_score
 
         # Define qualification threshold
         # For a typical scenario with 3-4 determinant questions:
@@ -3211,7 +3269,8 @@ class RobotFreeSWITCH:
         self,
         transcription: str,
         scenario: Optional[Dict] = None,
-        step_name: Optional[str] = None
+        step_name: Optional[str] = None,
+        call_uuid: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Analyze client intent using UNIFIED ObjectionMatcher system
@@ -3234,6 +3293,7 @@ class RobotFreeSWITCH:
             transcription: Client transcription
             scenario: Optional scenario context (for theme)
             step_name: Optional step name (unused, kept for compatibility)
+            call_uuid: Optional call UUID (objection matcher pinned for the call)
 
         Returns:
             {
@@ -3258,6 +3318,11 @@ class RobotFreeSWITCH:
 
         text_lower = transcription.lower().strip()
 
+        # Historique des transcriptions de l'appel
+        session = self.calls.get(call_uuid)
+        if session is not None:
+            session.add_transcript(transcription)
+
         # Get theme from scenario (fallback to "objections_general")
         theme = "objections_general"
         if scenario:
@@ -3265,20 +3330,23 @@ class RobotFreeSWITCH:
 
         # ===== SYSTEME UNIFIE: ObjectionMatcher pour TOUT =====
         # Intents (affirm, deny, insult) + Objections + FAQ tous dans objections_db
-        logger.info(f"")
-        logger.info(f"{'═'*60}")
-        logger.info(f"🎯 INTENT ANALYSIS - _analyze_intent()")
-        logger.info(f"{'═'*60}")
-        logger.info(f"📝 Transcription: '{transcription}'")
-        logger.info(f"📚 Theme: {theme}")
-        logger.info(f"{'─'*60}")
+        # Trace détaillée en DEBUG (args formatés seulement si le record est écrit)
+        trace = logger.isEnabledFor(logging.DEBUG)
+        if trace:
+            logger.debug(_RULE)
+            logger.debug("🎯 INTENT ANALYSIS - _analyze_intent()")
+            logger.debug("📝 Transcription: '%s'", transcription)
+            logger.debug("📚 Theme: %s", theme)
+            logger.debug(_THIN_RULE)
 
         if hasattr(self, 'objection_matcher_default') and self.objection_matcher_default:
-            objection_matcher = ObjectionMatcher.load_objections_for_theme(theme)
+            objection_matcher = self._get_objection_matcher(theme, call_uuid)
             if objection_matcher:
-                num_entries = len(objection_matcher.objections)
-                num_keywords = len(objection_matcher.keyword_lookup)
-                logger.info(f"✅ ObjectionMatcher chargé: {num_entries} entries, {num_keywords} keywords")
+                if trace:
+                    logger.debug(
+                        "✅ ObjectionMatcher chargé: %d entries, %d keywords",
+                        len(objection_matcher.objections), len(objection_matcher.keyword_lookup)
+                    )
 
                 match_result = objection_matcher.find_best_match(
                     text_lower,
@@ -3292,24 +3360,25 @@ class RobotFreeSWITCH:
                     matched_keyword = match_result.get('matched_keyword', '')
 
                     # Map entry_type to intent
-                    logger.info(f"{'─'*60}")
-                    logger.info(f"🔄 MAPPING entry_type → intent:")
                     if entry_type in ['affirm', 'deny', 'insult', 'time', 'unsure']:
                         intent = entry_type
-                        logger.info(f"   entry_type='{entry_type}' → intent='{intent}' (navigation directe)")
                     elif entry_type == 'faq':
                         intent = 'question'
-                        logger.info(f"   entry_type='faq' → intent='question' (FAQ)")
                     else:
                         intent = 'objection'
-                        logger.info(f"   entry_type='{entry_type}' → intent='objection' (réponse audio)")
+                    if trace:
+                        logger.debug("🔄 MAPPING entry_type='%s' → intent='%s'", entry_type, intent)
 
                     latency_ms = (time.time() - analyze_start) * 1000
 
                     # Log des alternatives si disponibles
                     alternatives = match_result.get("top_alternatives", [])
                     if alternatives:
-                        logger.info(f"   📋 Alternatives: {', '.join([f'{kw}({t}):{s:.2f}' for kw, s, t in alternatives])}")
+                        if trace:
+                            logger.debug(
+                                "   📋 Alternatives: %s",
+                                ', '.join(f'{kw}({t}):{s:.2f}' for kw, s, t in alternatives)
+                            )
 
                         # ⚠️ DETECT AMBIGUOUS MATCHES (multiple entries with same score)
                         ambiguous_matches = [
@@ -3341,15 +3410,10 @@ class RobotFreeSWITCH:
                                     f"Alternatives with same score: {', '.join([f'{kw}({t})' for kw, t in ambiguous_matches])}"
                                 )
 
-                    logger.info(f"{'─'*60}")
-                    logger.info(f"🏆 RÉSULTAT _analyze_intent:")
-                    logger.info(f"   Intent: {intent.upper()}")
-                    logger.info(f"   Confidence: {confidence:.2f}")
-                    logger.info(f"   Keyword: '{matched_keyword}' (len={len(matched_keyword)})")
-                    logger.info(f"   Entry type: {entry_type}")
-                    logger.info(f"   Latency: {latency_ms:.1f}ms")
-                    logger.info(f"{'═'*60}")
-                    logger.info(f"")
+                    logger.info(
+                        "🎯 Intent: %s (conf=%.2f, keyword='%s', entry_type=%s, theme=%s, %.1fms)",
+                        intent.upper(), confidence, matched_keyword, entry_type, theme, latency_ms
+                    )
 
                     return {
                         "intent": intent,
@@ -3363,16 +3427,10 @@ class RobotFreeSWITCH:
 
         # No match found -> not_understood
         latency_ms = (time.time() - analyze_start) * 1000
-        logger.info(f"{'─'*60}")
-        logger.info(f"❌ Aucun match trouvé dans ObjectionMatcher")
-        logger.info(f"{'─'*60}")
-        logger.info(f"🏆 RÉSULTAT _analyze_intent:")
-        logger.info(f"   Intent: NOT_UNDERSTOOD")
-        logger.info(f"   Confidence: 0.00")
-        logger.info(f"   Reason: no_match (score < min_score)")
-        logger.info(f"   Latency: {latency_ms:.1f}ms")
-        logger.info(f"{'═'*60}")
-        logger.info(f"")
+        logger.info(
+            "🎯 Intent: NOT_UNDERSTOOD (no_match, theme=%s, %.1fms) - '%s'",
+            theme, latency_ms, transcription
+        )
         return {
             "intent": "not_understood",
             "confidence": 0.0,
@@ -3381,11 +3439,33 @@ class RobotFreeSWITCH:
             "latency_ms": latency_ms
         }
 
+    def _get_objection_matcher(self, theme: str, call_uuid: Optional[str] = None) -> Optional[ObjectionMatcher]:
+        """
+        ObjectionMatcher for theme, pinned in the call session on first use.
+
+        A hot reload swaps objections in CacheManager for NEW calls only:
+        an in-flight call keeps the version it started matching with (and
+        no longer rebuilds a matcher from the cache on every turn).
+        """
+        session = self.calls.get(call_uuid)
+        if session is not None:
+            matcher = session.objection_matchers.get(theme)
+            if matcher:
+                return matcher
+
+        # Voix du scénario de l'appel: chemins et durées audio des objections
+        voice = (session.scenario or {}).get("voice", "julie") if session is not None else "julie"
+        matcher = ObjectionMatcher.load_objections_for_theme(theme, voice)
+        if matcher and session is not None:
+            session.objection_matchers[theme] = matcher
+        return matcher
+
     def _find_objection_response(
         self,
         objection_text: str,
         theme: str = "general",
-        min_score: float = 0.5
+        min_score: float = 0.5,
+        call_uuid: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Find best objection response using ObjectionMatcher
@@ -3394,6 +3474,7 @@ class RobotFreeSWITCH:
             objection_text: Client objection transcription
             theme: Objection theme (finance, immobilier, etc.)
             min_score: Minimum matching score (0.0-1.0)
+            call_uuid: Optional call UUID (objection matcher pinned for the call)
 
         Returns:
             {
@@ -3414,7 +3495,7 @@ class RobotFreeSWITCH:
 
         try:
             # Load ObjectionMatcher for theme
-            objection_matcher = ObjectionMatcher.load_objections_for_theme(theme)
+            objection_matcher = self._get_objection_matcher(theme, call_uuid)
 
             if not objection_matcher:
                 logger.warning(f"No ObjectionMatcher available for theme: {theme}")
@@ -3471,8 +3552,9 @@ class RobotFreeSWITCH:
         """
         Get audio duration in seconds from audio file (supports G.711, PCM, etc.)
 
-        Uses soundfile for robust format support (G.711 μ-law/ALAW, compressed formats),
-        falls back to wave module for simple PCM, and caches results for performance.
+        Looks up the persistent audio index (soundfile for G.711 μ-law/ALAW and
+        compressed formats, wave fallback for simple PCM, only re-probed when the
+        file changed), and caches results for performance.
 
         Args:
             audio_path: Path to audio file
@@ -3488,34 +3570,15 @@ class RobotFreeSWITCH:
         if cached_duration is not None:
             return cached_duration
 
-        duration = None
-
-        # Method 1: Try soundfile (handles G.711 μ-law/ALAW + 40+ formats)
-        try:
-            import soundfile as sf
-            info = sf.info(audio_path)
-            duration = info.duration
+        # Audio index: métadonnées persistées (soundfile, fallback wave si
+        # le fichier est nouveau ou a changé depuis l'indexation)
+        meta = get_audio_index().probe(audio_path)
+        duration = meta.duration if meta else None
+        if duration is not None:
             logger.debug(
-                f"Audio duration (soundfile): {audio_path} = {duration:.2f}s "
-                f"(format: {info.format}, subtype: {info.subtype}, {info.samplerate}Hz)"
+                f"Audio duration (index): {audio_path} = {duration:.2f}s "
+                f"(format: {meta.format}, subtype: {meta.subtype}, {meta.sample_rate}Hz)"
             )
-        except Exception as e:
-            logger.debug(f"soundfile failed for {audio_path}: {e}")
-
-        # Method 2: Fallback to wave module (simple PCM WAV only)
-        if duration is None:
-            try:
-                import wave
-                with wave.open(audio_path, 'rb') as wav:
-                    frames = wav.getnframes()
-                    rate = wav.getframerate()
-                    duration = frames / float(rate)
-                    logger.debug(
-                        f"Audio duration (wave): {audio_path} = {duration:.2f}s "
-                        f"({rate}Hz, {frames} frames)"
-                    )
-            except Exception as e:
-                logger.debug(f"wave module failed for {audio_path}: {e}")
 
         # Final fallback: 20.0s (increased from 10.0s to reduce Phase 3 overlap risk)
         if duration is None:
@@ -3547,6 +3610,16 @@ class RobotFreeSWITCH:
         Returns:
             Full path to audio file or None if not found
         """
+        # Manifest audio (résolu au chargement du scénario): aucun accès disque
+        if not audio_file:
+            manifest = self.scenario_manager.get_audio_manifest(scenario)
+            if manifest and step_name in manifest.steps:
+                audio_path = manifest.step_path(step_name)
+                if not audio_path:
+                    logger.error(f"Audio file not found for step: {step_name} (manifest)")
+                return audio_path
+
+        # Fallback: résolution disque (override audio_file ou step hors manifest)
         # Get step config
         step_config = self.scenario_manager.get_step_config(scenario, step_name)
 
@@ -3653,7 +3726,7 @@ class RobotFreeSWITCH:
         self.clog.phase1_start(uuid=short_uuid)
 
         # Recording file
-        record_file = f"/tmp/amd_{call_uuid}.wav"
+        record_file = self._call_temp_file(call_uuid, f"/tmp/amd_{call_uuid}.wav")
 
         try:
             # CRITICAL: Play short silence to "prime" the RTP stream
@@ -3720,7 +3793,7 @@ class RobotFreeSWITCH:
             self.clog.latency(record_latency, "Recording", uuid=short_uuid)
 
             # Step 2: Extract LEFT channel (client audio) from STEREO
-            mono_file = f"/tmp/amd_{call_uuid}_mono.wav"
+            mono_file = self._call_temp_file(call_uuid, f"/tmp/amd_{call_uuid}_mono.wav")
             logger.info(f"🎧 [{short_uuid}] Extracting client audio (left channel)...")
 
             # Use ffmpeg to extract left channel
@@ -3923,9 +3996,16 @@ class RobotFreeSWITCH:
                 "transcription": "",
                 "last_partial": "",  # Fallback si FINAL n'arrive pas
                 "final_received": False,
-                "speech_detected": False
+                "speech_detected": False,
+                "early_decision": None  # Décision anticipée (StreamingAMDDetector)
             }
 
+            # Détecteur incrémental: MACHINE dès "messagerie"/"répondeur",
+            # HUMAN sur salutation courte + silence → fin de phase anticipée
+            stream_detector = None
+            if config.AMD_EARLY_DECISION_ENABLED:
+                stream_detector = self.amd_service.create_stream_detector()
+
             def amd_callback(event_data):
                 """Callback pour récupérer transcription finale de Vosk"""
                 logger.info(f"🔔 [{short_uuid}] AMD CALLBACK TRIGGERED: {event_data}")
@@ -3940,16 +4020,23 @@ class RobotFreeSWITCH:
                         amd_state["final_received"] = True
                         # Afficher transcription AMD avec panel Rich visible
                         self.clog.transcription(text, uuid=short_uuid, latency_ms=0)
+                        if stream_detector and text:
+                            amd_state["early_decision"] = stream_detector.feed(text)
                     else:
                         # Store PARTIAL as fallback
                         partial_text = event_data.get("text", "").strip()
                         if partial_text:
                             amd_state["last_partial"] = partial_text
+                            if stream_detector:
+                                amd_state["early_decision"] = stream_detector.feed(partial_text)
                         logger.debug(f"📝 [{short_uuid}] AMD CALLBACK received PARTIAL: '{partial_text}'")
 
                 elif event == "speech_start":
                     amd_state["speech_detected"] = True
                     logger.info(f"🗣️ [{short_uuid}] AMD CALLBACK received SPEECH_START")
+                elif event == "speech_end":
+                    if stream_detector:
+                        amd_state["early_decision"] = stream_detector.on_speech_end()
                 else:
                     logger.debug(f"🔔 [{short_uuid}] AMD CALLBACK unknown event: {event}")
 
@@ -4002,12 +4089,20 @@ class RobotFreeSWITCH:
             amd_timeout = config.AMD_MAX_DURATION
             amd_hangup_detected = False
 
+            # Pré-classification signal (énergie/cadence/bip) sur le PCM brut,
+            # l'ASR ne sert alors qu'en cas UNSURE (AMD_SIGNAL_MODE=on); en
+            # shadow la décision est seulement loggée et comparée à l'ASR
+            signal_decision = None
+            signal_shadow = None
+            signal_pending = config.AMD_SIGNAL_MODE in ("shadow", "on")
+            last_signal_check = 0.0
+
             while (time.time() - record_start) < amd_timeout:
                 # ===== ULTRA-FAST HANGUP DETECTION pendant AMD =====
                 # Vérification 1: Flag session (setté par HANGUP handler)
-                session = self.call_sessions.get(call_uuid, {})
-                if session.get("hangup_detected", False):
-                    hangup_ts = session.get("hangup_timestamp", 0)
+                session = self.calls.get(call_uuid)
+                if session is not None and session.hangup_detected:
+                    hangup_ts = session.hangup_timestamp
                     detection_delay_ms = (time.time() - hangup_ts) * 1000
                     logger.warning(
                         f"🚨 [{short_uuid}] HANGUP FLAG detected during AMD! "
@@ -4024,14 +4119,47 @@ class RobotFreeSWITCH:
                     amd_hangup_detected = True
                     break
 
-                if call_uuid not in self.active_calls:
-                    logger.info(f"[{short_uuid}] Call removed from active_calls during AMD")
+                if not self.calls.is_active(call_uuid):
+                    logger.info(f"[{short_uuid}] Call removed from registry during AMD")
                     amd_hangup_detected = True
                     break
 
+                if signal_pending and (time.time() - last_signal_check) >= 0.2:
+                    last_signal_check = time.time()
+                    audio_head = self.streaming_asr.get_audio_head(call_uuid)
+                    head_s = len(audio_head) / (2 * self.streaming_asr.sample_rate)
+                    if head_s >= config.AMD_SIGNAL_MIN_WINDOW_S:
+                        signal_result = self.amd_service.classify_signal(
+                            audio_head, self.streaming_asr.sample_rate
+                        )
+                        if signal_result["result"] != "UNSURE":
+                            signal_pending = False
+                            if config.AMD_SIGNAL_MODE == "on":
+                                signal_decision = {
+                                    "result": signal_result["result"],
+                                    "confidence": signal_result["confidence"],
+                                    "keywords_matched": [],
+                                    "method": "signal",
+                                    "transcription": amd_state["transcription"] or amd_state["last_partial"]
+                                }
+                            else:
+                                signal_shadow = signal_result["result"]
+                            logger.info(
+                                f"📶 [{short_uuid}] AMD signal{' (shadow)' if signal_shadow else ''}: "
+                                f"{signal_result['result']} ({signal_result['reason']}, {head_s:.1f}s audio, "
+                                f"{signal_result['latency_ms']:.1f}ms)"
+                            )
+                        elif len(audio_head) >= self.streaming_asr.audio_head_bytes:
+                            signal_pending = False
+
+                # Décision anticipée → inutile d'écouter la fin de la fenêtre AMD
+                if amd_state["early_decision"] or signal_decision:
+                    break
+
                 time.sleep(0.02)  # Poll every 20ms
 
             record_latency = (time.time() - record_start) * 1000
+            early_decision = amd_state["early_decision"] or signal_decision
 
             # Si HANGUP détecté, on arrête tout de suite
             if amd_hangup_detected:
@@ -4057,14 +4185,14 @@ class RobotFreeSWITCH:
             max_wait = 1.5  # 1500ms max (cohérence avec Phase 2 et Phase 3)
             wait_start = time.time()
 
-            while (time.time() - wait_start) < max_wait:
+            while not early_decision and (time.time() - wait_start) < max_wait:
                 # HANGUP check même pendant l'attente FINAL!
-                session = self.call_sessions.get(call_uuid, {})
-                if session.get("hangup_detected", False):
+                session = self.calls.get(call_uuid)
+                if session is not None and session.hangup_detected:
                     logger.warning(f"🚨 [{short_uuid}] HANGUP during AMD FINAL wait!")
                     break
 
-                if call_uuid not in self.active_calls:
+                if not self.calls.is_active(call_uuid):
                     logger.info(f"[{short_uuid}] Call hung up during AMD FINAL wait")
                     break
 
@@ -4081,6 +4209,9 @@ class RobotFreeSWITCH:
 
             transcription = amd_state["transcription"]
 
+            if early_decision:
+                transcription = early_decision["transcription"]
+
             # Use PARTIAL as fallback if FINAL didn't arrive
             if not transcription and amd_state["last_partial"]:
                 transcription = amd_state["last_partial"]
@@ -4089,8 +4220,14 @@ class RobotFreeSWITCH:
             # Transcription - Colored log
             self.clog.transcription(transcription, uuid=short_uuid, latency_ms=transcribe_latency)
 
-            # Check for SILENCE
-            if not transcription or len(transcription) <= 2:
+            # Temps gagné vs fenêtre AMD complète (0 si pas de décision anticipée)
+            saved_s = (amd_timeout - record_latency / 1000) if early_decision else 0.0
+            mean_saved_ms = self.amd_service.record_stream_phase(
+                early_decision["result"] if early_decision else None, saved_s
+            )
+
+            # Check for SILENCE (décision signal possible sans transcription)
+            if not early_decision and (not transcription or len(transcription) <= 2):
                 logger.warning(f"⚠️ [{short_uuid}] AMD: SILENCE detected (no speech during {config.AMD_MAX_DURATION}s)")
                 total_latency = (time.time() - phase_start) * 1000
                 self.clog.success("AMD: NO_ANSWER detected (silence)", uuid=short_uuid)
@@ -4103,13 +4240,19 @@ class RobotFreeSWITCH:
                     "latency_ms": total_latency
                 }
 
-            # AMD Detection with keywords matching
+            # AMD Detection with keywords matching (déjà faite si décision anticipée)
             detection_start = time.time()
-            amd_result = self.amd_service.detect(transcription)
+            amd_result = early_decision or self.amd_service.detect(transcription)
             result_type = amd_result["result"]  # HUMAN/MACHINE/UNKNOWN
             confidence = amd_result["confidence"]
             detection_latency = (time.time() - detection_start) * 1000
 
+            if signal_shadow:
+                logger.info(
+                    f"📶 [{short_uuid}] AMD signal shadow: {signal_shadow} vs {result_type} "
+                    f"({'agree' if signal_shadow == result_type else 'DISAGREE'})"
+                )
+
             # TOTAL PHASE LATENCY
             total_latency = (time.time() - phase_start) * 1000
 
@@ -4119,6 +4262,11 @@ class RobotFreeSWITCH:
                 f"Rec={record_latency:.0f}ms | Wait={transcribe_latency:.0f}ms | "
                 f"Detect={detection_latency:.0f}ms | TOTAL={total_latency:.0f}ms"
             )
+            if early_decision:
+                logger.info(
+                    f"⚡ [{short_uuid}] AMD early {result_type} ({amd_result['method']}): saved {saved_s * 1000:.0f}ms "
+                    f"(mean saved/call: {mean_saved_ms:.0f}ms)"
+                )
 
             # PHASE 1 END - Colored log
             self.clog.success(
@@ -4128,8 +4276,9 @@ class RobotFreeSWITCH:
             self.clog.phase1_end(total_latency, uuid=short_uuid)
 
             # Store end timestamp for gap calculation
-            if call_uuid in self.call_sessions:
-                self.call_sessions[call_uuid]["phase1_end_timestamp"] = time.time()
+            session = self.calls.get(call_uuid)
+            if session is not None:
+                session.phase1_end_timestamp = time.time()
 
             return {
                 "result": result_type,
@@ -4192,7 +4341,7 @@ class RobotFreeSWITCH:
         self.clog.phase2_start(Path(audio_path).name, uuid=short_uuid)
 
         # Recording file (RAW format for real-time access)
-        record_file = f"/tmp/playing_{call_uuid}.raw"
+        record_file = self._call_temp_file(call_uuid, f"/tmp/playing_{call_uuid}.raw")
 
         # Shared state for VAD monitoring thread
         monitoring_state = {
@@ -4233,16 +4382,19 @@ class RobotFreeSWITCH:
 
             # Step 3: Monitor VAD for barge-in (if enabled)
             if enable_barge_in:
-                vad_thread = threading.Thread(
-                    target=self._monitor_vad_playing,
-                    args=(call_uuid, record_file, monitoring_state),
-                    daemon=True
+                vad_thread = self._start_call_worker(
+                    call_uuid, self._monitor_vad_playing, call_uuid, record_file, monitoring_state
                 )
-                vad_thread.start()
 
-                # Wait for barge-in or audio finish
+                # Wait for barge-in or audio finish (or hangup / monitor ended)
                 # Check every 100ms
+                audio_deadline = time.time() + self._get_audio_duration(audio_path)
                 while not monitoring_state["barged_in"] and not monitoring_state["audio_finished"]:
+                    if time.time() >= audio_deadline:
+                        monitoring_state["audio_finished"] = True
+                        break
+                    if not vad_thread.is_alive() or self.calls.is_hung_up(call_uuid):
+                        break
                     time.sleep(0.1)
 
                 # Stop monitoring
@@ -4278,8 +4430,9 @@ class RobotFreeSWITCH:
 
                         if noise_floor > 0:
                             # Sauver dans session pour réutilisation
-                            if call_uuid in self.call_sessions:
-                                self.call_sessions[call_uuid]["noise_floor_rms"] = noise_floor
+                            session = self.calls.get(call_uuid)
+                            if session is not None:
+                                session.noise_floor_rms = noise_floor
                                 logger.info(f"🎚️ [{short_uuid}] ✅ Noise floor saved (barge-in): {noise_floor:.0f}")
                             else:
                                 logger.warning(f"🎚️ [{short_uuid}] ⚠️  Session not found, cannot save noise floor")
@@ -4321,7 +4474,7 @@ class RobotFreeSWITCH:
                 time.sleep(0.05)  # Poll every 50ms
 
             # Step 4.5: Extract client audio (left channel) from STEREO recording
-            mono_file = record_file.replace(".raw", "_mono.wav")
+            mono_file = self._call_temp_file(call_uuid, record_file.replace(".raw", "_mono.wav"))
             logger.info(f"🎧 [{short_uuid}] Extracting client audio (left channel)...")
 
             import subprocess
@@ -4484,12 +4637,12 @@ class RobotFreeSWITCH:
 
         # Calculate gap Phase X→2 (from Phase 1 or Phase 3)
         gap_to_phase2 = 0
-        if call_uuid in self.call_sessions:
+        session = self.calls.get(call_uuid)
+        if session is not None:
             # Priorité Phase 3 (conversation loop) sinon Phase 1 (premier audio)
-            if "phase3_end_timestamp" in self.call_sessions[call_uuid]:
-                gap_to_phase2 = (phase_start - self.call_sessions[call_uuid]["phase3_end_timestamp"]) * 1000
-            elif "phase1_end_timestamp" in self.call_sessions[call_uuid]:
-                gap_to_phase2 = (phase_start - self.call_sessions[call_uuid]["phase1_end_timestamp"]) * 1000
+            previous_end = session.phase3_end_timestamp or session.phase1_end_timestamp
+            if previous_end is not None:
+                gap_to_phase2 = (phase_start - previous_end) * 1000
 
         # PHASE 2 START - Colored log
         self.clog.phase2_start(Path(audio_path).name, uuid=short_uuid)
@@ -4605,6 +4758,7 @@ class RobotFreeSWITCH:
             if not fork_result or "+OK" not in fork_result:
                 logger.error(f"❌ [{short_uuid}] Audio fork failed: {fork_result}")
                 # Fallback to WebRTC VAD
+                self.streaming_asr.unregister_callback(call_uuid, streaming_callback)
                 return self._execute_phase_playing(call_uuid, audio_path, enable_barge_in)
 
             fork_latency = (time.time() - fork_start) * 1000
@@ -4630,10 +4784,9 @@ class RobotFreeSWITCH:
             logger.debug(f"✅ [{short_uuid}] Stream initialized in {stream_init_latency:.0f}ms")
 
             # === ENERGY GATE: Appliquer noise floor calibré (si disponible) ===
-            if call_uuid in self.call_sessions:
-                saved_noise_floor = self.call_sessions[call_uuid].get("noise_floor_rms", 0)
-                if saved_noise_floor > 0:
-                    self.streaming_asr.set_noise_floor(call_uuid, saved_noise_floor)
+            session = self.calls.get(call_uuid)
+            if session is not None and session.noise_floor_rms > 0:
+                self.streaming_asr.set_noise_floor(call_uuid, session.noise_floor_rms)
 
             # === ENERGY GATE: Démarrer calibration si demandé ===
             if calibrate_noise:
@@ -4650,6 +4803,7 @@ class RobotFreeSWITCH:
                 logger.error(f"❌ [{short_uuid}] Playback failed: {playback_result}")
                 # Arrêter audio fork
                 self._execute_esl_command(f"uuid_audio_fork {call_uuid} stop")
+                self.streaming_asr.unregister_callback(call_uuid, streaming_callback)
                 return self._execute_phase_playing(call_uuid, audio_path, enable_barge_in)
 
             playback_latency = (time.time() - playback_start) * 1000
@@ -4683,9 +4837,9 @@ class RobotFreeSWITCH:
 
                 # ===== ULTRA-FAST HANGUP DETECTION (20ms polling) =====
                 # Vérification 1: Flag session (setté par HANGUP handler)
-                session = self.call_sessions.get(call_uuid, {})
-                if session.get("hangup_detected", False):
-                    hangup_ts = session.get("hangup_timestamp", 0)
+                session = self.calls.get(call_uuid)
+                if session is not None and session.hangup_detected:
+                    hangup_ts = session.hangup_timestamp
                     detection_delay_ms = (current_time - hangup_ts) * 1000
                     logger.warning(
                         f"🚨 [{short_uuid}] HANGUP FLAG detected in Phase 2! "
@@ -4701,9 +4855,9 @@ class RobotFreeSWITCH:
                     break
 
                 # Legacy check (moins fiable)
-                if call_uuid not in self.active_calls:
+                if not self.calls.is_active(call_uuid):
                     logger.info(
-                        f"[{short_uuid}] Call removed from active_calls during Phase 2"
+                        f"[{short_uuid}] Call removed from registry during Phase 2"
                     )
                     break
 
@@ -4736,8 +4890,9 @@ class RobotFreeSWITCH:
 
                         if noise_floor > 0:
                             # Sauver dans session pour réutilisation
-                            if call_uuid in self.call_sessions:
-                                self.call_sessions[call_uuid]["noise_floor_rms"] = noise_floor
+                            session = self.calls.get(call_uuid)
+                            if session is not None:
+                                session.noise_floor_rms = noise_floor
                                 logger.info(f"🎚️ [{short_uuid}] ✅ Noise floor saved (barge-in): {noise_floor:.0f}")
                             else:
                                 logger.warning(f"🎚️ [{short_uuid}] ⚠️  Session not found, cannot save noise floor")
@@ -4756,10 +4911,10 @@ class RobotFreeSWITCH:
 
                     # Attendre que le client finisse de parler
                     speech_end_wait_start = time.time()
-                    while not detection_state["speech_ended"] and call_uuid in self.active_calls:
+                    while not detection_state["speech_ended"] and self.calls.is_active(call_uuid):
                         # HANGUP check même pendant l'attente speech_end!
-                        session = self.call_sessions.get(call_uuid, {})
-                        if session.get("hangup_detected", False):
+                        session = self.calls.get(call_uuid)
+                        if session is not None and session.hangup_detected:
                             logger.warning(
                                 f"🚨 [{short_uuid}] HANGUP during speech_ended wait in Phase 2!"
                             )
@@ -4778,8 +4933,8 @@ class RobotFreeSWITCH:
 
                     while (time.time() - final_wait_start) < max_final_wait:
                         # HANGUP check même pendant l'attente FINAL!
-                        session = self.call_sessions.get(call_uuid, {})
-                        if session.get("hangup_detected", False):
+                        session = self.calls.get(call_uuid)
+                        if session is not None and session.hangup_detected:
                             logger.warning(
                                 f"🚨 [{short_uuid}] HANGUP during FINAL wait in Phase 2!"
                             )
@@ -4803,7 +4958,7 @@ class RobotFreeSWITCH:
                 time.sleep(0.02)
 
             # Fin du monitoring (timeout atteint ou barge-in/hangup)
-            if not detection_state["barged_in"] and call_uuid in self.active_calls:
+            if not detection_state["barged_in"] and self.calls.is_active(call_uuid):
                 detection_state["audio_finished"] = True
                 # Early exit optimization: monitoring stopped but audio still playing!
                 # Phase 3 will start while last second of audio continues in background
@@ -4821,9 +4976,10 @@ class RobotFreeSWITCH:
             # === ENERGY GATE: Arrêter calibration et calculer noise floor ===
             if calibrate_noise:
                 noise_floor = self.streaming_asr.stop_noise_calibration(call_uuid)
-                # Stocker dans call_sessions pour réutiliser dans les phases suivantes
-                if noise_floor > 0 and call_uuid in self.call_sessions:
-                    self.call_sessions[call_uuid]["noise_floor_rms"] = noise_floor
+                # Stocker dans la session pour réutiliser dans les phases suivantes
+                session = self.calls.get(call_uuid)
+                if noise_floor > 0 and session is not None:
+                    session.noise_floor_rms = noise_floor
                     logger.info(f"🎚️ [{short_uuid}] Noise floor saved to session: {noise_floor:.0f}")
 
             # CRITICAL: Attendre que WebSocket se ferme complètement (évite race condition)
@@ -4877,8 +5033,9 @@ class RobotFreeSWITCH:
             self.clog.phase2_end(phase_duration, uuid=short_uuid)
 
             # Store end timestamp for gap calculation
-            if call_uuid in self.call_sessions:
-                self.call_sessions[call_uuid]["phase2_end_timestamp"] = time.time()
+            session = self.calls.get(call_uuid)
+            if session is not None:
+                session.phase2_end_timestamp = time.time()
 
             return {
                 "barged_in": detection_state["barged_in"],
@@ -4973,7 +5130,9 @@ class RobotFreeSWITCH:
                 if last_snapshot_time is None or (current_time - last_snapshot_time) >= snapshot_interval:
                     if Path(record_file).exists():
                         # Create snapshot with .wav extension for ffmpeg output format detection
-                        snapshot_file = f"/tmp/snapshot_{call_uuid}_{int(current_time * 1000)}.wav"
+                        snapshot_file = self._call_temp_file(
+                            call_uuid, f"/tmp/snapshot_{call_uuid}_{int(current_time * 1000)}.wav"
+                        )
 
                         try:
                             # Extract client MONO audio from RAW recording (client-only stream)
@@ -5019,12 +5178,9 @@ class RobotFreeSWITCH:
                             )
 
                             # Launch background transcription thread
-                            bg_thread = threading.Thread(
-                                target=self._background_transcribe_snapshot,
-                                args=(snapshot_file, state),
-                                daemon=True
+                            bg_thread = self._start_call_worker(
+                                call_uuid, self._background_transcribe_snapshot, snapshot_file, state
                             )
-                            bg_thread.start()
 
                         except subprocess.TimeoutExpired:
                             logger.error(f"❌ [{short_uuid}] ffmpeg extraction timeout (>5s)")
@@ -5150,13 +5306,6 @@ class RobotFreeSWITCH:
                 f"'{transcription}' (snapshot: {snapshot_name})"
             )
 
-            # Cleanup snapshot
-            try:
-                Path(snapshot_file).unlink()
-                logger.debug(f"🗑️ Snapshot cleaned: {snapshot_name}")
-            except Exception as cleanup_error:
-                logger.debug(f"⚠️ Snapshot cleanup failed: {cleanup_error}")
-
         except Exception as e:
             transcribe_duration = time.time() - transcribe_start
             logger.error(
@@ -5165,6 +5314,14 @@ class RobotFreeSWITCH:
             )
             state["bg_ready"] = False
 
+        finally:
+            # Cleanup snapshot (succès ou échec)
+            try:
+                Path(snapshot_file).unlink()
+                logger.debug(f"🗑️ Snapshot cleaned: {snapshot_name}")
+            except Exception as cleanup_error:
+                logger.debug(f"⚠️ Snapshot cleanup failed: {cleanup_error}")
+
     def _execute_phase_waiting(
         self,
         call_uuid: str,
@@ -5200,7 +5357,7 @@ class RobotFreeSWITCH:
         self.clog.phase3_start(uuid=short_uuid)
 
         # Recording file
-        record_file = f"/tmp/waiting_{call_uuid}.wav"
+        record_file = self._call_temp_file(call_uuid, f"/tmp/waiting_{call_uuid}.wav")
 
         # Shared state for VAD monitoring
         monitoring_state = {
@@ -5223,15 +5380,14 @@ class RobotFreeSWITCH:
                 }
 
             # Step 2: Monitor VAD for end-of-speech
-            vad_thread = threading.Thread(
-                target=self._monitor_vad_waiting,
-                args=(call_uuid, record_file, timeout, monitoring_state),
-                daemon=True
+            vad_thread = self._start_call_worker(
+                call_uuid, self._monitor_vad_waiting, call_uuid, record_file, timeout, monitoring_state
             )
-            vad_thread.start()
 
-            # Wait for end-of-speech or timeout
+            # Wait for end-of-speech or timeout (or hangup / monitor ended)
             while not monitoring_state["end_of_speech"] and not monitoring_state["silence_timeout"]:
+                if not vad_thread.is_alive() or self.calls.is_hung_up(call_uuid):
+                    break
                 time.sleep(0.1)
 
             # Stop monitoring
@@ -5409,18 +5565,15 @@ class RobotFreeSWITCH:
                         )
 
                         # Create snapshot
-                        snapshot_file = f"{record_file}.snapshot"
+                        snapshot_file = self._call_temp_file(call_uuid, f"{record_file}.snapshot")
                         try:
                             import shutil
                             shutil.copy2(record_file, snapshot_file)
 
                             # Launch background thread
-                            bg_thread = threading.Thread(
-                                target=self._background_transcribe_snapshot,
-                                args=(snapshot_file, state),
-                                daemon=True
+                            bg_thread = self._start_call_worker(
+                                call_uuid, self._background_transcribe_snapshot, snapshot_file, state
                             )
-                            bg_thread.start()
                         except Exception as e:
                             logger.error(f"❌ [{short_uuid}] Snapshot error: {e}")
 
@@ -5645,11 +5798,11 @@ class RobotFreeSWITCH:
             # This flag is checked by _handle_channel_hangup() to distinguish
             # robot hangup vs client hangup (for NOT_INTERESTED detection)
 
-            if call_uuid not in self.call_sessions:
-                self.call_sessions[call_uuid] = {}
-
-            self.call_sessions[call_uuid]["robot_hangup"] = True
-            self.call_sessions[call_uuid]["final_status"] = status
+            # Pas de open(): une session déjà fermée (hangup reçu) ne doit pas renaître
+            session = self.calls.get(call_uuid)
+            if session is not None:
+                session.robot_hangup = True
+                session.final_status = status
 
             logger.debug(
                 f"[{short_uuid}] Marked robot_hangup=True, "
@@ -5878,7 +6031,7 @@ class RobotFreeSWITCH:
     # ACTIONS FRAMEWORK (Email, Webhook, Transfer, etc.)
     # ========================================================================
 
-    def _execute_step_actions(self, call_uuid: str, step_config: Dict, session: Dict):
+    def _execute_step_actions(self, call_uuid: str, step_config: Dict, session: CallSession):
         """
         Execute configured actions for a step (email, webhook, transfer, etc.)
 
@@ -5923,7 +6076,7 @@ class RobotFreeSWITCH:
             except Exception as e:
                 logger.error(f"❌ [{short_uuid}] Action {i+1} failed ({action_type}): {e}")
 
-    def _action_send_email(self, call_uuid: str, config: Dict, session: Dict):
+    def _action_send_email(self, call_uuid: str, config: Dict, session: CallSession):
         """Send email via API (placeholder for future implementation)"""
         short_uuid = call_uuid[:8]
         logger.info(f"📧 [{short_uuid}] EMAIL action triggered")
@@ -5932,7 +6085,7 @@ class RobotFreeSWITCH:
         # TODO: Implement API call to email service
         # requests.post(config["api_endpoint"], json={...})
 
-    def _action_webhook(self, call_uuid: str, config: Dict, session: Dict):
+    def _action_webhook(self, call_uuid: str, config: Dict, session: CallSession):
         """Call webhook API (placeholder for future implementation)"""
         short_uuid = call_uuid[:8]
         logger.info(f"🔗 [{short_uuid}] WEBHOOK action triggered")
@@ -5940,7 +6093,7 @@ class RobotFreeSWITCH:
         # TODO: Implement webhook call
         # requests.post(config["url"], json=session)
 
-    def _action_transfer(self, call_uuid: str, config: Dict, session: Dict):
+    def _action_transfer(self, call_uuid: str, config: Dict, session: CallSession):
         """
         Transfer call to another destination (SIP URI, extension, etc.)
 
@@ -5992,7 +6145,7 @@ class RobotFreeSWITCH:
             logger.error(f"❌ [{short_uuid}] Transfer error: {e}")
             return False
 
-    def _action_update_crm(self, call_uuid: str, config: Dict, session: Dict):
+    def _action_update_crm(self, call_uuid: str, config: Dict, session: CallSession):
         """Update CRM via API (placeholder for future implementation)"""
         short_uuid = call_uuid[:8]
         logger.info(f"💼 [{short_uuid}] CRM UPDATE action triggered")
@@ -6021,7 +6174,7 @@ if __name__ == "__main__":
         print("\n" + "=" * 80)
         print("ROBOT INITIALIZED SUCCESSFULLY")
         print("=" * 80)
-        print(f"Active calls: {len(robot.active_calls)}")
+        print(f"Active calls: {len(robot.calls)}")
         print(f"STT service: {'OK' if robot.stt_service else 'FAIL'}")
         print(f"AMD service: {'OK' if robot.amd_service else 'FAIL'}")
         print(f"VAD service: {'OK' if robot.vad else 'FAIL'}")
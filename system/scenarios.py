@@ -89,18 +89,175 @@ Utilisation:
 
     # Exécuter scénario
     result = manager.execute_scenario(scenario, call_uuid, contact_data)
+
+Scénario compilé:
+    load_scenario() retourne un CompiledScenario (Mapping en lecture seule,
+    s'utilise comme le dict JSON: scenario["steps"], scenario.get("metadata")).
+    Les méthodes du manager (get_step_config, get_next_step, get_theme_file,
+    get_max_autonomous_turns, ...) y font des lookups O(1) dans des tables
+    précalculées au chargement au lieu de re-parcourir le JSON à chaque tour.
 """
 
 import logging
 import json
-from typing import Dict, Any, Optional, List
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from system.config import config
 from system.cache_manager import get_cache  # Phase 8
+from system.audio_manifest import AudioManifest, build_manifest, is_stale
 
 logger = logging.getLogger(__name__)
 
+# Noms d'étapes terminales historiques (avant le champ is_terminal)
+LEGACY_TERMINAL_STEPS = ("bye", "bye_failed", "end")
+
+DEFAULT_MAX_AUTONOMOUS_TURNS = 2
+
+
+class CompiledScenario(Mapping):
+    """
+    Scénario validé et compilé (immutable).
+
+    Se comporte comme le dict JSON d'origine (lecture seule) et expose des
+    tables précalculées indexées par ID d'étape (int):
+    - step_ids / step_names: nom ↔ ID (lookup insensible à la casse inclus)
+    - transitions[step_id][intent_id]: prochaine étape ("*" déjà résolu)
+    - rail / rail_next: rail et étape suivante du rail
+    - theme_file, step_voices, max_turns, determinant, weights, terminal
+
+    Construit par ScenarioManager.load_scenario() après _validate_scenario().
+    """
+
+    __slots__ = (
+        "name", "_raw", "step_names", "step_ids", "_step_ids_lower",
+        "step_configs", "intent_ids", "transitions", "wildcards", "rail",
+        "rail_next", "theme_file", "step_voices", "max_turns", "determinant",
+        "weights", "terminal", "fallbacks", "start_step",
+    )
+
+    def __init__(self, name: str, scenario: Dict[str, Any]):
+        set_attr = object.__setattr__
+        steps = scenario["steps"]
+
+        set_attr(self, "name", name)
+        set_attr(self, "_raw", scenario)
+
+        # Étapes → IDs
+        step_names = tuple(steps.keys())
+        step_ids = {step: i for i, step in enumerate(step_names)}
+        step_ids_lower: Dict[str, int] = {}
+        for step, step_id in step_ids.items():
+            step_ids_lower.setdefault(step.lower(), step_id)
+        set_attr(self, "step_names", step_names)
+        set_attr(self, "step_ids", MappingProxyType(step_ids))
+        set_attr(self, "_step_ids_lower", MappingProxyType(step_ids_lower))
+        set_attr(self, "step_configs", tuple(steps.values()))
+
+        # Intents → IDs, table dense intent → prochaine étape
+        intent_ids: Dict[str, int] = {}
+        for step_config in steps.values():
+            for intent in step_config.get("intent_mapping", {}):
+                if intent != "*":
+                    intent_ids.setdefault(intent, len(intent_ids))
+
+        transitions: List[Tuple[Optional[str], ...]] = []
+        wildcards: List[Optional[str]] = []
+        for step_config in steps.values():
+            intent_mapping = step_config.get("intent_mapping", {})
+            wildcard = intent_mapping.get("*")
+            row = [wildcard] * len(intent_ids)
+            for intent, target in intent_mapping.items():
+                if intent != "*":
+                    row[intent_ids[intent]] = target
+            transitions.append(tuple(row))
+            wildcards.append(wildcard)
+        set_attr(self, "intent_ids", MappingProxyType(intent_ids))
+        set_attr(self, "transitions", tuple(transitions))
+        set_attr(self, "wildcards", tuple(wildcards))
+
+        # Rail
+        rail = tuple(scenario.get("rail", []))
+        rail_next: Dict[str, Optional[str]] = {}
+        for i, step in enumerate(rail):
+            rail_next.setdefault(step, rail[i + 1] if i + 1 < len(rail) else None)
+        set_attr(self, "rail", rail)
+        set_attr(self, "rail_next", MappingProxyType(rail_next))
+
+        # Valeurs pré-résolues
+        set_attr(self, "theme_file", ScenarioManager._resolve_theme_file(scenario))
+        set_attr(self, "step_voices", tuple(
+            scenario.get("voice", step_config.get("voice", "julie")) for step_config in steps.values()
+        ))
+        set_attr(self, "max_turns", tuple(
+            step_config.get("max_autonomous_turns", DEFAULT_MAX_AUTONOMOUS_TURNS) for step_config in steps.values()
+        ))
+        set_attr(self, "determinant", tuple(
+            step_config.get("is_determinant", False) for step_config in steps.values()
+        ))
+        set_attr(self, "weights", tuple(
+            float(step_config.get("qualification_weight", 0)) for step_config in steps.values()
+        ))
+        set_attr(self, "terminal", tuple(
+            step_config.get("is_terminal", False)
+            or step.lower() in LEGACY_TERMINAL_STEPS
+            or step.lower().startswith("bye_")
+            for step, step_config in steps.items()
+        ))
+        set_attr(self, "fallbacks", MappingProxyType(dict(scenario.get("metadata", {}).get("fallbacks", {}))))
+
+        # Étape de départ: rail[0], sinon "hello", "intro" ou première étape
+        if rail:
+            start_step = rail[0]
+        elif "hello" in steps:
+            start_step = "hello"
+        elif "intro" in steps:
+            start_step = "intro"
+        else:
+            start_step = step_names[0]
+        set_attr(self, "start_step", start_step)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("CompiledScenario is immutable")
+
+    def __getitem__(self, key):
+        return self._raw[key]
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return f"CompiledScenario({self.name!r}, steps={len(self.step_names)}, intents={len(self.intent_ids)})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copie dict du JSON d'origine (sérialisation, édition)."""
+        return json.loads(json.dumps(self._raw))
+
+    def step_id(self, step_name: str) -> Optional[int]:
+        """ID d'une étape (exact puis insensible à la casse), None si inconnue."""
+        step_id = self.step_ids.get(step_name)
+        if step_id is None:
+            step_id = self._step_ids_lower.get(step_name.lower())
+        return step_id
+
+    def next_step(self, step_id: int, intent: str) -> Optional[str]:
+        """Prochaine étape pour (étape, intent), wildcard "*" inclus."""
+        intent_id = self.intent_ids.get(intent)
+        if intent_id is None:
+            return self.wildcards[step_id]
+        return self.transitions[step_id][intent_id]
+
+    def fallback(self, intent: str, default: str = "bye_failed") -> str:
+        """Fallback global metadata.fallbacks[intent]."""
+        return self.fallbacks.get(intent, default)
+
+
 class ScenarioManager:
     """Gestionnaire de scénarios conversationnels."""
 
@@ -113,6 +270,12 @@ class ScenarioManager:
         # Phase 8: Utiliser CacheManager global au lieu de cache local
         self.cache = get_cache()
 
+        # Manifests audio par scénario: {scenario_name: (scenario, AudioManifest)}
+        self._audio_manifests: Dict[str, Tuple[Dict, AudioManifest]] = {}
+        # Génération précédente (hot reload): appels en cours sur l'ancien snapshot
+        self._previous_manifests: Dict[str, Tuple[Dict, AudioManifest]] = {}
+        self._manifest_lock = threading.Lock()
+
         logger.info("✅ ScenarioManager initialized (using CacheManager)")
 
     def load_scenario(self, scenario_name: str) -> Optional[Dict[str, Any]]:
@@ -127,13 +290,51 @@ class ScenarioManager:
         Returns:
             Dict avec définition scénario ou None si erreur
         """
-        # Phase 8: Check CacheManager global
-        cached_scenario = self.cache.get_scenario(scenario_name)
-        if cached_scenario:
-            logger.debug(f"Scenario '{scenario_name}' loaded from CacheManager (hit)")
-            return cached_scenario
+        # Phase 8: CacheManager global, chargement single-flight sur miss
+        # (N appels simultanés sur un scénario froid → 1 seule lecture/compilation)
+        return self.cache.get_or_load_scenario(scenario_name, self._load_from_disk)
+
+    def _load_from_disk(self, scenario_name: str) -> Optional[CompiledScenario]:
+        """Loader du cache: compile le scénario et résout ses audios (None si erreur)."""
+        scenario = self._compile_from_disk(scenario_name)
+        if scenario is None:
+            return None
+
+        # Résoudre tous les audios une fois (aucun stat disque pendant les appels)
+        self.get_audio_manifest(scenario, new_version=True)
+
+        logger.info(f"✅ Scenario '{scenario_name}' loaded successfully ({scenario!r})")
+        return scenario
+
+    def reload_scenario(self, scenario_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Recharge un scénario modifié sur disque (hot reload).
+
+        Lecture, validation, compilation et manifest audio sont faits AVANT le
+        swap dans le CacheManager: les nouveaux appels obtiennent directement la
+        nouvelle version (aucun chargement à froid), les appels en cours gardent
+        leur snapshot (CompiledScenario immuable référencé par la session).
+        Si le fichier est invalide, l'ancienne version reste en place.
+
+        Args:
+            scenario_name: Nom du scénario (sans .json)
+
+        Returns:
+            Nouveau scénario compilé ou None si erreur (ancienne version conservée)
+        """
+        scenario = self._compile_from_disk(scenario_name)
+        if scenario is None:
+            logger.warning(f"⚠️ Hot reload '{scenario_name}' skipped, keeping current version")
+            return None
+
+        self.get_audio_manifest(scenario, new_version=True)
+        self.cache.set_scenario(scenario_name, scenario)
+
+        logger.info(f"🔄 Scenario '{scenario_name}' reloaded ({scenario!r})")
+        return scenario
 
-        # Charger depuis fichier
+    def _compile_from_disk(self, scenario_name: str) -> Optional[CompiledScenario]:
+        """Lit, valide et compile scenarios/{scenario_name}.json (None si erreur)."""
         scenario_path = self.scenarios_dir / f"{scenario_name}.json"
 
         if not scenario_path.exists():
@@ -149,11 +350,8 @@ class ScenarioManager:
                 logger.error(f"Invalid scenario structure: {scenario_name}")
                 return None
 
-            # Phase 8: Mettre en cache via CacheManager
-            self.cache.set_scenario(scenario_name, scenario)
-
-            logger.info(f"✅ Scenario '{scenario_name}' loaded successfully")
-            return scenario
+            # Compiler une fois (tables de routage O(1) pour les tours d'appel)
+            return CompiledScenario(scenario_name, scenario)
 
         except Exception as e:
             logger.error(f"❌ Failed to load scenario '{scenario_name}': {e}")
@@ -352,6 +550,10 @@ class ScenarioManager:
         Returns:
             Dict config de l'étape ou None
         """
+        if isinstance(scenario, CompiledScenario):
+            step_id = scenario.step_id(step_name)
+            return scenario.step_configs[step_id] if step_id is not None else None
+
         if "steps" not in scenario:
             return None
 
@@ -386,6 +588,15 @@ class ScenarioManager:
         Returns:
             Nom de la prochaine étape ou None si fin
         """
+        if isinstance(scenario, CompiledScenario):
+            step_id = scenario.step_id(current_step)
+            if step_id is None or "intent_mapping" not in scenario.step_configs[step_id]:
+                return None
+            next_step = scenario.next_step(step_id, intent)
+            if next_step is None:
+                logger.warning(f"No intent mapping found for '{intent}' in step '{current_step}'")
+            return next_step
+
         step_config = self.get_step_config(scenario, current_step)
 
         if not step_config or "intent_mapping" not in step_config:
@@ -405,6 +616,88 @@ class ScenarioManager:
         logger.warning(f"No intent mapping found for '{intent}' in step '{current_step}'")
         return None
 
+    def get_audio_manifest(
+        self,
+        scenario: Dict,
+        refresh: bool = False,
+        rebuild: bool = False,
+        new_version: bool = False
+    ) -> Optional[AudioManifest]:
+        """
+        Manifest audio du scénario (chemins, variantes retry, objections, durées).
+
+        Construit au premier appel puis réutilisé; reconstruit si un
+        répertoire audio a changé (mtime) ou si les fichiers audio des
+        objections ont changé. Le manifest de la version précédente est
+        conservé pour les appels en cours après un hot reload: chaque
+        génération est reconstruite dans son propre emplacement, une
+        reconstruction de l'ancienne ne déplace jamais la nouvelle.
+
+        Args:
+            scenario: Scénario chargé
+            refresh: Forcer la vérification des mtime
+            rebuild: Revérifier aussi les objections (ex: objections rechargées)
+            new_version: Scénario tout juste compilé (chargement, hot reload):
+                         devient la génération courante
+
+        Returns:
+            AudioManifest ou None si erreur
+        """
+        name = getattr(scenario, "name", None) or scenario.get("name") or scenario.get("metadata", {}).get("name", "unknown")
+
+        with self._manifest_lock:
+            for slots in (self._audio_manifests, self._previous_manifests):
+                owner, manifest = slots.get(name, (None, None))
+                if owner is scenario:
+                    break
+            else:
+                slots = manifest = None
+
+        try:
+            theme_file = self.get_theme_file(scenario)
+            if manifest and not is_stale(manifest, force=refresh or rebuild):
+                if not rebuild:
+                    return manifest
+                objection_files = self._objection_audio_files(theme_file, scenario.get("voice", "julie"))
+                if list(dict.fromkeys(f for f in objection_files if f)) == list(manifest.objections):
+                    return manifest  # Mêmes fichiers, mêmes répertoires: rien à reconstruire
+            else:
+                objection_files = self._objection_audio_files(theme_file, scenario.get("voice", "julie"))
+
+            if manifest:
+                logger.info(f"🔄 Audio manifest '{name}' outdated, rebuilding...")
+            manifest = build_manifest(scenario, theme_file, objection_files)
+        except Exception as e:
+            logger.error(f"❌ Failed to build audio manifest for '{name}': {e}")
+            return None
+
+        with self._manifest_lock:
+            if slots is not None:
+                # Génération connue: remplacée sur place (si toujours présente)
+                if slots.get(name, (None, None))[0] is scenario:
+                    slots[name] = (scenario, manifest)
+            elif new_version or name not in self._audio_manifests:
+                current = self._audio_manifests.get(name)
+                if current and current[0] is not scenario:
+                    self._previous_manifests[name] = current
+                self._audio_manifests[name] = (scenario, manifest)
+            # Sinon: génération plus ancienne que les deux gardées, non mise en cache
+        return manifest
+
+    @staticmethod
+    def _objection_audio_files(theme_file: str, voice: str = "julie") -> List[str]:
+        """audio_path des objections du theme_file (via ObjectionMatcher/cache)."""
+        try:
+            from system.objection_matcher import ObjectionMatcher
+            matcher = ObjectionMatcher.load_objections_for_theme(theme_file, voice)
+        except Exception as e:
+            logger.warning(f"⚠️ Objections '{theme_file}' unavailable for audio manifest: {e}")
+            return []
+
+        if not matcher:
+            return []
+        return [path for path in matcher.audio_paths.values() if path]
+
     def replace_variables(self, text: str, variables: Dict[str, Any]) -> str:
         """
         Remplace les variables dans un texte.
@@ -479,6 +772,9 @@ class ScenarioManager:
         Returns:
             Nom de la prochaine étape du rail ou None si fin
         """
+        if isinstance(scenario, CompiledScenario):
+            return scenario.rail_next.get(current_step)
+
         rail = self.get_rail(scenario)
 
         if not rail or current_step not in rail:
@@ -526,6 +822,14 @@ class ScenarioManager:
             >>> print(theme_file)
             objections_finance
         """
+        if isinstance(scenario, CompiledScenario):
+            return scenario.theme_file
+
+        return self._resolve_theme_file(scenario)
+
+    @staticmethod
+    def _resolve_theme_file(scenario: Dict) -> str:
+        """Résout theme_file depuis le JSON brut (voir get_theme_file)."""
         # Essayer d'abord "metadata.theme_file" (nouveau système v3.0)
         if "metadata" in scenario and "theme_file" in scenario["metadata"]:
             return scenario["metadata"]["theme_file"]
@@ -556,12 +860,16 @@ class ScenarioManager:
         Returns:
             Max turns (défaut: 2)
         """
+        if isinstance(scenario, CompiledScenario):
+            step_id = scenario.step_id(step_name)
+            return scenario.max_turns[step_id] if step_id is not None else DEFAULT_MAX_AUTONOMOUS_TURNS
+
         step_config = self.get_step_config(scenario, step_name)
 
         if not step_config:
-            return 2
+            return DEFAULT_MAX_AUTONOMOUS_TURNS
 
-        return step_config.get("max_autonomous_turns", 2)
+        return step_config.get("max_autonomous_turns", DEFAULT_MAX_AUTONOMOUS_TURNS)
 
     def is_determinant_step(self, scenario: Dict, step_name: str) -> bool:
         """
@@ -574,6 +882,10 @@ class ScenarioManager:
         Returns:
             True si étape déterminante
         """
+        if isinstance(scenario, CompiledScenario):
+            step_id = scenario.step_id(step_name)
+            return scenario.determinant[step_id] if step_id is not None else False
+
         step_config = self.get_step_config(scenario, step_name)
 
         if not step_config:
@@ -592,6 +904,10 @@ class ScenarioManager:
         Returns:
             Poids (défaut: 0)
         """
+        if isinstance(scenario, CompiledScenario):
+            step_id = scenario.step_id(step_name)
+            return scenario.weights[step_id] if step_id is not None else 0.0
+
         step_config = self.get_step_config(scenario, step_name)
 
         if not step_config:
@@ -599,6 +915,65 @@ class ScenarioManager:
 
         return float(step_config.get("qualification_weight", 0))
 
+    def is_terminal_step(self, scenario: Dict, step_name: str) -> bool:
+        """
+        Vérifie si une étape termine l'appel (is_terminal ou noms bye/bye_*/end)
+
+        Args:
+            scenario: Scénario chargé
+            step_name: Nom de l'étape
+
+        Returns:
+            True si étape terminale
+        """
+        if isinstance(scenario, CompiledScenario):
+            step_id = scenario.step_ids.get(step_name)
+            if step_id is not None:
+                return scenario.terminal[step_id]
+
+        step_config = scenario.get("steps", {}).get(step_name, {})
+        return (
+            step_config.get("is_terminal", False)
+            or step_name.lower() in LEGACY_TERMINAL_STEPS
+            or step_name.lower().startswith("bye_")
+        )
+
+    def get_fallback(self, scenario: Dict, intent: str, default: str = "bye_failed") -> str:
+        """
+        Récupère le fallback global d'un intent (metadata.fallbacks)
+
+        Args:
+            scenario: Scénario chargé
+            intent: "silence", "unknown", ...
+            default: Valeur si non définie
+
+        Returns:
+            Nom de l'étape de fallback
+        """
+        if isinstance(scenario, CompiledScenario):
+            return scenario.fallback(intent, default)
+
+        return scenario.get("metadata", {}).get("fallbacks", {}).get(intent, default)
+
+    def get_step_voice(self, scenario: Dict, step_name: str) -> str:
+        """
+        Voix d'une étape (voice du scénario, sinon de l'étape, sinon "julie")
+
+        Args:
+            scenario: Scénario chargé
+            step_name: Nom de l'étape
+
+        Returns:
+            Nom de la voix
+        """
+        if isinstance(scenario, CompiledScenario):
+            step_id = scenario.step_id(step_name)
+            if step_id is not None:
+                return scenario.step_voices[step_id]
+
+        step_config = self.get_step_config(scenario, step_name) or {}
+        return scenario.get("voice", step_config.get("voice", "julie"))
+
     def calculate_lead_score(
         self,
         scenario: Dict,
@@ -12,14 +12,36 @@ Note: Intent detection est intégré dans robot_freeswitch.py (via INTENT_KEYWOR
 
 __version__ = "3.0.0"
 
-# Exports
-from system.services.faster_whisper_stt import FasterWhisperSTT
-from system.services.amd_service import AMDService
-from system.services.vosk_asr import VoskASR, create_vosk_service
+import importlib
+
+# Exports lazy (PEP 562): importer le package ne charge aucun service
+# (numpy, faster_whisper, ESL...), seulement le nom demandé au premier accès
+_LAZY_EXPORTS = {
+    "FasterWhisperSTT": "system.services.faster_whisper_stt",
+    "AMDService": "system.services.amd_service",
+    "get_amd_service": "system.services.amd_service",
+    "VoskASR": "system.services.vosk_asr",
+    "create_vosk_service": "system.services.vosk_asr",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Accès suivants sans passer par __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "FasterWhisperSTT",
     "AMDService",
+    "get_amd_service",
     "VoskASR",
     "create_vosk_service"
 ]
@@ -5,17 +5,207 @@ AMD Service - MiniBotPanel v3
 Answering Machine Detection via Keywords Matching
 Fast and reliable detection HUMAN vs MACHINE
 Target latency: 10-30ms
+
+Streaming mode (early decision):
+    detector = amd_service.create_stream_detector()
+    detector.feed(partial_text)          # each Vosk PARTIAL/FINAL
+    detector.on_speech_end()             # VAD speech_end event
+    if detector.decision: ...            # stop recording early
+
+Signal pre-classifier (before any transcript):
+    amd_service.classify_signal(pcm_head)  # first 1-3s of client PCM
+    # -> HUMAN / MACHINE / UNSURE (ASR only needed for UNSURE)
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
 from difflib import SequenceMatcher
+
+import numpy as np
 from unidecode import unidecode
 from system.config import config
 
 logger = logging.getLogger(__name__)
 
 
+# Signal analysis (20ms frames, 50Hz FFT bins at 16kHz)
+SIGNAL_FRAME_MS = 20
+SIGNAL_SNR_DB = 12.0          # speech = energy > noise floor + 12dB
+SIGNAL_PEAK_DB = 15.0         # ... or > loudest frames - 15dB (continuous speech)
+SIGNAL_MIN_SPEECH_DB = -45.0  # absolute floor (dBFS)
+SIGNAL_GAP_FILL_FRAMES = 3    # gaps <= 60ms merged into one speech run
+SIGNAL_MIN_RUN_FRAMES = 3     # runs < 60ms ignored (clicks)
+BEEP_MIN_HZ = 300.0
+BEEP_MAX_HZ = 3000.0
+BEEP_PEAK_RATIO = 0.75        # energy share of peak +/- 1 bin
+BEEP_MIN_S = 0.12
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """Contiguous True runs of a boolean mask as (start, end) frame indexes"""
+    if not mask.any():
+        return []
+    padded = np.concatenate(([False], mask, [False])).astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+
+def extract_signal_features(
+    pcm: Union[bytes, bytearray, np.ndarray],
+    sample_rate: int = 16000
+) -> Dict[str, float]:
+    """
+    Energy / cadence / tone features on the first seconds of client audio
+
+    Args:
+        pcm: SLIN16 bytes (mono int16) or numpy array (int16 or float -1..1)
+        sample_rate: Sample rate (Hz)
+
+    Returns:
+        {
+            "duration_s", "speech_s", "speech_ratio", "runs",
+            "longest_run_s", "leading_silence_s", "trailing_silence_s",
+            "noise_db", "beep_s", "beep_hz"
+        }
+    """
+    if isinstance(pcm, (bytes, bytearray, memoryview)):
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+    else:
+        samples = np.asarray(pcm)
+        if samples.dtype.kind in "iu":
+            samples = samples.astype(np.float32) / 32768.0
+        else:
+            samples = samples.astype(np.float32)
+
+    frame_len = int(sample_rate * SIGNAL_FRAME_MS / 1000)
+    frame_s = SIGNAL_FRAME_MS / 1000.0
+    n_frames = len(samples) // frame_len
+
+    features = {
+        "duration_s": n_frames * frame_s,
+        "speech_s": 0.0,
+        "speech_ratio": 0.0,
+        "runs": 0,
+        "longest_run_s": 0.0,
+        "leading_silence_s": n_frames * frame_s,
+        "trailing_silence_s": n_frames * frame_s,
+        "noise_db": -100.0,
+        "beep_s": 0.0,
+        "beep_hz": 0.0,
+    }
+    if n_frames == 0:
+        return features
+
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+
+    # Energy envelope (dBFS); digital silence (stream warmup) excluded from floor
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    db = 20.0 * np.log10(rms + 1e-10)
+    live = rms > 1e-4
+    noise_db = float(np.percentile(db[live], 10)) if live.any() else -100.0
+    # No pause at all (greeting monologue) -> floor = speech level, use peak instead
+    peak_db = float(np.percentile(db[live], 95)) if live.any() else -100.0
+    threshold = max(min(noise_db + SIGNAL_SNR_DB, peak_db - SIGNAL_PEAK_DB), SIGNAL_MIN_SPEECH_DB)
+    speech = db > threshold
+
+    # Hangover: fill short gaps, then drop clicks
+    for start, end in _runs(~speech):
+        if start > 0 and end < n_frames and end - start <= SIGNAL_GAP_FILL_FRAMES:
+            speech[start:end] = True
+    runs = [(a, b) for a, b in _runs(speech) if b - a >= SIGNAL_MIN_RUN_FRAMES]
+
+    features["noise_db"] = noise_db
+    if runs:
+        lengths = [b - a for a, b in runs]
+        features["speech_s"] = sum(lengths) * frame_s
+        features["speech_ratio"] = sum(lengths) / n_frames
+        features["runs"] = len(runs)
+        features["longest_run_s"] = max(lengths) * frame_s
+        features["leading_silence_s"] = runs[0][0] * frame_s
+        features["trailing_silence_s"] = (n_frames - runs[-1][1]) * frame_s
+
+    # Tone / beep: spectral peak holding most of the energy, stable over frames
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(frame_len), axis=1)) ** 2
+    total = spectrum.sum(axis=1) + 1e-12
+    peak = spectrum.argmax(axis=1)
+    rows = np.arange(n_frames)
+    around = spectrum[rows, peak]
+    around = around + spectrum[rows, np.maximum(peak - 1, 0)] + spectrum[rows, np.minimum(peak + 1, spectrum.shape[1] - 1)]
+    peak_hz = peak * sample_rate / frame_len
+    tonal = (
+        (around / total >= BEEP_PEAK_RATIO)
+        & (peak_hz >= BEEP_MIN_HZ) & (peak_hz <= BEEP_MAX_HZ)
+        & (db > threshold)
+    )
+    # Same tone = peak stays within one bin of the previous frame
+    jump = np.ones(n_frames, dtype=bool)
+    jump[1:] = np.abs(np.diff(peak)) > 1
+    for start, end in _runs(tonal):
+        cuts = [start] + [i for i in range(start + 1, end) if jump[i]] + [end]
+        for seg_start, seg_end in zip(cuts, cuts[1:]):
+            if (seg_end - seg_start) * frame_s > features["beep_s"]:
+                features["beep_s"] = (seg_end - seg_start) * frame_s
+                features["beep_hz"] = float(np.median(peak_hz[seg_start:seg_end]))
+
+    return features
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over normalized keywords.
+
+    One pass over the text finds every keyword occurring as a substring
+    (same semantics as `keyword in text`), instead of one scan per keyword.
+    """
+
+    def __init__(self, keywords: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+
+        for keyword in dict.fromkeys(keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] += (keyword,)
+
+        # Failure links (BFS), outputs merged along the fail chain
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def search(self, text: str) -> Set[str]:
+        """Return the set of keywords found in text (substring match)"""
+        found: Set[str] = set()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
 class AMDService:
     """AMD Detection Service using keywords matching"""
 
@@ -33,6 +223,36 @@ class AMDService:
         self.keywords_human = [unidecode(k.lower()) for k in self.keywords_human]
         self.keywords_machine = [unidecode(k.lower()) for k in self.keywords_machine]
 
+        # Single automaton over HUMAN + MACHINE keywords (exact stage)
+        self._automaton = KeywordAutomaton(self.keywords_human + self.keywords_machine)
+
+        # Fuzzy variants: deletion-1 neighbours of single-word keywords
+        # (symspell-like), verified with SequenceMatcher on lookup
+        self._fuzzy_variants = self._build_fuzzy_variants(
+            self.keywords_human + self.keywords_machine
+        )
+
+        # Early decision (streaming) config
+        self.early_machine_keywords = [
+            unidecode(k.lower())
+            for k in getattr(config, "AMD_EARLY_MACHINE_KEYWORDS", ["messagerie", "repondeur"])
+        ]
+        self.early_human_max_words = getattr(config, "AMD_EARLY_HUMAN_MAX_WORDS", 3)
+
+        # Signal pre-classifier thresholds
+        self.signal_machine_run_s = getattr(config, "AMD_SIGNAL_MACHINE_RUN_S", 1.8)
+        self.signal_human_max_speech_s = getattr(config, "AMD_SIGNAL_HUMAN_MAX_SPEECH_S", 1.2)
+        self.signal_human_silence_s = getattr(config, "AMD_SIGNAL_HUMAN_SILENCE_S", 0.7)
+
+        # Streaming stats (time saved vs full AMD window)
+        self._stream_lock = threading.Lock()
+        self._stream_stats = {
+            "phases": 0,
+            "early_machine": 0,
+            "early_human": 0,
+            "saved_s_total": 0.0,
+        }
+
         logger.info(
             f"AMD Service init: "
             f"{len(self.keywords_human)} HUMAN keywords, "
@@ -63,15 +283,7 @@ class AMDService:
         # Normalize (lowercase + remove accents)
         text_normalized = unidecode(transcription.lower().strip())
 
-        # Match keywords (exact match first)
-        human_matches = self._match_keywords(text_normalized, self.keywords_human)
-        machine_matches = self._match_keywords(text_normalized, self.keywords_machine)
-
-        # If no matches, try fuzzy matching (fallback)
-        if not human_matches and not machine_matches:
-            logger.debug(f"AMD: No exact match, trying fuzzy matching...")
-            human_matches = self._match_keywords_fuzzy(text_normalized, self.keywords_human, threshold=0.85)
-            machine_matches = self._match_keywords_fuzzy(text_normalized, self.keywords_machine, threshold=0.85)
+        human_matches, machine_matches = self._classify_matches(text_normalized)
 
         # Calculate scores
         human_score = len(human_matches)
@@ -119,22 +331,65 @@ class AMDService:
             "machine_score": machine_score
         }
 
-    def _match_keywords(self, text: str, keywords: List[str]) -> List[str]:
+    def _classify_matches(self, text_normalized: str) -> Tuple[List[str], List[str]]:
+        """
+        Exact matching (automaton), then fuzzy fallback if nothing matched
+
+        Returns:
+            (human_matches, machine_matches)
+        """
+        # Match keywords (exact match first)
+        found = self._automaton.search(text_normalized)
+        human_matches = self._match_keywords(found, self.keywords_human)
+        machine_matches = self._match_keywords(found, self.keywords_machine)
+
+        # If no matches, try fuzzy matching (fallback)
+        if not human_matches and not machine_matches:
+            logger.debug(f"AMD: No exact match, trying fuzzy matching...")
+            human_matches = self._match_keywords_fuzzy(text_normalized, self.keywords_human, threshold=0.85)
+            machine_matches = self._match_keywords_fuzzy(text_normalized, self.keywords_machine, threshold=0.85)
+
+        return human_matches, machine_matches
+
+    def _match_keywords(self, found: Set[str], keywords: List[str]) -> List[str]:
         """
-        Find all keywords present in text (exact substring match)
+        Keep keywords found by the automaton (exact substring match)
 
         Args:
-            text: Normalized text (already lowercase + unidecode)
+            found: Keywords found in text by KeywordAutomaton.search()
             keywords: Normalized keywords (already lowercase + unidecode)
 
         Returns:
-            List of matched keywords
+            List of matched keywords (keywords order, duplicates kept)
         """
-        matches = []
+        return [keyword for keyword in keywords if keyword in found]
+
+    @staticmethod
+    def _build_fuzzy_variants(keywords: List[str]) -> Dict[str, Set[str]]:
+        """
+        Precompute deletion-1 variants of single-word keywords
+
+        A word within one insertion/deletion/substitution of a keyword
+        shares at least one entry of {word, word minus one char} with
+        {keyword, keyword minus one char}.
+        """
+        variants: Dict[str, Set[str]] = {}
         for keyword in keywords:
-            if keyword in text:
-                matches.append(keyword)
-        return matches
+            if ' ' in keyword or len(keyword) < 3:
+                continue
+            for variant in {keyword} | {keyword[:i] + keyword[i + 1:] for i in range(len(keyword))}:
+                variants.setdefault(variant, set()).add(keyword)
+        return variants
+
+    def _fuzzy_lookup(self, word: str, threshold: float = 0.85) -> Set[str]:
+        """Single-word keywords close to word (variants lookup + ratio check)"""
+        candidates: Set[str] = set()
+        for variant in {word} | {word[:i] + word[i + 1:] for i in range(len(word))}:
+            candidates |= self._fuzzy_variants.get(variant, set())
+        return {
+            keyword for keyword in candidates
+            if SequenceMatcher(None, word, keyword).ratio() >= threshold
+        }
 
     def _match_keywords_fuzzy(
         self,
@@ -172,7 +427,11 @@ class AMDService:
 
             # For single-word keywords, check fuzzy similarity
             for word in words:
-                ratio = SequenceMatcher(None, word, keyword).ratio()
+                matcher = SequenceMatcher(None, word, keyword)
+                # Upper bounds first (cheap), full ratio only if reachable
+                if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                    continue
+                ratio = matcher.ratio()
                 if ratio >= threshold:
                     matches.append(keyword)
                     logger.debug(f"AMD: Fuzzy match '{word}' → '{keyword}' (ratio: {ratio:.2f})")
@@ -198,6 +457,99 @@ class AMDService:
         else:  # 3+
             return 0.95
 
+    def classify_signal(
+        self,
+        pcm: Union[bytes, bytearray, np.ndarray],
+        sample_rate: int = 16000
+    ) -> Dict[str, Any]:
+        """
+        Fast HUMAN/MACHINE/UNSURE score from raw client audio (no ASR)
+
+        Rules (checked in order):
+        - tone >= 120ms (voicemail beep) -> MACHINE
+        - continuous speech run >= AMD_SIGNAL_MACHINE_RUN_S (greeting
+          monologue) -> MACHINE
+        - short speech (<= AMD_SIGNAL_HUMAN_MAX_SPEECH_S, <= 2 runs) then
+          silence >= AMD_SIGNAL_HUMAN_SILENCE_S ("allo ?" + wait) -> HUMAN
+        - otherwise UNSURE (transcript decides)
+
+        Returns:
+            {
+                "result": "HUMAN" | "MACHINE" | "UNSURE",
+                "confidence": 0.0-1.0,
+                "reason": str,
+                "features": {...},
+                "method": "signal",
+                "latency_ms": float
+            }
+        """
+        start = time.perf_counter()
+        features = extract_signal_features(pcm, sample_rate)
+
+        result, confidence, reason = "UNSURE", 0.0, "undecided"
+        if features["beep_s"] >= BEEP_MIN_S:
+            result, confidence, reason = "MACHINE", 0.95, "beep"
+        elif features["longest_run_s"] >= self.signal_machine_run_s:
+            result, confidence, reason = "MACHINE", 0.8, "long_speech_run"
+        elif (
+            0 < features["speech_s"] <= self.signal_human_max_speech_s
+            and features["runs"] <= 2
+            and features["trailing_silence_s"] >= self.signal_human_silence_s
+        ):
+            result, confidence, reason = "HUMAN", 0.7, "short_greeting_then_silence"
+        elif features["speech_s"] == 0:
+            reason = "no_speech"
+
+        if result != "UNSURE" and confidence < self.min_confidence:
+            result, reason = "UNSURE", f"low_confidence:{reason}"
+
+        return {
+            "result": result,
+            "confidence": confidence,
+            "reason": reason,
+            "features": features,
+            "method": "signal",
+            "latency_ms": (time.perf_counter() - start) * 1000
+        }
+
+    def create_stream_detector(self) -> "StreamingAMDDetector":
+        """New early-decision detector for one call (fed by Vosk callbacks)"""
+        return StreamingAMDDetector(self)
+
+    def record_stream_phase(self, decision: Optional[str], saved_s: float) -> float:
+        """
+        Record one streaming AMD phase
+
+        Args:
+            decision: Early decision ("HUMAN"/"MACHINE") or None (full window)
+            saved_s: Recording time saved vs config.AMD_MAX_DURATION
+
+        Returns:
+            Mean time saved per call (ms)
+        """
+        with self._stream_lock:
+            stats = self._stream_stats
+            stats["phases"] += 1
+            if decision == "MACHINE":
+                stats["early_machine"] += 1
+            elif decision == "HUMAN":
+                stats["early_human"] += 1
+            stats["saved_s_total"] += max(0.0, saved_s)
+            return stats["saved_s_total"] / stats["phases"] * 1000
+
+    def get_stream_stats(self) -> Dict[str, Any]:
+        """Early decision stats (mean AMD time saved per call)"""
+        with self._stream_lock:
+            stats = dict(self._stream_stats)
+        phases = stats["phases"]
+        return {
+            "phases": phases,
+            "early_machine": stats["early_machine"],
+            "early_human": stats["early_human"],
+            "early_rate": (stats["early_machine"] + stats["early_human"]) / phases if phases else 0.0,
+            "mean_saved_ms": stats["saved_s_total"] / phases * 1000 if phases else 0.0,
+        }
+
     def get_stats(self) -> Dict[str, Any]:
         """Return AMD service stats"""
         return {
@@ -205,12 +557,98 @@ class AMDService:
             "keywords_machine_count": len(self.keywords_machine),
             "min_confidence": self.min_confidence,
             "keywords_human_preview": self.keywords_human[:5],
-            "keywords_machine_preview": self.keywords_machine[:5]
+            "keywords_machine_preview": self.keywords_machine[:5],
+            "streaming": self.get_stream_stats()
         }
 
 
-# Global instance
-amd_service = AMDService()
+class StreamingAMDDetector:
+    """
+    Incremental AMD for one call, fed with each Vosk PARTIAL/FINAL
+
+    Rules:
+    - MACHINE as soon as a decisive keyword appears
+      (config.AMD_EARLY_MACHINE_KEYWORDS: messagerie, repondeur, ...)
+      exact (automaton) or fuzzy (precomputed variants)
+    - HUMAN on speech_end if the text so far is a short greeting
+      (<= AMD_EARLY_HUMAN_MAX_WORDS words, detect() would say HUMAN)
+
+    Not thread-safe: one instance per call, updated from the ASR callback.
+    """
+
+    def __init__(self, service: AMDService):
+        self.service = service
+        self.text = ""
+        self.decision: Optional[Dict[str, Any]] = None
+        self._decisive = set(service.early_machine_keywords)
+        self._decisive_automaton = KeywordAutomaton(service.early_machine_keywords)
+
+    def feed(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Feed latest transcription (partial or final)
+
+        Returns:
+            Decision dict (same shape as AMDService.detect) or None
+        """
+        if self.decision or not text or not text.strip():
+            return self.decision
+
+        self.text = text
+        text_normalized = unidecode(text.lower().strip())
+
+        matched = self._decisive_automaton.search(text_normalized)
+        if not matched:
+            for word in text_normalized.split():
+                matched |= self.service._fuzzy_lookup(word) & self._decisive
+
+        if matched:
+            self.decision = self._make_decision("MACHINE", 0.95, sorted(matched))
+        return self.decision
+
+    def on_speech_end(self) -> Optional[Dict[str, Any]]:
+        """Speech followed by silence: decide HUMAN on a short greeting"""
+        if self.decision or not self.text:
+            return self.decision
+
+        text_normalized = unidecode(self.text.lower().strip())
+        if len(text_normalized.split()) > self.service.early_human_max_words:
+            return None
+
+        human_matches, machine_matches = self.service._classify_matches(text_normalized)
+        if human_matches and not machine_matches:
+            confidence = self.service._calculate_confidence(len(human_matches), len(self.service.keywords_human))
+            if confidence >= self.service.min_confidence:
+                self.decision = self._make_decision("HUMAN", confidence, human_matches)
+        return self.decision
+
+    def _make_decision(self, result: str, confidence: float, keywords: List[str]) -> Dict[str, Any]:
+        logger.info(f"AMD early decision: {result} (conf: {confidence:.2f}, keywords: {keywords[:3]})")
+        return {
+            "result": result,
+            "confidence": confidence,
+            "keywords_matched": keywords,
+            "method": "streaming_keywords",
+            "transcription": self.text
+        }
+
+
+# Global instance (lazy: built on first use, not at import)
+_amd_service: Optional[AMDService] = None
+
+
+def get_amd_service() -> AMDService:
+    """Return the shared AMDService, creating it on first call."""
+    global _amd_service
+    if _amd_service is None:
+        _amd_service = AMDService()
+    return _amd_service
+
+
+def __getattr__(name):
+    # Backward compatibility: `from system.services.amd_service import amd_service`
+    if name == "amd_service":
+        return get_amd_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Unit tests
@@ -252,6 +690,29 @@ if __name__ == "__main__":
 
         print(f"[{status}] '{transcription[:30]}' -> {result['result']} (conf: {result['confidence']:.2f})")
 
+    # Streaming early decision (partials, then speech_end)
+    stream_cases = [
+        (["vous etes", "vous etes sur la messagerie"], "MACHINE"),
+        (["allo"], "HUMAN"),
+        (["bonjour vous etes bien"], None),
+    ]
+
+    print("\nStreaming:")
+    for partials, expected in stream_cases:
+        detector = amd.create_stream_detector()
+        for partial in partials:
+            detector.feed(partial)
+        detector.on_speech_end()
+        got = detector.decision["result"] if detector.decision else None
+        status = "PASS" if got == expected else "FAIL"
+
+        if status == "PASS":
+            passed += 1
+        else:
+            failed += 1
+
+        print(f"[{status}] {partials} -> {got}")
+
     print(f"\nResults: {passed} PASS, {failed} FAIL")
     
     if failed == 0:
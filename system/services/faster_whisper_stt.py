@@ -296,6 +296,27 @@ class FasterWhisperSTT:
                 "error": str(e)
             }
 
+    def warmup(self, seconds: float = 1.0) -> float:
+        """
+        Warm up the model on in-memory silence (no temp WAV on disk)
+
+        Args:
+            seconds: Silence duration at 16kHz (Whisper's native rate)
+
+        Returns:
+            Warmup latency in ms
+        """
+        if not self.model:
+            raise RuntimeError("Model not loaded")
+
+        import numpy
+
+        start_time = time.time()
+        silence = numpy.zeros(int(16000 * seconds), dtype=numpy.float32)
+        segments, _ = self.model.transcribe(silence, language=self.language, beam_size=1)
+        list(segments)  # Generator: force decoding
+        return (time.time() - start_time) * 1000
+
     def get_stats(self) -> Dict[str, Any]:
         """Return STT service stats"""
         return {
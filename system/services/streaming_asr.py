@@ -101,6 +101,9 @@ class StreamingASR:
         self.silence_threshold = config.VAD_SILENCE_THRESHOLD_MS / 1000.0  # 500ms → 0.5s (optimisé bruits)
         self.speech_start_threshold = config.VAD_SPEECH_START_THRESHOLD_MS / 1000.0  # 500ms → 0.5s
 
+        # Début d'audio brut conservé pour la pré-classification AMD signal
+        self.audio_head_bytes = int(config.AMD_SIGNAL_MAX_WINDOW_S * self.sample_rate) * 2
+
         # Audio filters DÉSACTIVÉS (causaient des problèmes de transcription)
         # Les filtres high-pass et noise gate ont été supprimés
         logger.info("ℹ️ Audio filters disabled (raw audio to Vosk)")
@@ -116,6 +119,9 @@ class StreamingASR:
         # Serveur WebSocket
         self.websocket_server = None
         self.server_task = None
+        # Boucle asyncio du serveur: seul thread qui touche aux recognizers Vosk
+        # et à active_streams (voir _call_on_loop)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Statistiques
         self.stats = {
@@ -168,6 +174,7 @@ class StreamingASR:
 
         try:
             logger.info(f"🌐 Starting WebSocket server on {host}:{port}")
+            self.loop = asyncio.get_running_loop()
 
             self.websocket_server = await websockets.serve(
                 self._handle_websocket_connection,
@@ -257,7 +264,9 @@ class StreamingASR:
             # Energy gate adaptatif
             "noise_floor_rms": None,  # Plancher de bruit calibré
             "calibration_samples": [],  # RMS samples pendant calibration
-            "is_calibrating": False  # Mode calibration actif
+            "is_calibrating": False,  # Mode calibration actif
+            # PCM brut des premières secondes (AMD signal)
+            "audio_head": bytearray()
         }
 
         # Vérifier état des autres structures
@@ -273,11 +282,11 @@ class StreamingASR:
 
     async def _process_audio_frame(self, call_uuid: str, frame_bytes: bytes):
         """Traite une frame audio en temps réel"""
-        if call_uuid not in self.active_streams:
+        stream_info = self.active_streams.get(call_uuid)
+        if stream_info is None:
             return
 
         start_time = time.time()
-        stream_info = self.active_streams[call_uuid]
         recognizer = self.recognizers.get(call_uuid)
 
         if not recognizer:
@@ -290,6 +299,9 @@ class StreamingASR:
 
             # Mise à jour statistiques
             stream_info["frame_count"] += 1
+
+            if len(stream_info["audio_head"]) < self.audio_head_bytes:
+                stream_info["audio_head"] += frame_bytes
             self.stats["total_frames_processed"] += 1
 
             frame_duration_s = self.frame_duration_ms / 1000.0
@@ -500,9 +512,11 @@ class StreamingASR:
         Démarre la calibration du bruit de fond.
         Appelé au début de Phase 2 hello pendant que le robot parle.
         """
-        if call_uuid in self.active_streams:
-            self.active_streams[call_uuid]["is_calibrating"] = True
-            self.active_streams[call_uuid]["calibration_samples"] = []
+        # get(): le stream peut être nettoyé sur la boucle du serveur entre-temps
+        stream_info = self.active_streams.get(call_uuid)
+        if stream_info is not None:
+            stream_info["is_calibrating"] = True
+            stream_info["calibration_samples"] = []
             logger.info(f"🎚️ [{call_uuid[:8]}] Noise calibration STARTED")
 
     def stop_noise_calibration(self, call_uuid: str) -> float:
@@ -521,8 +535,8 @@ class StreamingASR:
         noise_floor_threshold = 0.0
         MIN_NOISE_THRESHOLD = 500  # Fallback absolu si pas assez de données
 
-        if call_uuid in self.active_streams:
-            stream_info = self.active_streams[call_uuid]
+        stream_info = self.active_streams.get(call_uuid)
+        if stream_info is not None:
             stream_info["is_calibrating"] = False
 
             samples = stream_info["calibration_samples"]
@@ -570,6 +584,22 @@ class StreamingASR:
         logger.info(f"🎚️ [{call_uuid[:8]}] stop_noise_calibration returning: {noise_floor_threshold:.0f}")
         return noise_floor_threshold
 
+    def get_audio_head(self, call_uuid: str) -> bytes:
+        """
+        Retourne le PCM brut (SLIN16 mono) reçu depuis le début du stream,
+        limité à AMD_SIGNAL_MAX_WINDOW_S secondes.
+
+        Args:
+            call_uuid: UUID de l'appel
+
+        Returns:
+            bytes (vide si stream inconnu)
+        """
+        stream_info = self.active_streams.get(call_uuid)
+        if not stream_info:
+            return b""
+        return bytes(stream_info["audio_head"])
+
     def set_noise_floor(self, call_uuid: str, noise_floor_rms: float):
         """
         Applique un noise floor calibré à un stream existant.
@@ -579,8 +609,9 @@ class StreamingASR:
             call_uuid: UUID de l'appel
             noise_floor_rms: Le threshold RMS à appliquer
         """
-        if call_uuid in self.active_streams and noise_floor_rms > 0:
-            self.active_streams[call_uuid]["noise_floor_rms"] = noise_floor_rms
+        stream_info = self.active_streams.get(call_uuid)
+        if stream_info is not None and noise_floor_rms > 0:
+            stream_info["noise_floor_rms"] = noise_floor_rms
             logger.info(f"🎚️ [{call_uuid[:8]}] Noise floor SET: threshold={noise_floor_rms:.0f}")
 
     async def _notify_transcription(self, call_uuid: str, text: str, transcription_type: str, latency_ms: float):
@@ -629,38 +660,81 @@ class StreamingASR:
         logger.debug(f"✅ Callback registered for {call_uuid[:8]}")
         logger.debug(f"🔧 Current callbacks after: {list(self.callbacks.keys())}")
 
-    def unregister_callback(self, call_uuid: str):
-        """Désenregistre callback"""
+    def unregister_callback(self, call_uuid: str, callback: Optional[Callable] = None):
+        """
+        Désenregistre callback
+
+        Args:
+            call_uuid: UUID de l'appel
+            callback: Si fourni, ne retire que ce callback (pas celui
+                      qu'une phase suivante aurait déjà enregistré)
+        """
         logger.debug(f"🔧 Unregistering callback for UUID: {call_uuid} (short: {call_uuid[:8]})")
         logger.debug(f"🔧 Current callbacks before: {list(self.callbacks.keys())}")
 
-        if call_uuid in self.callbacks:
+        registered = self.callbacks.get(call_uuid)
+        if registered is not None and (callback is None or registered is callback):
             del self.callbacks[call_uuid]
             logger.debug(f"❌ Callback unregistered for {call_uuid[:8]}")
-        else:
+        elif registered is None:
             logger.warning(f"⚠️ No callback to unregister for {call_uuid[:8]}")
 
         logger.debug(f"🔧 Current callbacks after: {list(self.callbacks.keys())}")
 
+    def _call_on_loop(self, func: Callable, *args) -> bool:
+        """
+        Exécute func(*args) sur la boucle du serveur (appelé depuis un autre thread).
+
+        Les frames sont traitées sur cette boucle (AcceptWaveform), et le
+        finally du handler WebSocket y nettoie son stream: y passer aussi le
+        nettoyage et le Reset demandés par les threads du robot évite des
+        appels Vosk natifs concurrents sur le même recognizer et les
+        check-then-del concurrents sur active_streams / recognizers.
+
+        Returns:
+            True si planifié sur la boucle, False si exécuté ici (pas de boucle
+            ou déjà sur la boucle)
+        """
+        loop = self.loop
+        if loop is not None and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not loop:
+                try:
+                    loop.call_soon_threadsafe(func, *args)
+                    return True
+                except RuntimeError:
+                    pass  # Boucle fermée entre-temps: exécution directe
+        func(*args)
+        return False
+
     def reset_recognizer(self, call_uuid: str):
         """
         Réinitialise le recognizer Vosk pour vider le buffer audio
 
         Utilisé après un barge-in pour éviter l'accumulation de transcriptions partielles.
-        Basé sur la méthode Reset() de KaldiRecognizer (vosk-api).
+        Basé sur la méthode Reset() de KaldiRecognizer (vosk-api). Exécuté sur
+        la boucle du serveur (entre deux frames), comme AcceptWaveform.
 
         Args:
             call_uuid: UUID de l'appel
         """
-        if call_uuid in self.recognizers:
+        self._call_on_loop(self._reset_recognizer, call_uuid)
+
+    def _reset_recognizer(self, call_uuid: str):
+        recognizer = self.recognizers.get(call_uuid)
+        if recognizer is not None:
             try:
-                self.recognizers[call_uuid].Reset()
+                recognizer.Reset()
                 logger.debug(f"[{call_uuid[:8]}] 🔄 Vosk recognizer reset (buffer cleared)")
 
                 # Réinitialiser aussi les transcriptions partielles dans stream_info
-                if call_uuid in self.active_streams:
-                    self.active_streams[call_uuid]["partial_transcription"] = ""
-                    self.active_streams[call_uuid]["final_transcription"] = ""
+                stream_info = self.active_streams.get(call_uuid)
+                if stream_info is not None:
+                    stream_info["partial_transcription"] = ""
+                    stream_info["final_transcription"] = ""
 
             except Exception as e:
                 logger.error(f"[{call_uuid[:8]}] ❌ Failed to reset recognizer: {e}")
@@ -668,36 +742,30 @@ class StreamingASR:
             logger.warning(f"[{call_uuid[:8]}] ⚠️ Cannot reset - recognizer not found")
 
     def _cleanup_stream(self, call_uuid: str):
-        """Nettoie un stream"""
-        # Log état avant cleanup
-        had_stream = call_uuid in self.active_streams
-        had_recognizer = call_uuid in self.recognizers
-        frame_count = 0
-        if had_stream:
-            frame_count = self.active_streams[call_uuid].get("frame_count", 0)
+        """Nettoie un stream (boucle du serveur; idempotent: handler et release_call)"""
+        # Retraits atomiques (pop): un second nettoyage ne trouve plus rien
+        stream_info = self.active_streams.pop(call_uuid, None)
+        recognizer = self.recognizers.pop(call_uuid, None)
+        frame_count = stream_info.get("frame_count", 0) if stream_info else 0
 
         logger.info(
             f"🧹 [{call_uuid[:8]}] Cleanup stream: "
-            f"had_stream={had_stream}, had_recognizer={had_recognizer}, frames={frame_count}"
+            f"had_stream={stream_info is not None}, had_recognizer={recognizer is not None}, frames={frame_count}"
         )
 
-        if call_uuid in self.active_streams:
-            del self.active_streams[call_uuid]
-
-        if call_uuid in self.recognizers:
+        if recognizer is not None:
             # IMPORTANT: Vider le buffer interne de Vosk avant de supprimer
             # Sinon l'état peut s'accumuler et causer des problèmes
             try:
-                recognizer = self.recognizers[call_uuid]
                 # FinalResult() vide le buffer et retourne la dernière transcription
                 final = recognizer.FinalResult()
                 logger.debug(f"🧹 [{call_uuid[:8]}] Vosk buffer flushed: {final[:50] if final else 'empty'}...")
             except Exception as e:
                 logger.warning(f"⚠️ [{call_uuid[:8]}] Error flushing Vosk buffer: {e}")
-            del self.recognizers[call_uuid]
 
         # ❌ NE PAS supprimer le callback automatiquement !
         # Le callback est géré explicitement par register/unregister
+        # (et release_call au hangup)
         # Sinon, quand une connexion WebSocket se ferme (ex: AMD),
         # elle supprime le callback de la phase suivante (Phase 2/3)
         #
@@ -707,12 +775,48 @@ class StreamingASR:
         self.stats["active_streams"] = len(self.active_streams)
         logger.debug(f"🧹 [{call_uuid[:8]}] Stream cleanup completed (callback preserved)")
 
+    def release_call(self, call_uuid: str) -> Dict[str, bool]:
+        """
+        Libère tout ce que l'appel possède encore (fin d'appel, hangup).
+
+        Contrairement à _cleanup_stream (fin d'UNE connexion WebSocket),
+        retire aussi le callback: il capture l'état de la phase en cours
+        (detection_state, amd_state) et resterait en mémoire à vie.
+
+        Appelé sur le thread des événements ESL: le nettoyage du stream est
+        planifié sur la boucle du serveur (_call_on_loop), jamais exécuté
+        pendant un AcceptWaveform du même recognizer.
+
+        Args:
+            call_uuid: UUID de l'appel
+
+        Returns:
+            {"callback": bool, "stream": bool, "recognizer": bool} libérés
+        """
+        if not self.is_available:
+            return {"callback": False, "stream": False, "recognizer": False}
+
+        released = {
+            "callback": self.callbacks.pop(call_uuid, None) is not None,
+            "stream": call_uuid in self.active_streams,
+            "recognizer": call_uuid in self.recognizers,
+        }
+        if released["stream"] or released["recognizer"]:
+            # WebSocket pas encore fermé par FreeSWITCH: le finally du handler
+            # retrouvera un stream absent (no-op)
+            self._call_on_loop(self._cleanup_stream, call_uuid)
+        return released
+
     def get_stats(self) -> Dict[str, Any]:
         """Retourne statistiques"""
+        if not self.is_available:
+            return {**self.stats, "is_available": False}
         return {
             **self.stats,
             "is_available": self.is_available,
-            "active_streams_list": list(self.active_streams.keys())
+            "active_streams_list": list(self.active_streams.keys()),
+            "callbacks": len(self.callbacks),
+            "recognizers": len(self.recognizers)
         }
 
 
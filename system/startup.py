@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Startup Orchestrator - MiniBotPanel v3
+
+Démarrage parallèle et par étapes des services du robot.
+
+Chaque étape (chargement modèle, warmup, index...) tourne dans son propre
+thread dès que ses dépendances sont prêtes: les modèles indépendants
+(Faster-Whisper, Vosk, AMD, VAD, scénarios, objections) se chargent en
+même temps au lieu de s'additionner.
+
+- wait(names): bloque jusqu'à ce que ces étapes (et leurs dépendances)
+  soient terminées; lève StartupError si une étape critique a échoué
+- failed(names): étapes critiques déjà en échec (non bloquant)
+- report(): tableau des temps par étape (début, durée, statut) + gain
+  du parallélisme (somme des durées / temps mur)
+
+Usage:
+    from system.startup import StartupOrchestrator
+
+    startup = StartupOrchestrator("robot")
+    startup.add("whisper", load_whisper)
+    startup.add("warmup_whisper", warmup_whisper, deps=("whisper",), critical=False)
+    startup.start()
+    startup.wait(["whisper"])      # prêt pour la première phase
+    startup.wait_all()
+    startup.log_report()
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+
+class StartupError(RuntimeError):
+    """Une étape critique du démarrage a échoué."""
+
+
+@dataclass
+class Stage:
+    """Étape de démarrage et ses temps (secondes depuis start())."""
+    name: str
+    func: Callable[[], None]
+    deps: Tuple[str, ...] = ()
+    critical: bool = True
+    status: str = STATUS_PENDING
+    started_at: Optional[float] = None
+    ended_at: Optional[float] = None
+    error: Optional[BaseException] = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None or self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
+
+
+class StartupOrchestrator:
+    """Exécute des étapes de démarrage en parallèle selon leurs dépendances."""
+
+    def __init__(self, name: str = "startup", parallel: bool = True):
+        """
+        Args:
+            name: Nom affiché dans le rapport
+            parallel: False = exécution séquentielle dans le thread appelant
+                      (ordre d'ajout, pour debug/comparaison)
+        """
+        self.name = name
+        self.parallel = parallel
+        self._stages: Dict[str, Stage] = {}
+        self._origin: Optional[float] = None
+        self._threads: List[threading.Thread] = []
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], None],
+        deps: Iterable[str] = (),
+        critical: bool = True
+    ) -> Stage:
+        """
+        Déclare une étape (avant start()).
+
+        Args:
+            name: Nom unique
+            func: Fonction sans argument; une exception = étape échouée
+            deps: Étapes qui doivent être terminées avant (ajoutées avant)
+            critical: Un échec fait lever StartupError dans wait()
+        """
+        deps = tuple(deps)
+        unknown = [dep for dep in deps if dep not in self._stages]
+        if unknown:
+            raise ValueError(f"Unknown startup dependencies for '{name}': {unknown}")
+        stage = Stage(name=name, func=func, deps=deps, critical=critical)
+        self._stages[name] = stage
+        return stage
+
+    def start(self):
+        """Lance toutes les étapes (threads), ou les exécute en séquence si parallel=False."""
+        self._origin = time.perf_counter()
+        if not self.parallel:
+            for stage in self._stages.values():
+                self._run(stage)
+            return
+
+        for stage in self._stages.values():
+            thread = threading.Thread(target=self._run, args=(stage,), name=f"startup-{stage.name}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def _run(self, stage: Stage):
+        for dep in stage.deps:
+            self._stages[dep].done.wait()
+
+        failed_deps = [dep for dep in stage.deps if self._stages[dep].status != STATUS_DONE]
+        if failed_deps:
+            stage.status = STATUS_SKIPPED
+            stage.error = StartupError(f"dependencies not ready: {', '.join(failed_deps)}")
+            logger.warning(f"⏭️  Startup stage '{stage.name}' skipped ({stage.error})")
+            stage.done.set()
+            return
+
+        stage.status = STATUS_RUNNING
+        stage.started_at = self._elapsed()
+        try:
+            stage.func()
+            stage.status = STATUS_DONE
+        except BaseException as e:
+            stage.status = STATUS_FAILED
+            stage.error = e
+            log = logger.error if stage.critical else logger.warning
+            log(f"{'❌' if stage.critical else '⚠️ '} Startup stage '{stage.name}' failed: {e}")
+        finally:
+            stage.ended_at = self._elapsed()
+            stage.done.set()
+
+    # ========== ATTENTE ==========
+
+    def _closure(self, names: Iterable[str]) -> List[Stage]:
+        """Étapes demandées + leurs dépendances (transitives)."""
+        seen: Dict[str, Stage] = {}
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in seen:
+                continue
+            stage = self._stages[name]
+            seen[name] = stage
+            stack.extend(stage.deps)
+        return list(seen.values())
+
+    def wait(self, names: Iterable[str], timeout: Optional[float] = None) -> bool:
+        """
+        Attend des étapes (et leurs dépendances).
+
+        Returns:
+            True si toutes terminées, False si timeout
+
+        Raises:
+            StartupError: si une étape critique a échoué ou a été sautée
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        stages = self._closure(names)
+
+        for stage in stages:
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            if not stage.done.wait(remaining):
+                return False
+
+        failed = self._failed(stages)
+        if failed:
+            details = ", ".join(f"{s.name} ({s.error})" for s in failed)
+            raise StartupError(f"{self.name}: critical startup stage failed: {details}")
+        return True
+
+    @staticmethod
+    def _failed(stages: Iterable[Stage]) -> List[Stage]:
+        return [s for s in stages if s.critical and s.status in (STATUS_FAILED, STATUS_SKIPPED)]
+
+    def failed(self, names: Iterable[str]) -> List[str]:
+        """Étapes critiques (et dépendances) déjà en échec ou sautées, sans attendre."""
+        return [s.name for s in self._failed(self._closure(names))]
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Attend toutes les étapes (voir wait())."""
+        return self.wait(list(self._stages), timeout)
+
+    def is_ready(self, name: str) -> bool:
+        """True si l'étape est terminée avec succès (non bloquant)."""
+        stage = self._stages.get(name)
+        return bool(stage and stage.status == STATUS_DONE)
+
+    def status(self, name: str) -> Optional[str]:
+        stage = self._stages.get(name)
+        return stage.status if stage else None
+
+    # ========== RAPPORT ==========
+
+    def report(self) -> str:
+        """Tableau des temps par étape (ms depuis start())."""
+        stages = sorted(
+            self._stages.values(),
+            key=lambda s: (s.started_at is None, s.started_at or 0.0)
+        )
+        ended = [s.ended_at for s in stages if s.ended_at is not None]
+        wall = max(ended) if ended else 0.0
+        total = sum(s.duration or 0.0 for s in stages)
+
+        lines = [
+            f"{'Stage':<22} {'Status':<8} {'Start':>9} {'Duration':>10} {'End':>9}  Deps",
+            "-" * 78,
+        ]
+        for s in stages:
+            start = f"{s.started_at * 1000:.0f}ms" if s.started_at is not None else "-"
+            duration = f"{s.duration * 1000:.0f}ms" if s.duration is not None else "-"
+            end = f"{s.ended_at * 1000:.0f}ms" if s.ended_at is not None else "-"
+            name = s.name if s.critical else f"{s.name} (opt)"
+            lines.append(f"{name:<22} {s.status:<8} {start:>9} {duration:>10} {end:>9}  {','.join(s.deps) or '-'}")
+        lines.append("-" * 78)
+        gain = f" | parallel gain x{total / wall:.1f}" if wall > 0 else ""
+        lines.append(f"Wall: {wall * 1000:.0f}ms | Sum of stages: {total * 1000:.0f}ms{gain}")
+        return "\n".join(lines)
+
+    def log_report(self):
+        """Log du tableau (une ligne de log par ligne du tableau)."""
+        logger.info(f"⏱️  Startup timings ({self.name}):")
+        for line in self.report().splitlines():
+            logger.info(f"   {line}")
@@ -0,0 +1,266 @@
+"""
+Stats Rollup - MiniBotPanel v3
+
+Compteurs pré-agrégés des appels terminés (table campaign_stats_rollup).
+
+Un appel dans un état final (COMPLETED, FAILED, NO_ANSWER, BUSY,
+CANCELLED) compte pour 1 dans la ligne (campagne, minute de fin, statut,
+résultat, sentiment, AMD) de la table, avec sa durée. Chaque écriture qui
+fait entrer un appel dans un état final, ou l'en fait sortir (retry), met
+à jour le rollup dans la même transaction:
+
+    delta = RollupDelta()
+    delta.remove(call)          # contribution avant modification
+    call.status = CallStatus.COMPLETED
+    delta.add(call)             # contribution après
+    delta.apply(db)             # un INSERT ... ON CONFLICT DO UPDATE (incréments)
+    db.commit()
+
+Les écritures SQL groupées utilisent rollup_columns() dans leur RETURNING
+(ou leur SELECT) pour obtenir les mêmes attributs sans charger d'objet ORM.
+
+Les statistiques (system/call_stats.py, moniteurs) lisent le rollup pour
+les appels terminés et la table calls seulement pour les appels en cours
+ou en file: O(minutes) au lieu de O(appels).
+
+rebuild() reconstruit le rollup depuis l'historique des appels (première
+mise en service, dérive), check() le compare aux comptages bruts:
+
+    python scripts/stats_rollup.py backfill
+    python scripts/stats_rollup.py check --campaign-id 42
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import DateTime, String, cast, delete, func, literal, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import FunctionElement
+
+from system.models import Call, CallStatus, CampaignStatsRollup
+
+logger = logging.getLogger(__name__)
+
+FINAL_STATUSES = (
+    CallStatus.COMPLETED, CallStatus.FAILED, CallStatus.NO_ANSWER, CallStatus.BUSY, CallStatus.CANCELLED
+)
+
+KEY_COLUMNS = ("campaign_id", "bucket", "status", "result", "sentiment", "amd_result")
+
+# Lignes par INSERT multi-VALUES (9 paramètres par ligne, limite SQLite 32766)
+UPSERT_CHUNK = 1000
+
+
+class minute_bucket(FunctionElement):
+    """minute_bucket(ts): ts tronqué à la minute (expression SQL, par dialecte)."""
+    type = DateTime()
+    name = "minute_bucket"
+    inherit_cache = True
+
+
+@compiles(minute_bucket, "postgresql")
+def _minute_bucket_postgresql(element, compiler, **kw):
+    return f"date_trunc('minute', {compiler.process(element.clauses, **kw)})"
+
+
+@compiles(minute_bucket, "sqlite")
+def _minute_bucket_sqlite(element, compiler, **kw):
+    # Même texte que les datetime écrits par SQLAlchemy (clé primaire comparée en texte)
+    return f"strftime('%Y-%m-%d %H:%M:00.000000', {compiler.process(element.clauses, **kw)})"
+
+
+def rollup_columns(entity=Call) -> List:
+    """Colonnes d'un appel nécessaires à sa contribution (SELECT / RETURNING)."""
+    return [
+        entity.campaign_id, entity.status, entity.result, entity.sentiment, entity.amd_result,
+        entity.duration, entity.ended_at, entity.last_attempt_at, entity.created_at,
+    ]
+
+
+def _name(value) -> str:
+    return value.name if value is not None else ""
+
+
+def contribution(call, **changes) -> Optional[Tuple[tuple, int]]:
+    """
+    Clé du rollup et durée comptée pour un appel (None s'il n'est pas dans un état final).
+
+    Args:
+        call: Appel ORM ou ligne avec les attributs de rollup_columns()
+        changes: Valeurs qui remplacent celles de `call` (ex: status=...)
+    """
+    def value(name):
+        return changes[name] if name in changes else getattr(call, name)
+
+    status = value("status")
+    campaign_id = value("campaign_id")
+    if campaign_id is None or status not in FINAL_STATUSES:
+        return None
+
+    at = value("ended_at") or value("last_attempt_at") or value("created_at") or datetime.utcnow()
+    key = (
+        campaign_id,
+        at.replace(second=0, microsecond=0),
+        status.name,
+        _name(value("result")),
+        _name(value("sentiment")),
+        value("amd_result") or "",
+    )
+    duration = value("duration")
+    return key, duration if duration and duration > 0 else 0
+
+
+class RollupDelta:
+    """Variations du rollup accumulées pendant une transaction, appliquées en un upsert."""
+
+    def __init__(self):
+        self._deltas: Dict[tuple, List[int]] = defaultdict(lambda: [0, 0, 0])
+
+    def _record(self, call, sign: int, changes: Dict[str, Any]):
+        entry = contribution(call, **changes)
+        if entry is None:
+            return
+        key, duration = entry
+        delta = self._deltas[key]
+        delta[0] += sign
+        if duration:
+            delta[1] += sign * duration
+            delta[2] += sign
+
+    def add(self, call, **changes):
+        """Compte l'appel dans son état (final) actuel."""
+        self._record(call, 1, changes)
+
+    def remove(self, call, **changes):
+        """Retire la contribution de l'appel (à appeler avant de le modifier)."""
+        self._record(call, -1, changes)
+
+    def __bool__(self) -> bool:
+        return any(any(delta) for delta in self._deltas.values())
+
+    def apply(self, db: Session) -> int:
+        """
+        Applique les variations (INSERT ... ON CONFLICT DO UPDATE, sans commit).
+
+        Returns:
+            Nombre de lignes du rollup modifiées
+        """
+        rows = [
+            {
+                **dict(zip(KEY_COLUMNS, key)),
+                "calls": calls, "duration_sum": duration_sum, "duration_count": duration_count,
+            }
+            # Ordre stable des clés: deux transactions verrouillent les lignes dans le même ordre
+            for key, (calls, duration_sum, duration_count) in sorted(self._deltas.items())
+            if calls or duration_sum or duration_count
+        ]
+        self._deltas.clear()
+        if not rows:
+            return 0
+
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        for start in range(0, len(rows), UPSERT_CHUNK):
+            statement = dialect.insert(CampaignStatsRollup).values(rows[start:start + UPSERT_CHUNK])
+            db.execute(statement.on_conflict_do_update(
+                index_elements=list(KEY_COLUMNS),
+                set_={
+                    column: getattr(CampaignStatsRollup, column) + getattr(statement.excluded, column)
+                    for column in ("calls", "duration_sum", "duration_count")
+                },
+            ))
+        return len(rows)
+
+
+def _raw_rollup_query(campaign_id: Optional[int] = None):
+    """Rollup attendu, calculé depuis la table calls (GROUP BY sur les appels terminés)."""
+    bucket = minute_bucket(func.coalesce(Call.ended_at, Call.last_attempt_at, Call.created_at))
+    dimensions = [
+        Call.campaign_id,
+        bucket.label("bucket"),
+        cast(Call.status, String(20)).label("status"),
+        func.coalesce(cast(Call.result, String(20)), literal("")).label("result"),
+        func.coalesce(cast(Call.sentiment, String(20)), literal("")).label("sentiment"),
+        func.coalesce(Call.amd_result, literal("")).label("amd_result"),
+    ]
+    query = select(
+        *dimensions,
+        func.count().label("calls"),
+        func.coalesce(func.sum(Call.duration).filter(Call.duration > 0), 0).label("duration_sum"),
+        func.count().filter(Call.duration > 0).label("duration_count"),
+    ).where(Call.campaign_id != None, Call.status.in_(FINAL_STATUSES))
+    if campaign_id is not None:
+        query = query.where(Call.campaign_id == campaign_id)
+    # Alias: les expressions ont leurs propres paramètres
+    return query.group_by(*[text(column) for column in KEY_COLUMNS])
+
+
+def rebuild(db: Session, campaign_id: Optional[int] = None) -> int:
+    """
+    Reconstruit le rollup depuis les appels (une campagne ou toutes), commit inclus.
+
+    PostgreSQL: la table est verrouillée (EXCLUSIVE) pendant la reconstruction,
+    les upserts concurrents attendent le commit et s'appliquent ensuite.
+
+    Returns:
+        Nombre de lignes du rollup écrites
+    """
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("LOCK TABLE campaign_stats_rollup IN EXCLUSIVE MODE"))
+
+        purge = delete(CampaignStatsRollup)
+        if campaign_id is not None:
+            purge = purge.where(CampaignStatsRollup.campaign_id == campaign_id)
+        db.execute(purge)
+
+        source = _raw_rollup_query(campaign_id).subquery()
+        result = db.execute(
+            CampaignStatsRollup.__table__.insert().from_select(
+                list(KEY_COLUMNS) + ["calls", "duration_sum", "duration_count"],
+                select(*source.c)
+            )
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(f"✅ Stats rollup rebuilt ({'campaign ' + str(campaign_id) if campaign_id else 'all campaigns'}): "
+                f"{result.rowcount} rows")
+    return result.rowcount
+
+
+def check(db: Session, campaign_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Compare le rollup aux comptages bruts de la table calls.
+
+    Returns:
+        Écarts [{key, expected, rollup}] (liste vide = rollup cohérent);
+        expected / rollup = (calls, duration_sum, duration_count)
+    """
+    expected = {
+        tuple(row[:6]): tuple(row[6:])
+        for row in db.execute(_raw_rollup_query(campaign_id)).all()
+    }
+
+    query = select(
+        *[getattr(CampaignStatsRollup, column) for column in KEY_COLUMNS],
+        CampaignStatsRollup.calls, CampaignStatsRollup.duration_sum, CampaignStatsRollup.duration_count,
+    )
+    if campaign_id is not None:
+        query = query.where(CampaignStatsRollup.campaign_id == campaign_id)
+    actual = {
+        tuple(row[:6]): tuple(row[6:])
+        for row in db.execute(query).all()
+        if any(row[6:])  # Lignes revenues à zéro (appels repartis en retry)
+    }
+
+    return [
+        {"key": dict(zip(KEY_COLUMNS, key)), "expected": expected.get(key, (0, 0, 0)), "rollup": actual.get(key, (0, 0, 0))}
+        for key in sorted(set(expected) | set(actual), key=lambda k: (k[0], k[1], k[2:]))
+        if expected.get(key, (0, 0, 0)) != actual.get(key, (0, 0, 0))
+    ]
@@ -15,6 +15,7 @@ Usage:
 import sys
 import os
 import random
+import time
 import argparse
 import requests
 import json
@@ -341,6 +342,47 @@ EDGE_CASES = [
 ]
 
 
+def run_batch_matching(matcher: ObjectionMatcher, texts: list, min_score: float = 0.70) -> list:
+    """
+    Score tout le corpus via find_best_matches et affiche le débit (phrases/s).
+
+    Mesure à froid (cache phonetic_key et index batch du matcher vidés) puis
+    à chaud (même corpus, caches remplis): seul le premier chiffre reflète
+    le coût réel d'inputs nouveaux. Les doublons du corpus ne sont scorés
+    qu'une fois (nombre d'inputs uniques affiché).
+    """
+    unique = len({text.strip().lower() for text in texts if text and text.strip()})
+
+    matcher.reset_batch_index()
+    start = time.perf_counter()
+    results = matcher.find_best_matches(texts, min_score=min_score, workers=-1)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher.find_best_matches(texts, min_score=min_score, workers=-1)
+    warm = time.perf_counter() - start
+
+    def rate(elapsed: float) -> str:
+        return f"{len(texts) / elapsed:,.0f}" if elapsed > 0 else "inf"
+
+    print(
+        f"⚡ Matching batch: {len(texts)} phrases ({unique} uniques) | "
+        f"à froid {cold * 1000:.1f}ms ({rate(cold)} phrases/s) | "
+        f"à chaud, caches remplis {warm * 1000:.1f}ms ({rate(warm)} phrases/s)"
+    )
+
+    # Part des phrases résolues par étape (lookup direct, phonétique, fuzzy)
+    stages = defaultdict(int)
+    for r in results:
+        stages[r.method if r else "no_match"] += 1
+    print("   Étapes: " + " | ".join(
+        f"{stage} {stages[stage] / max(len(texts), 1) * 100:.0f}%"
+        for stage in ("direct_lookup", "phonetic_lookup", "keyword_match", "no_match")
+    ))
+    print()
+    return results
+
+
 def run_simulation(theme: str = "objections_finance", verbose: bool = False, num_tests: int = 100):
     """Run matching simulation on random inputs."""
 
@@ -393,18 +435,18 @@ def run_simulation(theme: str = "objections_finance", verbose: bool = False, num
     stats = defaultdict(lambda: {"total": 0, "correct": 0, "wrong": 0})
     results = []
 
+    # Matching batch (un seul appel, sans logs par input)
+    batch_results = run_batch_matching(matcher, [inp for inp, _ in test_corpus])
+
     print("─" * 70)
     print("RÉSULTATS DES TESTS")
     print("─" * 70)
 
-    for i, (input_text, expected_category) in enumerate(test_corpus, 1):
-        # Run matching (silent mode to avoid flooding logs)
-        result = matcher.find_best_match(input_text, min_score=0.70, silent=True)
-
+    for i, ((input_text, expected_category), result) in enumerate(zip(test_corpus, batch_results), 1):
         if result:
-            detected_intent = result.get("entry_type", "objection")
-            score = result["score"]
-            keyword = result.get("matched_keyword", "")
+            detected_intent = result.entry_type
+            score = result.score
+            keyword = result.matched_keyword
 
             # Map entry_type to intent category
             if detected_intent in ["affirm", "deny", "insult", "time", "unsure"]:
@@ -705,82 +747,25 @@ def run_random_simulation(theme: str = "objections_finance", run_number: int = 1
     # Shuffle
     random.shuffle(test_corpus)
 
-
-def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1, collect_issues: list = None, verbose: bool = False):
-    """Run simulation with Ollama-generated corpus."""
-
-    print("=" * 70)
-    print(f"🤖 SIMULATION OLLAMA - Run #{run_number}")
-    print("=" * 70)
-    print(f"Theme: {theme}")
-    if verbose:
-        print(f"🔧 MODE VERBOSE ACTIVÉ - Logs ultra détaillés")
-    print("=" * 70)
-    print()
-
-    # Load matcher
-    matcher = ObjectionMatcher.load_objections_for_theme(theme)
-    if not matcher:
-        print("❌ Erreur: Impossible de charger le matcher")
-        return
-
-    print(f"✅ Matcher chargé: {len(matcher.objections)} entries, {len(matcher.keyword_lookup)} keywords")
-    print()
-
-    # Generate corpus with Ollama
-    test_corpus = generate_ollama_corpus(count_per_category=15, verbose=verbose)
-
-    if len(test_corpus) < 50:
-        print("⚠️  Corpus trop petit, utilisation du fallback...")
-        # Fallback to random generation
-        test_corpus = []
-        for _ in range(15):
-            test_corpus.append((generate_random_phrase("1_MOT"), "1_MOT"))
-        for _ in range(15):
-            test_corpus.append((generate_random_phrase("2-3_MOTS"), "2-3_MOTS"))
-        for _ in range(15):
-            test_corpus.append((generate_random_phrase("4-6_MOTS"), "4-6_MOTS"))
-        for _ in range(15):
-            test_corpus.append((generate_random_phrase("7-10_MOTS"), "7-10_MOTS"))
-        for _ in range(15):
-            test_corpus.append((generate_random_phrase("11+_MOTS"), "11+_MOTS"))
-        for _ in range(25):
-            test_corpus.append((generate_random_phrase("RANDOM"), "RANDOM"))
-
-    # Shuffle
-    random.shuffle(test_corpus)
-
     # Statistics par catégorie détectée
     detected_stats = defaultdict(int)
     score_ranges = {"high": 0, "medium": 0, "low": 0, "none": 0}
     results_by_type = defaultdict(list)
 
     print("─" * 70)
-    print(f"RÉSULTATS ({len(test_corpus)} tests)")
+    print("RÉSULTATS (100 tests)")
     print("─" * 70)
     print()
 
-    for i, (input_text, input_type) in enumerate(test_corpus, 1):
-        if verbose:
-            print(f"\n{'═'*70}")
-            print(f"🔍 TEST #{i}: '{input_text}'")
-            print(f"   Type: {input_type}")
-            print(f"{'─'*70}")
-
-        # Use silent=False when verbose for detailed matching logs
-        result = matcher.find_best_match(input_text, min_score=0.70, silent=not verbose)
-
-        if verbose:
-            if result:
-                print(f"   📊 Résultat brut: {result}")
-            else:
-                print(f"   📊 Résultat: AUCUN MATCH")
+    batch_results = run_batch_matching(matcher, [inp for inp, _ in test_corpus])
 
+    for i, ((input_text, input_type), result) in enumerate(zip(test_corpus, batch_results), 1):
         if result:
-            entry_type = result.get("entry_type", "objection")
-            score = result["score"]
-            keyword = result.get("matched_keyword", "")
+            entry_type = result.entry_type
+            score = result.score
+            keyword = result.matched_keyword
 
+            # Map to category
             if entry_type in ["affirm", "deny", "insult", "time", "unsure"]:
                 detected = entry_type.upper()
             elif entry_type == "faq":
@@ -788,6 +773,7 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
             else:
                 detected = "OBJECTION"
 
+            # Score range
             if score >= 0.9:
                 score_range = "high"
                 score_icon = "🟢"
@@ -807,26 +793,30 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
         detected_stats[detected] += 1
         score_ranges[score_range] += 1
 
-        # Print result
-        print(f"{score_icon} [{i:3d}] [{input_type:12}] '{input_text[:50]}{'...' if len(input_text) > 50 else ''}'")
-        print(f"       → {detected:10} | score={score:.2f} | kw='{keyword}'")
+        # Print result with detailed logging
+        print(f"{score_icon} [{i:3d}] [{input_type:12}] '{input_text[:40]}{'...' if len(input_text) > 40 else ''}'")
+        print(f"       → {detected:10} | score={score:.2f} | kw='{keyword}' (len={len(keyword)})")
 
-        # Log issues
+        # Log potential issues
         is_issue = False
         issue_reason = ""
 
-        if input_type in ["1_MOT", "RANDOM"] and 0.65 <= score < 0.7:
+        # Issue 1: Low score match on simple words (fuzzy false positive)
+        if input_type in ["MOT_SIMPLE", "RANDOM"] and 0.4 <= score < 0.7:
             is_issue = True
             issue_reason = f"FUZZY_LOW_SCORE ({score:.2f})"
 
+        # Issue 2: RANDOM input matched with high score (should be NONE)
         if input_type == "RANDOM" and score >= 0.7:
             is_issue = True
             issue_reason = f"RANDOM_HIGH_MATCH ({score:.2f})"
 
+        # Issue 3: Semantic mismatch (keyword doesn't relate to input)
         if score >= 0.5 and len(keyword) > 0:
+            # Check if keyword shares any significant chars with input
             input_chars = set(input_text.lower().replace(" ", ""))
             kw_chars = set(keyword.lower().replace(" ", ""))
-            overlap = len(input_chars & kw_chars) / max(len(input_chars), len(kw_chars)) if max(len(input_chars), len(kw_chars)) > 0 else 0
+            overlap = len(input_chars & kw_chars) / max(len(input_chars), len(kw_chars))
             if overlap < 0.15 and score >= 0.5:
                 is_issue = True
                 issue_reason = f"SEMANTIC_MISMATCH (overlap={overlap:.2f})"
@@ -862,7 +852,7 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
     print(f"\n{'Détecté':<15} {'Count':>8} {'%':>8}")
     print("-" * 35)
     for det in sorted(detected_stats.keys()):
-        pct = detected_stats[det] / len(test_corpus) * 100
+        pct = detected_stats[det] / 100 * 100
         print(f"{det:<15} {detected_stats[det]:>8} {pct:>7.1f}%")
 
     print()
@@ -872,18 +862,17 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
 
     print(f"\n🟢 High (>=0.9):   {score_ranges['high']:>3}")
     print(f"🟡 Medium (0.7-0.9): {score_ranges['medium']:>3}")
-    print(f"🟠 Low (0.65-0.7):  {score_ranges['low']:>3}")
-    print(f"⚪ None (<0.65):    {score_ranges['none']:>3}")
+    print(f"🟠 Low (0.4-0.7):   {score_ranges['low']:>3}")
+    print(f"⚪ None (<0.4):     {score_ranges['none']:>3}")
 
+    # Analysis par type d'input
     print()
     print("=" * 70)
     print("📊 ANALYSE PAR TYPE D'INPUT")
     print("=" * 70)
 
     for input_type in ["1_MOT", "2-3_MOTS", "4-6_MOTS", "7-10_MOTS", "11+_MOTS", "RANDOM"]:
-        results = results_by_type.get(input_type, [])
-        if not results:
-            continue
+        results = results_by_type[input_type]
         avg_score = sum(r["score"] for r in results) / len(results) if results else 0
         none_count = sum(1 for r in results if r["detected"] == "NONE")
 
@@ -891,6 +880,7 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
         print(f"  Score moyen: {avg_score:.2f}")
         print(f"  Non matchés: {none_count}/{len(results)}")
 
+        # Top detections
         det_counts = defaultdict(int)
         for r in results:
             det_counts[r["detected"]] += 1
@@ -904,25 +894,88 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
 
     return detected_stats, score_ranges, results_by_type
 
+
+def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1, collect_issues: list = None, verbose: bool = False):
+    """Run simulation with Ollama-generated corpus."""
+
+    print("=" * 70)
+    print(f"🤖 SIMULATION OLLAMA - Run #{run_number}")
+    print("=" * 70)
+    print(f"Theme: {theme}")
+    if verbose:
+        print(f"🔧 MODE VERBOSE ACTIVÉ - Logs ultra détaillés")
+    print("=" * 70)
+    print()
+
+    # Load matcher
+    matcher = ObjectionMatcher.load_objections_for_theme(theme)
+    if not matcher:
+        print("❌ Erreur: Impossible de charger le matcher")
+        return
+
+    print(f"✅ Matcher chargé: {len(matcher.objections)} entries, {len(matcher.keyword_lookup)} keywords")
+    print()
+
+    # Generate corpus with Ollama
+    test_corpus = generate_ollama_corpus(count_per_category=15, verbose=verbose)
+
+    if len(test_corpus) < 50:
+        print("⚠️  Corpus trop petit, utilisation du fallback...")
+        # Fallback to random generation
+        test_corpus = []
+        for _ in range(15):
+            test_corpus.append((generate_random_phrase("1_MOT"), "1_MOT"))
+        for _ in range(15):
+            test_corpus.append((generate_random_phrase("2-3_MOTS"), "2-3_MOTS"))
+        for _ in range(15):
+            test_corpus.append((generate_random_phrase("4-6_MOTS"), "4-6_MOTS"))
+        for _ in range(15):
+            test_corpus.append((generate_random_phrase("7-10_MOTS"), "7-10_MOTS"))
+        for _ in range(15):
+            test_corpus.append((generate_random_phrase("11+_MOTS"), "11+_MOTS"))
+        for _ in range(25):
+            test_corpus.append((generate_random_phrase("RANDOM"), "RANDOM"))
+
+    # Shuffle
+    random.shuffle(test_corpus)
+
     # Statistics par catégorie détectée
     detected_stats = defaultdict(int)
     score_ranges = {"high": 0, "medium": 0, "low": 0, "none": 0}
     results_by_type = defaultdict(list)
 
+    # Matching batch (le mode verbose garde l'analyse détaillée input par input)
+    batch_results = None if verbose else run_batch_matching(matcher, [inp for inp, _ in test_corpus])
+
     print("─" * 70)
-    print("RÉSULTATS (100 tests)")
+    print(f"RÉSULTATS ({len(test_corpus)} tests)")
     print("─" * 70)
     print()
 
     for i, (input_text, input_type) in enumerate(test_corpus, 1):
-        result = matcher.find_best_match(input_text, min_score=0.70, silent=True)
+        if verbose:
+            print(f"\n{'═'*70}")
+            print(f"🔍 TEST #{i}: '{input_text}'")
+            print(f"   Type: {input_type}")
+            print(f"{'─'*70}")
+
+            # Use silent=False when verbose for detailed matching logs
+            result = matcher.find_best_match(input_text, min_score=0.70, silent=False)
+
+            if result:
+                print(f"   📊 Résultat brut: {result}")
+            else:
+                print(f"   📊 Résultat: AUCUN MATCH")
+        else:
+            result = batch_results[i - 1]
+            if result:
+                result = result._asdict()
 
         if result:
             entry_type = result.get("entry_type", "objection")
             score = result["score"]
             keyword = result.get("matched_keyword", "")
 
-            # Map to category
             if entry_type in ["affirm", "deny", "insult", "time", "unsure"]:
                 detected = entry_type.upper()
             elif entry_type == "faq":
@@ -930,7 +983,6 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
             else:
                 detected = "OBJECTION"
 
-            # Score range
             if score >= 0.9:
                 score_range = "high"
                 score_icon = "🟢"
@@ -950,30 +1002,26 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
         detected_stats[detected] += 1
         score_ranges[score_range] += 1
 
-        # Print result with detailed logging
-        print(f"{score_icon} [{i:3d}] [{input_type:12}] '{input_text[:40]}{'...' if len(input_text) > 40 else ''}'")
-        print(f"       → {detected:10} | score={score:.2f} | kw='{keyword}' (len={len(keyword)})")
+        # Print result
+        print(f"{score_icon} [{i:3d}] [{input_type:12}] '{input_text[:50]}{'...' if len(input_text) > 50 else ''}'")
+        print(f"       → {detected:10} | score={score:.2f} | kw='{keyword}'")
 
-        # Log potential issues
+        # Log issues
         is_issue = False
         issue_reason = ""
 
-        # Issue 1: Low score match on simple words (fuzzy false positive)
-        if input_type in ["MOT_SIMPLE", "RANDOM"] and 0.4 <= score < 0.7:
+        if input_type in ["1_MOT", "RANDOM"] and 0.65 <= score < 0.7:
             is_issue = True
             issue_reason = f"FUZZY_LOW_SCORE ({score:.2f})"
 
-        # Issue 2: RANDOM input matched with high score (should be NONE)
         if input_type == "RANDOM" and score >= 0.7:
             is_issue = True
             issue_reason = f"RANDOM_HIGH_MATCH ({score:.2f})"
 
-        # Issue 3: Semantic mismatch (keyword doesn't relate to input)
         if score >= 0.5 and len(keyword) > 0:
-            # Check if keyword shares any significant chars with input
             input_chars = set(input_text.lower().replace(" ", ""))
             kw_chars = set(keyword.lower().replace(" ", ""))
-            overlap = len(input_chars & kw_chars) / max(len(input_chars), len(kw_chars))
+            overlap = len(input_chars & kw_chars) / max(len(input_chars), len(kw_chars)) if max(len(input_chars), len(kw_chars)) > 0 else 0
             if overlap < 0.15 and score >= 0.5:
                 is_issue = True
                 issue_reason = f"SEMANTIC_MISMATCH (overlap={overlap:.2f})"
@@ -1009,7 +1057,7 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
     print(f"\n{'Détecté':<15} {'Count':>8} {'%':>8}")
     print("-" * 35)
     for det in sorted(detected_stats.keys()):
-        pct = detected_stats[det] / 100 * 100
+        pct = detected_stats[det] / len(test_corpus) * 100
         print(f"{det:<15} {detected_stats[det]:>8} {pct:>7.1f}%")
 
     print()
@@ -1019,17 +1067,18 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
 
     print(f"\n🟢 High (>=0.9):   {score_ranges['high']:>3}")
     print(f"🟡 Medium (0.7-0.9): {score_ranges['medium']:>3}")
-    print(f"🟠 Low (0.4-0.7):   {score_ranges['low']:>3}")
-    print(f"⚪ None (<0.4):     {score_ranges['none']:>3}")
+    print(f"🟠 Low (0.65-0.7):  {score_ranges['low']:>3}")
+    print(f"⚪ None (<0.65):    {score_ranges['none']:>3}")
 
-    # Analysis par type d'input
     print()
     print("=" * 70)
     print("📊 ANALYSE PAR TYPE D'INPUT")
     print("=" * 70)
 
     for input_type in ["1_MOT", "2-3_MOTS", "4-6_MOTS", "7-10_MOTS", "11+_MOTS", "RANDOM"]:
-        results = results_by_type[input_type]
+        results = results_by_type.get(input_type, [])
+        if not results:
+            continue
         avg_score = sum(r["score"] for r in results) / len(results) if results else 0
         none_count = sum(1 for r in results if r["detected"] == "NONE")
 
@@ -1037,7 +1086,6 @@ def run_ollama_simulation(theme: str = "objections_finance", run_number: int = 1
         print(f"  Score moyen: {avg_score:.2f}")
         print(f"  Non matchés: {none_count}/{len(results)}")
 
-        # Top detections
         det_counts = defaultdict(int)
         for r in results:
             det_counts[r["detected"]] += 1
@@ -141,17 +141,12 @@ def main():
             print("=" * 80)
 
             # Get call stats
-            if call_uuid in robot.call_sessions:
-                session = robot.call_sessions[call_uuid]
+            session = robot.calls.get(call_uuid)
+            if session is not None:
                 print(f"\nSession UUID: {call_uuid}")
-                print(f"Statut final: {session.get('final_status', 'N/A')}")
-                print(f"Duree totale: {session.get('duration', 0):.1f}s")
-
-                # Display latencies if available
-                if 'latencies' in session:
-                    print("\nLatences par phase:")
-                    for phase, latency in session['latencies'].items():
-                        print(f"   {phase}: {latency:.0f}ms")
+                print(f"Statut final: {session.final_status or 'N/A'}")
+                print(f"Duree totale: {time.time() - session.start_time:.1f}s")
+                print(f"Etapes: {len(session.steps_executed)}, transcriptions: {len(session.transcripts)}")
         else:
             print("❌ Echec lancement appel")
             return 1